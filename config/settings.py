@@ -15,6 +15,7 @@ class APIConfig:
     app_secret: str
     account_no: str
     ws_url: str  
+    hts_id: str = ""    # HTS ID (실시간 체결 통보 구독 키)
 
     @classmethod
     def from_env(cls) -> "APIConfig":
@@ -24,6 +25,7 @@ class APIConfig:
             app_secret=dotenv_helper.get_value("KIS_APP_SECRET", ""),
             account_no=dotenv_helper.get_value("KIS_ACCOUNT_NO", ""),
             ws_url=dotenv_helper.get_value("KIS_WS_URL", ""),
+            hts_id=dotenv_helper.get_value("KIS_HTS_ID", ""),
         )
 
 @dataclass
@@ -96,6 +98,7 @@ class DatabaseConfig:
     """DB 설정"""
     db_path: str = "trading_bot.database_manager"
     backup_interval: int = 3600
+    daily_bar_db_path: str = "daily_bars.db"  # 일봉 이력 저장소
 
 class AlertConfig:
     """알림 설정"""
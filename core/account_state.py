@@ -102,7 +102,7 @@ class AccountState:
 
             try:
                 # API로부터 계좌 잔고 조회
-                balance_data = api_client.get_account_balance()
+                balance_data = await api_client.get_account_balance_async()
                 self.last_api_call_time = time.time()
                 
                 # API 오류 확인
@@ -248,7 +248,7 @@ class AccountState:
                 if amount > 100000:
                     # 실제 API에서 잔고 다시 확인
                     try:
-                        balance_data = api_client.get_account_balance()
+                        balance_data = await api_client.get_account_balance_async()
                         if balance_data.get("rt_cd") == "0":
                             # 데이터 형식에 따라 처리
                             api_ord_psbl_cash = 0  # API 주문가능금액
@@ -0,0 +1,149 @@
+"""
+엔드포인트별 적응형 요청 타임아웃 (최근 지연 시간 분포 기반)
+"""
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from core.api_metrics import api_metrics
+from utils.logger import logger
+
+# 주문/정정/취소 경로 (응답이 늦어도 서버에서 처리될 수 있어 하한을 높게 둠)
+ORDER_PATH_PREFIX = "/uapi/domestic-stock/v1/trading/order"
+
+
+class TimeoutBounds:
+    """타임아웃 하한/상한 (초)"""
+
+    def __init__(self, floor: float, ceiling: float):
+        self.floor = floor
+        self.ceiling = ceiling
+
+
+class _EndpointTimeout:
+    """엔드포인트별 타임아웃 계산 상태"""
+
+    def __init__(self):
+        self.timeout: Optional[float] = None    # 마지막으로 계산한 타임아웃 (None이면 표본 부족)
+        self.sample_count = 0                   # 계산 시점의 누적 응답 수
+        self.computed_at = 0.0
+        self.penalty = 1.0                      # 연속 타임아웃 시 늘어나는 배수
+        self.timeouts = 0
+
+
+class AdaptiveTimeouts:
+    """엔드포인트별 적응형 타임아웃 관리자
+
+    - 타임아웃 = clamp(최근 p99 지연 시간 * factor * penalty, floor, ceiling)
+    - 표본이 min_samples 미만이면 default_timeout 사용 (장 시작 직후 등)
+    - 타임아웃이 발생하면 penalty를 늘리고, 응답을 받으면 점차 1로 되돌림
+      (지연이 급격히 늘어 p99가 따라오기 전에도 재시도 타임아웃이 함께 늘어남)
+    - 값은 aiohttp.ClientTimeout으로 전달되어 시간 초과 시 연결 자체가 취소됨
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.enabled = True
+            self.default_timeout = 10.0     # 표본 부족 시 타임아웃 (초)
+            self.quantile = 99              # 기준 백분위
+            self.factor = 3.0               # 백분위 지연 시간에 곱하는 배수
+            self.min_samples = 20           # 적응형 계산에 필요한 최소 표본 수
+            self.recompute_samples = 16     # 이 수만큼 새 응답이 쌓이면 다시 계산
+            self.recompute_interval = 5.0   # 또는 이 시간(초)이 지나면 다시 계산
+            self.max_penalty = 4.0
+            self.default_bounds = TimeoutBounds(floor=1.0, ceiling=10.0)
+            # {경로 접두사: 하한/상한} - 긴 접두사 우선
+            self.path_bounds: Dict[str, TimeoutBounds] = {
+                ORDER_PATH_PREFIX: TimeoutBounds(floor=5.0, ceiling=15.0),
+                "/uapi/domestic-stock/v1/trading/inquire-balance": TimeoutBounds(floor=2.0, ceiling=15.0),
+            }
+
+            self._states: Dict[str, _EndpointTimeout] = {}
+            self._state_lock = threading.Lock()
+
+            self._initialized = True
+
+    def set_bounds(self, path_prefix: str, floor: float, ceiling: float):
+        """경로 접두사별 하한/상한 설정"""
+        self.path_bounds[path_prefix] = TimeoutBounds(floor, ceiling)
+
+    def _bounds(self, path: str) -> TimeoutBounds:
+        matched = [prefix for prefix in self.path_bounds if path.startswith(prefix)]
+        if not matched:
+            return self.default_bounds
+        return self.path_bounds[max(matched, key=len)]
+
+    def _state(self, path: str, tr_id: Optional[str]) -> _EndpointTimeout:
+        key = f"{path}|{tr_id or ''}"
+        state = self._states.get(key)
+        if state is None:
+            with self._state_lock:
+                state = self._states.setdefault(key, _EndpointTimeout())
+        return state
+
+    def get(self, path: str, tr_id: Optional[str] = None) -> float:
+        """엔드포인트의 현재 요청 타임아웃 (초)"""
+        bounds = self._bounds(path)
+        if not self.enabled:
+            return max(bounds.floor, min(bounds.ceiling, self.default_timeout))
+
+        state = self._state(path, tr_id)
+        metrics = api_metrics.endpoint(path, tr_id)
+        now = time.monotonic()
+        if (state.timeout is None
+                or metrics.latency.count - state.sample_count >= self.recompute_samples
+                or now - state.computed_at >= self.recompute_interval):
+            observed = metrics.latency_quantile(self.quantile, self.min_samples)
+            state.timeout = observed * self.factor if observed is not None else None
+            state.sample_count = metrics.latency.count
+            state.computed_at = now
+
+        base = state.timeout if state.timeout is not None else self.default_timeout
+        return max(bounds.floor, min(bounds.ceiling, base * state.penalty))
+
+    def record_timeout(self, path: str, tr_id: Optional[str] = None):
+        """타임아웃 발생 기록 (다음 시도의 타임아웃 증가)"""
+        state = self._state(path, tr_id)
+        state.timeouts += 1
+        previous = state.penalty
+        state.penalty = min(self.max_penalty, state.penalty * 1.5)
+        if state.penalty != previous:
+            logger.log_warning(f"[타임아웃] {path} ({tr_id or '-'}) 타임아웃 배수 {previous:.2f} -> {state.penalty:.2f}")
+
+    def record_success(self, path: str, tr_id: Optional[str] = None):
+        """응답 수신 기록 (타임아웃 배수를 점차 1로 복원)"""
+        state = self._state(path, tr_id)
+        if state.penalty > 1.0:
+            state.penalty = max(1.0, state.penalty * 0.8)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """엔드포인트별 현재 타임아웃 반환"""
+        with self._state_lock:
+            keys = list(self._states)
+        stats = {}
+        for key in keys:
+            path, tr_id = key.split("|", 1)
+            state = self._states[key]
+            stats[key] = {
+                "timeout": round(self.get(path, tr_id or None), 3),
+                "adaptive": state.timeout is not None,
+                "penalty": round(state.penalty, 2),
+                "timeouts": state.timeouts,
+            }
+        return {"enabled": self.enabled, "endpoints": stats}
+
+
+# 싱글톤 인스턴스
+adaptive_timeouts = AdaptiveTimeouts()
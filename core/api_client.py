@@ -2,27 +2,39 @@
 한국투자증권 API 클라이언트
 """
 import requests
+import aiohttp
 import json
 import hashlib
 import time
 from datetime import datetime, timedelta, time as time_class
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from config.settings import config, APIConfig
 from utils.logger import logger
 import os
 from dotenv import load_dotenv
 from pathlib import Path
 from utils.database import database_manager
+from core.http_session import http_session_manager
+from core.token_manager import token_manager, TOKEN_FILE_PATH
+from core.rate_limiter import rate_limiter
+from core.request_coalescer import request_coalescer
+from core.cassette import cassette
+from core.api_metrics import api_metrics
+from core.adaptive_timeout import adaptive_timeouts, ORDER_PATH_PREFIX
+from core.circuit_breaker import circuit_breakers, CircuitOpenError, STATE_OPEN
+from core.retry_policy import retry_policy, ERROR_TIMEOUT, ERROR_CONNECTION, ERROR_RATE_LIMITED, RATE_LIMIT_MSG_CODES
+from core.quote_cache import quote_cache, PRICE_FIELDS, SYMBOL_INFO_FIELDS
+from core.response_models import loads, Quote, AccountSummary, decode_holdings
 import asyncio
 import threading
 import socket
 
-# 토큰 정보 저장 파일 경로
-TOKEN_FILE_PATH = os.path.join(os.path.abspath(os.getcwd()), "token_info.json")
-
 class KISAPIClient:
     """한국투자증권 REST API 클라이언트"""
     
+    # 여러 종목 동시 조회 시 기본 최대 동시 실행 수
+    MULTI_QUOTE_CONCURRENCY = 20
+    
     _instance = None
     _lock = threading.Lock()
     
@@ -41,11 +53,6 @@ class KISAPIClient:
             env_path = Path(__file__).parent.parent / ".env"
             load_dotenv(dotenv_path=env_path)
             
-            # 초기화
-            self.access_token = None
-            self.token_expire_time = None  # 만료 시간 (Unix timestamp)
-            self.token_issue_time = None   # 발급 시간 (Unix timestamp)
-            
             # 환경 변수에서 읽어오기
             self.base_url = os.getenv("KIS_BASE_URL")
             self.app_key = os.getenv("KIS_APP_KEY")
@@ -59,284 +66,51 @@ class KISAPIClient:
             #self.app_secret = self.config.app_secret
             #self.account_no = self.config.account_no
             
-            # 앱 시작 시 파일에서 유효한 토큰 로드
-            self.load_token_from_file()
+            # 토큰 관리자 설정 후 앱 시작 시 파일에서 유효한 토큰 로드
+            token_manager.configure(self.base_url, self.app_key, self.app_secret)
+            token_manager.sync_from_file(force=True)
+            
+            # 계좌 단위 초당 요청 제한 (KIS 실전 20건/초, 모의 2건/초)
+            rate_limiter.configure_account(self.account_no or "", 2 if self._is_virtual_trade() else 20)
             
             self._initialized = True
         
+    @property
+    def access_token(self) -> Optional[str]:
+        """현재 메모리에 보관된 접근 토큰"""
+        return token_manager.access_token
+
+    @property
+    def token_expire_time(self) -> Optional[float]:
+        """토큰 만료 시간 (Unix timestamp)"""
+        return token_manager.token_expire_time
+
+    @property
+    def token_issue_time(self) -> Optional[float]:
+        """토큰 발급 시간 (Unix timestamp)"""
+        return token_manager.token_issue_time
+
     def _get_access_token(self) -> str:
-        """접근 토큰 발급/갱신"""
-        current_time = datetime.now().timestamp()
-        
-        # 토큰 재발급 임계값 (12시간 = 43200초)
-        # KIS 토큰은 24시간 유효하므로 12시간으로 설정
-        TOKEN_RENEWAL_THRESHOLD = 43200
-        
-        # 먼저 파일에서 토큰 정보 로드 시도
-        token_loaded = self.load_token_from_file()
-        
-        # 파일에서 토큰을 성공적으로 로드했고, 토큰이 유효한 경우
-        if token_loaded and self.access_token and self.token_expire_time:
-            # 만료까지 남은 시간
-            remaining_seconds = self.token_expire_time - current_time
-            remaining_hours = remaining_seconds / 3600
-            
-            # 임계값 이상 시간이 남았으면 기존 토큰 재사용
-            if remaining_seconds > TOKEN_RENEWAL_THRESHOLD:
-                # 시간당 한번만 로깅하도록 제한
-                #if int(remaining_hours) % 2 == 0 or remaining_hours < 1.0:
-                #    logger.log_system(f"[토큰재사용] 기존 토큰이 유효하여 재사용합니다. (만료까지 {remaining_hours:.1f}시간 남음)")
-                return self.access_token
-            else:
-                # 만료 임계값 이하로 남았을 때만 갱신
-                logger.log_system(f"[토큰갱신] 토큰이 {remaining_hours:.1f}시간 후 만료 예정, 갱신합니다. (현재={datetime.fromtimestamp(current_time).strftime('%Y-%m-%d %H:%M:%S')}, 만료={datetime.fromtimestamp(self.token_expire_time).strftime('%Y-%m-%d %H:%M:%S')})")
-        else:
-            # 토큰 발급/갱신 작업 로그
-            if not token_loaded:
-                logger.log_system("[토큰발급] 파일에서 유효한 토큰을 찾을 수 없어 새로운 토큰을 발급합니다...")
-            else:
-                logger.log_system("[토큰발급] 새로운 KIS API 토큰 발급을 시작합니다...")
-        
-        # 토큰 발급/갱신
-        url = f"{self.base_url}/oauth2/tokenP"
-        headers = {"content-type": "application/json"}
-        body = {
-            "grant_type": "client_credentials",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret
-        }
-        
-        try:
-            response = requests.post(url, headers=headers, json=body)
-            response.raise_for_status()
-            token_data = response.json()
-            
-            self.access_token = token_data["access_token"]
-            self.token_issue_time = current_time
-            # 토큰 만료 시간 설정 (24시간)
-            self.token_expire_time = current_time + (24 * 60 * 60)
-            
-            # 토큰 정보를 파일에 저장
-            self.save_token_to_file(
-                token=self.access_token,
-                issue_time=current_time,
-                expire_time=self.token_expire_time
-            )
-            
-            logger.log_system("Access token refreshed successfully")
-            return self.access_token
-            
-        except Exception as e:
-            # 토큰 발급 실패 로그
-            logger.log_error(e, "Failed to get access token")
-            # 토큰 발급 실패 정보를 파일에 저장
-            self.save_token_to_file(
-                token=None,
-                issue_time=current_time,
-                expire_time=None,
-                status="FAIL",
-                error_message=str(e)
-            )
-            raise
+        """접근 토큰 발급/갱신 (메모리 토큰이 유효하면 그대로 반환)"""
+        return token_manager.get_token()
 
     def save_token_to_file(self, token: str = None, issue_time: float = None, 
                          expire_time: float = None, status: str = "SUCCESS", 
                          error_message: str = None):
         """토큰 정보를 파일에 저장"""
-        try:
-            # 파일이 존재하면 기존 내용 로드
-            token_info = {}
-            if os.path.exists(TOKEN_FILE_PATH):
-                try:
-                    with open(TOKEN_FILE_PATH, 'r') as f:
-                        token_info = json.load(f)
-                        # 기존 정보 보존을 위해 'history' 키가 없으면 생성
-                        if 'history' not in token_info:
-                            token_info['history'] = []
-                except (json.JSONDecodeError, FileNotFoundError):
-                    # 파일이 손상되었거나 없으면 새로 생성
-                    token_info = {'current': {}, 'history': []}
-            else:
-                token_info = {'current': {}, 'history': []}
-            
-            # 현재 시간
-            current_time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # 현재 토큰 정보 업데이트
-            if status == "SUCCESS" and token:
-                token_info['current'] = {
-                    'token': token,
-                    'issue_time': issue_time,
-                    'issue_time_str': datetime.fromtimestamp(issue_time).strftime("%Y-%m-%d %H:%M:%S") if issue_time else None,
-                    'expire_time': expire_time,
-                    'expire_time_str': datetime.fromtimestamp(expire_time).strftime("%Y-%m-%d %H:%M:%S") if expire_time else None,
-                    'status': status,
-                    'updated_at': current_time_str
-                }
-            
-            # 히스토리에 추가
-            history_entry = {
-                'token': token[:10] + '...' if token else None,  # 보안상 전체 토큰은 저장하지 않음
-                'issue_time_str': datetime.fromtimestamp(issue_time).strftime("%Y-%m-%d %H:%M:%S") if issue_time else None,
-                'expire_time_str': datetime.fromtimestamp(expire_time).strftime("%Y-%m-%d %H:%M:%S") if expire_time else None,
-                'status': status,
-                'error_message': error_message,
-                'recorded_at': current_time_str
-            }
-            token_info['history'].append(history_entry)
-            
-            # 히스토리 최대 50개로 제한
-            if len(token_info['history']) > 50:
-                token_info['history'] = token_info['history'][-50:]
-            
-            # 파일에 저장
-            with open(TOKEN_FILE_PATH, 'w') as f:
-                json.dump(token_info, f, indent=2)
-            
-            logger.log_system(f"토큰 정보를 파일에 저장했습니다: {TOKEN_FILE_PATH}")
-            
-        except Exception as e:
-            logger.log_error(e, "토큰 정보를 파일에 저장하는 중 오류 발생")
+        token_manager.save_token_to_file(token, issue_time, expire_time, status, error_message)
 
     def load_token_from_file(self):
-        """파일에서 토큰 정보 로드
+        """파일에서 토큰 정보 로드 (파일이 변경된 경우에만 다시 읽음)
         
         Returns:
             bool: 토큰 로드 성공 여부 (True: 유효한 토큰 로드 성공, False: 실패)
         """
-        # 토큰 재발급 임계값 (12시간 = 43200초)
-        # KIS 토큰은 24시간 유효하므로 12시간으로 설정
-        TOKEN_RENEWAL_THRESHOLD = 43200
-        
-        # 현재 시간 가져오기 (한 번만 계산)
-        current_time = datetime.now().timestamp()
-        
-        try:
-            # 1. 파일 존재 여부 확인
-            if not os.path.exists(TOKEN_FILE_PATH):
-                logger.log_debug(f"토큰 파일이 존재하지 않습니다: {TOKEN_FILE_PATH}")
-                return False
-            
-            # 2. 파일 읽기 시도
-            try:
-                with open(TOKEN_FILE_PATH, 'r') as f:
-                    token_info = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError) as e:
-                logger.log_error(e, f"토큰 파일 데이터 파싱 오류: {TOKEN_FILE_PATH}")
-                return False
-            
-            # 3. 토큰 정보 구조 확인
-            if 'current' not in token_info or not token_info['current']:
-                logger.log_debug("토큰 파일에 'current' 필드가 없습니다")
-                return False
-            
-            current_token = token_info['current']
-            
-            # 4. 필수 필드 확인
-            if 'token' not in current_token or 'expire_time' not in current_token:
-                logger.log_debug("토큰 파일에 필수 필드(token/expire_time)가 없습니다")
-                return False
-            
-            # 5. 토큰 정보 로드
-            self.access_token = current_token['token']
-            self.token_expire_time = current_token['expire_time']
-            self.token_issue_time = current_token['issue_time']
-            
-            # 6. 토큰 유효성 검사
-            if current_time >= self.token_expire_time:
-                # 이미 만료된 토큰
-                expire_time_str = datetime.fromtimestamp(self.token_expire_time).strftime("%Y-%m-%d %H:%M:%S")
-                logger.log_debug(f"만료된 토큰이 발견됨. 만료 시간: {expire_time_str}")
-                self.access_token = None
-                self.token_expire_time = None
-                self.token_issue_time = None
-                return False
-            
-            # 7. 만료 임박성 검사 - 로그 수준 조절
-            hours_remaining = (self.token_expire_time - current_time) / 3600
-            time_remaining = self.token_expire_time - current_time
-            
-            # 만료 시간이 임계값 미만이면 경고 로그 출력
-            if time_remaining < TOKEN_RENEWAL_THRESHOLD:
-                logger.log_system(f"유효한 토큰이지만 만료까지 {hours_remaining:.1f}시간만 남았습니다. (임계값: {TOKEN_RENEWAL_THRESHOLD/3600:.1f}시간)")
-            #else:
-                # 토큰이 유효하고 충분한 시간이 남은 경우 로그 최소화 (시간당 1번만 출력)
-                #if int(hours_remaining) % 6 == 0 or hours_remaining < 1.0:
-                #    logger.log_system(f"파일에서 유효한 토큰을 로드했습니다. 만료까지 {hours_remaining:.1f}시간 남음")
-            
-            return True
-                
-        except Exception as e:
-            logger.log_error(e, "파일에서 토큰 정보를 로드하는 중 예상치 못한 오류 발생")
-            # 오류 발생 시 토큰 정보 초기화
-            self.access_token = None
-            self.token_expire_time = None
-            self.token_issue_time = None
-            return False
+        return token_manager.sync_from_file()
     
     async def _get_access_token_async(self):
         """비동기 방식으로 액세스 토큰 획득"""
-        # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-        # 스레드별 락 생성 (기존 _token_lock 대신 임시 락 생성)
-        async with asyncio.Lock():
-            # 파일에서 토큰 정보 다시 확인
-            token_loaded = self.load_token_from_file()
-            
-            current_time = datetime.now().timestamp()
-            
-            # 토큰 재발급 임계값 (12시간 = 43200초)
-            # KIS 토큰은 24시간 유효하므로 12시간으로 설정
-            TOKEN_RENEWAL_THRESHOLD = 43200
-            
-            # 토큰이 있고 유효한지 확인
-            if self.access_token and self.token_expire_time:
-                # 토큰 만료까지 남은 시간 계산 (시간 단위)
-                remaining_seconds = self.token_expire_time - current_time
-                remaining_hours = remaining_seconds / 3600
-                
-                # 만료 시간이 임계값 이상 남았으면 기존 토큰 사용
-                if remaining_seconds > TOKEN_RENEWAL_THRESHOLD:
-                    # 디버깅 과도한 로깅 방지: 1시간마다 또는 30분 미만일 때만 로깅
-                    # if int(remaining_hours) % 1 == 0 or remaining_hours < 0.5:
-                    #     logger.log_system(f"[토큰재사용] 유효한 토큰이 있습니다. 현재={datetime.fromtimestamp(current_time).strftime('%Y-%m-%d %H:%M:%S')}, "
-                    #                      f"만료={datetime.fromtimestamp(self.token_expire_time).strftime('%Y-%m-%d %H:%M:%S')}, "
-                    #                      f"남은시간={remaining_hours:.1f}시간")
-                    return self.access_token
-                else:
-                    # 만료 임계값 이내인 경우에만 갱신 시도
-                    logger.log_system(f"[토큰갱신] 토큰 만료 {remaining_hours:.1f}시간 이내, 갱신 필요: 현재={datetime.fromtimestamp(current_time).strftime('%Y-%m-%d %H:%M:%S')}, "
-                                     f"만료={datetime.fromtimestamp(self.token_expire_time).strftime('%Y-%m-%d %H:%M:%S')}")
-            else:
-                # 파일에서 로드 시도 결과에 따라 다른 메시지 표시
-                if token_loaded:
-                    logger.log_system("[토큰오류] 파일에서 토큰을 로드했지만 유효하지 않습니다.")
-                else:
-                    logger.log_system("[토큰없음] 유효한 토큰이 없어 새로 발급합니다.")
-            
-            # 새 토큰 발급 필요
-            try:
-                logger.log_system("[토큰발급] 새 토큰 발급 시작...")
-                # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
-                new_token = await loop.run_in_executor(None, self._get_access_token)
-                logger.log_system("[토큰발급] 새 토큰 발급 완료")
-                return new_token
-            except Exception as e:
-                logger.log_error(e, "[토큰발급] 새 토큰 발급 중 오류 발생")
-                raise
+        return await token_manager.get_token_async()
 
     async def is_token_valid(self, min_hours: float = 0.5) -> bool:
         """토큰이 유효한지 확인
@@ -422,9 +196,7 @@ class KISAPIClient:
     def force_token_refresh(self) -> Dict[str, Any]:
         """토큰 강제 갱신"""
         try:
-            self.access_token = None  # 토큰 초기화
-            self.token_expire_time = None
-            new_token = self._get_access_token()
+            token_manager.get_token(force=True)
             
             return {
                 "status": "success",
@@ -440,54 +212,24 @@ class KISAPIClient:
     
     async def ensure_token(self) -> str:
         """토큰이 있고 유효한지 확인하고, 없거나 유효하지 않으면 새로 발급"""
-        # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-        # 스레드별 락 생성
-        async with asyncio.Lock():
-            # 토큰 유효성 먼저 확인
-            if await self.is_token_valid():
-                logger.log_system("토큰이 유효함. 새로 발급하지 않고 기존 토큰 사용")
-                return self.access_token
-            
-            # 토큰이 유효하지 않으면 새로 발급
-            logger.log_system("토큰이 없거나 만료됨. 새로 발급 진행")
-            await self.issue_token()
+        # 토큰 유효성 먼저 확인
+        if await self.is_token_valid():
+            logger.log_system("토큰이 유효함. 새로 발급하지 않고 기존 토큰 사용")
             return self.access_token
+        
+        # 토큰이 유효하지 않으면 새로 발급
+        logger.log_system("토큰이 없거나 만료됨. 새로 발급 진행")
+        return await token_manager.get_token_async(min_remaining=1800)
     
     async def issue_token(self) -> str:
-        """비동기적으로 토큰 발급 (Python 3.7+ 호환)"""
-        # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
+        """비동기적으로 토큰 발급"""
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-        # 스레드별 락 생성
-        async with asyncio.Lock():
-            try:
-                # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
-                # 동기 함수 _get_access_token을 실행하여 토큰 발급 (run_in_executor 사용)
-                token = await loop.run_in_executor(None, self._get_access_token)
-                logger.log_system("토큰 발급 성공")
-                return token
-            except Exception as e:
-                logger.log_error(e, "토큰 발급 실패")
-                raise
+            token = await token_manager.get_token_async(force=True)
+            logger.log_system("토큰 발급 성공")
+            return token
+        except Exception as e:
+            logger.log_error(e, "토큰 발급 실패")
+            raise
     
     def get_token_file_info(self) -> Dict[str, Any]:
         """토큰 파일 정보 반환"""
@@ -542,29 +284,71 @@ class KISAPIClient:
             }
 
     def _get_hashkey(self, data: Dict[str, Any]) -> str:
-        """해시키 생성"""
+        """해시키 생성 (동기 래퍼)"""
+        return http_session_manager.run_sync(self._get_hashkey_async(data))
+
+    async def _get_hashkey_async(self, data: Dict[str, Any]) -> str:
+        """해시키 생성 (비동기 버전)"""
         url = f"{self.base_url}/uapi/hashkey"
         headers = {
             "content-type": "application/json",
             "appkey": self.app_key,
             "appsecret": self.app_secret
         }
-        
+
         try:
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            hashkey = response.json()["HASH"]
-            return hashkey
-            
+            await rate_limiter.acquire("hashkey", account=self.account_no or "")
+            session = cassette.session if cassette.replaying else http_session_manager.get_session()
+            async with session.post(url, headers=headers, json=data,
+                                    timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                result = json.loads(await response.text())
+                return result["HASH"]
+
         except Exception as e:
             logger.log_error(e, "Failed to get hashkey")
             raise
-    
-    def _make_request(self, method: str, path: str, headers: Dict = None, 
+
+    def _make_request(self, method: str, path: str, headers: Dict = None,
                      params: Dict = None, data: Dict = None, max_retries: int = 3,
-                     raise_on_error: bool = False) -> Dict[str, Any]:
-        """API 요청 실행
-        
+                     raise_on_error: bool = False, priority: int = None) -> Dict[str, Any]:
+        """API 요청 실행 (동기 래퍼)
+
+        공유 커넥션 풀을 사용하는 _make_request_async를 백그라운드 이벤트 루프에서 실행합니다.
+        인자와 반환값은 _make_request_async와 동일합니다.
+        """
+        return http_session_manager.run_sync(
+            self._make_request_async(method, path, headers=headers, params=params, data=data,
+                                     max_retries=max_retries, raise_on_error=raise_on_error,
+                                     priority=priority)
+        )
+
+    async def _make_request_async(self, method: str, path: str, headers: Dict = None,
+                                  params: Dict = None, data: Dict = None, max_retries: int = 3,
+                                  raise_on_error: bool = False, priority: int = None) -> Dict[str, Any]:
+        """API 요청 실행 (비동기 버전)
+
+        동시에 진행 중인 동일한 조회 요청(GET, 같은 path/tr_id/params)은 하나로 합쳐
+        실제 요청은 한 번만 보내고 결과를 공유합니다. 인자는 _send_request_async 참조.
+        """
+        if method.upper() != "GET":
+            return await self._send_request_async(method, path, headers=headers, params=params, data=data,
+                                                  max_retries=max_retries, raise_on_error=raise_on_error,
+                                                  priority=priority)
+
+        key = request_coalescer.make_key(method, path, (headers or {}).get("tr_id"), params, raise_on_error)
+        return await request_coalescer.run(
+            key,
+            lambda: self._send_request_async(method, path, headers=headers, params=params, data=data,
+                                             max_retries=max_retries, raise_on_error=raise_on_error,
+                                             priority=priority)
+        )
+
+    async def _send_request_async(self, method: str, path: str, headers: Dict = None,
+                                  params: Dict = None, data: Dict = None, max_retries: int = 3,
+                                  raise_on_error: bool = False, priority: int = None) -> Dict[str, Any]:
+        """API 요청 실제 전송 (공유 aiohttp 세션, 속도 제한/토큰/재시도 처리)
+
         Args:
             method: HTTP 메서드 (GET, POST 등)
             path: API 경로
@@ -573,63 +357,35 @@ class KISAPIClient:
             data: 요청 바디 (POST 요청)
             max_retries: 최대 재시도 횟수
             raise_on_error: True인 경우 API 오류 시 예외 발생, False인 경우 오류 정보가 포함된 응답 반환
-        
+            priority: 속도 제한 우선순위 레인 (None이면 tr_id 기본값, core.rate_limiter 참조)
+
         Returns:
             API 응답 딕셔너리
         """
         url = f"{self.base_url}{path}"
-        
+        tr_id = (headers or {}).get("tr_id")
+
         # 분봉 데이터 조회를 위한 특수 처리 추가
         is_minute_chart_request = False
         if path == "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice":
             is_minute_chart_request = True
-            #logger.log_system("[특수처리] 분봉 데이터 조회 요청 감지")
-        
+
         # 상수 정의
-        TOKEN_RENEWAL_THRESHOLD = 43200  # 12시간 (43200초)
         MAX_TOKEN_REFRESH_ATTEMPTS = 2
-        REQUEST_TIMEOUT = 30  # 요청 타임아웃 (초)
-        
-        # 상세 로그 추가 - 요청 정보
-        # logger.log_system(f"API 요청: method={method}, path={path}, url={url}")
-        # if params:
-        #     logger.log_system(f"API 파라미터: {params}")
-        # if headers:
-        #     safe_headers = {k: v for k, v in headers.items() if k.lower() not in ["appkey", "appsecret", "authorization"]}
-        #     logger.log_system(f"API 헤더: {safe_headers}")
-            
-        # 토큰 유효성 확인 (KIS 토큰은 24시간 유효)
-        current_time = datetime.now().timestamp()
-        
-        # 파일에서 최신 토큰 정보 로드
-        self.load_token_from_file()
-        
-        # 토큰이 있고 아직 유효한지 확인 (만료 12시간 전까지 유효)
-        token_valid = (
-            self.access_token and 
-            self.token_expire_time and 
-            current_time < self.token_expire_time - TOKEN_RENEWAL_THRESHOLD
-        )
-        
-        # 토큰이 유효하지 않으면 새로 발급
-        if not token_valid:
-            logger.log_system("토큰이 유효하지 않아 새로 발급합니다.")
-            try:
-                token = self._get_access_token()
-            except Exception as e:
-                logger.log_error(e, "토큰 발급 실패")
-                if raise_on_error:
-                    raise
-                return {
-                    "rt_cd": "9999",
-                    "msg1": f"토큰 발급 실패: {str(e)}",
-                    "error_type": "token_issue_error"
-                }
-        else:
-            token = self.access_token
-            # remaining_hours = (self.token_expire_time - current_time) / 3600
-            # logger.log_debug(f"유효한 토큰 사용 (만료까지 {remaining_hours:.1f}시간 남음)")
-        
+
+        # 메모리 토큰 사용 (유효하지 않을 때만 발급, 만료 전 갱신은 백그라운드 태스크 담당)
+        try:
+            token = await token_manager.get_token_async()
+        except Exception as e:
+            logger.log_error(e, "토큰 발급 실패")
+            if raise_on_error:
+                raise
+            return {
+                "rt_cd": "9999",
+                "msg1": f"토큰 발급 실패: {str(e)}",
+                "error_type": "token_issue_error"
+            }
+
         # 기본 헤더 설정
         default_headers = {
             "authorization": f"Bearer {token}",
@@ -637,45 +393,124 @@ class KISAPIClient:
             "appsecret": self.app_secret,
             "tr_cont": "",
         }
-        
+
         if headers:
             default_headers.update(headers)
-        
+
+        # aiohttp는 None 값 헤더를 허용하지 않으므로 제외 (requests와 동일한 동작)
+        default_headers = {k: v for k, v in default_headers.items() if v is not None}
+
         token_refresh_attempts = 0
-        
+        # 카세트 재생 중에는 기록된 응답을 반환하는 세션 사용 (core.cassette 참조)
+        session = cassette.session if cassette.replaying else http_session_manager.get_session()
+
+        # 재시도 정책 (오류 유형별 백오프 + 재시도 예산, core.retry_policy 참조)
+        retry_policy.record_request()
+        # 주문 전송(POST)은 타임아웃/연결 오류 뒤에도 거래소가 접수했을 수 있으므로 재전송하지 않고
+        # (중복 주문 방지, 호출 측이 주문 내역으로 확인), 손절 매도가 막히지 않도록 서킷 차단에서도 제외
+        is_order_request = method.upper() == "POST" and path.startswith(ORDER_PATH_PREFIX)
+        # 엔드포인트별 서킷 브레이커 (장애 엔드포인트는 재시도/타임아웃 없이 즉시 실패)
+        breaker = circuit_breakers.get(path, tr_id) if circuit_breakers.enabled and not is_order_request else None
+        retry_counts: Dict[str, int] = {}
+        last_delay = 0.0
+        # 엔드포인트별 계측 (지연 시간/상태 코드/재시도 등, core.api_metrics 참조)
+        metrics = api_metrics.endpoint(path, tr_id) if api_metrics.enabled else None
+        if metrics is not None:
+            metrics.count_call()
+
+        async def backoff(error_type: str, reason: str) -> bool:
+            """재시도 가능하면 대기(이벤트 루프 비차단) 후 True 반환"""
+            nonlocal last_delay
+            if attempt >= max_retries - 1:
+                return False
+            # 서킷이 열렸으면 기다려도 차단되므로 바로 실패 처리
+            if breaker is not None and breaker.state == STATE_OPEN:
+                return False
+            delay = retry_policy.next_delay(error_type, retry_counts.get(error_type, 0), last_delay)
+            if delay is None:
+                return False
+            retry_counts[error_type] = retry_counts.get(error_type, 0) + 1
+            last_delay = delay
+            if metrics is not None:
+                metrics.count_retry(error_type)
+            logger.log_warning(f"{reason}, {delay:.2f}초 후 재시도... ({attempt + 1}/{max_retries}) {path}")
+            await asyncio.sleep(delay)
+            return True
+
         # 재시도 루프
         for attempt in range(max_retries):
             try:
-                # HTTP 요청 실행 (타임아웃 적용)
+                # 서킷이 열려 있으면 요청을 보내지 않음 (반열림이면 시험 요청 1건만 통과)
+                if breaker is not None and not breaker.allow_request():
+                    retry_after = breaker.retry_after()
+                    if metrics is not None:
+                        metrics.observe_failure("circuit_open", attempted=False)
+                    if raise_on_error:
+                        raise CircuitOpenError(breaker.key, retry_after)
+                    return {
+                        "rt_cd": "9994",
+                        "msg1": f"서킷 차단 중 ({retry_after:.1f}초 후 재확인)",
+                        "error_type": "circuit_open",
+                        "retry_after": retry_after
+                    }
+
+                # 계좌/TR ID별 속도 제한 (우선순위 레인 순으로 허가)
+                waited = await rate_limiter.acquire(tr_id, account=self.account_no or "", priority=priority)
+                if metrics is not None:
+                    metrics.observe_wait(waited)
+
+                # HTTP 요청 실행 (타임아웃 적용, 커넥션 재사용)
                 if method.upper() == "GET":
-                    #logger.log_system(f"GET 요청 시도 ({attempt+1}/{max_retries}): {url}")
-                    response = requests.get(
-                        url, 
-                        headers=default_headers, 
-                        params=params, 
-                        timeout=REQUEST_TIMEOUT
-                    )
+                    request_kwargs = {"params": params}
                 else:
                     logger.log_system(f"POST 요청 시도 ({attempt+1}/{max_retries}): {url}")
-                    response = requests.post(
-                        url, 
-                        headers=default_headers, 
-                        json=data, 
-                        timeout=REQUEST_TIMEOUT
-                    )
-                
-                # 응답 상태 코드 로그
-                #logger.log_system(f"API 응답 상태 코드: {response.status_code}")
-                
-                # # 응답 내용 로그 (디버깅용)
-                # try:
-                #     resp_text = response.text[:1000] + "..." if len(response.text) > 1000 else response.text
-                #     logger.log_system(f"API 응답 내용: {resp_text}")
-                # except Exception as log_e:
-                #     logger.log_system(f"응답 내용 로깅 중 오류: {str(log_e)}")
-                
+                    request_kwargs = {"json": data}
+
+                # 엔드포인트별 적응형 타임아웃 (초과 시 aiohttp가 연결을 끊어 요청이 남지 않음)
+                timeout_seconds = adaptive_timeouts.get(path, tr_id)
+                sent_at = time.perf_counter()
+                async with session.request(
+                    method.upper(),
+                    url,
+                    headers=default_headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout_seconds),
+                    **request_kwargs
+                ) as response:
+                    status_code = response.status
+                    response_body = await response.read()
+                    response_text = await response.text()
+                    elapsed = time.perf_counter() - sent_at
+                    if metrics is not None:
+                        metrics.observe_response(status_code, elapsed, len(response_body))
+                    if cassette.recording:
+                        cassette.record_rest(method, path, tr_id, params if method.upper() == "GET" else data,
+                                             status_code, response_text, elapsed)
+                    adaptive_timeouts.record_success(path, tr_id)
+
+                    if raise_on_error and status_code not in (200, 500):
+                        response.raise_for_status()
+
+                error_type = None
+                if status_code != 200:
+                    try:
+                        error_body = loads(response_text) if response_text else {}
+                    except json.JSONDecodeError:
+                        error_body = {}
+                    error_type = retry_policy.classify_http_error(status_code, error_body)
+
+                # 서킷 상태 기록 (5xx는 실패, 초당 거래건수 초과는 서버가 응답한 것이므로 성공)
+                if breaker is not None:
+                    if status_code >= 500 and error_type != ERROR_RATE_LIMITED:
+                        breaker.record_failure(f"HTTP {status_code}")
+                    else:
+                        breaker.record_success()
+
+                # 초당 거래건수 초과 등 일시적 오류는 토큰 갱신 없이 백오프 후 재시도
+                if error_type and await backoff(error_type, f"HTTP {status_code} ({error_body.get('msg_cd', '')})"):
+                    continue
+
                 # 500 에러 처리 (서버 내부 오류)
-                if response.status_code == 500:
+                if status_code == 500 and error_type != ERROR_RATE_LIMITED:
                     if token_refresh_attempts >= MAX_TOKEN_REFRESH_ATTEMPTS:
                         error_msg = f"최대 토큰 갱신 시도 횟수({MAX_TOKEN_REFRESH_ATTEMPTS}회) 초과"
                         logger.log_error(Exception(error_msg), error_msg)
@@ -687,18 +522,19 @@ class KISAPIClient:
                             "error_type": "token_refresh_limit_exceeded",
                             "http_status": 500
                         }
-                    
+
                     logger.log_warning(f"500 에러 발생, 토큰 강제 갱신 시도... (시도 {token_refresh_attempts + 1}/{MAX_TOKEN_REFRESH_ATTEMPTS})")
-                    self.access_token = None  # 토큰 초기화
-                    self.token_expire_time = None
-                    
+                    # 사용한 토큰만 무효화 (다른 요청이 이미 갱신한 토큰은 유지)
+                    token_manager.invalidate(token)
+
                     # 토큰 강제 갱신
                     try:
-                        new_token = self._get_access_token()
+                        token = await token_manager.get_token_async()
                         logger.log_system("토큰 강제 갱신 성공")
-                        default_headers["authorization"] = f"Bearer {new_token}"
+                        default_headers["authorization"] = f"Bearer {token}"
                         token_refresh_attempts += 1
-                        time.sleep(1)  # 토큰 갱신 후 짧은 대기
+                        if metrics is not None:
+                            metrics.count_token_refresh()
                         continue  # 새 토큰으로 재시도
                     except Exception as token_error:
                         logger.log_error(token_error, "토큰 강제 갱신 실패")
@@ -713,46 +549,40 @@ class KISAPIClient:
                             }
                         token_refresh_attempts += 1
                         continue
-                
+
                 # 응답 내용 로그 (200이 아닌 경우)
-                if response.status_code != 200:
-                    try:
-                        logger.log_system(f"API 오류 응답 내용: {response.text[:500]}")
-                    except:
-                        logger.log_system("API 오류 응답 텍스트 추출 실패")
-                    
-                    if raise_on_error:
-                        response.raise_for_status()
+                if status_code != 200:
+                    logger.log_system(f"API 오류 응답 내용: {response_text[:500]}")
                     return {
                         "rt_cd": "9999",
-                        "msg1": f"HTTP 에러: {response.status_code}",
+                        "msg1": f"HTTP 에러: {status_code}",
                         "error_type": "http_error",
-                        "http_status": response.status_code,
-                        "response_text": response.text[:1000] if response.text else ""
+                        "http_status": status_code,
+                        "response_text": response_text[:1000] if response_text else ""
                     }
-                
-                # JSON 파싱 시도
+
+                # JSON 파싱 시도 (orjson이 있으면 사용)
                 try:
-                    result = response.json()
+                    result = loads(response_text)
                 except json.JSONDecodeError as json_err:
-                    logger.log_error(json_err, f"JSON 파싱 실패: {response.text[:300]}")
+                    logger.log_error(json_err, f"JSON 파싱 실패: {response_text[:300]}")
                     if raise_on_error:
                         raise
                     return {
                         "rt_cd": "9999",
                         "msg1": "JSON 파싱 실패",
                         "error_type": "json_parse_error",
-                        "http_status": response.status_code,
-                        "response_text": response.text[:1000] if response.text else ""
+                        "http_status": status_code,
+                        "response_text": response_text[:1000] if response_text else ""
                     }
-                
+
                 # rt_cd 누락 처리 (현재 분봉 데이터가 특히 이런 문제가 있음)
                 if "rt_cd" not in result:
                     logger.log_system(f"API 응답에 rt_cd 필드가 없습니다. 응답 키: {list(result.keys())}")
-                    
+
                     # 성공 응답 여부 확인 (일부 API는 다른 필드로 성공 여부를 나타냄)
                     success_indicator = False
-                    
+
                     # 분봉 데이터 요청의 경우 output1과 output2 필드가 있으면 성공으로 간주
                     if is_minute_chart_request and "output1" in result and "output2" in result:
                         success_indicator = True
@@ -764,65 +594,74 @@ class KISAPIClient:
                             success_indicator = True
                             result["rt_cd"] = "0"  # 성공 코드 설정
                             logger.log_system("현재가 응답 구조 확인: output 필드 내 stck_prpr 필드가 존재하여 성공으로 처리")
-                    
+
                     if not success_indicator:
                         logger.log_system(f"API 응답에 성공 여부를 판단할 필드가 없습니다. 응답: {json.dumps(result, indent=2, ensure_ascii=False)[:500]}...")
                         result["rt_cd"] = "9995"
                         result["msg1"] = "API 응답 구조 비정상 (rt_cd 필드 없음)"
                         result["error_type"] = "invalid_response_structure"
-                
+
                 # API 응답 코드 체크
                 if result.get("rt_cd") != "0":
                     # rt_cd 값이 없거나 '0'이 아닌 경우 에러 메시지 처리
                     error_msg = result.get("msg1", "Unknown error")
                     if not error_msg or error_msg.strip() == "":
                         error_msg = "Unknown error (Empty error message)"
-                    
+
                     # 응답 데이터 추가 로깅
                     logger.log_system(f"API 응답 디버깅: {json.dumps(result, indent=2, ensure_ascii=False)[:1000]}...")
-                    
+
+                    # 초당 거래건수 초과는 백오프 후 재시도
+                    if result.get("msg_cd") in RATE_LIMIT_MSG_CODES and await backoff(ERROR_RATE_LIMITED, error_msg):
+                        continue
+
                     # 토큰 관련 에러 키워드
                     token_error_keywords = ["token", "auth", "unauthorized", "인증", "토큰"]
-                    
+
                     # 토큰 관련 에러인 경우 토큰 갱신
                     if error_msg.lower() != "unknown error" and any(keyword in error_msg.lower() for keyword in token_error_keywords):
                         if token_refresh_attempts < MAX_TOKEN_REFRESH_ATTEMPTS:
                             logger.log_warning(f"토큰 관련 에러 발생 ({error_msg}), 토큰 갱신 시도...")
-                            self.access_token = None  # 토큰 초기화
-                            self.token_expire_time = None
-                            
+                            token_manager.invalidate(token)
+
                             # 토큰 재발급 시도
                             try:
-                                new_token = self._get_access_token()
-                                default_headers["authorization"] = f"Bearer {new_token}"
+                                token = await token_manager.get_token_async()
+                                default_headers["authorization"] = f"Bearer {token}"
                                 token_refresh_attempts += 1
-                                time.sleep(1)
+                                if metrics is not None:
+                                    metrics.count_token_refresh()
                                 continue
                             except Exception as token_error:
                                 logger.log_error(token_error, "토큰 재발급 실패")
-                    
+
                     # API 에러 로그
                     rt_cd_value = result.get("rt_cd", "알 수 없음")
+                    if metrics is not None:
+                        metrics.observe_failure(f"rt_cd_{rt_cd_value}", attempted=False)
                     logger.log_error(Exception(f"API error: {error_msg}"), f"API 응답 오류 (rt_cd: {rt_cd_value})")
-                    
+
                     # 예외 발생 대신 오류 정보가 포함된 응답 반환
                     if raise_on_error:
                         raise Exception(f"API error: {error_msg}")
-                    
+
                     # API 에러 정보를 포함한 응답 반환
                     result["error_type"] = "api_error"
                     return result
-                
+
                 # 성공 응답 반환
                 return result
-                
-            except requests.exceptions.Timeout:
-                error_msg = f"요청 타임아웃 ({REQUEST_TIMEOUT}초)"
-                if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 2  # 지수 백오프
-                    logger.log_warning(f"{error_msg}, {wait_time}초 후 재시도...")
-                    time.sleep(wait_time)
-                else:
+
+            except asyncio.TimeoutError:
+                error_msg = f"요청 타임아웃 ({timeout_seconds:.1f}초)"
+                if metrics is not None:
+                    metrics.observe_failure(ERROR_TIMEOUT)
+                adaptive_timeouts.record_timeout(path, tr_id)
+                if breaker is not None:
+                    breaker.record_failure(error_msg)
+                if is_order_request:
+                    logger.log_warning(f"주문 요청 타임아웃 - 중복 주문 방지를 위해 재전송하지 않음 (주문 내역 확인 필요): {path}")
+                if is_order_request or not await backoff(ERROR_TIMEOUT, error_msg):
                     logger.log_error(Exception(error_msg), "요청 타임아웃으로 실패")
                     if raise_on_error:
                         raise
@@ -831,14 +670,21 @@ class KISAPIClient:
                         "msg1": error_msg,
                         "error_type": "timeout"
                     }
-                    
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 2  # 지수 백오프
-                    logger.log_warning(f"요청 실패 ({type(e).__name__}): {str(e)[:200]}, {wait_time}초 후 재시도...")
-                    time.sleep(wait_time)
-                else:
-                    logger.log_error(e, f"요청 실패 (최대 재시도 횟수 {max_retries}회 초과)")
+
+            except aiohttp.ClientError as e:
+                if metrics is not None and not isinstance(e, aiohttp.ClientResponseError):
+                    metrics.observe_failure(ERROR_CONNECTION)
+                if breaker is not None:
+                    if isinstance(e, aiohttp.ClientResponseError) and e.status < 500:
+                        breaker.record_success()
+                    else:
+                        breaker.record_failure(f"{type(e).__name__}: {e}")
+                if raise_on_error and isinstance(e, aiohttp.ClientResponseError):
+                    raise
+                if is_order_request:
+                    logger.log_warning(f"주문 요청 연결 오류 - 중복 주문 방지를 위해 재전송하지 않음 (주문 내역 확인 필요): {path}")
+                if is_order_request or not await backoff(ERROR_CONNECTION, f"요청 실패 ({type(e).__name__}): {str(e)[:200]}"):
+                    logger.log_error(e, f"요청 실패 (재시도 {attempt + 1}회 후 포기)")
                     if raise_on_error:
                         raise
                     return {
@@ -847,7 +693,7 @@ class KISAPIClient:
                         "error_type": "request_exception",
                         "exception_type": type(e).__name__
                     }
-            
+
         # 모든 재시도 실패
         error_msg = f"최대 재시도 횟수({max_retries}회) 초과"
         logger.log_error(Exception(error_msg), error_msg)
@@ -858,9 +704,13 @@ class KISAPIClient:
             "msg1": error_msg,
             "error_type": "max_retries_exceeded"
         }
-    
-    def get_current_price(self, symbol: str) -> Dict[str, Any]:
-        """현재가 조회"""
+
+    async def close(self):
+        """공유 HTTP 세션 및 백그라운드 루프 종료"""
+        await http_session_manager.close()
+
+    def _current_price_request(self, symbol: str):
+        """현재가 조회 요청 정보 (path, headers, params)"""
         path = "/uapi/domestic-stock/v1/quotations/inquire-price"
         headers = {
             "tr_id": "FHKST01010100"
@@ -869,24 +719,70 @@ class KISAPIClient:
             "FID_COND_MRKT_DIV_CODE": "J",  # 주식
             "FID_INPUT_ISCD": symbol
         }
-        
-        #logger.log_system(f"[현재가조회] {symbol} 현재가 조회 시도")
-        # raise_on_error=False로 설정하여 예외를 발생시키지 않고 오류 정보 반환
-        result = self._make_request("GET", path, headers=headers, params=params, raise_on_error=False)
-        
+        return path, headers, params
+
+    def _finish_current_price(self, symbol: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """현재가 조회 결과 후처리"""
         # 결과에 추가 정보 포함
         result["symbol"] = symbol
         result["query_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         if result.get("rt_cd") == "0":
+            quote_cache.update_from_rest(symbol, result.get("output"))
+            # 숫자 변환은 여기서 한 번만 수행 (호출 측은 result["quote"] 사용)
+            result["quote"] = Quote.from_output(symbol, result.get("output"))
             logger.log_system(f"[현재가조회성공] {symbol} 현재가 조회 성공")
         else:
             logger.log_system(f"[현재가조회실패] {symbol} 현재가 조회 실패: {result.get('msg1', '알 수 없는 오류')}")
         
         return result
+
+    def _cached_current_price(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """시세 캐시가 유효하면 현재가 조회 응답 형식으로 반환"""
+        quote = quote_cache.get(symbol, PRICE_FIELDS)
+        if quote is None:
+            return None
+        return {
+            "rt_cd": "0",
+            "msg1": "시세 캐시",
+            "output": quote_cache.to_price_output(quote),
+            "quote": Quote(
+                symbol=symbol,
+                price=quote["current_price"],
+                open=quote["open_price"],
+                high=quote["high_price"],
+                low=quote["low_price"],
+                volume=quote["volume"],
+                change_rate=quote["change_rate"],
+            ),
+            "symbol": symbol,
+            "query_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "source": "cache"
+        }
+
+    def get_current_price(self, symbol: str, use_cache: bool = True) -> Dict[str, Any]:
+        """현재가 조회 (시세 캐시가 유효하면 REST 호출 생략)"""
+        if use_cache:
+            cached = self._cached_current_price(symbol)
+            if cached:
+                return cached
+        path, headers, params = self._current_price_request(symbol)
+        # raise_on_error=False로 설정하여 예외를 발생시키지 않고 오류 정보 반환
+        result = self._make_request("GET", path, headers=headers, params=params, raise_on_error=False)
+        return self._finish_current_price(symbol, result)
     
-    def get_orderbook(self, symbol: str) -> Dict[str, Any]:
-        """호가 조회"""
+    async def get_current_price_async(self, symbol: str, use_cache: bool = True) -> Dict[str, Any]:
+        """현재가 조회 (비동기 버전)"""
+        if use_cache:
+            cached = self._cached_current_price(symbol)
+            if cached:
+                return cached
+        path, headers, params = self._current_price_request(symbol)
+        result = await self._make_request_async("GET", path, headers=headers, params=params, raise_on_error=False)
+        return self._finish_current_price(symbol, result)
+    
+    def _orderbook_request(self, symbol: str):
+        """호가 조회 요청 정보 (path, headers, params)"""
         path = "/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn"
         headers = {
             "tr_id": "FHKST01010200"
@@ -895,17 +791,20 @@ class KISAPIClient:
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": symbol
         }
-        
+        return path, headers, params
+
+    def get_orderbook(self, symbol: str) -> Dict[str, Any]:
+        """호가 조회"""
+        path, headers, params = self._orderbook_request(symbol)
         return self._make_request("GET", path, headers=headers, params=params)
     
-    def get_account_balance(self) -> Dict[str, Any]:
-        """계좌 잔고 조회
-        
-        Returns:
-            Dict[str, Any]: 계좌 잔고 정보를 담은 딕셔너리
-                - output1 (list): 보유 종목 목록 (데이터 타입 변환 처리됨)
-                - output2 (list): 계좌 요약 정보 (예수금 총액, 평가금액 등) (데이터 타입 변환 처리됨)
-        """
+    async def get_orderbook_async(self, symbol: str) -> Dict[str, Any]:
+        """호가 조회 (비동기 버전)"""
+        path, headers, params = self._orderbook_request(symbol)
+        return await self._make_request_async("GET", path, headers=headers, params=params)
+    
+    def _account_balance_request(self):
+        """계좌 잔고 조회 요청 정보 (path, headers, params)"""
         path = "/uapi/domestic-stock/v1/trading/inquire-balance"
         
         # 모의투자 여부 확인
@@ -929,31 +828,48 @@ class KISAPIClient:
             "CTX_AREA_FK100": "",
             "CTX_AREA_NK100": ""
         }
-        
-        try:
-            # API 요청 전 유효한 토큰 확보
-            self._ensure_token()
-                    
-            # API 요청 실행
-            result = self._make_request("GET", path, headers=headers, params=params)
+        return path, headers, params
+
+    def _finish_account_balance(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """계좌 잔고 조회 결과 후처리 (표준화 및 타입 변환)"""
+        if result and result.get("rt_cd") == "0":
+            logger.log_system(f"계좌 정보 조회 성공: {result.get('msg1', '정상')}")
             
-            # 응답 데이터 처리
-            if result and result.get("rt_cd") == "0":
-                logger.log_system(f"계좌 정보 조회 성공: {result.get('msg1', '정상')}")
-                
-                # 응답 데이터 구조 검증 및 표준화
-                standardized_result = self._standardize_balance_result(result)
-                
-                # 데이터 타입 변환 - 문자열 -> 숫자
-                standardized_result = self._convert_balance_data_types(standardized_result)
-                
-                return standardized_result
-            else:
-                error_msg = result.get("msg1", "알 수 없는 오류")
-                logger.log_system(f"계좌 정보 조회 실패: {error_msg}", level="ERROR")
-                
-                # 오류 응답에도 표준 구조 제공
-                return self._create_default_balance_result(error_msg=error_msg)
+            # 응답 데이터 구조 검증 및 표준화
+            standardized_result = self._standardize_balance_result(result)
+            
+            # 데이터 타입 변환 - 문자열 -> 숫자
+            standardized_result = self._convert_balance_data_types(standardized_result)
+            
+            # 보유 종목/계좌 요약 레코드 (호출 측은 문자열 필드 대신 사용)
+            standardized_result["holdings"] = decode_holdings(standardized_result["output1"])
+            standardized_result["summary"] = AccountSummary.from_item(
+                standardized_result["output2"][0] if standardized_result["output2"] else {}
+            )
+            
+            return standardized_result
+        else:
+            error_msg = result.get("msg1", "알 수 없는 오류")
+            logger.log_system(f"계좌 정보 조회 실패: {error_msg}", level="ERROR")
+            
+            # 오류 응답에도 표준 구조 제공
+            return self._create_default_balance_result(error_msg=error_msg)
+
+    def get_account_balance(self) -> Dict[str, Any]:
+        """계좌 잔고 조회
+        
+        Returns:
+            Dict[str, Any]: 계좌 잔고 정보를 담은 딕셔너리
+                - output1 (list): 보유 종목 목록 (데이터 타입 변환 처리됨)
+                - output2 (list): 계좌 요약 정보 (예수금 총액, 평가금액 등) (데이터 타입 변환 처리됨)
+        """
+        try:
+            # API 요청 전 유효한 토큰 확보
+            self._ensure_token()
+            
+            path, headers, params = self._account_balance_request()
+            result = self._make_request("GET", path, headers=headers, params=params)
+            return self._finish_account_balance(result)
         except Exception as e:
             logger.log_error(e, "계좌 정보 조회 중 예외 발생")
             return self._create_default_balance_result(error_msg=str(e))
@@ -971,9 +887,9 @@ class KISAPIClient:
 
     def _ensure_token(self):
         """토큰 유효성 확인 및 필요시 갱신"""
-        if not self.access_token or not self.token_expire_time:
+        if not token_manager.get_cached_token():
             logger.log_system("계좌 정보 조회 전 토큰 발급이 필요합니다.")
-            self._get_access_token()
+            token_manager.get_token()
 
     def _standardize_balance_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """응답 결과 표준화"""
@@ -1051,29 +967,17 @@ class KISAPIClient:
                 "tot_evlu_amt": 0,  # 총 평가금액
                 "scts_evlu_amt": 0,  # 유가증권 평가금액
                 "nass_amt": 0  # 순자산금액
-            }]
+            }],
+            "holdings": [],
+            "summary": AccountSummary(0.0, 0.0, 0.0, 0.0)
         }
 
-    # 비동기 구현 개선 버전
     async def get_account_balance_async(self) -> Dict[str, Any]:
         """계좌 잔고 조회 (비동기 버전)"""
         try:
-            # 비동기 토큰 확보
-            token = await self._get_access_token_async()
-            
-            # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # 동기 함수를 비동기적으로 실행
-            result = await loop.run_in_executor(None, self.get_account_balance)
-            
-            # 결과 반환
-            return result
+            path, headers, params = self._account_balance_request()
+            result = await self._make_request_async("GET", path, headers=headers, params=params)
+            return self._finish_account_balance(result)
         except Exception as e:
             logger.log_error(e, "비동기 계좌 정보 조회 중 오류 발생")
             return self._create_default_balance_result(error_msg=str(e))
@@ -1092,17 +996,7 @@ class KISAPIClient:
         텔레그램 봇 핸들러와의 호환성을 위한 메서드
         """
         try:
-            # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # 동기 함수를 비동기적으로 실행
-            result = await loop.run_in_executor(None, self.get_account_balance)
-            return result
+            return await self.get_account_balance_async()
         except Exception as e:
             logger.log_error(e, "비동기 계좌 정보 조회 중 오류 발생")
             # 오류 발생 시 에러 정보 반환
@@ -1112,9 +1006,12 @@ class KISAPIClient:
                 "output": {}
             }
     
-    def place_order(self, symbol: str, order_type: str, side: str, 
-                      quantity: int, price: int = 0) -> Dict[str, Any]:
-        """주문 실행"""
+    def _check_order_quantity_limits(self, symbol: str, side: str, quantity: int) -> Optional[Dict[str, Any]]:
+        """주문 수량 기본 검증 (API 호출 없음)
+
+        Returns:
+            Optional[Dict[str, Any]]: 거부 시 오류 응답, 통과 시 None
+        """
         # 주문 수량 검증 (추가)
         if quantity <= 0:
             logger.log_system(f"[주문거부] {symbol} {side} 주문 거부 - 수량이 0 이하입니다: {quantity}주")
@@ -1123,11 +1020,11 @@ class KISAPIClient:
                 "msg1": "주문 수량이 0 이하입니다",
                 "output": {}
             }
-        
+
         # 최대 주문 수량 제한 (한국투자증권 기준 100,000주로 설정)
         # 주문 수량이 너무 클 경우 API에서 거부되므로 사전에 체크
         MAX_ORDER_QUANTITY = 10000  # 기본 최대 주문 수량을 10만주에서 1만주로 보수적 설정
-        
+
         if quantity > MAX_ORDER_QUANTITY:
             logger.log_system(f"[주문거부] {symbol} {side} 주문 거부 - 최대 주문 수량({MAX_ORDER_QUANTITY:,}주)을 초과: {quantity:,}주")
             return {
@@ -1135,18 +1032,32 @@ class KISAPIClient:
                 "msg1": f"최대 주문 수량({MAX_ORDER_QUANTITY:,}주)을 초과했습니다",
                 "output": {}
             }
-        
+
+        return None
+
+    def _order_needs_balance(self, side: str, price: int) -> bool:
+        """주문 검증에 계좌 잔고 조회가 필요한지 여부"""
+        return (side.upper() == "BUY" and price > 0) or side.upper() == "SELL"
+
+    def _adjust_order_quantity(self, symbol: str, side: str, quantity: int, price: int,
+                               stock_info: Optional[Dict[str, Any]],
+                               balance_data: Optional[Dict[str, Any]]) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """주문 단위/주문가능금액/보유 수량 기준 주문 수량 검증 및 조정
+
+        Args:
+            stock_info: 종목 기본 정보 조회 결과 (조회 실패 시 None)
+            balance_data: 계좌 잔고 조회 결과 (조회 실패 또는 불필요 시 None)
+
+        Returns:
+            Tuple[int, Optional[Dict[str, Any]]]: (조정된 수량, 거부 시 오류 응답)
+        """
         # 주문 수량 검증 - 추가 조건
         # 한국 시장에서는 일부 종목이 10주, 100주 단위로 거래될 수 있음
+        # 주문 단위 확인 (기본값 1주)
+        order_unit = 1
         try:
-            # 최소 주문 단위 확인 (기본값 1주)
-            min_order_unit = 1
-            # 주문 단위 확인 (기본값 1주)
-            order_unit = 1
-            
             # 종목 정보 조회를 통해 주문 단위 확인 가능하면 조회
-            stock_info = self.get_stock_info(symbol)
-            if stock_info.get("rt_cd") == "0" and "output" in stock_info:
+            if stock_info and stock_info.get("rt_cd") == "0" and "output" in stock_info:
                 # 종목별 주문 단위 정보가 있으면 적용 (API에 따라 필드명이 다를 수 있음)
                 # 필드명 예시: 'unit_trade_qty', 'ord_unit_qty', 'mktd_ord_unpr_unit' 등
                 for field in ["unit_trade_qty", "ord_unit_qty", "mktd_ord_unpr_unit"]:
@@ -1157,36 +1068,33 @@ class KISAPIClient:
                                 break
                         except (ValueError, TypeError):
                             pass
-            
+
             # 주문 단위로 조정
             if order_unit > 1 and quantity % order_unit != 0:
                 adjusted_quantity = (quantity // order_unit) * order_unit
                 logger.log_system(f"[주문수량조정] {symbol} {side} 주문 - 주문 단위({order_unit}주) 조정: {quantity}주 → {adjusted_quantity}주")
-                
+
                 if adjusted_quantity <= 0:
                     logger.log_system(f"[주문거부] {symbol} {side} 주문 거부 - 주문 단위 조정 후 수량이 0입니다.")
-                    return {
+                    return quantity, {
                         "rt_cd": "9999",
                         "msg1": "주문 단위 조정 후 수량이 0입니다",
                         "output": {}
                     }
-                
+
                 quantity = adjusted_quantity
-        
+
         except Exception as unit_e:
             # 주문 단위 검증 실패 시 로그만 남기고 계속 진행
             logger.log_warning(f"주문 단위 검증 중 오류 발생: {str(unit_e)}")
-        
+
         # 매수일 경우 계좌 잔고 확인 (최대 구매 가능 수량 검증)
-        if side.upper() == "BUY" and price > 0:
+        if side.upper() == "BUY" and price > 0 and balance_data is not None:
             try:
-                # 계좌 잔고 조회 - 주문 직전 최신 정보로 강제 갱신
-                balance_data = self.get_account_balance()
-                
                 # 주문가능금액 초기화
                 available_cash = 0
                 ord_psbl_cash = 0  # 실제 주문가능금액
-                
+
                 # 다양한 형식의 응답 처리
                 if isinstance(balance_data, dict):
                     # 주문가능금액(ord_psbl_cash) 필드 찾기 시도 - output2에서 우선 확인
@@ -1209,7 +1117,7 @@ class KISAPIClient:
                             # 예수금 필드 확인
                             if "dnca_tot_amt" in output2:
                                 available_cash = float(output2.get("dnca_tot_amt", "0"))
-                    
+
                     # output1에서도 확인
                     if "output1" in balance_data:
                         output1 = balance_data["output1"]
@@ -1231,98 +1139,101 @@ class KISAPIClient:
                             # 예수금 필드 확인
                             if "dnca_tot_amt" in output1 and available_cash == 0:
                                 available_cash = float(output1.get("dnca_tot_amt", "0"))
-                
+
                 # 최종 주문가능금액 결정 (API가 제공하는 주문가능금액 우선 사용)
                 final_available_cash = ord_psbl_cash if ord_psbl_cash > 0 else available_cash * 0.98
-                
+
                 # 주문 금액 계산 (수수료 고려)
                 order_amount = price * quantity * 1.005  # 0.5% 수수료 고려
-                
+
                 # 최대 주문 금액 제한 (100만원)
                 MAX_ORDER_VALUE = 1000000  # 100만원
                 if order_amount > MAX_ORDER_VALUE:
                     max_units_by_value = int(MAX_ORDER_VALUE / price)
                     max_units_by_value = (max_units_by_value // order_unit) * order_unit if order_unit > 1 else max_units_by_value
-                    
+
                     if max_units_by_value <= 0:
                         logger.log_system(f"[주문거부] {symbol} {side} - 최대 주문 금액({MAX_ORDER_VALUE:,.0f}원) 제한으로 주문 불가: {order_amount:,.0f}원")
-                        return {
+                        return quantity, {
                             "rt_cd": "9999",
                             "msg1": f"최대 주문 금액({MAX_ORDER_VALUE:,.0f}원)을 초과했습니다",
                             "output": {}
                         }
-                    
+
                     logger.log_system(f"[주문수량조정] {symbol} {side} - 최대 주문 금액 제한으로 수량 조정: {quantity}주({order_amount:,.0f}원) → {max_units_by_value}주({max_units_by_value*price:,.0f}원)")
                     quantity = max_units_by_value
                     order_amount = price * quantity * 1.005
-                
+
                 # 주문가능금액 검증
                 if order_amount > final_available_cash:
                     # 주문가능금액 내에서 최대 수량 계산
                     max_quantity = int((final_available_cash / price) / 1.005)
                     max_quantity = (max_quantity // order_unit) * order_unit if order_unit > 1 else max_quantity
-                    
+
                     if max_quantity <= 0:
                         logger.log_system(f"[주문거부] {symbol} {side} - 주문가능금액 부족: 필요={order_amount:,.0f}원, 가능={final_available_cash:,.0f}원")
-                        return {
+                        return quantity, {
                             "rt_cd": "9999",
                             "msg1": "주문가능금액이 부족합니다",
                             "output": {}
                         }
-                    
+
                     # 수량 자동 조정
                     logger.log_system(f"[주문수량조정] {symbol} {side} - 주문가능금액 기준 수량 조정: {quantity}주 → {max_quantity}주")
                     quantity = max_quantity
                     order_amount = price * quantity * 1.005
-                
+
                 logger.log_system(f"[주문검증] {symbol} {side} - 주문 검증 성공: 주문금액={order_amount:,.0f}원, 주문가능금액={final_available_cash:,.0f}원")
-            
+
             except Exception as balance_e:
                 # 계좌 잔고 조회 실패 시 경고만 로깅하고 진행
                 logger.log_warning(f"계좌 잔고 확인 중 오류 발생: {str(balance_e)}")
-        
+
         # 매도인 경우 추가 검증 (보유 수량 확인)
-        elif side.upper() == "SELL":
+        elif side.upper() == "SELL" and balance_data is not None:
             try:
-                # 보유 종목 조회
-                holdings = self.get_account_balance()
                 positions = []
-                
+
                 # 응답 형식에 따른 보유 종목 정보 추출
-                if isinstance(holdings, dict) and "output1" in holdings:
-                    positions = holdings.get("output1", [])
-                elif isinstance(holdings, list):
-                    positions = holdings
-                
+                if isinstance(balance_data, dict) and "output1" in balance_data:
+                    positions = balance_data.get("output1", [])
+                elif isinstance(balance_data, list):
+                    positions = balance_data
+
                 # 보유 수량 확인
                 available_quantity = 0
-                for position in positions:
-                    if isinstance(position, dict) and position.get("pdno") == symbol:
-                        available_quantity = int(position.get("hldg_qty", "0"))
+                for holding in decode_holdings(positions):
+                    if holding.symbol == symbol:
+                        available_quantity = holding.quantity
                         break
-                
+
                 if available_quantity <= 0:
                     logger.log_system(f"[주문거부] {symbol} {side} - 보유 수량이 없습니다")
-                    return {
+                    return quantity, {
                         "rt_cd": "9999",
                         "msg1": "보유 수량이 없습니다",
                         "output": {}
                     }
-                
+
                 if quantity > available_quantity:
                     logger.log_system(f"[주문거부] {symbol} {side} - 보유 수량({available_quantity}주)을 초과하는 주문입니다: {quantity}주")
-                    return {
+                    return quantity, {
                         "rt_cd": "9999",
                         "msg1": "보유 수량을 초과했습니다",
                         "output": {}
                     }
-                
+
             except Exception as position_e:
                 # 보유 종목 조회 실패 시 경고만 로깅
                 logger.log_warning(f"보유 종목 확인 중 오류 발생: {str(position_e)}")
-        
+
+        return quantity, None
+
+    def _build_order_request(self, symbol: str, order_type: str, side: str,
+                             quantity: int, price: int):
+        """주문 요청 정보 (path, headers, data)"""
         path = "/uapi/domestic-stock/v1/trading/order-cash"
-        
+
         # 모의투자 여부 확인
         is_dev = False
         try:
@@ -1332,17 +1243,17 @@ class KISAPIClient:
             logger.log_system(f"주문 실행 - 모의투자 모드: {is_dev} (환경 변수 TEST_MODE: '{test_mode_str}')")
         except Exception as e:
             logger.log_error(e, "TEST_MODE 환경 변수 확인 중 오류")
-        
+
         # 매수/매도 구분 (모의투자/실거래 TR_ID 구분)
         # https://apiportal.koreainvestment.com/apiservice-apiservice?/uapi/domestic-stock/v1/trading/order-cash
         if side.upper() == "BUY":
             tr_id = "TTTC0012U"
         else:
             tr_id = "TTTC0011U"
-        
+
         # 주문 유형 (00: 지정가, 01: 시장가)
         ord_dvsn = "01" if order_type.upper() == "MARKET" else "00"
-        
+
         # 요청 데이터 준비 - 모든 KEY는 대문자로 작성
         data = {
             "CANO": self.account_no[:8],
@@ -1355,7 +1266,7 @@ class KISAPIClient:
             "SLL_TYPE": "01", # 매도유형(01: 일반매도, 02: 원의매매, 05: 대차매도)
             "ALGO_NO": ""     # 알고리즘 주문번호(선택값)
         }
-        
+
         # 헤더 설정
         headers = {
             "content-type": "application/json; charset=utf-8",
@@ -1365,20 +1276,17 @@ class KISAPIClient:
             "tr_id": tr_id,
             "custtype": "P"  # 개인
         }
-        
-        # 해시키 생성 및 헤더에 추가
-        hashkey = self._get_hashkey(data)
-        headers["hashkey"] = hashkey
-        
-        # API 요청 실행 - data를 JSON 문자열로 변환
-        result = self._make_request("POST", path, headers=headers, data=data)
-        
-        # 주문 결과 로깅
+
+        return path, headers, data
+
+    def _log_order_result(self, result: Dict[str, Any], symbol: str, order_type: str,
+                          side: str, quantity: int, price: int) -> Dict[str, Any]:
+        """주문 결과 로깅"""
         if result.get("rt_cd") == "0":
             order_id = result.get("output", {}).get("ODNO")
             logger.log_system(f"[💰 주문성공] {symbol} {side} 주문 성공! - 가격: {price:,}원, 수량: {quantity}주, 주문ID: {order_id}")
             logger.log_trade(
-                action=f"{side}_API", 
+                action=f"{side}_API",
                 symbol=symbol,
                 price=price,
                 quantity=quantity,
@@ -1402,13 +1310,86 @@ class KISAPIClient:
                 reason=f"API 주문 실패: {error_msg}",
                 status="FAILED"
             )
-        
+
         return result
-    
-    def cancel_order(self, order_id: str, symbol: str, quantity: int) -> Dict[str, Any]:
-        """주문 취소"""
+
+    def place_order(self, symbol: str, order_type: str, side: str,
+                      quantity: int, price: int = 0) -> Dict[str, Any]:
+        """주문 실행"""
+        rejected = self._check_order_quantity_limits(symbol, side, quantity)
+        if rejected:
+            return rejected
+
+        # 주문 단위 확인용 종목 정보 조회
+        stock_info = None
+        try:
+            stock_info = self.get_stock_info(symbol)
+        except Exception as unit_e:
+            logger.log_warning(f"주문 단위 검증 중 오류 발생: {str(unit_e)}")
+
+        # 주문가능금액/보유 수량 확인용 계좌 잔고 조회 - 주문 직전 최신 정보로 강제 갱신
+        balance_data = None
+        if self._order_needs_balance(side, price):
+            try:
+                balance_data = self.get_account_balance()
+            except Exception as balance_e:
+                logger.log_warning(f"계좌 잔고 확인 중 오류 발생: {str(balance_e)}")
+
+        quantity, rejected = self._adjust_order_quantity(symbol, side, quantity, price, stock_info, balance_data)
+        if rejected:
+            return rejected
+
+        path, headers, data = self._build_order_request(symbol, order_type, side, quantity, price)
+
+        # 해시키 생성 및 헤더에 추가
+        headers["hashkey"] = self._get_hashkey(data)
+
+        # API 요청 실행
+        result = self._make_request("POST", path, headers=headers, data=data)
+
+        return self._log_order_result(result, symbol, order_type, side, quantity, price)
+
+    async def place_order_async(self, symbol: str, order_type: str, side: str,
+                                quantity: int, price: int = 0) -> Dict[str, Any]:
+        """주문 실행 (비동기 버전)"""
+        rejected = self._check_order_quantity_limits(symbol, side, quantity)
+        if rejected:
+            return rejected
+
+        # 종목 정보와 계좌 잔고를 동시에 조회
+        fetches = [self.get_stock_info_async(symbol)]
+        if self._order_needs_balance(side, price):
+            fetches.append(self.get_account_balance_async())
+        fetched = await asyncio.gather(*fetches, return_exceptions=True)
+
+        stock_info = fetched[0]
+        if isinstance(stock_info, Exception):
+            logger.log_warning(f"주문 단위 검증 중 오류 발생: {str(stock_info)}")
+            stock_info = None
+
+        balance_data = fetched[1] if len(fetched) > 1 else None
+        if isinstance(balance_data, Exception):
+            logger.log_warning(f"계좌 잔고 확인 중 오류 발생: {str(balance_data)}")
+            balance_data = None
+
+        quantity, rejected = self._adjust_order_quantity(symbol, side, quantity, price, stock_info, balance_data)
+        if rejected:
+            return rejected
+
+        path, headers, data = self._build_order_request(symbol, order_type, side, quantity, price)
+
+        # 해시키 생성 및 헤더에 추가
+        headers["hashkey"] = await self._get_hashkey_async(data)
+
+        # API 요청 실행
+        result = await self._make_request_async("POST", path, headers=headers, data=data)
+
+        return self._log_order_result(result, symbol, order_type, side, quantity, price)
+
+    def _build_cancel_request(self, order_id: str):
+        """주문 취소 요청 정보 (path, headers, data)"""
         path = "/uapi/domestic-stock/v1/trading/order-rvsecncl"
-        
+
         # 모의투자 여부 확인
         is_dev = False
         try:
@@ -1418,10 +1399,10 @@ class KISAPIClient:
             logger.log_system(f"주문 취소 - 모의투자 모드: {is_dev} (환경 변수 TEST_MODE: '{test_mode_str}')")
         except Exception as e:
             logger.log_error(e, "TEST_MODE 환경 변수 확인 중 오류")
-        
+
         # TR ID 설정 (모의투자:VTTC0803U / 실거래:TTTC0803U)
         tr_id = "TTTC0803U" if not is_dev else "VTTC0803U"
-        
+
         # 요청 데이터 준비 - 모든 KEY는 대문자로 작성
         data = {
             "CANO": self.account_no[:8],
@@ -1434,7 +1415,7 @@ class KISAPIClient:
             "ORD_UNPR": "0",
             "QTY_ALL_ORD_YN": "Y"  # 전량주문여부
         }
-        
+
         # 헤더 설정
         headers = {
             "content-type": "application/json; charset=utf-8",
@@ -1444,19 +1425,16 @@ class KISAPIClient:
             "tr_id": tr_id,
             "custtype": "P"  # 개인
         }
-        
-        # 해시키 생성 및 헤더에 추가
-        hashkey = self._get_hashkey(data)
-        headers["hashkey"] = hashkey
-        
-        # API 요청 실행
-        result = self._make_request("POST", path, headers=headers, data=data)
-        
-        # 주문 취소 결과 로깅
+
+        return path, headers, data
+
+    def _log_cancel_result(self, result: Dict[str, Any], order_id: str, symbol: str,
+                           quantity: int) -> Dict[str, Any]:
+        """주문 취소 결과 로깅"""
         if result.get("rt_cd") == "0":
             logger.log_system(f"[💰 주문취소성공] 주문ID: {order_id} 취소 성공!")
             logger.log_trade(
-                action="CANCEL_ORDER", 
+                action="CANCEL_ORDER",
                 symbol=symbol,
                 quantity=quantity,
                 order_id=order_id,
@@ -1478,11 +1456,35 @@ class KISAPIClient:
                 reason=f"API 주문 취소 실패: {error_msg}",
                 status="FAILED"
             )
-        
+
         return result
-    
-    def get_order_history(self, start_date: str = None, end_date: str = None) -> Dict[str, Any]:
-        """주문 내역 조회"""
+
+    def cancel_order(self, order_id: str, symbol: str, quantity: int) -> Dict[str, Any]:
+        """주문 취소"""
+        path, headers, data = self._build_cancel_request(order_id)
+
+        # 해시키 생성 및 헤더에 추가
+        headers["hashkey"] = self._get_hashkey(data)
+
+        # API 요청 실행
+        result = self._make_request("POST", path, headers=headers, data=data)
+
+        return self._log_cancel_result(result, order_id, symbol, quantity)
+
+    async def cancel_order_async(self, order_id: str, symbol: str, quantity: int) -> Dict[str, Any]:
+        """주문 취소 (비동기 버전)"""
+        path, headers, data = self._build_cancel_request(order_id)
+
+        # 해시키 생성 및 헤더에 추가
+        headers["hashkey"] = await self._get_hashkey_async(data)
+
+        # API 요청 실행
+        result = await self._make_request_async("POST", path, headers=headers, data=data)
+
+        return self._log_cancel_result(result, order_id, symbol, quantity)
+
+    def _order_history_request(self, start_date: str = None, end_date: str = None):
+        """주문 내역 조회 요청 정보 (path, headers, params)"""
         if not start_date:
             start_date = datetime.now().strftime("%Y%m%d")
         if not end_date:
@@ -1528,30 +1530,51 @@ class KISAPIClient:
             "CTX_AREA_FK100": "",
             "CTX_AREA_NK100": ""
         }
-        
+        return path, headers, params
+
+    @staticmethod
+    def _finish_order_history(result: Dict[str, Any], start_date: str, end_date: str) -> Dict[str, Any]:
+        """주문 내역 조회 결과 로그"""
+        if result and result.get("rt_cd") == "0":
+            logger.log_system(f"주문 내역 조회 성공: {start_date}~{end_date}")
+        else:
+            error_msg = result.get("msg1", "알 수 없는 오류")
+            logger.log_system(f"주문 내역 조회 실패: {error_msg}")
+        return result
+
+    @staticmethod
+    def _order_history_error(e: Exception) -> Dict[str, Any]:
+        """주문 내역 조회 오류 시 기본 결과"""
+        logger.log_error(e, "주문 내역 조회 중 오류 발생")
+        return {
+            "rt_cd": "9999", 
+            "msg1": f"주문 내역 조회 실패: {str(e)}", 
+            "output": [],
+            "ctx_area_fk100": "",
+            "ctx_area_nk100": ""
+        }
+
+    def get_order_history(self, start_date: str = None, end_date: str = None) -> Dict[str, Any]:
+        """주문 내역 조회"""
         try:
-            # API 요청 실행
+            path, headers, params = self._order_history_request(start_date, end_date)
             result = self._make_request("GET", path, headers=headers, params=params)
-            
-            if result and result.get("rt_cd") == "0":
-                logger.log_system(f"주문 내역 조회 성공: {start_date}~{end_date}")
-            else:
-                error_msg = result.get("msg1", "알 수 없는 오류")
-                logger.log_system(f"주문 내역 조회 실패: {error_msg}")
-            
-            return result
+            return self._finish_order_history(result, params["INQR_STRT_DT"], params["INQR_END_DT"])
         except Exception as e:
-            logger.log_error(e, "주문 내역 조회 중 오류 발생")
-            return {
-                "rt_cd": "9999", 
-                "msg1": f"주문 내역 조회 실패: {str(e)}", 
-                "output": [],
-                "ctx_area_fk100": "",
-                "ctx_area_nk100": ""
-            }
+            return self._order_history_error(e)
+
+    async def get_order_history_async(self, start_date: str = None, end_date: str = None) -> Dict[str, Any]:
+        """주문 내역 조회 (비동기 버전)"""
+        try:
+            path, headers, params = self._order_history_request(start_date, end_date)
+            result = await self._make_request_async("GET", path, headers=headers, params=params)
+            return self._finish_order_history(result, params["INQR_STRT_DT"], params["INQR_END_DT"])
+        except Exception as e:
+            return self._order_history_error(e)
     
-    def get_stock_info(self, symbol: str) -> Dict[str, Any]:
-        """종목 기본 정보 조회"""
+    
+    def _stock_info_request(self, symbol: str):
+        """종목 기본 정보 조회 요청 정보 (path, headers, params)"""
         path = "/uapi/domestic-stock/v1/quotations/search-stock-info"
         headers = {
             "tr_id": "CTPF1002R"
@@ -1560,178 +1583,203 @@ class KISAPIClient:
             "PRDT_TYPE_CD": "300",  # 주식/ETF/ETN
             "PDNO": symbol
         }
-        
+        return path, headers, params
+
+    def get_stock_info(self, symbol: str) -> Dict[str, Any]:
+        """종목 기본 정보 조회"""
+        path, headers, params = self._stock_info_request(symbol)
         return self._make_request("GET", path, headers=headers, params=params)
-    
-    def get_minute_price(self, symbol: str, time_unit: str = "1") -> Dict[str, Any]:
-        """
-        분봉 차트 데이터 조회 (한국투자증권 API)
-        Args:
-            symbol: 종목코드
-            time_unit: 분봉 단위 (1, 3, 5, 10, 15, 30, 60)
-        Returns:
-            API 응답 데이터
-        """
+
+    async def get_stock_info_async(self, symbol: str) -> Dict[str, Any]:
+        """종목 기본 정보 조회 (비동기 버전)"""
+        path, headers, params = self._stock_info_request(symbol)
+        return await self._make_request_async("GET", path, headers=headers, params=params)
+
+    def _minute_price_request(self, symbol: str, time_unit: str):
+        """분봉 차트 조회 요청 정보 (path, headers, params)"""
         path = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
         headers = {
             "tr_id": "FHKST03010200",
             "custtype": "P",
             "content-type": "application/json"
         }
-        
+
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",  # 시장구분코드 J:주식, ETF, ETN
             "FID_INPUT_ISCD": symbol,        # 종목코드
-            "FID_INPUT_HOUR_1": time_unit,   # 입력 시간1 (분봉단위)
+            "FID_INPUT_HOUR_1": time_unit,   # 입력 시간1 (조회 기준 시각 HHMMSS, 이 시각 이전 30건)
             "FID_PW_DATA_INCU_YN": "Y",     # 과거데이터 포함여부 (Y:포함, N:미포함)
             "FID_ETC_CLS_CODE": ""          # 기타 구분 코드 (필수 파라미터)
         }
-        
-        try:
-            # 모든 설정 정보 로깅
-            # logger.log_system(f"[분봉조회설정] 기본URL: {self.base_url}, 앱키 존재: {bool(self.app_key)}, 계좌번호 존재: {bool(self.account_no)}")
-            # logger.log_system(f"[분봉조회설정] 전체 URL: {self.base_url}{path}")
-            
-            # 요청 전에 현재 인증 상태 확인
-            if hasattr(self, 'access_token'):
-                logger.log_system(f"현재 액세스 토큰: {self.access_token[:10]}... (토큰 만료: {datetime.fromtimestamp(self.token_expire_time).strftime('%Y-%m-%d %H:%M:%S') if self.token_expire_time else 'None'})")
-            
-            # 종목 정보 로그
-            logger.log_system(f"[분봉조회] {symbol} {time_unit}분봉 데이터 조회 시도")
-            
-            # API 요청 전에 토큰 확인
-            if not self.access_token or not self.token_expire_time:
-                logger.log_system("[분봉조회] 토큰이 없어 새로 발급합니다")
-                self._get_access_token()
-            
-            # 요청 매개변수 로깅
-            # logger.log_system(f"[분봉조회] 요청 헤더: {headers}")
-            # logger.log_system(f"[분봉조회] 요청 파라미터: {params}")
-            
-            # API 요청 실행 - raise_on_error=False로 설정하여 예외 대신 오류 정보 반환
-            result = self._make_request("GET", path, headers=headers, params=params, raise_on_error=False)
-            
-            # API 오류 확인 및 처리
-            if result.get("rt_cd") != "0":
-                logger.log_system(f"[분봉조회실패] {symbol} {time_unit}분봉 데이터 조회 실패. 오류: {result.get('msg1', '알 수 없음')}, 오류 유형: {result.get('error_type', '알 수 없음')}")
-                
-                # 결과에 종목 및 시간 정보 추가
-                result["symbol"] = symbol
-                result["time_unit"] = time_unit
-                result["query_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                return result
-            
-            # 응답 로깅 (디버깅용)
-            if 'output2' in result and isinstance(result['output2'], list):
-                #logger.log_system(f"[분봉조회] 분봉 데이터 건수: {len(result['output2'])}")
-                # 첫 번째 데이터 항목 구조만 로깅
-                if result['output2']:
-                    logger.log_system(f"[분봉조회] 첫 번째 데이터 항목: {result['output2'][0] if len(result['output2']) > 0 else '없음'}")
-            else:
-                # output2가 없는 경우 전체 응답 구조 로깅
-                logger.log_system(f"[분봉조회] 응답 구조: {list(result.keys())}")
-            
-            # 성공 로그 기록
-            #chart_items = result.get("output2", [])
-            #logger.log_system(f"[분봉조회성공] {symbol} {time_unit}분봉 데이터 조회 성공: {len(chart_items)}개 데이터")
-            
-            # 메타데이터 추가
-            result["symbol"] = symbol
-            result["time_unit"] = time_unit
-            result["query_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            return result
-            
-        except Exception as e:
-            # 예외 발생 시 디버깅 정보 추가
-            logger.log_error(e, f"[분봉조회예외] {symbol} {time_unit}분봉 데이터 조회 중 예외 발생: {str(e)}, 유형: {type(e)}")
-            
-            # 상세 예외 정보 출력
-            import traceback
-            logger.log_error(e, f"[분봉조회예외] 상세 예외 정보: {traceback.format_exc()}")
-            
-            # 오류 발생 시 구조화된 응답 반환
-            return {
-                "rt_cd": "9999", 
-                "msg1": str(e),
-                "error_type": str(type(e)),
-                "symbol": symbol,
-                "time_unit": time_unit,
-                "query_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "output1": {},
-                "output2": []
-            }
-    
-    def get_daily_price(self, symbol: str, period: str = "D", count: int = 30) -> Dict[str, Any]:
+
+        # 종목 정보 로그
+        logger.log_system(f"[분봉조회] {symbol} {time_unit} 이전 분봉 데이터 조회 시도")
+
+        return path, headers, params
+
+    def _finish_minute_price(self, symbol: str, time_unit: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """분봉 차트 조회 결과 후처리"""
+        # API 오류 확인 및 처리
+        if result.get("rt_cd") != "0":
+            logger.log_system(f"[분봉조회실패] {symbol} {time_unit} 분봉 데이터 조회 실패. 오류: {result.get('msg1', '알 수 없음')}, 오류 유형: {result.get('error_type', '알 수 없음')}")
+        elif 'output2' in result and isinstance(result['output2'], list):
+            # 첫 번째 데이터 항목 구조만 로깅
+            if result['output2']:
+                logger.log_system(f"[분봉조회] 첫 번째 데이터 항목: {result['output2'][0]}")
+        else:
+            # output2가 없는 경우 전체 응답 구조 로깅
+            logger.log_system(f"[분봉조회] 응답 구조: {list(result.keys())}")
+
+        # 메타데이터 추가
+        result["symbol"] = symbol
+        result["time_unit"] = time_unit
+        result["query_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        return result
+
+    def _minute_price_error(self, symbol: str, time_unit: str, e: Exception) -> Dict[str, Any]:
+        """분봉 차트 조회 예외 시 구조화된 응답 생성"""
+        # 예외 발생 시 디버깅 정보 추가
+        logger.log_error(e, f"[분봉조회예외] {symbol} {time_unit} 분봉 데이터 조회 중 예외 발생: {str(e)}, 유형: {type(e)}")
+
+        # 상세 예외 정보 출력
+        import traceback
+        logger.log_error(e, f"[분봉조회예외] 상세 예외 정보: {traceback.format_exc()}")
+
+        # 오류 발생 시 구조화된 응답 반환
+        return {
+            "rt_cd": "9999",
+            "msg1": str(e),
+            "error_type": str(type(e)),
+            "symbol": symbol,
+            "time_unit": time_unit,
+            "query_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "output1": {},
+            "output2": []
+        }
+
+    def get_minute_price(self, symbol: str, time_unit: str = None) -> Dict[str, Any]:
         """
-        일봉 차트 데이터 조회 (한국투자증권 API)
+        당일 1분봉 차트 데이터 조회 (한국투자증권 API, 한 번에 30건)
+        
+        당일 분봉 전체가 필요하면 core.minute_bars.minute_bar_service를 사용한다.
+        
         Args:
             symbol: 종목코드
-            period: 일봉 구분 (D:일봉, W:주봉, M:월봉)
-            count: 요청할 데이터 개수 (최대 100)
+            time_unit: 조회 기준 시각 (HHMMSS, 이 시각 이전 분봉을 최신순으로 반환, 기본값 현재 시각)
         Returns:
             API 응답 데이터
         """
+        time_unit = time_unit or datetime.now().strftime("%H%M%S")
+        try:
+            path, headers, params = self._minute_price_request(symbol, time_unit)
+            # API 요청 실행 - raise_on_error=False로 설정하여 예외 대신 오류 정보 반환
+            result = self._make_request("GET", path, headers=headers, params=params, raise_on_error=False)
+            return self._finish_minute_price(symbol, time_unit, result)
+        except Exception as e:
+            return self._minute_price_error(symbol, time_unit, e)
+
+    async def get_minute_price_async(self, symbol: str, time_unit: str = None) -> Dict[str, Any]:
+        """당일 1분봉 차트 데이터 조회 (비동기 버전)"""
+        time_unit = time_unit or datetime.now().strftime("%H%M%S")
+        try:
+            path, headers, params = self._minute_price_request(symbol, time_unit)
+            result = await self._make_request_async("GET", path, headers=headers, params=params, raise_on_error=False)
+            return self._finish_minute_price(symbol, time_unit, result)
+        except Exception as e:
+            return self._minute_price_error(symbol, time_unit, e)
+
+    def _daily_price_request(self, symbol: str, period: str, count: int,
+                             start_date: str = "", end_date: str = ""):
+        """일봉 차트 조회 요청 정보 (path, headers, params)"""
         path = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
         headers = {
             "tr_id": "FHKST03010100",
             "custtype": "P"
         }
-        
+
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",  # 시장구분코드 J:주식, ETF, ETN
             "FID_INPUT_ISCD": symbol,        # 종목코드
             "FID_PERIOD_DIV_CODE": period,   # 기간분류코드 (D:일봉, W:주봉, M:월봉)
             "FID_ORG_ADJ_PRC": "0",          # 수정주가 원주가 가격 여부 (0:수정주가, 1:원주가)
-            "FID_INPUT_DATE_1": "",          # 입력일자1 (YYYYMMDD)
-            "FID_INPUT_DATE_2": "",          # 입력일자2 (YYYYMMDD)
+            "FID_INPUT_DATE_1": start_date,  # 입력일자1 (YYYYMMDD, 조회 시작일)
+            "FID_INPUT_DATE_2": end_date,    # 입력일자2 (YYYYMMDD, 조회 종료일)
             "FID_DAY_1": count               # 요청 데이터 개수 (최대 100)
         }
-        
+        return path, headers, params
+
+    def _finish_daily_price(self, symbol: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """일봉 차트 조회 결과 로깅"""
+        if result.get("rt_cd") == "0":
+            chart_items = result.get("output2", [])
+            logger.log_system(f"{symbol} 일봉 데이터 조회 성공: {len(chart_items)}개 데이터")
+        else:
+            error_msg = result.get("msg1", "Unknown error")
+            logger.log_error(Exception(error_msg), f"{symbol} 일봉 데이터 조회 실패: {error_msg}")
+
+        return result
+
+    def _daily_price_error(self, symbol: str, e: Exception) -> Dict[str, Any]:
+        """일봉 차트 조회 예외 시 빈 응답 생성"""
+        logger.log_error(e, f"{symbol} 일봉 데이터 조회 중 예외 발생")
+        # 오류 발생 시 빈 응답 반환
+        return {
+            "rt_cd": "9999",
+            "msg1": str(e),
+            "output1": {},
+            "output2": []
+        }
+
+    def get_daily_price(self, symbol: str, period: str = "D", count: int = 30,
+                        start_date: str = "", end_date: str = "") -> Dict[str, Any]:
+        """
+        일봉 차트 데이터 조회 (한국투자증권 API)
+        Args:
+            symbol: 종목코드
+            period: 일봉 구분 (D:일봉, W:주봉, M:월봉)
+            count: 요청할 데이터 개수 (최대 100)
+            start_date: 조회 시작일 (YYYYMMDD)
+            end_date: 조회 종료일 (YYYYMMDD)
+        Returns:
+            API 응답 데이터
+        """
         try:
+            path, headers, params = self._daily_price_request(symbol, period, count, start_date, end_date)
             result = self._make_request("GET", path, headers=headers, params=params)
-            
-            # 성공 로그 기록
-            if result.get("rt_cd") == "0":
-                output1 = result.get("output1", {})
-                chart_items = result.get("output2", [])
-                logger.log_system(f"{symbol} 일봉 데이터 조회 성공: {len(chart_items)}개 데이터")
-            else:
-                error_msg = result.get("msg1", "Unknown error")
-                logger.log_error(Exception(error_msg), f"{symbol} 일봉 데이터 조회 실패: {error_msg}")
-            
-            return result
-            
+            return self._finish_daily_price(symbol, result)
         except Exception as e:
-            logger.log_error(e, f"{symbol} 일봉 데이터 조회 중 예외 발생")
-            # 오류 발생 시 빈 응답 반환
-            return {
-                "rt_cd": "9999", 
-                "msg1": str(e),
-                "output1": {},
-                "output2": []
-            }
+            return self._daily_price_error(symbol, e)
 
+    async def get_daily_price_async(self, symbol: str, period: str = "D", count: int = 30,
+                                    start_date: str = "", end_date: str = "") -> Dict[str, Any]:
+        """일봉 차트 데이터 조회 (비동기 버전)"""
+        try:
+            path, headers, params = self._daily_price_request(symbol, period, count, start_date, end_date)
+            result = await self._make_request_async("GET", path, headers=headers, params=params)
+            return self._finish_daily_price(symbol, result)
+        except Exception as e:
+            return self._daily_price_error(symbol, e)
 
-    def get_market_trading_volume(self, 
-                                market_code: str = "J", 
-                                screen_code: str = "20171", 
-                                symbol: str = "0000",  # 0000(전체) 기타(업종코드)
-                                div_cls_code: str = "0", # 0(전체) 1(보통주) 2(우선주)
-                                blng_cls_code: str = "4", # 0 : 평균거래량 1:거래증가율 2:평균거래회전율 3:거래금액순 4:평균거래금액회전율
-                                trgt_cls_code: str = "111111111",  # 1 or 0 9자리 (차례대로 증거금 30% 40% 50% 60% 100% 신용보증금 30% 40% 50% 60%) ex) "111111111"
-                                trgt_exls_cls_code: str = "0000000000", 
-                                input_price_1: str = "", 
-                                input_price_2: str = "", 
-                                vol_cnt: str = "", 
-                                input_date_1: str = "") -> Dict[str, Any]:
-
+    def _market_trading_volume_request(self,
+                                       market_code: str = "J",
+                                       screen_code: str = "20171",
+                                       symbol: str = "0000",  # 0000(전체) 기타(업종코드)
+                                       div_cls_code: str = "0", # 0(전체) 1(보통주) 2(우선주)
+                                       blng_cls_code: str = "4", # 0 : 평균거래량 1:거래증가율 2:평균거래회전율 3:거래금액순 4:평균거래금액회전율
+                                       trgt_cls_code: str = "111111111",  # 1 or 0 9자리 (차례대로 증거금 30% 40% 50% 60% 100% 신용보증금 30% 40% 50% 60%) ex) "111111111"
+                                       trgt_exls_cls_code: str = "0000000000",
+                                       input_price_1: str = "",
+                                       input_price_2: str = "",
+                                       vol_cnt: str = "",
+                                       input_date_1: str = ""):
+        """거래량 순위 조회 요청 정보 (path, headers, params)"""
         path = "/uapi/domestic-stock/v1/quotations/volume-rank"
         headers = {
             "tr_id": "FHPST01710000",
             "custtype": "P"
         }
-        
+
         params = {
             "FID_COND_MRKT_DIV_CODE": market_code,      # 조건 시장 분류 코드
             "FID_COND_SCR_DIV_CODE": screen_code,       # 조건 화면 분류 코드
@@ -1745,165 +1793,72 @@ class KISAPIClient:
             "FID_VOL_CNT": vol_cnt,                     # 거래량 수
             "FID_INPUT_DATE_1": input_date_1            # 입력 날짜1
         }
-        
+        return path, headers, params
+
+    def _finish_market_trading_volume(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """거래량 순위 조회 결과 로깅"""
+        if result.get("rt_cd") == "0":
+            # API 문서에 따른 올바른 키로 접근
+            output = result.get("output", [])
+            if output:
+                logger.log_system(f"거래량 상위 종목 조회 성공: {len(output)}개 데이터")
+                # 첫 번째 항목 구조 로그
+                logger.log_system(f"첫 항목 구조: {output[0] if output else '{}'}")
+            else:
+                logger.log_system("거래량 상위 종목 조회: 데이터 없음")
+                # 출력 구조 로그
+                for key in result.keys():
+                    logger.log_system(f"API 응답 {key}: {result[key]}")
+        else:
+            error_msg = result.get("msg1", "Unknown error")
+            logger.log_error(Exception(error_msg), f"거래량 상위 종목 조회 실패: {error_msg}")
+            # API 오류 응답 구조 기록
+            logger.log_system(f"API 오류 응답: {result}")
+
+        return result
+
+    def _market_trading_volume_error(self, e: Exception) -> Dict[str, Any]:
+        """거래량 순위 조회 예외 시 빈 응답 생성"""
+        logger.log_error(e, "거래량 상위 종목 조회 중 예외 발생")
+        # 오류 발생 시 API 응답 형식에 맞는 빈 응답 반환
+        logger.log_system(f"거래량 상위 조회 예외 발생: {str(e)}")
+        return {
+            "rt_cd": "9999",
+            "msg_cd": "9999",
+            "msg1": str(e),
+            "output": []  # 빈 배열로 초기화 (API 응답 형식에 맞춤)
+        }
+
+    def get_market_trading_volume(self, **kwargs) -> Dict[str, Any]:
+        """거래량 순위 조회 (인자는 _market_trading_volume_request 참조)"""
         # 재시도 횟수 증가 (기본 3회 대신 5회로 증가)
         api_max_retries = 5
-        
+
         try:
-            #logger.log_system(f"거래량 상위 조회 API 요청: market_code={market_code}, screen_code={screen_code}, top_n={vol_cnt}")
+            path, headers, params = self._market_trading_volume_request(**kwargs)
             result = self._make_request("GET", path, headers=headers, params=params, max_retries=api_max_retries)
-            
-            # API 응답 구조 로그
-            #logger.log_system(f"거래량 상위 API 원본 응답: {json.dumps(result, indent=2, ensure_ascii=False)[:1000]}...")
-            #logger.log_system(f"거래량 상위 API 응답 구조: 키={list(result.keys())}")
-            
-            # 성공 로그 기록
-            if result.get("rt_cd") == "0":
-                # API 문서에 따른 올바른 키로 접근
-                output = result.get("output", [])
-                if output:
-                    logger.log_system(f"거래량 상위 종목 조회 성공: {len(output)}개 데이터")
-                    # 첫 번째 항목 구조 로그
-                    logger.log_system(f"첫 항목 구조: {output[0] if output else '{}'}")  
-                else:
-                    logger.log_system("거래량 상위 종목 조회: 데이터 없음")
-                    # 출력 구조 로그
-                    for key in result.keys():
-                        logger.log_system(f"API 응답 {key}: {result[key]}")
-            else:
-                error_msg = result.get("msg1", "Unknown error")
-                logger.log_error(Exception(error_msg), f"거래량 상위 종목 조회 실패: {error_msg}")
-                # API 오류 응답 구조 기록
-                logger.log_system(f"API 오류 응답: {result}")
-            
-            return result
-            
+            return self._finish_market_trading_volume(result)
         except Exception as e:
-            logger.log_error(e, "거래량 상위 종목 조회 중 예외 발생")
-            # 오류 발생 시 API 응답 형식에 맞는 빈 응답 반환
-            logger.log_system(f"거래량 상위 조회 예외 발생: {str(e)}")
-            return {
-                "rt_cd": "9999", 
-                "msg_cd": "9999",
-                "msg1": str(e),
-                "output": []  # 빈 배열로 초기화 (API 응답 형식에 맞춤)
-            }
+            return self._market_trading_volume_error(e)
+
+    async def get_market_trading_volume_async(self, **kwargs) -> Dict[str, Any]:
+        """거래량 순위 조회 (비동기 버전)"""
+        # 재시도 횟수 증가 (기본 3회 대신 5회로 증가)
+        api_max_retries = 5
 
-    async def get_symbol_info(self, symbol: str) -> Dict[str, Any]:
-        """종목 정보 조회 (비동기 버전)"""
-        # 기본 응답 생성 헬퍼 함수
-        def create_default_response(error_suffix="", error_msg=""):
-            return {
-                "symbol": symbol,
-                "name": f"{symbol} ({error_suffix})" if error_suffix else symbol,
-                "current_price": 0,
-                "open_price": 0,
-                "high_price": 0,
-                "low_price": 0,
-                "prev_close": 0,
-                "volume": 0,
-                "change_rate": 0,
-                "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "error": error_msg
-            }
-        
-        # 안전하게 숫자 변환하는 헬퍼 함수
-        def safe_convert(value, converter, default=0):
-            try:
-                return converter(value) if value else default
-            except (ValueError, TypeError):
-                return default
-        
         try:
-            # 디버깅 로그 추가
-            logger.log_system(f"[API] 종목 정보 조회 시작: {symbol}")
-            
-            # 비동기로 토큰 확보
-            await self._get_access_token_async()
-            
-            path = "/uapi/domestic-stock/v1/quotations/inquire-price"
-            headers = {"tr_id": "FHKST01010100"}
-            params = {
-                "FID_COND_MRKT_DIV_CODE": "J",
-                "FID_INPUT_ISCD": symbol
-            }
-            
-            # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                # 현재 스레드에 이벤트 루프가 없는 경우 새로 생성
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # 동기 함수를 비동기적으로 실행
-            result = await loop.run_in_executor(
-                None, 
-                lambda: self._make_request("GET", path, headers=headers, params=params, max_retries=3)
-            )
-            
-            # 응답 검증
-            if result.get("rt_cd") != "0":
-                error_msg = result.get("msg1", "알 수 없는 오류")
-                logger.log_system(f"[API] {symbol} 종목 정보 조회 실패: {error_msg}")
-                return create_default_response("조회실패", error_msg)
-            
-            # output 필드 확인
-            if "output" not in result:
-                logger.log_system(f"[API] {symbol} 응답에 'output' 필드가 없습니다. 응답 키: {list(result.keys())}")
-                return create_default_response("형식오류", "API 응답에 'output' 필드가 없습니다")
-            
-            output = result["output"]
-            
-            try:
-                # 데이터 안전하게 추출 및 변환
-                response_data = {
-                    "symbol": symbol,
-                    "name": output.get("rprs_mrkt_kor_name", "Unknown"),
-                    "current_price": safe_convert(output.get("stck_prpr"), float),
-                    "open_price": safe_convert(output.get("stck_oprc"), float),
-                    "high_price": safe_convert(output.get("stck_hgpr"), float),
-                    "low_price": safe_convert(output.get("stck_lwpr"), float),
-                    "prev_close": safe_convert(output.get("stck_sdpr"), float),
-                    "volume": safe_convert(output.get("acml_vol"), int),
-                    "change_rate": safe_convert(output.get("prdy_ctrt"), float),
-                    "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-                
-                logger.log_system(f"[API] {symbol} 종목 정보 조회 성공: 종목명 '{response_data['name']}', 현재가 {response_data['current_price']:,}원")
-                return response_data
-                
-            except Exception as e:
-                logger.log_error(e, f"[API] {symbol} 가격 데이터 변환 오류")
-                # 오류 정보 자세히 기록
-                for field_name, field_value in [
-                    ("rprs_mrkt_kor_name", output.get("rprs_mrkt_kor_name")),
-                    ("stck_prpr", output.get("stck_prpr")),
-                    ("stck_oprc", output.get("stck_oprc")),
-                    ("stck_hgpr", output.get("stck_hgpr")),
-                    ("stck_lwpr", output.get("stck_lwpr")),
-                    ("stck_sdpr", output.get("stck_sdpr")),
-                    ("acml_vol", output.get("acml_vol")),
-                    ("prdy_ctrt", output.get("prdy_ctrt"))
-                ]:
-                    logger.log_system(f"[API] {field_name}: {field_value} (타입: {type(field_value)})")
-                
-                return create_default_response("변환오류", f"데이터 변환 오류: {str(e)}")
-        
-        except requests.Timeout:
-            logger.log_system(f"[API] {symbol} 종목 정보 조회 타임아웃 발생")
-            return create_default_response("타임아웃", "API 요청 타임아웃")
-        
-        except requests.RequestException as e:
-            logger.log_error(e, f"[API] {symbol} 종목 정보 조회 요청 오류")
-            return create_default_response("요청오류", f"API 요청 오류: {str(e)}")
-        
+            path, headers, params = self._market_trading_volume_request(**kwargs)
+            result = await self._make_request_async("GET", path, headers=headers, params=params, max_retries=api_max_retries)
+            return self._finish_market_trading_volume(result)
         except Exception as e:
-            logger.log_error(e, f"[API] {symbol} 종목 정보 조회 중 오류 발생")
-            return create_default_response("오류", f"예외 발생: {str(e)}")
+            return self._market_trading_volume_error(e)
 
     def get_trading_status(self, symbol: str) -> Dict[str, Any]:
-        """종목의 거래 정지 여부 확인
+        """종목의 거래 정지 여부 확인 (동기 래퍼, 반환값은 get_trading_status_async 참조)"""
+        return http_session_manager.run_sync(self.get_trading_status_async(symbol))
+
+    async def get_trading_status_async(self, symbol: str) -> Dict[str, Any]:
+        """종목의 거래 정지 여부 확인 (비동기 버전)
         
         Args:
             symbol: 종목 코드
@@ -1915,11 +1870,8 @@ class KISAPIClient:
                     - status: 거래 상태 ("NORMAL": 정상, "SUSPENDED": 거래 정지)
         """
         try:
-            # 토큰 확인
-            self._ensure_token()
-            
             # 종목 정보 API로 거래 정지 여부 확인
-            stock_info = self.get_stock_info(symbol)
+            stock_info = await self.get_stock_info_async(symbol)
             
             # 응답 코드 확인
             if stock_info.get("rt_cd") != "0":
@@ -1951,7 +1903,8 @@ class KISAPIClient:
             
             # 현재가 데이터로 추가 확인
             try:
-                price_data = self.get_current_price(symbol)
+                # 거래정지 플래그는 REST 응답에만 있으므로 캐시 사용 안 함
+                price_data = await self.get_current_price_async(symbol, use_cache=False)
                 if price_data.get("rt_cd") == "0":
                     price_output = price_data.get("output", {})
                     # 거래 정지 관련 추가 필드 확인
@@ -1990,7 +1943,11 @@ class KISAPIClient:
             }
     
     def get_trading_restrictions(self, symbol: str) -> Dict[str, Any]:
-        """종목의 매도 제한 여부 확인
+        """종목의 매도 제한 여부 확인 (동기 래퍼, 반환값은 get_trading_restrictions_async 참조)"""
+        return http_session_manager.run_sync(self.get_trading_restrictions_async(symbol))
+
+    async def get_trading_restrictions_async(self, symbol: str) -> Dict[str, Any]:
+        """종목의 매도 제한 여부 확인 (비동기 버전)
         
         Args:
             symbol: 종목 코드
@@ -2003,11 +1960,8 @@ class KISAPIClient:
                     - reason: 매도 제한 사유 (있는 경우)
         """
         try:
-            # 토큰 확인
-            self._ensure_token()
-            
             # 종목 정보 API로 매도 제한 여부 확인
-            stock_info = self.get_stock_info(symbol)
+            stock_info = await self.get_stock_info_async(symbol)
             
             # 응답 코드 확인
             if stock_info.get("rt_cd") != "0":
@@ -2085,12 +2039,21 @@ class KISAPIClient:
                 "error": error_msg
             }
         
-        # 안전하게 숫자 변환하는 헬퍼 함수
-        def safe_convert(value, converter, default=0):
-            try:
-                return converter(value) if value else default
-            except (ValueError, TypeError):
-                return default
+        # 실시간 틱으로 갱신된 시세 캐시가 유효하면 REST 호출 생략
+        cached = quote_cache.get(symbol, SYMBOL_INFO_FIELDS)
+        if cached:
+            return {
+                "symbol": symbol,
+                "name": cached["name"],
+                "current_price": cached["current_price"],
+                "open_price": cached["open_price"],
+                "high_price": cached["high_price"],
+                "low_price": cached["low_price"],
+                "prev_close": cached["prev_close"],
+                "volume": cached["volume"],
+                "change_rate": cached["change_rate"],
+                "updated_at": cached["updated_at"]
+            }
         
         try:
             # 디버깅 로그 추가
@@ -2099,19 +2062,10 @@ class KISAPIClient:
             # 비동기로 토큰 확보
             await self._get_access_token_async()
             
-            path = "/uapi/domestic-stock/v1/quotations/inquire-price"
-            headers = {"tr_id": "FHKST01010100"}
-            params = {
-                "FID_COND_MRKT_DIV_CODE": "J",
-                "FID_INPUT_ISCD": symbol
-            }
+            path, headers, params = self._current_price_request(symbol)
             
-            # 동기 함수를 비동기적으로 실행
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, 
-                lambda: self._make_request("GET", path, headers=headers, params=params, max_retries=3)
-            )
+            # 공유 세션을 통한 비동기 요청 (동시 현재가 조회와 병합됨)
+            result = await self._make_request_async("GET", path, headers=headers, params=params, max_retries=3)
             
             # 응답 검증
             if result.get("rt_cd") != "0":
@@ -2125,47 +2079,31 @@ class KISAPIClient:
                 return create_default_response("형식오류", "API 응답에 'output' 필드가 없습니다")
             
             output = result["output"]
+            quote_cache.update_from_rest(symbol, output)
             
-            try:
-                # 데이터 안전하게 추출 및 변환
-                response_data = {
-                    "symbol": symbol,
-                    "name": output.get("rprs_mrkt_kor_name", "Unknown"),
-                    "current_price": safe_convert(output.get("stck_prpr"), float),
-                    "open_price": safe_convert(output.get("stck_oprc"), float),
-                    "high_price": safe_convert(output.get("stck_hgpr"), float),
-                    "low_price": safe_convert(output.get("stck_lwpr"), float),
-                    "prev_close": safe_convert(output.get("stck_sdpr"), float),
-                    "volume": safe_convert(output.get("acml_vol"), int),
-                    "change_rate": safe_convert(output.get("prdy_ctrt"), float),
-                    "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-                
-                logger.log_system(f"[API] {symbol} 종목 정보 조회 성공: 종목명 '{response_data['name']}', 현재가 {response_data['current_price']:,}원")
-                return response_data
-                
-            except Exception as e:
-                logger.log_error(e, f"[API] {symbol} 가격 데이터 변환 오류")
-                # 오류 정보 자세히 기록
-                for field_name, field_value in [
-                    ("rprs_mrkt_kor_name", output.get("rprs_mrkt_kor_name")),
-                    ("stck_prpr", output.get("stck_prpr")),
-                    ("stck_oprc", output.get("stck_oprc")),
-                    ("stck_hgpr", output.get("stck_hgpr")),
-                    ("stck_lwpr", output.get("stck_lwpr")),
-                    ("stck_sdpr", output.get("stck_sdpr")),
-                    ("acml_vol", output.get("acml_vol")),
-                    ("prdy_ctrt", output.get("prdy_ctrt"))
-                ]:
-                    logger.log_system(f"[API] {field_name}: {field_value} (타입: {type(field_value)})")
-                
-                return create_default_response("변환오류", f"데이터 변환 오류: {str(e)}")
+            # 숫자 필드는 Quote 생성 시 한 번만 변환 (변환 실패 필드는 0)
+            quote = Quote.from_output(symbol, output) or Quote(symbol, 0.0)
+            response_data = {
+                "symbol": symbol,
+                "name": output.get("rprs_mrkt_kor_name", "Unknown"),
+                "current_price": quote.price,
+                "open_price": quote.open,
+                "high_price": quote.high,
+                "low_price": quote.low,
+                "prev_close": quote.prev_close,
+                "volume": quote.volume,
+                "change_rate": quote.change_rate,
+                "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            
+            logger.log_system(f"[API] {symbol} 종목 정보 조회 성공: 종목명 '{response_data['name']}', 현재가 {response_data['current_price']:,}원")
+            return response_data
         
-        except requests.Timeout:
+        except asyncio.TimeoutError:
             logger.log_system(f"[API] {symbol} 종목 정보 조회 타임아웃 발생")
             return create_default_response("타임아웃", "API 요청 타임아웃")
         
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             logger.log_error(e, f"[API] {symbol} 종목 정보 조회 요청 오류")
             return create_default_response("요청오류", f"API 요청 오류: {str(e)}")
         
@@ -2173,6 +2111,59 @@ class KISAPIClient:
             logger.log_error(e, f"[API] {symbol} 종목 정보 조회 중 오류 발생")
             return create_default_response("오류", f"예외 발생: {str(e)}")
 
+    async def gather_by_symbol(self, symbols: List[str], fetch, max_concurrency: int = None,
+                               timeout: float = None) -> Dict[str, Dict[str, Any]]:
+        """종목별 비동기 조회를 동시 실행하여 {종목: 결과} 반환
+
+        Args:
+            symbols: 종목코드 목록 (중복은 한 번만 조회)
+            fetch: 종목코드를 받아 결과 딕셔너리를 반환하는 코루틴 함수
+            max_concurrency: 최대 동시 실행 수 (기본값 MULTI_QUOTE_CONCURRENCY)
+            timeout: 종목별 타임아웃 (초, None이면 무제한)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 종목별 결과. 실패한 종목은 {"symbol", "error"}를 포함
+        """
+        unique_symbols = list(dict.fromkeys(s for s in symbols if s))
+        if not unique_symbols:
+            return {}
+
+        # 속도 제한기가 실제 전송 속도를 조절하므로 여기서는 동시 대기 코루틴 수만 제한
+        semaphore = asyncio.Semaphore(max_concurrency or self.MULTI_QUOTE_CONCURRENCY)
+
+        async def run_one(symbol: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    if timeout:
+                        return await asyncio.wait_for(fetch(symbol), timeout=timeout)
+                    return await fetch(symbol)
+                except asyncio.TimeoutError:
+                    return {"symbol": symbol, "error": f"조회 타임아웃 ({timeout}초)"}
+                except Exception as e:
+                    logger.log_error(e, f"[API] {symbol} 조회 중 오류 발생")
+                    return {"symbol": symbol, "error": str(e)}
+
+        results = await asyncio.gather(*(run_one(symbol) for symbol in unique_symbols))
+        return dict(zip(unique_symbols, results))
+
+    async def get_symbol_info_many(self, symbols: List[str], max_concurrency: int = None,
+                                   timeout: float = None) -> Dict[str, Dict[str, Any]]:
+        """여러 종목 정보 동시 조회
+
+        Args:
+            symbols: 종목코드 목록
+            max_concurrency: 최대 동시 실행 수
+            timeout: 종목별 타임아웃 (초)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {종목코드: get_symbol_info 결과}.
+                실패한 종목은 결과에 "error" 필드가 채워짐
+        """
+        started_at = time.time()
+        results = await self.gather_by_symbol(symbols, self.get_symbol_info, max_concurrency, timeout)
+        failed = sum(1 for info in results.values() if info.get("error"))
+        logger.log_system(f"[API] 종목 정보 일괄 조회 완료: {len(results)}개 (실패 {failed}개, {time.time() - started_at:.2f}초)")
+        return results
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,360 @@
+"""
+REST 클라이언트 계측 (엔드포인트별 지연 시간 히스토그램, 상태 코드/오류/재시도 통계)
+
+path + tr_id 단위로 기록하며 JSON 또는 Prometheus 텍스트 형식으로 내보낼 수 있다.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+from utils.logger import logger
+
+# 지연 시간 히스토그램 버킷 상한 (초)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 속도 제한 대기 시간 히스토그램 버킷 상한 (초)
+WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# 요약에 포함할 백분위
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """누적 버킷 히스토그램 + 최근 표본 (백분위 계산용)
+
+    버킷 카운트는 시작 이후 누적(Prometheus 히스토그램), 백분위는 최근 window개 표본 기준이다.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS, window: int = 1024):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value: float):
+        """표본 1건 기록"""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def percentiles(self, qs: Sequence[int] = PERCENTILES) -> Dict[str, float]:
+        """최근 표본 기준 백분위 {"p50": 초, ...} (표본이 없으면 빈 딕셔너리)"""
+        if not self.recent:
+            return {}
+        values = np.percentile(np.fromiter(self.recent, dtype=np.float64), qs)
+        return {f"p{q}": float(v) for q, v in zip(qs, values)}
+
+    def cumulative_counts(self) -> List[int]:
+        """버킷별 누적 카운트 (le 기준, 마지막은 +Inf)"""
+        return np.cumsum(self.bucket_counts).tolist()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+            **self.percentiles(),
+        }
+
+
+class EndpointMetrics:
+    """단일 엔드포인트(path + tr_id) 계측 값"""
+
+    def __init__(self, path: str, tr_id: Optional[str]):
+        self.path = path
+        self.tr_id = tr_id or ""
+        self.latency = LatencyHistogram(LATENCY_BUCKETS)
+        self.rate_limit_wait = LatencyHistogram(WAIT_BUCKETS)
+        self.calls = 0                          # 호출 수 (재시도 포함 1건)
+        self.attempts = 0                       # 실제 HTTP 전송 수
+        self.statuses: Dict[int, int] = {}      # {HTTP 상태 코드: 수}
+        self.errors: Dict[str, int] = {}        # {오류 유형: 수}
+        self.retries: Dict[str, int] = {}       # {오류 유형: 재시도 수}
+        self.token_refreshes = 0
+        self.response_bytes = 0
+        self.max_response_bytes = 0
+        self._metrics_lock = threading.Lock()
+
+    def observe_response(self, status: int, seconds: float, size: int):
+        """응답 수신 기록 (전송 시작부터 본문 수신까지)"""
+        with self._metrics_lock:
+            self.attempts += 1
+            self.latency.observe(seconds)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.response_bytes += size
+            self.max_response_bytes = max(self.max_response_bytes, size)
+
+    def observe_failure(self, error_type: str, attempted: bool = True):
+        """오류 기록 (attempted가 True면 HTTP 전송 시도 1건 포함)"""
+        with self._metrics_lock:
+            if attempted:
+                self.attempts += 1
+            self.errors[error_type] = self.errors.get(error_type, 0) + 1
+
+    def observe_wait(self, seconds: float):
+        """속도 제한 대기 시간 기록"""
+        with self._metrics_lock:
+            self.rate_limit_wait.observe(seconds)
+
+    def latency_quantile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """최근 표본 기준 지연 시간 백분위 (초, 표본이 min_samples 미만이면 None)"""
+        with self._metrics_lock:
+            if len(self.latency.recent) < min_samples:
+                return None
+            return float(np.percentile(np.fromiter(self.latency.recent, dtype=np.float64), q))
+
+    def count_call(self):
+        with self._metrics_lock:
+            self.calls += 1
+
+    def count_retry(self, error_type: str):
+        with self._metrics_lock:
+            self.retries[error_type] = self.retries.get(error_type, 0) + 1
+
+    def count_token_refresh(self):
+        with self._metrics_lock:
+            self.token_refreshes += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._metrics_lock:
+            return {
+                "path": self.path,
+                "tr_id": self.tr_id,
+                "calls": self.calls,
+                "attempts": self.attempts,
+                "latency": self.latency.to_dict(),
+                "statuses": {str(code): count for code, count in sorted(self.statuses.items())},
+                "errors": dict(self.errors),
+                "retries": dict(self.retries),
+                "token_refreshes": self.token_refreshes,
+                "response_bytes": self.response_bytes,
+                "max_response_bytes": self.max_response_bytes,
+                "rate_limit_wait": self.rate_limit_wait.to_dict(),
+            }
+
+
+class ApiMetrics:
+    """REST 클라이언트 계측 관리자
+
+    - _send_request_async가 엔드포인트별로 응답 지연/상태 코드/오류/재시도/토큰 갱신/응답 크기/속도 제한 대기를 기록
+    - get_metrics()는 메모리 상의 값을, dump()는 JSON/Prometheus 파일을 생성
+    - 속도 제한기, 재시도 정책, 서킷 브레이커 등 관련 모듈의 통계도 함께 포함
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.enabled = True
+            self._endpoints: Dict[str, EndpointMetrics] = {}
+            self._registry_lock = threading.Lock()
+            self.started_at = time.time()
+
+            self._initialized = True
+
+    def endpoint(self, path: str, tr_id: Optional[str] = None) -> EndpointMetrics:
+        """엔드포인트 계측 객체 반환 (없으면 생성)"""
+        key = f"{path}|{tr_id or ''}"
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            with self._registry_lock:
+                metrics = self._endpoints.get(key)
+                if metrics is None:
+                    metrics = EndpointMetrics(path, tr_id)
+                    self._endpoints[key] = metrics
+        return metrics
+
+    def _snapshot(self) -> List[EndpointMetrics]:
+        with self._registry_lock:
+            return list(self._endpoints.values())
+
+    def reset(self):
+        """계측 값 초기화 (장 시작 전 등)"""
+        with self._registry_lock:
+            self._endpoints.clear()
+            self.started_at = time.time()
+
+    @staticmethod
+    def _component_metrics() -> Dict[str, Any]:
+        """관련 모듈 통계 수집"""
+        from core.rate_limiter import rate_limiter
+        from core.retry_policy import retry_policy
+        from core.circuit_breaker import circuit_breakers
+        from core.request_coalescer import request_coalescer
+        from core.quote_cache import quote_cache
+        from core.token_manager import token_manager
+        from core.adaptive_timeout import adaptive_timeouts
+        from core.websocket_client import ws_client
+        from core.tick_bus import tick_bus
+        from core.ws_pool import ws_pool
+        from core.subscription_manager import subscription_manager
+        from core.gap_filler import gap_filler
+        from core.order_book import order_books
+        from core.order_tracker import order_tracker
+
+        return {
+            "rate_limiter": rate_limiter.get_metrics(),
+            "retry_policy": retry_policy.get_stats(),
+            "circuit_breakers": circuit_breakers.get_metrics(),
+            "request_coalescer": request_coalescer.get_stats(),
+            "quote_cache": quote_cache.get_stats(),
+            "token_manager": token_manager.get_status(),
+            "adaptive_timeouts": adaptive_timeouts.get_stats(),
+            "ws_dispatch": ws_client.get_dispatch_stats(),
+            "tick_bus": tick_bus.get_stats(),
+            "ws_pool": ws_pool.get_stats(),
+            "subscription_manager": subscription_manager.get_stats(),
+            "gap_filler": gap_filler.get_stats(),
+            "order_books": order_books.get_stats(),
+            "order_tracker": order_tracker.get_stats(),
+        }
+
+    def get_metrics(self, include_components: bool = True) -> Dict[str, Any]:
+        """전체 계측 값 반환
+
+        Args:
+            include_components: True면 속도 제한기/재시도/서킷 등 관련 모듈 통계 포함
+        """
+        endpoints = sorted((m.to_dict() for m in self._snapshot()), key=lambda m: (m["path"], m["tr_id"]))
+        totals = {
+            "calls": sum(m["calls"] for m in endpoints),
+            "attempts": sum(m["attempts"] for m in endpoints),
+            "errors": sum(sum(m["errors"].values()) for m in endpoints),
+            "retries": sum(sum(m["retries"].values()) for m in endpoints),
+            "token_refreshes": sum(m["token_refreshes"] for m in endpoints),
+            "response_bytes": sum(m["response_bytes"] for m in endpoints),
+            "rate_limit_wait": round(sum(m["rate_limit_wait"]["sum"] for m in endpoints), 6),
+        }
+        metrics = {
+            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "uptime": round(time.time() - self.started_at, 1),
+            "totals": totals,
+            "endpoints": endpoints,
+        }
+        if include_components:
+            metrics["components"] = self._component_metrics()
+        return metrics
+
+    def to_json(self, include_components: bool = True) -> str:
+        """계측 값을 JSON 문자열로 반환"""
+        return json.dumps(self.get_metrics(include_components), ensure_ascii=False, indent=2, default=str)
+
+    def to_prometheus(self) -> str:
+        """계측 값을 Prometheus 텍스트 형식으로 반환"""
+        lines = []
+
+        def header(name: str, metric_type: str, help_text: str):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        def labels(metrics: EndpointMetrics, **extra) -> str:
+            pairs = {"path": metrics.path, "tr_id": metrics.tr_id, **extra}
+            return ",".join(f'{k}="{v}"' for k, v in pairs.items())
+
+        endpoints = self._snapshot()
+
+        def histogram(name: str, help_text: str, attr: str):
+            header(name, "histogram", help_text)
+            for metrics in endpoints:
+                with metrics._metrics_lock:
+                    hist = getattr(metrics, attr)
+                    cumulative = hist.cumulative_counts()
+                    bounds = [str(b) for b in hist.buckets] + ["+Inf"]
+                    for bound, count in zip(bounds, cumulative):
+                        lines.append(f"{name}_bucket{{{labels(metrics, le=bound)}}} {count}")
+                    lines.append(f"{name}_sum{{{labels(metrics)}}} {hist.sum:.6f}")
+                    lines.append(f"{name}_count{{{labels(metrics)}}} {hist.count}")
+
+        def counter(name: str, help_text: str, attr: str, label: str = None):
+            header(name, "counter", help_text)
+            for metrics in endpoints:
+                with metrics._metrics_lock:
+                    value = getattr(metrics, attr)
+                    if label is None:
+                        lines.append(f"{name}{{{labels(metrics)}}} {value}")
+                    else:
+                        for key, count in sorted(value.items()):
+                            lines.append(f"{name}{{{labels(metrics, **{label: key})}}} {count}")
+
+        histogram("kis_api_request_duration_seconds", "KIS REST response latency", "latency")
+        header("kis_api_request_duration_quantile_seconds", "gauge", "KIS REST latency percentiles over recent samples")
+        for metrics in endpoints:
+            with metrics._metrics_lock:
+                for name, value in metrics.latency.percentiles().items():
+                    quantile = int(name[1:]) / 100
+                    lines.append(f"kis_api_request_duration_quantile_seconds{{{labels(metrics, quantile=quantile)}}} {value:.6f}")
+        histogram("kis_api_rate_limit_wait_seconds", "Time spent waiting on the rate limiter", "rate_limit_wait")
+        counter("kis_api_calls_total", "KIS REST calls (retries counted once)", "calls")
+        counter("kis_api_attempts_total", "KIS REST HTTP attempts", "attempts")
+        counter("kis_api_responses_total", "KIS REST responses by HTTP status", "statuses", "status")
+        counter("kis_api_errors_total", "KIS REST errors by type", "errors", "type")
+        counter("kis_api_retries_total", "KIS REST retries by error type", "retries", "type")
+        counter("kis_api_token_refreshes_total", "Token refreshes triggered by API errors", "token_refreshes")
+        counter("kis_api_response_bytes_total", "KIS REST response payload bytes", "response_bytes")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, directory: str = None, prefix: str = "api_metrics") -> Dict[str, str]:
+        """JSON/Prometheus 파일로 저장
+
+        Args:
+            directory: 저장 디렉토리 (기본값: 로그 디렉토리)
+            prefix: 파일명 접두사
+
+        Returns:
+            {"json": 경로, "prometheus": 경로}
+        """
+        if directory is None:
+            from config.settings import config, LoggingConfig
+            directory = getattr(config.get("logging", LoggingConfig()), "log_dir", "logs")
+        os.makedirs(directory, exist_ok=True)
+
+        paths = {
+            "json": os.path.join(directory, f"{prefix}.json"),
+            "prometheus": os.path.join(directory, f"{prefix}.prom"),
+        }
+        with open(paths["json"], "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+        with open(paths["prometheus"], "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        return paths
+
+    def log_summary(self, top: int = 10):
+        """지연 시간 상위 엔드포인트 요약 로그"""
+        endpoints = [m for m in self.get_metrics(include_components=False)["endpoints"] if m["latency"]["count"]]
+        endpoints.sort(key=lambda m: m["latency"].get("p95", 0.0), reverse=True)
+        for m in endpoints[:top]:
+            latency = m["latency"]
+            logger.log_system(
+                f"[API계측] {m['tr_id'] or m['path']} 호출 {m['calls']}회 | "
+                f"p50 {latency.get('p50', 0) * 1000:.0f}ms p95 {latency.get('p95', 0) * 1000:.0f}ms "
+                f"p99 {latency.get('p99', 0) * 1000:.0f}ms | 재시도 {sum(m['retries'].values())} "
+                f"오류 {sum(m['errors'].values())} | 대기 {m['rate_limit_wait']['sum']:.2f}초"
+            )
+
+
+# 싱글톤 인스턴스
+api_metrics = ApiMetrics()
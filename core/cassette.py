@@ -0,0 +1,395 @@
+"""
+KIS API 트래픽 기록/재생 (카세트)
+
+실제 세션의 REST 응답과 웹소켓 프레임을 gzip JSON Lines 파일로 기록하고,
+네트워크 없이 KISAPIClient / KISWebSocketClient를 통해 그대로 재생한다.
+재생 시에도 응답 파싱, 재시도, 계측, 전략, 주문 수량 계산 등 이후 경로는 모두 실제 코드가 실행된다.
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple, List
+from urllib.parse import urlsplit
+
+from utils.logger import logger
+
+CASSETTE_VERSION = 1
+
+# 이벤트 종류
+EVENT_REST = "r"
+EVENT_WS = "w"
+
+# 요청 파라미터가 정확히 일치하지 않을 때 사용할 보조 키 필드 (시각/날짜 파라미터는 재생 시점마다 달라짐)
+LOOSE_KEY_FIELDS = ("FID_INPUT_ISCD", "PDNO", "ORGN_ODNO")
+
+MISS_BODY = json.dumps({"rt_cd": "1", "msg_cd": "CASSETTE", "msg1": "기록된 응답이 없습니다."}, ensure_ascii=False)
+
+
+def _request_keys(method: str, path: str, tr_id: Optional[str], payload: Optional[Dict]) -> Tuple[str, str]:
+    """(정확 키, 보조 키) 생성"""
+    payload = payload or {}
+    base = f"{method.upper()} {path} {tr_id or ''}"
+    exact = base + " " + json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    loose = base + " " + "|".join(str(payload.get(name, "")) for name in LOOSE_KEY_FIELDS)
+    return exact, loose
+
+
+class _RecordedResponse:
+    """기록된 REST 응답 (aiohttp ClientResponse 대체)"""
+
+    def __init__(self, method: str, url: str, status: int, body: str):
+        self.method = method
+        self.url = url
+        self.status = status
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body.encode("utf-8")
+
+    async def text(self) -> str:
+        return self._body
+
+    async def json(self) -> Any:
+        return json.loads(self._body)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            import aiohttp
+            raise aiohttp.ClientResponseError(None, (), status=self.status, message=self._body[:200])
+
+
+class _ReplayRequest:
+    """session.request(...) 반환값 (async with 지원)"""
+
+    def __init__(self, cassette: "Cassette", method: str, url: str, kwargs: Dict[str, Any]):
+        self._cassette = cassette
+        self._method = method
+        self._url = url
+        self._kwargs = kwargs
+
+    async def __aenter__(self) -> _RecordedResponse:
+        return await self._cassette._replay_response(self._method, self._url, self._kwargs)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class ReplaySession:
+    """재생용 HTTP 세션 (aiohttp.ClientSession 중 KISAPIClient가 사용하는 부분만 구현)"""
+
+    def __init__(self, cassette: "Cassette"):
+        self._cassette = cassette
+        self.closed = False
+
+    def request(self, method: str, url: str, **kwargs) -> _ReplayRequest:
+        return _ReplayRequest(self._cassette, method.upper(), url, kwargs)
+
+    def get(self, url: str, **kwargs) -> _ReplayRequest:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> _ReplayRequest:
+        return self.request("POST", url, **kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
+class ReplayWebSocket:
+    """재생용 웹소켓 연결 (websockets 연결 객체 중 KISWebSocketClient가 사용하는 부분만 구현)
+
+    실제 서버처럼 첫 구독 요청을 보낸 뒤부터 프레임을 반환한다(재생 시계도 이때 시작).
+    프레임은 기록 당시 간격(speed 배속)으로 반환하고, 소진되면 close() 전까지 대기한다.
+    재연결해도 같은 큐와 재생 시계를 이어서 사용한다.
+    """
+
+    def __init__(self, cassette: "Cassette"):
+        self._cassette = cassette
+        self._closed_event = asyncio.Event()
+        self._subscribed = asyncio.Event()
+        self.closed = False
+        self.sent: List[str] = []
+        if cassette._ws_started is not None:
+            self._subscribed.set()
+
+    async def recv(self) -> str:
+        cassette = self._cassette
+        await self._subscribed.wait()
+        if not cassette._frames:
+            cassette._ws_finished.set()
+            await self._closed_event.wait()
+            import websockets
+            raise websockets.exceptions.ConnectionClosedOK(None, None)
+
+        offset, frame = cassette._frames.popleft()
+        if cassette.speed > 0:
+            delay = cassette._ws_started + (offset - cassette._ws_origin) / cassette.speed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        else:
+            # 최대 속도 재생에서도 다른 태스크(전략, 주문)가 실행될 기회를 줌
+            await asyncio.sleep(0)
+        cassette.stats["ws_frames"] += 1
+        return frame
+
+    async def send(self, message: str):
+        self.sent.append(message)
+        # PINGPONG 등은 무시하고 구독 요청(tr_key 포함)부터 프레임 전송 시작
+        if "tr_key" not in message:
+            return
+        if self._cassette._ws_started is None:
+            self._cassette._ws_started = time.monotonic()
+        self._subscribed.set()
+
+    async def ping(self):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+    async def close(self):
+        self.closed = True
+        self._closed_event.set()
+
+
+class Cassette:
+    """KIS API 트래픽 기록/재생 관리자
+
+    - record(path): _send_request_async의 응답(상태 코드, 본문, 지연 시간)과 웹소켓 수신 프레임을 기록
+    - replay(path, speed): ReplaySession / ReplayWebSocket으로 네트워크를 대체
+      (speed=1.0은 기록 당시 간격 그대로, 0이면 대기 없이 최대 속도)
+    - 같은 요청은 기록 순서대로 응답하고, 소진되면 마지막 응답을 반복
+    - 요청 파라미터가 다르면(조회 시각 등) 종목코드 기준 보조 키로 찾고, 그래도 없으면 HTTP 404 응답
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.mode = "off"               # off / record / replay
+            self.path: Optional[str] = None
+            self.speed = 1.0
+            self.flush_interval = 1.0       # 기록 파일 flush 간격 (초)
+
+            self._file = None
+            self._write_lock = threading.Lock()
+            self._started = 0.0
+            self._last_flush = 0.0
+
+            # 재생 데이터 {키: deque[(상태 코드, 본문, 지연 시간)]}
+            self._exact: Dict[str, deque] = {}
+            self._loose: Dict[str, deque] = {}
+            self._last: Dict[str, Tuple[int, str, float]] = {}
+            self._frames: deque = deque()       # [(기록 시각, 프레임)]
+            self._ws_origin = 0.0
+            self._ws_started: Optional[float] = None
+            self._ws_finished = asyncio.Event()
+            self._rate_limiter_enabled = None
+
+            self.stats = self._empty_stats()
+            self._initialized = True
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {"rest_recorded": 0, "ws_recorded": 0, "rest_replayed": 0,
+                "rest_loose_hits": 0, "rest_misses": 0, "ws_frames": 0}
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    # --- 기록 ---
+    def record(self, path: str = None):
+        """기록 시작 (기존 파일이 있으면 이어서 기록하지 않고 새로 생성)"""
+        self.stop()
+        if path is None:
+            from config.settings import config, LoggingConfig
+            directory = getattr(config.get("logging", LoggingConfig()), "log_dir", "logs")
+            path = os.path.join(directory, f"cassette_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.path = path
+        self.stats = self._empty_stats()
+        self._started = time.monotonic()
+        self._last_flush = self._started
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._write({"v": CASSETTE_VERSION, "started": datetime.now().isoformat()})
+        self.mode = "record"
+        logger.log_system(f"[카세트] 기록 시작: {path}")
+        return path
+
+    def _write(self, event: Dict[str, Any]):
+        line = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+        with self._write_lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._last_flush = now
+
+    def record_rest(self, method: str, path: str, tr_id: Optional[str], payload: Optional[Dict],
+                    status: int, body: str, latency: float):
+        """REST 응답 기록"""
+        if not self.recording:
+            return
+        self._write({
+            "t": round(time.monotonic() - self._started, 6), "k": EVENT_REST,
+            "m": method.upper(), "p": path, "tr": tr_id or "", "q": payload or {},
+            "s": status, "l": round(latency, 6), "b": body,
+        })
+        self.stats["rest_recorded"] += 1
+
+    def record_ws(self, frame):
+        """웹소켓 수신 프레임 기록"""
+        if not self.recording:
+            return
+        if isinstance(frame, bytes):
+            frame = frame.decode("utf-8", errors="replace")
+        self._write({"t": round(time.monotonic() - self._started, 6), "k": EVENT_WS, "d": frame})
+        self.stats["ws_recorded"] += 1
+
+    # --- 재생 ---
+    def replay(self, path: str, speed: float = 1.0):
+        """카세트 파일을 읽어 재생 모드로 전환
+
+        Args:
+            path: 기록 파일 경로
+            speed: 재생 배속 (1.0=실시간, 0=최대 속도)
+        """
+        self.stop()
+        exact: Dict[str, deque] = {}
+        loose: Dict[str, deque] = {}
+        frames: List[Tuple[float, str]] = []
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                event = json.loads(line)
+                kind = event.get("k")
+                if kind == EVENT_REST:
+                    exact_key, loose_key = _request_keys(event["m"], event["p"], event["tr"], event["q"])
+                    # 정확 키/보조 키 큐가 같은 항목을 공유 (한쪽에서 사용하면 다른 쪽에서 건너뜀)
+                    response = [event["s"], event["b"], event["l"], False]
+                    exact.setdefault(exact_key, deque()).append(response)
+                    loose.setdefault(loose_key, deque()).append(response)
+                elif kind == EVENT_WS:
+                    frames.append((event["t"], event["d"]))
+
+        self.path = path
+        self.speed = max(0.0, speed)
+        self.stats = self._empty_stats()
+        self._exact, self._loose, self._last = exact, loose, {}
+        self._frames = deque(frames)
+        self._ws_origin = frames[0][0] if frames else 0.0
+        self._ws_started = None
+        self._ws_finished = asyncio.Event()
+        self.mode = "replay"
+        self._install_replay_token()
+
+        # 최대 속도 재생에서는 속도 제한 대기를 끔 (처리 경로만 측정)
+        if self.speed == 0:
+            from core.rate_limiter import rate_limiter
+            self._rate_limiter_enabled = rate_limiter.enabled
+            rate_limiter.enabled = False
+
+        logger.log_system(
+            f"[카세트] 재생 시작: {path} (REST 요청 {len(exact)}종, 웹소켓 프레임 {len(frames)}개, "
+            f"{'최대 속도' if self.speed == 0 else f'{self.speed:g}배속'})"
+        )
+
+    @staticmethod
+    def _install_replay_token():
+        """재생 중 토큰 발급 요청이 나가지 않도록 메모리 토큰 설정"""
+        from core.token_manager import token_manager
+        now = datetime.now().timestamp()
+        token_manager.access_token = "CASSETTE_REPLAY"
+        token_manager.token_issue_time = now
+        token_manager.token_expire_time = now + 24 * 60 * 60
+
+    @property
+    def session(self) -> ReplaySession:
+        return ReplaySession(self)
+
+    async def open_websocket(self) -> ReplayWebSocket:
+        """재생용 웹소켓 연결 생성"""
+        return ReplayWebSocket(self)
+
+    async def wait_ws_finished(self):
+        """기록된 웹소켓 프레임이 모두 재생될 때까지 대기"""
+        await self._ws_finished.wait()
+
+    def _next_response(self, method: str, path: str, tr_id: Optional[str],
+                       payload: Optional[Dict]) -> Tuple[int, str, float]:
+        exact_key, loose_key = _request_keys(method, path, tr_id, payload)
+        for key, queue in ((exact_key, self._exact.get(exact_key)), (loose_key, self._loose.get(loose_key))):
+            while queue and queue[0][3]:
+                queue.popleft()
+            if queue:
+                entry = queue.popleft()
+                entry[3] = True
+                self._last[key] = response = (entry[0], entry[1], entry[2])
+                if key is loose_key:
+                    self.stats["rest_loose_hits"] += 1
+                return response
+            if key in self._last:
+                return self._last[key]
+        self.stats["rest_misses"] += 1
+        logger.log_warning(f"[카세트] 기록된 응답 없음: {method} {path} ({tr_id or '-'})")
+        return 404, MISS_BODY, 0.0
+
+    async def _replay_response(self, method: str, url: str, kwargs: Dict[str, Any]) -> _RecordedResponse:
+        path = urlsplit(url).path
+        headers = kwargs.get("headers") or {}
+        if path == "/uapi/hashkey":
+            body = json.dumps(kwargs.get("json") or {}, sort_keys=True).encode("utf-8")
+            return _RecordedResponse(method, url, 200, json.dumps({"HASH": hashlib.sha256(body).hexdigest()}))
+
+        payload = kwargs.get("params") if method == "GET" else kwargs.get("json")
+        status, body, latency = self._next_response(method, path, headers.get("tr_id"), payload)
+        self.stats["rest_replayed"] += 1
+        if self.speed > 0 and latency > 0:
+            await asyncio.sleep(latency / self.speed)
+        return _RecordedResponse(method, url, status, body)
+
+    # --- 공통 ---
+    def stop(self):
+        """기록/재생 종료"""
+        if self.recording:
+            with self._write_lock:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+            logger.log_system(f"[카세트] 기록 종료: {self.path} (REST {self.stats['rest_recorded']}건, "
+                              f"웹소켓 {self.stats['ws_recorded']}건)")
+        elif self.replaying:
+            if self._rate_limiter_enabled is not None:
+                from core.rate_limiter import rate_limiter
+                rate_limiter.enabled = self._rate_limiter_enabled
+                self._rate_limiter_enabled = None
+            logger.log_system(f"[카세트] 재생 종료: {self.stats}")
+        self.mode = "off"
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "path": self.path, "speed": self.speed, **self.stats}
+
+
+# 싱글톤 인스턴스
+cassette = Cassette()
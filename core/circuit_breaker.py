@@ -0,0 +1,221 @@
+"""
+KIS REST 엔드포인트별 서킷 브레이커 (path + tr_id 단위)
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from utils.logger import logger
+
+# 서킷 상태
+STATE_CLOSED = "closed"         # 정상 (요청 통과)
+STATE_OPEN = "open"             # 차단 (요청 즉시 실패)
+STATE_HALF_OPEN = "half_open"   # 복구 확인 중 (시험 요청 1건만 통과)
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않고 실패한 경우"""
+
+    def __init__(self, key: str, retry_after: float):
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(f"서킷 차단 중: {key} ({retry_after:.1f}초 후 재확인)")
+
+
+class CircuitBreaker:
+    """단일 엔드포인트 서킷 브레이커
+
+    - 연속 실패가 failure_threshold 이상이면 열림 (이후 요청은 즉시 실패)
+    - open_timeout이 지나면 반열림으로 전환하여 시험 요청 1건만 통과
+    - 시험 요청이 성공하면 닫히고, 실패하면 대기 시간을 늘려 다시 열림
+    """
+
+    def __init__(self, key: str, failure_threshold: int = 5, open_timeout: float = 10.0,
+                 max_open_timeout: float = 120.0, probe_timeout: float = 60.0):
+        """
+        Args:
+            key: 엔드포인트 식별자 (path|tr_id)
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            open_timeout: 처음 열렸을 때 반열림까지 대기 시간 (초)
+            max_open_timeout: 시험 요청이 계속 실패할 때 최대 대기 시간 (초)
+            probe_timeout: 시험 요청 결과가 이 시간(초) 안에 기록되지 않으면 다른 시험 요청 허용
+        """
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.base_open_timeout = open_timeout
+        self.max_open_timeout = max_open_timeout
+        self.probe_timeout = probe_timeout
+
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.open_timeout = open_timeout
+        self.opened_at = 0.0
+        self.probe_started_at: Optional[float] = None
+        self._state_lock = threading.Lock()
+
+        self.stats = {
+            "successes": 0,
+            "failures": 0,
+            "rejected": 0,
+            "opened": 0,
+            "last_failure": None,
+            "last_state_change": None,
+        }
+
+    def _set_state(self, state: str):
+        """상태 전환 (_state_lock 보유 상태에서 호출)"""
+        if self.state != state:
+            logger.log_warning(f"[서킷] {self.key} {self.state} -> {state}")
+            self.state = state
+            self.stats["last_state_change"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def allow_request(self) -> bool:
+        """요청 통과 여부 (반열림 상태에서는 시험 요청 1건만 True)"""
+        with self._state_lock:
+            now = time.monotonic()
+            if self.state == STATE_CLOSED:
+                return True
+
+            if self.state == STATE_OPEN:
+                if now - self.opened_at < self.open_timeout:
+                    self.stats["rejected"] += 1
+                    return False
+                self._set_state(STATE_HALF_OPEN)
+                self.probe_started_at = None
+
+            # 반열림: 진행 중인 시험 요청이 없을 때만 통과
+            if self.probe_started_at is None or now - self.probe_started_at > self.probe_timeout:
+                self.probe_started_at = now
+                return True
+            self.stats["rejected"] += 1
+            return False
+
+    def retry_after(self) -> float:
+        """다시 요청 가능할 때까지 남은 시간 (초)"""
+        with self._state_lock:
+            if self.state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.open_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        """요청 성공 기록 (반열림이면 닫음)"""
+        with self._state_lock:
+            self.stats["successes"] += 1
+            self.consecutive_failures = 0
+            if self.state != STATE_CLOSED:
+                self.open_timeout = self.base_open_timeout
+                self.probe_started_at = None
+                self._set_state(STATE_CLOSED)
+
+    def record_failure(self, reason: str = ""):
+        """요청 실패 기록 (임계치 도달 또는 시험 요청 실패 시 열림)"""
+        with self._state_lock:
+            now = time.monotonic()
+            self.stats["failures"] += 1
+            self.stats["last_failure"] = reason[:200] if reason else None
+            self.consecutive_failures += 1
+
+            if self.state == STATE_HALF_OPEN:
+                # 복구 실패: 대기 시간을 늘려 다시 차단
+                self.open_timeout = min(self.max_open_timeout, self.open_timeout * 2)
+                self.probe_started_at = None
+                self.opened_at = now
+                self.stats["opened"] += 1
+                self._set_state(STATE_OPEN)
+            elif self.state == STATE_CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self.opened_at = now
+                self.stats["opened"] += 1
+                self._set_state(STATE_OPEN)
+
+    def reset(self):
+        """강제로 닫힘 상태로 초기화"""
+        with self._state_lock:
+            self.consecutive_failures = 0
+            self.open_timeout = self.base_open_timeout
+            self.probe_started_at = None
+            self._set_state(STATE_CLOSED)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """상태 및 통계 반환"""
+        with self._state_lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "open_timeout": self.open_timeout,
+                **self.stats,
+            }
+
+
+class CircuitBreakerRegistry:
+    """엔드포인트별 서킷 브레이커 관리자"""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.enabled = True
+            # 새로 생성되는 브레이커의 기본 설정
+            self.failure_threshold = 5
+            self.open_timeout = 10.0
+            self.max_open_timeout = 120.0
+
+            self._breakers: Dict[str, CircuitBreaker] = {}
+            self._registry_lock = threading.Lock()
+
+            self._initialized = True
+
+    @staticmethod
+    def make_key(path: str, tr_id: Optional[str]) -> str:
+        """서킷 키 생성"""
+        return f"{path}|{tr_id or ''}"
+
+    def get(self, path: str, tr_id: Optional[str] = None) -> CircuitBreaker:
+        """엔드포인트의 서킷 브레이커 반환 (없으면 생성)"""
+        key = self.make_key(path, tr_id)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._registry_lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        key,
+                        failure_threshold=self.failure_threshold,
+                        open_timeout=self.open_timeout,
+                        max_open_timeout=self.max_open_timeout,
+                    )
+                    self._breakers[key] = breaker
+        return breaker
+
+    def reset(self, key: str = None):
+        """서킷 초기화 (키 미지정 시 전체)"""
+        with self._registry_lock:
+            breakers = list(self._breakers.values()) if key is None else [self._breakers.get(key)]
+        for breaker in breakers:
+            if breaker:
+                breaker.reset()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """전체 서킷 상태 반환"""
+        with self._registry_lock:
+            breakers = list(self._breakers.values())
+        metrics = {breaker.key: breaker.get_metrics() for breaker in breakers}
+        return {
+            "enabled": self.enabled,
+            "open": [key for key, m in metrics.items() if m["state"] != STATE_CLOSED],
+            "breakers": metrics,
+        }
+
+
+# 싱글톤 인스턴스
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,306 @@
+"""
+일봉 이력 저장소 (SQLite 영구 저장 + NumPy 배열 조회)
+"""
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from config.settings import config, DatabaseConfig
+from core.api_client import api_client
+from core.response_models import decode_chart, DAILY_CHART_FIELDS
+from utils.logger import logger
+from utils.market_hours import is_market_open
+
+
+@dataclass
+class DailyBars:
+    """시간순(과거 -> 최근)으로 정렬된 완성 일봉 배열"""
+    symbol: str
+    dates: np.ndarray = field(default_factory=lambda: np.array([], dtype="datetime64[D]"))
+    open: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    high: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    low: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    close: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    volume: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def tail(self, count: int) -> "DailyBars":
+        """최근 count개 일봉만 포함하는 배열 (사본 없이 뷰 반환)"""
+        return DailyBars(
+            symbol=self.symbol,
+            dates=self.dates[-count:],
+            open=self.open[-count:],
+            high=self.high[-count:],
+            low=self.low[-count:],
+            close=self.close[-count:],
+            volume=self.volume[-count:],
+        )
+
+
+class DailyBarStore:
+    """종목별 일봉 이력 저장소
+
+    - 장 시작 전 배치 작업(prefill)에서 하루 한 번 REST로 채우고 SQLite에 영구 저장
+    - 이미 저장된 종목은 마지막 저장일 이후 일봉만 조회 (증분 갱신)
+    - 장중에는 REST를 호출하지 않고 저장된 데이터만 제공
+    - 리스크 관리자와 전략은 get_bars()로 NumPy 배열을 읽음
+    - 당일 일봉은 미완성이므로 저장하지 않음
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            db_cfg = config.get("database", DatabaseConfig())
+            self.db_path = getattr(db_cfg, "daily_bar_db_path", DatabaseConfig.daily_bar_db_path)
+            # 최초 조회 시 가져올 기간 (달력일, 약 95 거래일 - API 1회 최대 100건)
+            self.history_days = 140
+            # 장 시작 전 배치 조회 동시 실행 수
+            self.prefill_concurrency = 10
+
+            self._conn: Optional[sqlite3.Connection] = None
+            self._db_lock = threading.Lock()
+            # {symbol: DailyBars} - SQLite 재조회 방지용 메모리 사본
+            self._memory: Dict[str, DailyBars] = {}
+
+            self.stats = {
+                "memory_hits": 0,
+                "db_loads": 0,
+                "rest_fetches": 0,
+                "rest_skipped_market_hours": 0,
+            }
+
+            self._initialized = True
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """SQLite 연결 반환 (최초 호출 시 테이블 생성, _db_lock 보유 상태에서 호출)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS daily_bars (
+                    symbol TEXT NOT NULL,
+                    trade_date TEXT NOT NULL,
+                    open REAL NOT NULL,
+                    high REAL NOT NULL,
+                    low REAL NOT NULL,
+                    close REAL NOT NULL,
+                    volume INTEGER NOT NULL,
+                    PRIMARY KEY (symbol, trade_date)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS daily_bar_sync (
+                    symbol TEXT PRIMARY KEY,
+                    synced_date TEXT NOT NULL,
+                    synced_at TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now().strftime("%Y%m%d")
+
+    # --- 조회 ---
+    def get_bars(self, symbol: str, count: int = None) -> DailyBars:
+        """저장된 완성 일봉 반환 (REST 호출 없음)
+
+        Args:
+            symbol: 종목코드
+            count: 최근 N개만 반환 (None이면 전체)
+
+        Returns:
+            DailyBars: 데이터가 없으면 빈 배열
+        """
+        bars = self._memory.get(symbol)
+        if bars is not None:
+            self.stats["memory_hits"] += 1
+        else:
+            bars = self._load_from_db(symbol)
+            self._memory[symbol] = bars
+            self.stats["db_loads"] += 1
+
+        if count is not None and len(bars) > count:
+            return bars.tail(count)
+        return bars
+
+    def _load_from_db(self, symbol: str) -> DailyBars:
+        """SQLite에서 종목 일봉을 읽어 NumPy 배열로 변환"""
+        with self._db_lock:
+            rows = self._get_connection().execute(
+                "SELECT trade_date, open, high, low, close, volume FROM daily_bars "
+                "WHERE symbol = ? ORDER BY trade_date",
+                (symbol,)
+            ).fetchall()
+
+        if not rows:
+            return DailyBars(symbol=symbol)
+
+        dates, opens, highs, lows, closes, volumes = zip(*rows)
+        return DailyBars(
+            symbol=symbol,
+            dates=np.array([f"{d[:4]}-{d[4:6]}-{d[6:]}" for d in dates], dtype="datetime64[D]"),
+            open=np.array(opens, dtype=np.float64),
+            high=np.array(highs, dtype=np.float64),
+            low=np.array(lows, dtype=np.float64),
+            close=np.array(closes, dtype=np.float64),
+            volume=np.array(volumes, dtype=np.int64),
+        )
+
+    def is_synced(self, symbol: str) -> bool:
+        """오늘 날짜로 갱신이 완료된 종목인지 확인"""
+        with self._db_lock:
+            row = self._get_connection().execute(
+                "SELECT synced_date FROM daily_bar_sync WHERE symbol = ?", (symbol,)
+            ).fetchone()
+        return bool(row) and row[0] == self._today()
+
+    def _last_trade_date(self, symbol: str) -> Optional[str]:
+        with self._db_lock:
+            row = self._get_connection().execute(
+                "SELECT MAX(trade_date) FROM daily_bars WHERE symbol = ?", (symbol,)
+            ).fetchone()
+        return row[0] if row else None
+
+    # --- 갱신 ---
+    @staticmethod
+    def _parse_rows(items: List[Dict[str, Any]], before_date: str) -> List[tuple]:
+        """API 일봉 항목을 (trade_date, o, h, l, c, v)로 변환 (before_date 이전 완성 일봉만)"""
+        chart = decode_chart(items, DAILY_CHART_FIELDS)
+        cutoff = np.datetime64(f"{before_date[:4]}-{before_date[4:6]}-{before_date[6:]}", "s")
+        chart = chart.take(chart.ts < cutoff)
+        if not len(chart):
+            return []
+
+        trade_dates = np.char.replace(np.datetime_as_string(chart.ts, unit="D"), "-", "")
+        return list(zip(
+            trade_dates.tolist(),
+            chart.open.tolist(),
+            chart.high.tolist(),
+            chart.low.tolist(),
+            chart.close.tolist(),
+            chart.volume.tolist(),
+        ))
+
+    async def refresh_symbol(self, symbol: str) -> Dict[str, Any]:
+        """종목 일봉을 REST로 조회하여 저장 (마지막 저장일 이후만)
+
+        Returns:
+            {"symbol", "stored"} 또는 실패 시 {"symbol", "error"}
+        """
+        today = self._today()
+        last_date = self._last_trade_date(symbol)
+        if last_date:
+            # 마지막 저장일부터 다시 조회 (수정주가 반영 여부와 무관하게 덮어씀)
+            start_date = last_date
+        else:
+            start_date = (datetime.now() - timedelta(days=self.history_days)).strftime("%Y%m%d")
+
+        result = await api_client.get_daily_price_async(
+            symbol, "D", 100, start_date=start_date, end_date=today
+        )
+        self.stats["rest_fetches"] += 1
+        if result.get("rt_cd") != "0":
+            return {"symbol": symbol, "error": result.get("msg1", "일봉 조회 실패")}
+
+        rows = self._parse_rows(result.get("output2"), today)
+        synced_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._db_lock:
+            conn = self._get_connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO daily_bars (symbol, trade_date, open, high, low, close, volume) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(symbol,) + row for row in rows]
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO daily_bar_sync (symbol, synced_date, synced_at) VALUES (?, ?, ?)",
+                (symbol, today, synced_at)
+            )
+            conn.commit()
+
+        self._memory.pop(symbol, None)
+        return {"symbol": symbol, "stored": len(rows)}
+
+    async def prefill(self, symbols: List[str], force: bool = False,
+                      allow_market_hours: bool = False) -> Dict[str, Any]:
+        """장 시작 전 배치 작업: 오늘 갱신되지 않은 종목의 일봉을 채움
+
+        Args:
+            symbols: 종목코드 목록
+            force: True면 오늘 이미 갱신한 종목도 다시 조회
+            allow_market_hours: True면 장중에도 REST 조회 허용
+
+        Returns:
+            {"requested", "fetched", "failed", "skipped"} 요약
+        """
+        symbols = list(dict.fromkeys(s for s in symbols if s))
+        targets = symbols if force else [s for s in symbols if not self.is_synced(s)]
+        summary = {"requested": len(symbols), "fetched": 0, "failed": 0, "skipped": len(symbols) - len(targets)}
+        if not targets:
+            return summary
+
+        if is_market_open() and not allow_market_hours:
+            # 장중에는 일봉 이력 조회로 REST 한도를 쓰지 않음 (저장된 데이터만 사용)
+            self.stats["rest_skipped_market_hours"] += len(targets)
+            summary["skipped"] += len(targets)
+            logger.log_warning(f"[일봉저장소] 장중에는 일봉을 조회하지 않음 - 미갱신 종목 {len(targets)}개는 저장된 데이터 사용")
+            return summary
+
+        started_at = time.time()
+        results = await api_client.gather_by_symbol(
+            targets, self.refresh_symbol, max_concurrency=self.prefill_concurrency
+        )
+        for symbol, result in results.items():
+            if "error" in result:
+                summary["failed"] += 1
+                logger.log_warning(f"[일봉저장소] {symbol} 일봉 갱신 실패: {result['error']}")
+            else:
+                summary["fetched"] += 1
+
+        logger.log_system(
+            f"[일봉저장소] 일봉 갱신 완료: {summary['fetched']}개 성공, {summary['failed']}개 실패, "
+            f"{summary['skipped']}개 생략 ({time.time() - started_at:.2f}초)"
+        )
+        return summary
+
+    def clear_memory(self, symbol: str = None):
+        """메모리 사본 삭제 (다음 조회 시 SQLite에서 다시 읽음)"""
+        if symbol is None:
+            self._memory.clear()
+        else:
+            self._memory.pop(symbol, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """조회 통계 반환"""
+        return {**self.stats, "symbols_in_memory": len(self._memory)}
+
+    def close(self):
+        """SQLite 연결 종료"""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# 싱글톤 인스턴스
+daily_bar_store = DailyBarStore()
@@ -0,0 +1,206 @@
+"""
+웹소켓 재연결 후 실시간 공백 보정
+
+재연결되면 끊겨 있던 동안 받지 못한 체결을 분봉 API로 조회하여 tick_bus(TOPIC_GAP)로 전달한다.
+전략은 받은 분봉을 가격 시계열에 시간순으로 끼워 넣고, 보정이 끝날 때까지 해당 종목 매매 판단을 미룬다.
+보정 대상 종목은 끊김을 감지한 시점부터 보정 완료까지 보정 중으로 표시된다 (재구독 직후 들어오는 틱으로 매매하지 않도록).
+재연결마다 끊긴 시간, 재구독 시간, 보정한 분봉 수를 기록한다.
+"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, Iterable
+
+from core.api_client import api_client
+from core.minute_bars import minute_bar_service, MinuteBarSeries, SESSION_START, SESSION_END
+from core.tick_bus import tick_bus, TOPIC_GAP
+from core.ws_pool import ws_pool
+from utils.logger import logger
+
+
+@dataclass
+class GapFill:
+    """끊긴 구간 분봉 (since ~ until)"""
+    symbol: str
+    since: datetime
+    until: datetime
+    series: MinuteBarSeries
+
+
+def splice_bars(data: deque, series: MinuteBarSeries) -> deque:
+    """{"price", "volume", "timestamp"} 시계열에 분봉을 시간순으로 끼워 넣은 새 deque
+
+    이미 데이터가 있는 분은 건너뛰므로 끊기기 직전/재연결 직후에 받은 틱과 중복되지 않는다.
+    """
+    covered = {item["timestamp"].replace(second=0, microsecond=0) for item in data if item.get("timestamp")}
+    bars = [{"price": price, "volume": volume, "timestamp": timestamp}
+            for timestamp, price, volume in series.rows() if timestamp not in covered]
+    if not bars:
+        return data
+    merged = sorted([*data, *bars], key=lambda item: item.get("timestamp") or datetime.min)
+    return deque(merged, maxlen=data.maxlen)
+
+
+class GapFiller:
+    """재연결 공백 보정
+
+    - ws_pool 모든 세션의 연결 끊김 알림을 받아 해당 세션 구독 종목을 보정 중으로 표시
+    - 재연결 완료 알림을 받아 해당 세션 구독 종목의 분봉을 조회한 뒤 표시 해제
+    - 종목별 GapFill을 tick_bus TOPIC_GAP으로 발행
+    - is_recovering(symbol): 보정 중인 종목 여부 (전략은 이 동안 매매 판단을 건너뜀)
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.recovering: set = set()
+            self._held: Dict[str, set] = {}         # {세션 이름: 끊김 감지 후 보정 완료 전까지 보류 중인 종목}
+            self.history: deque = deque(maxlen=20)   # 최근 재연결 기록
+            self.stats = {
+                "reconnects": 0,
+                "filled_symbols": 0,
+                "filled_bars": 0,
+                "failed_symbols": 0,
+                "total_downtime_s": 0.0,
+                "max_downtime_s": 0.0,
+            }
+
+            ws_pool.add_disconnect_listener(self.on_disconnect)
+            ws_pool.add_reconnect_listener(self.on_reconnect)
+            self._initialized = True
+
+    def is_recovering(self, symbol: str) -> bool:
+        """공백 보정 중인 종목 여부"""
+        return symbol in self.recovering
+
+    @staticmethod
+    def _session_bounds(now: datetime):
+        """당일 정규장 시작/종료 시각"""
+        start = now.replace(hour=int(SESSION_START[:2]), minute=int(SESSION_START[2:4]), second=0, microsecond=0)
+        end = now.replace(hour=int(SESSION_END[:2]), minute=int(SESSION_END[2:4]), second=0, microsecond=0)
+        return start, end
+
+    @staticmethod
+    def _price_symbols(session):
+        """세션의 체결가 구독 종목"""
+        return [key for key, info in session.subscriptions.items()
+                if isinstance(info, dict) and info.get("type") == "price"]
+
+    def _sync_recovering(self, done: Iterable[str] = ()):
+        """보정이 끝난 종목 표시 해제 (다른 세션 끊김으로 보류 중인 종목은 유지)"""
+        self.recovering.difference_update(done)
+        for symbols in self._held.values():
+            self.recovering.update(symbols)
+
+    async def on_disconnect(self, session, down_since: datetime, gave_up: bool):
+        """세션 끊김 처리 (재연결 후 보정이 끝날 때까지 해당 종목 매매 판단 보류)"""
+        if gave_up:
+            # 재연결을 포기한 세션의 종목은 다른 세션으로 옮겨지므로 보류 해제
+            self._sync_recovering(self._held.pop(session.name, ()))
+            return
+        symbols = self._price_symbols(session)
+        self._held[session.name] = set(symbols)
+        self._sync_recovering()
+        if symbols:
+            logger.log_system(f"[공백 보정] {session.name} 연결 끊김 - {len(symbols)}종목 보정 완료까지 매매 판단 보류")
+
+    async def on_reconnect(self, session, down_since: datetime, resubscribe_seconds: float):
+        """세션 재연결 완료 처리 (끊긴 동안의 분봉 보정 후 보류 해제)"""
+        try:
+            await self._fill_session(session, down_since, resubscribe_seconds)
+        finally:
+            self._sync_recovering(self._held.pop(session.name, ()))
+
+    async def _fill_session(self, session, down_since: datetime, resubscribe_seconds: float):
+        """세션 구독 종목의 끊긴 구간 분봉 보정 및 기록"""
+        now = datetime.now()
+        symbols = self._price_symbols(session)
+        record = {
+            "session": session.name,
+            "down_since": down_since.strftime("%H:%M:%S"),
+            "reconnected_at": now.strftime("%H:%M:%S"),
+            "downtime_s": round((now - down_since).total_seconds(), 3),
+            "resubscribe_s": round(resubscribe_seconds, 3),
+            "symbols": len(symbols),
+            "gap_minutes": 0,
+            "filled_bars": 0,
+            "failed": 0,
+            "fill_s": 0.0,
+        }
+
+        # 장중에 끊긴 구간만 보정 (장 시작 전/마감 후 구간은 분봉이 없음)
+        session_start, session_end = self._session_bounds(now)
+        since = max(down_since, session_start)
+        until = min(now, session_end)
+        if symbols and since < until:
+            record["gap_minutes"] = int((until - since).total_seconds() // 60) + 1
+            started = time.monotonic()
+            filled, failed = await self.fill(symbols, since, until)
+            record["filled_bars"] = filled
+            record["failed"] = failed
+            record["fill_s"] = round(time.monotonic() - started, 3)
+
+        self.stats["reconnects"] += 1
+        self.stats["total_downtime_s"] += record["downtime_s"]
+        self.stats["max_downtime_s"] = max(self.stats["max_downtime_s"], record["downtime_s"])
+        self.history.append(record)
+        logger.log_system(
+            f"[공백 보정] {session.name} 재연결: 끊김 {record['downtime_s']:.1f}초, "
+            f"재구독 {record['resubscribe_s']:.2f}초 ({len(symbols)}종목), "
+            f"공백 {record['gap_minutes']}분 → 분봉 {record['filled_bars']}개 보정 "
+            f"({record['fill_s']:.2f}초, 실패 {record['failed']}종목)"
+        )
+
+    async def fill(self, symbols: Iterable[str], since: datetime, until: datetime):
+        """종목별 공백 분봉 조회 후 TOPIC_GAP 발행
+
+        Returns:
+            (보정한 분봉 수, 실패 종목 수)
+        """
+        symbols = list(symbols)
+        self.recovering.update(symbols)
+        filled = failed = 0
+        try:
+            results = await api_client.gather_by_symbol(symbols, lambda s: minute_bar_service.fill_gap(s, since))
+            for symbol in symbols:
+                series = results.get(symbol)
+                if not isinstance(series, MinuteBarSeries):
+                    failed += 1
+                    logger.log_warning(f"[공백 보정] {symbol} 분봉 조회 실패: "
+                                       f"{(series or {}).get('error', '알 수 없음')}")
+                    continue
+                if len(series):
+                    filled += len(series)
+                    await tick_bus.publish(TOPIC_GAP, symbol, GapFill(symbol, since, until, series))
+        finally:
+            self._sync_recovering(symbols)
+
+        self.stats["filled_symbols"] += len(symbols) - failed
+        self.stats["filled_bars"] += filled
+        self.stats["failed_symbols"] += failed
+        return filled, failed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """재연결/보정 통계와 최근 재연결 기록"""
+        return {
+            **self.stats,
+            "recovering": len(self.recovering),
+            "history": list(self.history),
+        }
+
+
+# 싱글톤 인스턴스
+gap_filler = GapFiller()
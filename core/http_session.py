@@ -0,0 +1,163 @@
+"""
+KIS REST API용 공유 HTTP 세션 관리자 (aiohttp 커넥션 풀)
+"""
+import asyncio
+import threading
+from typing import Dict, Any, Optional, Coroutine
+
+import aiohttp
+
+from utils.logger import logger
+
+
+class HTTPSessionManager:
+    """이벤트 루프별 공유 aiohttp 세션 관리자
+
+    - 이벤트 루프마다 하나의 ClientSession을 유지하여 TCP/TLS 연결을 재사용 (keep-alive)
+    - 호스트별 최대 동시 연결 수 제한
+    - 동기 API 호출을 위한 전용 백그라운드 이벤트 루프 제공
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            # 커넥션 풀 설정
+            self.connection_limit = 100     # 전체 최대 연결 수
+            self.limit_per_host = 20        # 호스트별 최대 연결 수
+            self.keepalive_timeout = 30     # 유휴 연결 유지 시간 (초)
+            self.dns_cache_ttl = 300        # DNS 캐시 유지 시간 (초)
+
+            # {이벤트 루프: ClientSession}
+            self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+            self._sessions_lock = threading.Lock()
+
+            # 동기 호출용 백그라운드 루프
+            self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+            self._bg_thread: Optional[threading.Thread] = None
+            self._bg_lock = threading.Lock()
+
+            self._initialized = True
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """현재 실행 중인 이벤트 루프의 공유 세션 반환 (없으면 생성)
+
+        Returns:
+            aiohttp.ClientSession: 현재 루프에 바인딩된 세션
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._sessions_lock:
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.connection_limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    enable_cleanup_closed=True
+                )
+                session = aiohttp.ClientSession(connector=connector)
+                self._sessions[loop] = session
+                self._prune_closed_loops()
+                logger.log_debug(f"HTTP 세션 생성 (활성 세션 수: {len(self._sessions)})")
+
+        return session
+
+    def _prune_closed_loops(self):
+        """닫힌 이벤트 루프에 묶인 세션 참조 제거"""
+        for loop in [l for l in self._sessions if l.is_closed()]:
+            del self._sessions[loop]
+
+    def _ensure_background_loop(self) -> asyncio.AbstractEventLoop:
+        """동기 호출용 백그라운드 이벤트 루프 확보"""
+        with self._bg_lock:
+            if self._bg_loop is None or self._bg_loop.is_closed():
+                self._bg_loop = asyncio.new_event_loop()
+                self._bg_thread = threading.Thread(
+                    target=self._bg_loop.run_forever,
+                    name="kis-http-loop",
+                    daemon=True
+                )
+                self._bg_thread.start()
+                logger.log_system("HTTP 백그라운드 이벤트 루프 시작")
+            return self._bg_loop
+
+    def run_sync(self, coro: Coroutine, timeout: float = None) -> Any:
+        """코루틴을 백그라운드 루프에서 실행하고 결과를 동기적으로 반환
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            코루틴 실행 결과
+        """
+        loop = self._ensure_background_loop()
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            coro.close()
+            raise RuntimeError("HTTP 백그라운드 루프 내부에서는 동기 API를 호출할 수 없습니다")
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    async def close_session(self):
+        """현재 이벤트 루프의 세션 종료"""
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            session = self._sessions.pop(loop, None)
+        if session and not session.closed:
+            await session.close()
+            logger.log_system("HTTP 세션 종료")
+
+    async def close(self):
+        """현재 루프 세션과 백그라운드 루프 세션을 모두 종료"""
+        await self.close_session()
+
+        with self._bg_lock:
+            bg_loop = self._bg_loop
+            self._bg_loop = None
+
+        if bg_loop and not bg_loop.is_closed():
+            try:
+                future = asyncio.run_coroutine_threadsafe(self.close_session(), bg_loop)
+                await asyncio.wrap_future(future)
+            except Exception as e:
+                logger.log_warning(f"백그라운드 HTTP 세션 종료 중 오류 (무시): {str(e)}")
+            bg_loop.call_soon_threadsafe(bg_loop.stop)
+
+    def get_pool_status(self) -> Dict[str, Any]:
+        """커넥션 풀 상태 정보 반환"""
+        with self._sessions_lock:
+            sessions = [s for s in self._sessions.values() if not s.closed]
+        return {
+            "active_sessions": len(sessions),
+            "connection_limit": self.connection_limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "background_loop_running": bool(self._bg_loop and self._bg_loop.is_running())
+        }
+
+
+# 싱글톤 인스턴스
+http_session_manager = HTTPSessionManager()
@@ -0,0 +1,309 @@
+"""
+당일 분봉 이력 관리 (역방향 페이지 조회 + 증분 동기화)
+"""
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from core.api_client import api_client
+from core.response_models import ChartColumns, decode_chart, MINUTE_CHART_FIELDS
+from utils.logger import logger
+
+# 정규장 시작/종료 시각 (HHMMSS)
+SESSION_START = "090000"
+SESSION_END = "153000"
+
+ONE_MINUTE = np.timedelta64(1, "m")
+
+
+@dataclass
+class MinuteBarSeries:
+    """시간순으로 정렬된 1분봉 수치 시계열 (NumPy 배열)"""
+    symbol: str
+    ts: np.ndarray = field(default_factory=lambda: np.array([], dtype="datetime64[m]"))
+    open: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    high: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    low: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    close: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    volume: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def timestamps(self) -> List[datetime]:
+        """분봉 시각 (datetime 목록)"""
+        return self.ts.tolist()
+
+    def rows(self):
+        """(시각, 종가, 거래량) 행 반복 (파이썬 기본 타입)"""
+        return zip(self.timestamps, self.close.tolist(), self.volume.tolist())
+
+    def tail(self, count: int) -> "MinuteBarSeries":
+        """최근 count개 분봉만 포함하는 시계열"""
+        return MinuteBarSeries(
+            symbol=self.symbol,
+            ts=self.ts[-count:],
+            open=self.open[-count:],
+            high=self.high[-count:],
+            low=self.low[-count:],
+            close=self.close[-count:],
+            volume=self.volume[-count:],
+        )
+
+
+class _SymbolBars:
+    """종목별 당일 분봉 저장소 (분 단위 시각 오름차순, 중복 없음)"""
+
+    def __init__(self, trade_date: str):
+        self.trade_date = trade_date
+        self.bars = ChartColumns(ts=np.array([], dtype="datetime64[m]"))
+        self.synced_at = 0.0                # 마지막 동기화 시각 (monotonic)
+        self.complete = False               # 장 시작까지 역방향 조회 완료 여부
+
+    @property
+    def last_time(self) -> Optional[np.datetime64]:
+        return self.bars.ts[-1] if len(self.bars) else None
+
+    def merge(self, page: ChartColumns) -> int:
+        """조회한 분봉 병합 (같은 분은 새로 조회한 값으로 교체)
+
+        Returns:
+            병합된 분봉 수
+        """
+        if not len(page):
+            return 0
+        bars = self.bars
+        combined = ChartColumns(
+            ts=np.concatenate([bars.ts, page.ts]),
+            open=np.concatenate([bars.open, page.open]),
+            high=np.concatenate([bars.high, page.high]),
+            low=np.concatenate([bars.low, page.low]),
+            close=np.concatenate([bars.close, page.close]),
+            volume=np.concatenate([bars.volume, page.volume]),
+        )
+        # 뒤에서부터 첫 등장 위치 = 새 페이지 값 우선
+        _, reverse_index = np.unique(combined.ts[::-1], return_index=True)
+        self.bars = combined.take(len(combined) - 1 - reverse_index)
+        return len(page)
+
+
+class MinuteBarService:
+    """당일 1분봉 이력 서비스
+
+    - 최초 조회 시 inquire-time-itemchartprice를 장 시작(09:00)까지 역방향으로 페이지 조회
+    - 이후에는 마지막 보유 분봉보다 새로운 분봉만 조회 (증분 동기화)
+    - 전략에는 빈 분(체결 없음)을 직전 종가로 채운 연속 수치 시계열을 제공
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            # 한 번의 조회로 받는 분봉 수 (KIS 고정 30건)
+            self.page_size = 30
+            # 역방향 최대 페이지 수 (정규장 390분 / 30 + 여유)
+            self.max_pages = 16
+            # 이 시간(초) 이내에 동기화한 종목은 다시 조회하지 않음
+            self.min_sync_interval = 30.0
+
+            self._store: Dict[str, _SymbolBars] = {}
+            self._symbol_locks: Dict[str, asyncio.Lock] = {}
+
+            self.stats = {
+                "pages_fetched": 0,
+                "full_loads": 0,
+                "delta_syncs": 0,
+                "skipped_syncs": 0,
+                "gap_fills": 0,
+            }
+
+            self._initialized = True
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now().strftime("%Y%m%d")
+
+    @staticmethod
+    def _session_time(trade_date: str, hhmmss: str) -> np.datetime64:
+        """당일 HHMMSS 시각을 분 단위 datetime64로 변환"""
+        return np.datetime64(
+            f"{trade_date[:4]}-{trade_date[4:6]}-{trade_date[6:]}T{hhmmss[:2]}:{hhmmss[2:4]}", "m"
+        )
+
+    async def _fetch_page(self, symbol: str, end_time: str) -> ChartColumns:
+        """end_time(HHMMSS) 이전 분봉 한 페이지 조회 (열 배열, 시간순)"""
+        result = await api_client.get_minute_price_async(symbol, time_unit=end_time)
+        self.stats["pages_fetched"] += 1
+        if result.get("rt_cd") != "0":
+            logger.log_warning(f"[분봉서비스] {symbol} {end_time} 분봉 조회 실패: {result.get('msg1', '알 수 없음')}")
+            return ChartColumns()
+
+        page = decode_chart(result.get("output2"), MINUTE_CHART_FIELDS)
+        page.ts = page.ts.astype("datetime64[m]")
+        return page
+
+    async def _fetch_back_to(self, symbol: str, entry: _SymbolBars, stop_time: Optional[np.datetime64]) -> int:
+        """현재 시각부터 stop_time(포함)까지 역방향 페이지 조회하여 저장
+
+        Args:
+            stop_time: 이미 보유한 마지막 분봉 시각 (None이면 장 시작까지)
+
+        Returns:
+            새로 추가되거나 갱신된 분봉 수
+        """
+        now_time = datetime.now().strftime("%H%M%S")
+        end_time = min(now_time, SESSION_END)
+        lower_bound = stop_time if stop_time is not None else self._session_time(entry.trade_date, SESSION_START)
+        day_start = self._session_time(entry.trade_date, "000000")
+        updated = 0
+
+        for _ in range(self.max_pages):
+            page = await self._fetch_page(symbol, end_time)
+            if not len(page):
+                break
+
+            # 과거 데이터 포함 옵션으로 전일 분봉이 섞여 오는 경우 제외
+            same_day = page.ts >= day_start
+            updated += entry.merge(page.take(same_day & (page.ts >= lower_bound)))
+
+            if not same_day.all() or len(page) < self.page_size:
+                break
+            oldest = page.ts[0]
+            if oldest <= lower_bound:
+                break
+            end_time = (oldest - ONE_MINUTE).item().strftime("%H%M%S")
+
+        if stop_time is None:
+            entry.complete = True
+        return updated
+
+    def _get_lock(self, symbol: str) -> asyncio.Lock:
+        lock = self._symbol_locks.get(symbol)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._symbol_locks[symbol] = lock
+        return lock
+
+    async def load_session(self, symbol: str, force: bool = False) -> MinuteBarSeries:
+        """당일 분봉 시계열 반환 (보유 분이 있으면 새 분봉만 조회)
+
+        Args:
+            symbol: 종목코드
+            force: True면 보유 데이터를 버리고 장 시작부터 다시 조회
+
+        Returns:
+            MinuteBarSeries: 장 시작부터 마지막 분봉까지의 연속 시계열
+        """
+        async with self._get_lock(symbol):
+            today = self._today()
+            entry = self._store.get(symbol)
+            if force or entry is None or entry.trade_date != today or not entry.complete:
+                entry = _SymbolBars(today)
+                self._store[symbol] = entry
+                started_at = time.time()
+                count = await self._fetch_back_to(symbol, entry, None)
+                self.stats["full_loads"] += 1
+                logger.log_system(f"[분봉서비스] {symbol} 당일 분봉 {count}개 로드 ({time.time() - started_at:.2f}초)")
+            elif time.monotonic() - entry.synced_at < self.min_sync_interval:
+                self.stats["skipped_syncs"] += 1
+            else:
+                # 마지막 분봉은 조회 시점에 미완성이었을 수 있으므로 포함하여 다시 조회
+                count = await self._fetch_back_to(symbol, entry, entry.last_time)
+                self.stats["delta_syncs"] += 1
+                logger.log_debug(f"[분봉서비스] {symbol} 증분 동기화 {count}개")
+            entry.synced_at = time.monotonic()
+
+        return self.get_series(symbol)
+
+    async def fill_gap(self, symbol: str, since: datetime) -> MinuteBarSeries:
+        """since가 속한 분부터 현재까지 분봉 조회 (웹소켓 공백 보정용, 보유 분봉은 새 값으로 교체)
+
+        Returns:
+            MinuteBarSeries: since 이후 분봉 (체결 없는 분은 제외)
+        """
+        stop_time = np.datetime64(since.replace(second=0, microsecond=0), "m")
+        async with self._get_lock(symbol):
+            today = self._today()
+            entry = self._store.get(symbol)
+            if entry is None or entry.trade_date != today:
+                # 장 시작부터의 이력은 다음 load_session에서 조회 (complete=False)
+                entry = _SymbolBars(today)
+                self._store[symbol] = entry
+            count = await self._fetch_back_to(symbol, entry, stop_time)
+            entry.synced_at = time.monotonic()
+            self.stats["gap_fills"] += 1
+            logger.log_debug(f"[분봉서비스] {symbol} 공백 보정 {count}개 ({since.strftime('%H:%M:%S')} 이후)")
+
+            bars = entry.bars.take(entry.bars.ts >= stop_time)
+        return MinuteBarSeries(symbol=symbol, ts=bars.ts, open=bars.open, high=bars.high,
+                               low=bars.low, close=bars.close, volume=bars.volume)
+
+    async def load_many(self, symbols: List[str], force: bool = False) -> Dict[str, MinuteBarSeries]:
+        """여러 종목 당일 분봉 동시 로드"""
+        return await api_client.gather_by_symbol(symbols, lambda s: self.load_session(s, force))
+
+    def get_series(self, symbol: str, contiguous: bool = True) -> MinuteBarSeries:
+        """보유 중인 당일 분봉 시계열 반환 (API 조회 없음)
+
+        Args:
+            symbol: 종목코드
+            contiguous: True면 체결 없는 분을 직전 종가/거래량 0으로 채움
+        """
+        entry = self._store.get(symbol)
+        if not entry or not len(entry.bars):
+            return MinuteBarSeries(symbol=symbol)
+
+        bars = entry.bars
+        if not contiguous:
+            return MinuteBarSeries(symbol=symbol, ts=bars.ts, open=bars.open, high=bars.high,
+                                   low=bars.low, close=bars.close, volume=bars.volume)
+
+        # 빈 분은 직전 분봉의 종가로 채움 (searchsorted로 직전 분봉 위치 계산)
+        timeline = np.arange(bars.ts[0], bars.ts[-1] + ONE_MINUTE, ONE_MINUTE)
+        pos = np.searchsorted(bars.ts, timeline, side="right") - 1
+        exact = bars.ts[pos] == timeline
+        prev_close = bars.close[pos]
+        return MinuteBarSeries(
+            symbol=symbol,
+            ts=timeline,
+            open=np.where(exact, bars.open[pos], prev_close),
+            high=np.where(exact, bars.high[pos], prev_close),
+            low=np.where(exact, bars.low[pos], prev_close),
+            close=prev_close,
+            volume=np.where(exact, bars.volume[pos], 0),
+        )
+
+    def clear(self, symbol: str = None):
+        """저장된 분봉 삭제 (종목 미지정 시 전체)"""
+        if symbol is None:
+            self._store.clear()
+        else:
+            self._store.pop(symbol, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """조회 통계 반환"""
+        return {
+            **self.stats,
+            "symbols": len(self._store),
+            "bars": sum(len(entry.bars) for entry in self._store.values()),
+        }
+
+
+# 싱글톤 인스턴스
+minute_bar_service = MinuteBarService()
@@ -0,0 +1,263 @@
+"""
+실시간 10단계 호가창 (H0STASP0)
+
+웹소켓 호가 레코드를 종목별 고정 크기 배열에 그대로 덮어써 보관한다.
+최우선 호가, 스프레드, 잔량 가중 중간가, 매수/매도 잔량 불균형은 갱신 시 계산해 두어 조회는 O(1)이다.
+주문 직전 REST 현재가 조회 대신 이 호가창으로 지정가와 체결 가능 수량을 확인한다.
+"""
+import threading
+import time
+from array import array
+from typing import Dict, Any, Iterable, List, Optional
+
+from core.realtime_frames import BOOK_LEVELS, OrderBookRecord
+from core.subscription_manager import subscription_manager
+from core.tick_bus import tick_bus, TOPIC_QUOTE
+from utils.logger import logger
+
+# H0STASP0 필드 위치
+_ASK_PRICE = 3
+_BID_PRICE = _ASK_PRICE + BOOK_LEVELS
+_ASK_SIZE = _BID_PRICE + BOOK_LEVELS
+_BID_SIZE = _ASK_SIZE + BOOK_LEVELS
+_TOTAL_ASK = _BID_SIZE + BOOK_LEVELS
+_TOTAL_BID = _TOTAL_ASK + 1
+
+
+def _int(value: str) -> int:
+    """호가 필드 문자열 → 정수 (빈 값은 0)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class OrderBook:
+    """종목별 10단계 호가창
+
+    - ask_prices/bid_prices, ask_sizes/bid_sizes: 1~10호가 가격/잔량 (0은 호가 없음)
+    - best_ask/best_bid/spread/mid/weighted_mid/imbalance: 갱신 시 계산된 값 (O(1))
+    - liquidity(side, limit_price), fill_price(side, quantity): 10단계 순회 (상수 시간)
+    """
+    __slots__ = ("symbol", "time", "ask_prices", "bid_prices", "ask_sizes", "bid_sizes",
+                 "total_ask", "total_bid", "updated_at", "updates",
+                 "_ask_depth", "_bid_depth", "_ask_notional", "_bid_notional")
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.time = ""                                  # 영업 시간 (HHMMSS)
+        self.ask_prices = array("q", [0] * BOOK_LEVELS)
+        self.bid_prices = array("q", [0] * BOOK_LEVELS)
+        self.ask_sizes = array("q", [0] * BOOK_LEVELS)
+        self.bid_sizes = array("q", [0] * BOOK_LEVELS)
+        self.total_ask = 0                              # 총 매도 잔량
+        self.total_bid = 0                              # 총 매수 잔량
+        self.updated_at = 0.0                           # 마지막 갱신 (time.monotonic)
+        self.updates = 0
+        self._ask_depth = 0                             # 10단계 매도 잔량 합
+        self._bid_depth = 0
+        self._ask_notional = 0                          # 10단계 매도 가격 × 잔량 합
+        self._bid_notional = 0
+
+    def apply(self, raw: List[str]):
+        """H0STASP0 레코드로 호가창 전체 갱신 (호가 레코드는 매번 전체 스냅샷)"""
+        self.time = raw[1]
+        ask_depth = bid_depth = ask_notional = bid_notional = 0
+        for level in range(BOOK_LEVELS):
+            ask_price = self.ask_prices[level] = _int(raw[_ASK_PRICE + level])
+            bid_price = self.bid_prices[level] = _int(raw[_BID_PRICE + level])
+            ask_size = self.ask_sizes[level] = _int(raw[_ASK_SIZE + level])
+            bid_size = self.bid_sizes[level] = _int(raw[_BID_SIZE + level])
+            if ask_price > 0:
+                ask_depth += ask_size
+                ask_notional += ask_price * ask_size
+            if bid_price > 0:
+                bid_depth += bid_size
+                bid_notional += bid_price * bid_size
+        self.total_ask = _int(raw[_TOTAL_ASK])
+        self.total_bid = _int(raw[_TOTAL_BID])
+        self._ask_depth = ask_depth
+        self._bid_depth = bid_depth
+        self._ask_notional = ask_notional
+        self._bid_notional = bid_notional
+        self.updated_at = time.monotonic()
+        self.updates += 1
+
+    @property
+    def best_ask(self) -> int:
+        """최우선 매도호가 (없으면 0)"""
+        return self.ask_prices[0]
+
+    @property
+    def best_bid(self) -> int:
+        """최우선 매수호가 (없으면 0)"""
+        return self.bid_prices[0]
+
+    @property
+    def is_valid(self) -> bool:
+        """양쪽 최우선 호가가 모두 있는지 여부 (동시호가/상하한가에서는 한쪽이 비어 있을 수 있음)"""
+        return self.ask_prices[0] > 0 and self.bid_prices[0] > 0
+
+    @property
+    def spread(self) -> int:
+        """최우선 호가 스프레드 (원)"""
+        return self.best_ask - self.best_bid if self.is_valid else 0
+
+    @property
+    def mid(self) -> float:
+        """최우선 호가 중간가"""
+        return (self.best_ask + self.best_bid) / 2 if self.is_valid else 0.0
+
+    @property
+    def weighted_mid(self) -> float:
+        """10단계 잔량 가중 중간가
+
+        매도/매수 각각의 잔량 가중 평균가를 반대편 잔량으로 가중한다.
+        매수 잔량이 두꺼우면 매도 평균가 쪽으로 치우친다.
+        """
+        ask_depth, bid_depth = self._ask_depth, self._bid_depth
+        if ask_depth <= 0 or bid_depth <= 0:
+            return self.mid
+        ask_avg = self._ask_notional / ask_depth
+        bid_avg = self._bid_notional / bid_depth
+        return (ask_avg * bid_depth + bid_avg * ask_depth) / (ask_depth + bid_depth)
+
+    @property
+    def imbalance(self) -> float:
+        """10단계 잔량 불균형 (-1.0 매도 우위 ~ 1.0 매수 우위)"""
+        total = self._ask_depth + self._bid_depth
+        return (self._bid_depth - self._ask_depth) / total if total > 0 else 0.0
+
+    def age(self) -> float:
+        """마지막 갱신 후 경과 시간 (초)"""
+        return time.monotonic() - self.updated_at if self.updated_at else float("inf")
+
+    def _side(self, side: str):
+        """주문 방향이 체결되는 반대편 호가 (매수 → 매도호가)"""
+        if side.upper() == "BUY":
+            return self.ask_prices, self.ask_sizes, True
+        return self.bid_prices, self.bid_sizes, False
+
+    def liquidity(self, side: str, limit_price: int) -> int:
+        """limit_price 지정가 주문이 즉시 체결될 수 있는 수량"""
+        prices, sizes, is_buy = self._side(side)
+        available = 0
+        for level in range(BOOK_LEVELS):
+            price = prices[level]
+            if price <= 0 or (price > limit_price if is_buy else price < limit_price):
+                break
+            available += sizes[level]
+        return available
+
+    def fill_price(self, side: str, quantity: int) -> Optional[int]:
+        """quantity 전량이 즉시 체결되는 가장 불리한 호가 (10단계로 부족하면 None)"""
+        prices, sizes, _ = self._side(side)
+        remaining = quantity
+        for level in range(BOOK_LEVELS):
+            price = prices[level]
+            if price <= 0:
+                break
+            remaining -= sizes[level]
+            if remaining <= 0:
+                return price
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """호가창 요약"""
+        return {
+            "symbol": self.symbol,
+            "time": self.time,
+            "best_ask": self.best_ask,
+            "best_bid": self.best_bid,
+            "spread": self.spread,
+            "mid": self.mid,
+            "weighted_mid": round(self.weighted_mid, 2),
+            "imbalance": round(self.imbalance, 4),
+            "total_ask": self.total_ask,
+            "total_bid": self.total_bid,
+            "asks": list(zip(self.ask_prices, self.ask_sizes)),
+            "bids": list(zip(self.bid_prices, self.bid_sizes)),
+            "age_s": round(self.age(), 3),
+        }
+
+
+class OrderBookStore:
+    """종목별 호가창 저장소
+
+    - apply(record): 웹소켓 디스패처가 H0STASP0 레코드마다 호출 (같은 종목은 같은 워커에서 순서대로 처리)
+    - get(symbol, max_age): 호가창 조회 (max_age초보다 오래되면 None)
+    - watch(symbols): 호가 구독 목록을 symbols로 맞춤
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.books: Dict[str, OrderBook] = {}
+            self.stats = {"updates": 0, "hits": 0, "stale": 0, "misses": 0}
+            self._initialized = True
+
+    def apply(self, record: OrderBookRecord) -> OrderBook:
+        """호가 레코드 반영"""
+        book = self.books.get(record.symbol)
+        if book is None:
+            book = self.books[record.symbol] = OrderBook(record.symbol)
+        book.apply(record.raw)
+        self.stats["updates"] += 1
+        return book
+
+    def get(self, symbol: str, max_age: Optional[float] = None) -> Optional[OrderBook]:
+        """호가창 조회
+
+        Args:
+            symbol: 종목코드
+            max_age: 허용 경과 시간 (초, None이면 무제한)
+
+        Returns:
+            Optional[OrderBook]: 호가창 (없거나 오래되었으면 None)
+        """
+        book = self.books.get(symbol)
+        if book is None or not book.updates:
+            self.stats["misses"] += 1
+            return None
+        if max_age is not None and book.age() > max_age:
+            self.stats["stale"] += 1
+            return None
+        self.stats["hits"] += 1
+        return book
+
+    async def _on_quote(self, event):
+        """호가 구독 유지용 tick_bus 구독자 (호가창 갱신은 디스패처가 직접 수행)"""
+
+    def watched(self) -> List[str]:
+        """호가 구독 중인 종목"""
+        return tick_bus.listener_symbols(TOPIC_QUOTE, self._on_quote)
+
+    async def watch(self, symbols: Iterable[str]) -> Dict[str, bool]:
+        """호가 구독 목록을 symbols로 맞춤 (목록에서 빠진 종목은 해지하고 호가창도 정리)"""
+        symbols = list(symbols)
+        results = await subscription_manager.sync(self._on_quote, symbols, TOPIC_QUOTE)
+        for symbol in set(self.books) - set(symbols):
+            self.books.pop(symbol, None)
+        failed = [symbol for symbol, ok in results.items() if not ok]
+        if failed:
+            logger.log_warning(f"[호가창] 호가 구독 실패: {', '.join(failed)}")
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호가창 통계"""
+        return {**self.stats, "books": len(self.books)}
+
+
+# 싱글톤 인스턴스
+order_books = OrderBookStore()
@@ -8,8 +8,13 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from config.settings import config
 from core.api_client import api_client
+from core.response_models import decode_holdings
 from core.account_state import account_state
 from core.risk_manager import risk_manager
+from core.order_book import order_books
+from core.order_tracker import order_tracker, TrackedOrder, ORDER_FILLED, ORDER_REJECTED, ORDER_CANCELLED
+from core.realtime_frames import normalize_order_id
+from core.ws_pool import ws_pool
 from utils.logger import logger
 from utils.database import database_manager
 from monitoring.alert_system import alert_system
@@ -47,7 +52,9 @@ class OrderManager:
             self.retry_delay = 1  # 재시도 대기 시간 (초)
             self.max_retries = 2  # 최대 재시도 횟수
             self.max_order_wait_time = 30  # 주문 체결 최대 대기 시간 (초)
-            self.order_check_interval = 1  # 주문 상태 체크 간격 (초)
+            self.cancel_confirm_wait_time = 3  # 타임아웃 취소 후 취소 확인 통보 대기 시간 (초)
+            self.orderbook_max_age = 3.0  # 주문 가격 산정에 쓸 실시간 호가창 최대 경과 시간 (초)
+            self.max_book_slippage = 0.005  # 호가창 잔량 부족 시 지정가 조정 허용 폭 (0.5%)
             self._initialized = True
     
     async def initialize(self):
@@ -74,7 +81,7 @@ class OrderManager:
                             f"내부가용잔고={account_info['internal_available_cash']:,.0f}원")
             
             # 계좌 잔고 조회
-            balance_data = api_client.get_account_balance()
+            balance_data = await api_client.get_account_balance_async()
             
             # DB에서 포지션 로드
             db_positions = database_manager.get_all_positions()
@@ -122,6 +129,44 @@ class OrderManager:
             return True
         return False
     
+    async def watch_orderbooks(self, symbols: List[str]) -> Dict[str, bool]:
+        """주문 후보 종목의 실시간 호가 구독 (목록에서 빠진 종목은 해지)
+
+        체결가 구독이 우선이므로 남은 웹소켓 구독 한도만큼 앞 순서 종목만 구독한다.
+        """
+        try:
+            free = ws_pool.capacity - len(ws_pool.assignments) + len(order_books.watched())
+            return await order_books.watch(list(symbols)[:max(0, free)])
+        except Exception as e:
+            logger.log_error(e, "호가 구독 갱신 중 오류")
+            return {}
+    
+    def _price_from_book(self, symbol: str, side: str, quantity: int, price: float) -> float:
+        """실시간 호가창 기준 지정가 확인
+        
+        지정가로 즉시 체결 가능한 잔량이 부족하면 전량 체결되는 호가로 조정한다
+        (max_book_slippage 이내일 때만). 호가창이 없거나 오래되었으면 price를 그대로 사용한다.
+        """
+        book = order_books.get(symbol, self.orderbook_max_age)
+        if book is None or not book.is_valid or not quantity:
+            return price
+        
+        available = book.liquidity(side, int(price))
+        if available >= quantity:
+            return price
+        
+        is_buy = side.upper() == "BUY"
+        fill_price = book.fill_price(side, quantity)
+        limit = price * (1 + self.max_book_slippage) if is_buy else price * (1 - self.max_book_slippage)
+        if fill_price is not None and (fill_price <= limit if is_buy else fill_price >= limit):
+            logger.log_system(f"[호가확인] {symbol} {side} - {price:,.0f}원 즉시 체결 가능 {available}/{quantity}주, "
+                              f"지정가 조정 {price:,.0f} → {fill_price:,.0f}원")
+            return fill_price
+        
+        logger.log_warning(f"[호가확인] {symbol} {side} - {price:,.0f}원 즉시 체결 가능 {available}/{quantity}주 "
+                           f"(최우선 매도 {book.best_ask:,}원 / 매수 {book.best_bid:,}원), 잔량은 미체결로 남을 수 있음")
+        return price
+    
     async def place_order(self, symbol: str, side: str, quantity: int = None, 
                           price: float = None, order_type: str = "MARKET",
                           strategy: str = None, reason: str = None, 
@@ -150,20 +195,24 @@ class OrderManager:
         try:
             logger.log_system(f"[주문시도] {symbol} {side} 주문 시작 - 초기 요청 수량: {quantity}주, 가격: {price}, 타입: {order_type}")
             
-            # 가격 정보 확인 - 주문 처리를 위해 price 값 필요
+            # 가격 정보 확인 - 주문 처리를 위해 price 값 필요 (실시간 호가창 우선, 없으면 현재가 조회)
             if price is None or price <= 0:
-                # 현재가 조회 필요
-                try:
-                    price_data = api_client.get_current_price(symbol)
-                    if price_data and price_data.get("rt_cd") == "0" and "output" in price_data:
-                        price = float(price_data["output"]["stck_prpr"])
-                        logger.log_system(f"[주문정보] {symbol} - 현재가 조회 결과: {price:,.0f}원")
-                    else:
-                        logger.log_system(f"[주문실패] {symbol} - 현재가 조회 실패")
-                        return {"status": "failed", "reason": "현재가 조회 실패"}
-                except Exception as price_e:
-                    logger.log_error(price_e, f"{symbol} 현재가 조회 중 오류")
-                    return {"status": "failed", "reason": "현재가 조회 오류"}
+                book = order_books.get(symbol, self.orderbook_max_age)
+                if book is not None and book.is_valid:
+                    price = book.best_ask if side.upper() == "BUY" else book.best_bid
+                    logger.log_system(f"[주문정보] {symbol} - 호가창 최우선호가: {price:,.0f}원")
+                else:
+                    try:
+                        price_data = await api_client.get_current_price_async(symbol)
+                        if price_data and price_data.get("rt_cd") == "0" and price_data.get("quote"):
+                            price = price_data["quote"].price
+                            logger.log_system(f"[주문정보] {symbol} - 현재가 조회 결과: {price:,.0f}원")
+                        else:
+                            logger.log_system(f"[주문실패] {symbol} - 현재가 조회 실패")
+                            return {"status": "failed", "reason": "현재가 조회 실패"}
+                    except Exception as price_e:
+                        logger.log_error(price_e, f"{symbol} 현재가 조회 중 오류")
+                        return {"status": "failed", "reason": "현재가 조회 오류"}
             
             # BUY 주문이고 수량이 지정되지 않은 경우 리스크 관리자를 통해 수량 계산
             if side.upper() == "BUY" and (quantity is None or quantity <= 0):
@@ -182,6 +231,10 @@ class OrderManager:
                 
                 logger.log_system(f"[주문정보] {symbol} - 리스크 관리자 계산 수량: {quantity}주")
             
+            # 지정가 주문은 호가창으로 즉시 체결 가능 수량 확인 (부족하면 허용 폭 내에서 가격 조정)
+            if order_type.upper() == "LIMIT":
+                price = self._price_from_book(symbol, side, quantity, price)
+            
             # 매도 주문인 경우 사전 검증 - 보유 수량 확인
             if side.upper() == "SELL":
                 # 보유 수량 확인 (데이터베이스와 API 둘 다 확인)
@@ -191,10 +244,11 @@ class OrderManager:
                 try:
                     positions_data = await self.get_positions()
                     if positions_data and "output1" in positions_data:
-                        for position in positions_data["output1"]:
-                            if position.get("pdno") == symbol:
+                        # 당일 전량 매도 종목(수량 0)도 포함하여 확인
+                        for holding in decode_holdings(positions_data["output1"], held_only=False):
+                            if holding.symbol == symbol:
                                 # API에서 조회한 실제 보유 수량으로 업데이트
-                                current_position["quantity"] = int(position.get("hldg_qty", 0))
+                                current_position["quantity"] = holding.quantity
                                 break
                 except Exception as e:
                     logger.log_error(e, f"{symbol} 실제 보유 수량 조회 중 오류")
@@ -270,7 +324,7 @@ class OrderManager:
                     internal_available_cash = account_info["internal_available_cash"]  # 내부 가용 잔고
                     
                     # 실제 주문가능금액 조회 (API)
-                    api_balance = api_client.get_account_balance()
+                    api_balance = await api_client.get_account_balance_async()
                     api_ord_psbl_cash = 0  # API 주문가능금액
                     
                     if api_balance.get("rt_cd") == "0":
@@ -345,15 +399,16 @@ class OrderManager:
                         await asyncio.sleep(self.retry_delay)
                     
                     # API를 통한 주문 실행
+                    sent_at = datetime.now()
                     if order_type.upper() == "MARKET":
-                        order_result = api_client.place_order(
+                        order_result = await api_client.place_order_async(
                             symbol=symbol,
                             order_type="MARKET",
                             side=side,
                             quantity=quantity
                         )
                     else:
-                        order_result = api_client.place_order(
+                        order_result = await api_client.place_order_async(
                             symbol=symbol,
                             order_type="LIMIT",
                             side=side,
@@ -361,6 +416,13 @@ class OrderManager:
                             price=int(price)
                         )
                     
+                    # 타임아웃/연결 오류는 거래소가 주문을 접수했을 수 있으므로 재주문 전에 당일 주문 내역 확인
+                    if order_result.get("error_type") in ("timeout", "request_exception"):
+                        sent_order_id = await self._find_sent_order(symbol, side, quantity, sent_at)
+                        if sent_order_id:
+                            logger.log_warning(f"[주문확인] {symbol} 응답 없이 접수된 주문 확인 - 주문ID: {sent_order_id}")
+                            order_result = {"rt_cd": "0", "output": {"ODNO": sent_order_id}}
+                    
                     # 주문 성공
                     if order_result.get("rt_cd") == "0":
                         # 실패 카운터 초기화
@@ -387,6 +449,9 @@ class OrderManager:
                         # DB에 주문 정보 저장
                         database_manager.save_order(order_data)
                         self.pending_orders[order_id] = order_data
+                        # 지정가 주문은 체결 통보가 주문 응답보다 먼저 와도 반영되도록 바로 등록
+                        if order_type.upper() != "MARKET":
+                            order_tracker.track(order_id, symbol, side, quantity, price)
                         
                         # 내부 계좌 상태 업데이트 (임시 ID를 실제 주문 ID로 갱신)
                         if side.upper() == "BUY":
@@ -476,7 +541,7 @@ class OrderManager:
             if not order_data:
                 return {"status": "failed", "reason": "order_not_found"}
             
-            result = api_client.cancel_order(
+            result = await api_client.cancel_order_async(
                 order_id=order_id,
                 symbol=order_data["symbol"],
                 quantity=order_data["quantity"]
@@ -610,20 +675,15 @@ class OrderManager:
                 logger.log_system("[포지션체크] 현재 보유 종목 정보가 없습니다.")
                 return
                 
-            position_items = latest_positions.get("output1", [])
-            
-            # 보유 수량 > 0인 종목만 필터링
+            # 보유 수량 > 0인 종목만 포함 (잔고 조회 시 레코드로 변환됨)
             valid_positions = {}
-            for position in position_items:
-                symbol = position.get("pdno", "")
-                qty = int(position.get("hldg_qty", "0"))
-                if symbol and qty > 0:
-                    valid_positions[symbol] = {
-                        "quantity": qty,
-                        "avg_price": float(position.get("pchs_avg_pric", "0")),
-                        "current_price": float(position.get("prpr", "0")),
-                        "profit_rate": float(position.get("evlu_pfls_rt", "0")) / 100 if "evlu_pfls_rt" in position else 0
-                    }
+            for holding in latest_positions.get("holdings", []):
+                valid_positions[holding.symbol] = {
+                    "quantity": holding.quantity,
+                    "avg_price": holding.avg_price,
+                    "current_price": holding.current_price,
+                    "profit_rate": holding.profit_rate / 100
+                }
             
             # 유효한 포지션이 없으면 종료
             if not valid_positions:
@@ -656,14 +716,14 @@ class OrderManager:
                         
                         # 현재가 조회 - API 응답에 현재가가 없거나 정확하지 않은 경우 별도 조회
                         if position["current_price"] <= 0:
-                            price_data = api_client.get_current_price(symbol)
+                            price_data = await api_client.get_current_price_async(symbol)
                             
                             # 현재가 조회 실패 시 건너뛰기
-                            if price_data.get("rt_cd") != "0" or "output" not in price_data:
+                            if price_data.get("rt_cd") != "0" or not price_data.get("quote"):
                                 logger.log_system(f"[포지션체크] {symbol} 현재가 조회 실패, 건너뜀")
                                 continue
                                 
-                            current_price = float(price_data["output"]["stck_prpr"])
+                            current_price = price_data["quote"].price
                             position["current_price"] = current_price
                         else:
                             current_price = position["current_price"]
@@ -774,8 +834,7 @@ class OrderManager:
         """
         try:
             # API로 포지션 조회
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, api_client.get_account_balance)
+            result = await api_client.get_account_balance_async()
             
             if result and result.get("rt_cd") == "0":
                 # 로그 확인 추가
@@ -824,13 +883,13 @@ class OrderManager:
         """매도 가능 여부 확인"""
         try:
             # 1. 거래 정지 여부 확인
-            trading_status = api_client.get_trading_status(symbol)
+            trading_status = await api_client.get_trading_status_async(symbol)
             if trading_status.get("rt_cd") != "0" or trading_status.get("output", {}).get("status") == "SUSPENDED":
                 logger.log_system(f"[매도제한] {symbol} - 거래 정지 상태")
                 return False
             
             # 2. 매도 제한 여부 확인
-            restrictions = api_client.get_trading_restrictions(symbol)
+            restrictions = await api_client.get_trading_restrictions_async(symbol)
             if restrictions.get("rt_cd") == "0":
                 if restrictions.get("output", {}).get("sell_restricted"):
                     logger.log_system(f"[매도제한] {symbol} - 매도 제한 상태")
@@ -855,90 +914,151 @@ class OrderManager:
             return False
     
     async def _wait_for_order_execution(self, order_id: str, order_data: Dict[str, Any]):
-        """주문 체결 대기 및 모니터링"""
+        """주문 체결 대기 및 모니터링
+        
+        웹소켓 체결 통보(order_tracker)로 체결/부분 체결/거부/취소가 오면 바로 깨어나 처리한다.
+        부분 체결분은 도착할 때마다 포지션에 반영하고, max_order_wait_time까지 전량 체결되지 않으면 잔량을 취소한다.
+        체결 통보를 받을 수 없는 경우(HTS ID 미설정 등)에는 대기 시간 후 주문 내역을 한 번 조회해 확인한다.
+        통보는 재연결/복호화 실패 등으로 누락될 수 있으므로, 취소 후에도 종결되지 않은 주문은 주문 내역으로 확인한다.
+        """
+        tracked = order_tracker.get(order_id) or order_tracker.track(
+            order_id, order_data["symbol"], order_data["side"], order_data["quantity"], order_data["price"])
+        symbol = order_data["symbol"]
+        processed = 0  # 포지션에 반영한 체결 건수 (tracked.fills 인덱스)
         try:
-            start_time = time.time()
-            check_count = 0
-            
-            while time.time() - start_time < self.max_order_wait_time:
-                # 주문 상태 확인
-                order_status = await self._check_order_status(order_id)
-                check_count += 1
-                
-                if order_status["status"] == "FILLED":
-                    # 체결 완료
-                    await self._handle_order_execution(order_id, order_data)
-                    return
-                elif order_status["status"] == "CANCELLED":
-                    # 주문 취소됨
-                    logger.log_system(f"[주문취소] {order_data['symbol']} 주문이 취소되었습니다.")
-                    return
-                elif order_status["status"] == "REJECTED":
-                    # 주문 거부됨
-                    logger.log_system(f"[주문거부] {order_data['symbol']} 주문이 거부되었습니다.")
-                    return
-                elif order_status["status"] == "PARTIALLY_FILLED":
-                    # 부분 체결 처리
-                    if order_data["side"] == "SELL":
-                        filled_quantity = order_status.get("filled_quantity", 0)
-                        remaining_quantity = order_data["quantity"] - filled_quantity
-                        logger.log_system(f"[부분체결] {order_data['symbol']} - 체결: {filled_quantity}주, 잔여: {remaining_quantity}주")
-                        
-                        # 부분 체결된 수량만큼 처리
-                        partial_order_data = order_data.copy()
-                        partial_order_data["quantity"] = filled_quantity
-                        await self._handle_order_execution(order_id, partial_order_data)
-                        
-                        # 잔여 수량 재주문
-                        if remaining_quantity > 0:
-                            new_order_data = order_data.copy()
-                            new_order_data["quantity"] = remaining_quantity
-                            await self.place_order(
-                                symbol=new_order_data["symbol"],
-                                side=new_order_data["side"],
-                                quantity=remaining_quantity,
-                                price=new_order_data["price"],
-                                order_type=new_order_data["order_type"],
-                                strategy=new_order_data["strategy"],
-                                reason=f"partial_fill_{order_id}"
-                            )
-                        return
-                
-                # 대기 시간 로깅
-                if check_count % 5 == 0:  # 5회마다 로그 출력
-                    elapsed_time = time.time() - start_time
-                    logger.log_system(f"[주문대기] {order_data['symbol']} 주문 체결 대기 중... ({elapsed_time:.1f}초 경과)")
-                
-                await asyncio.sleep(self.order_check_interval)
-            
-            # 최대 대기 시간 초과
-            logger.log_system(f"[주문타임아웃] {order_data['symbol']} 주문 체결 대기 시간 초과")
+            deadline = time.monotonic() + self.max_order_wait_time
+            while not tracked.is_done:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if await order_tracker.wait_for_update(tracked, remaining):
+                    processed = await self._apply_fills(order_id, order_data, tracked, processed)
+            
+            # 대기 시작 전에 이미 종결되었거나 반영 중에 도착한 체결분 반영
+            processed = await self._apply_fills(order_id, order_data, tracked, processed)
+            
+            # 통보를 받지 못했으면 주문 내역으로 한 번 확인
+            if not tracked.is_done and not order_tracker.is_active:
+                await self._reconcile_order(order_id)
+                processed = await self._apply_fills(order_id, order_data, tracked, processed)
+            
+            if tracked.status == ORDER_FILLED:
+                logger.log_system(f"[주문체결] {symbol} 전량 체결 {tracked.filled_quantity}주, "
+                                  f"평균 {tracked.avg_fill_price:,.0f}원 "
+                                  f"({(time.monotonic() - tracked.created_at) * 1000:.0f}ms)")
+                return
+            if tracked.status == ORDER_REJECTED:
+                logger.log_system(f"[주문거부] {symbol} 주문이 거부되었습니다.")
+                database_manager.update_order(order_id, {"status": "REJECTED"})
+                self.pending_orders.pop(order_id, None)
+                return
+            if tracked.status == ORDER_CANCELLED:
+                logger.log_system(f"[주문취소] {symbol} 주문이 취소되었습니다. (체결 {tracked.filled_quantity}주)")
+                database_manager.update_order(order_id, {"status": "CANCELLED"})
+                self.pending_orders.pop(order_id, None)
+                return
             
-            # 주문 취소 시도
-            try:
-                await self.cancel_order(order_id)
-                logger.log_system(f"[주문취소] {order_data['symbol']} 타임아웃으로 주문 취소")
-            except Exception as cancel_error:
-                logger.log_error(cancel_error, f"Failed to cancel order {order_id}")
+            # 최대 대기 시간 초과 - 잔량 취소
+            logger.log_system(f"[주문타임아웃] {symbol} 주문 체결 대기 시간 초과 "
+                              f"(체결 {tracked.filled_quantity}/{tracked.quantity}주)")
+            cancel_result = await self.cancel_order(order_id)
+            cancelled = cancel_result.get("status") == "success"
+            if cancelled:
+                logger.log_system(f"[주문취소] {symbol} 타임아웃으로 주문 취소")
+            else:
+                logger.log_warning(f"[주문취소] {symbol} 주문 취소 실패 (이미 체결되었을 수 있음): "
+                                   f"{cancel_result.get('reason')}")
+            
+            # 취소 확인 전에 들어온 체결분 반영
+            if cancelled and order_tracker.is_active:
+                deadline = time.monotonic() + self.cancel_confirm_wait_time
+                while not tracked.is_done and deadline > time.monotonic():
+                    await order_tracker.wait_for_update(tracked, deadline - time.monotonic())
+                    processed = await self._apply_fills(order_id, order_data, tracked, processed)
+            
+            # 통보가 누락되었을 수 있으므로 주문 내역으로 체결 수량 확인
+            if not tracked.is_done:
+                await self._reconcile_order(order_id)
+                processed = await self._apply_fills(order_id, order_data, tracked, processed)
+                if tracked.status == ORDER_FILLED:
+                    logger.log_system(f"[주문체결] {symbol} 주문 내역 확인 결과 전량 체결 "
+                                      f"{tracked.filled_quantity}주, 평균 {tracked.avg_fill_price:,.0f}원")
+            self.pending_orders.pop(order_id, None)
             
         except Exception as e:
             logger.log_error(e, f"Error waiting for order execution: {order_id}")
+        finally:
+            order_tracker.forget(order_id)
+    
+    async def _apply_fills(self, order_id: str, order_data: Dict[str, Any], tracked: TrackedOrder,
+                           processed: int) -> int:
+        """아직 반영하지 않은 체결분을 포지션/거래 기록에 반영
+        
+        반영(await) 중에 새 체결 통보가 도착할 수 있으므로 남은 체결분이 없을 때까지 반복한다.
+        
+        Returns:
+            int: 반영한 체결 건수 (다음 호출의 processed)
+        """
+        while processed < len(tracked.fills):
+            fills = tracked.fills[processed:]
+            processed += len(fills)
+            
+            quantity = sum(fill_quantity for fill_quantity, _ in fills)
+            fill_data = order_data.copy()
+            fill_data["quantity"] = quantity
+            fill_data["price"] = sum(fill_quantity * price for fill_quantity, price in fills) / quantity
+            await self._handle_order_execution(order_id, fill_data)
+            
+            if not tracked.is_done:
+                # 부분 체결 - 잔량이 남아 있으므로 대기 주문으로 유지 (타임아웃 시 잔량 취소)
+                self.pending_orders[order_id] = order_data
+                database_manager.update_order(order_id, {"status": "PARTIALLY_FILLED"})
+                logger.log_system(f"[부분체결] {order_data['symbol']} - 체결: {tracked.filled_quantity}주, "
+                                  f"잔여: {tracked.quantity - tracked.filled_quantity}주")
+        return processed
     
-    async def _check_order_status(self, order_id: str) -> Dict[str, Any]:
-        """주문 상태 확인"""
+    async def _find_sent_order(self, symbol: str, side: str, quantity: int, sent_at: datetime) -> Optional[str]:
+        """응답을 받지 못한 주문이 접수되었는지 당일 주문 내역으로 확인
+
+        Returns:
+            Optional[str]: 접수된 주문번호 (없으면 None)
+        """
         try:
-            # API로 주문 상태 조회
-            result = api_client.get_order_status(order_id)
-            
-            if result.get("rt_cd") == "0":
-                status = result.get("output", {}).get("order_status", "UNKNOWN")
-                return {"status": status}
-            else:
-                return {"status": "UNKNOWN"}
-                
+            result = await api_client.get_order_history_async()
+            if result.get("rt_cd") != "0":
+                return None
+            side_code = "02" if side.upper() == "BUY" else "01"
+            since = (sent_at - timedelta(seconds=1)).strftime("%H%M%S")
+            known = {normalize_order_id(order_id) for order_id in self.pending_orders}
+            for row in result.get("output1", []):
+                order_id = row.get("odno", "")
+                if (row.get("pdno") == symbol and row.get("sll_buy_dvsn_cd") == side_code
+                        and int(float(row.get("ord_qty") or 0)) == quantity
+                        and row.get("ord_tmd", "") >= since
+                        and normalize_order_id(order_id) not in known):
+                    return order_id
+        except Exception as e:
+            logger.log_error(e, f"{symbol} 주문 접수 여부 확인 중 오류")
+        return None
+    
+    async def _reconcile_order(self, order_id: str):
+        """체결 통보를 받지 못한 주문의 체결 수량을 당일 주문 내역으로 확인 (1회)"""
+        try:
+            result = await api_client.get_order_history_async()
+            if result.get("rt_cd") != "0":
+                return
+            target = normalize_order_id(order_id)
+            for row in result.get("output1", []):
+                if normalize_order_id(row.get("odno", "")) == target:
+                    order_tracker.reconcile(
+                        order_id,
+                        filled_quantity=int(float(row.get("tot_ccld_qty") or 0)),
+                        avg_price=float(row.get("avg_prvs") or 0),
+                        cancelled=row.get("cncl_yn") == "Y",
+                    )
+                    return
         except Exception as e:
-            logger.log_error(e, f"Error checking order status: {order_id}")
-            return {"status": "UNKNOWN"}
+            logger.log_error(e, f"Error reconciling order: {order_id}")
     
     async def _handle_order_execution(self, order_id: str, order_data: Dict[str, Any]):
         """주문 체결 처리"""
@@ -0,0 +1,246 @@
+"""
+실시간 체결 통보 기반 주문 상태 관리
+
+웹소켓 체결 통보(H0STCNI0)를 주문번호별 상태 머신에 반영하고, 체결을 기다리는 쪽을 바로 깨운다.
+주문 상태를 REST로 반복 조회하지 않으며, 체결은 통보 1건이 도착하는 즉시 처리된다.
+주문 응답(ODNO)보다 통보가 먼저 도착할 수 있으므로 등록되지 않은 주문의 통보는 잠시 보관했다가 등록 시 반영한다.
+
+계좌 단위 구독이므로 tr_key로 HTS ID(환경 변수 KIS_HTS_ID)가 필요하다.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+
+from config.settings import config
+from core.realtime_frames import FillNotice, normalize_order_id, AES
+from core.tick_bus import tick_bus, TOPIC_FILL
+from core.ws_pool import ws_pool
+from utils.logger import logger
+
+# 주문 상태
+ORDER_PENDING = "PENDING"                   # 주문 전송 후 접수 통보 전
+ORDER_ACCEPTED = "ACCEPTED"                 # 거래소 접수
+ORDER_PARTIALLY_FILLED = "PARTIALLY_FILLED"
+ORDER_FILLED = "FILLED"
+ORDER_CANCELLED = "CANCELLED"
+ORDER_REJECTED = "REJECTED"
+TERMINAL_STATES = (ORDER_FILLED, ORDER_CANCELLED, ORDER_REJECTED)
+
+# 미등록 주문 통보 보관 시간 (초)
+UNMATCHED_TTL = 60.0
+
+
+@dataclass
+class TrackedOrder:
+    """주문 1건의 체결 상태"""
+    order_id: str
+    symbol: str
+    side: str
+    quantity: int
+    price: float
+    status: str = ORDER_PENDING
+    fills: List[Tuple[int, float]] = field(default_factory=list)    # [(체결 수량, 체결 단가)]
+    created_at: float = field(default_factory=time.monotonic)
+    updated_at: float = 0.0
+    changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def filled_quantity(self) -> int:
+        return sum(quantity for quantity, _ in self.fills)
+
+    @property
+    def avg_fill_price(self) -> float:
+        filled = self.filled_quantity
+        return sum(quantity * price for quantity, price in self.fills) / filled if filled else 0.0
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in TERMINAL_STATES
+
+
+class OrderTracker:
+    """주문 상태 머신
+
+    - start(): 계좌 체결 통보 구독 (ws_pool 세션 1곳, 재연결 시 자동 재등록)
+    - track(order_id, ...): 주문 등록 (보관 중인 통보 반영)
+    - wait_for_update(order, timeout): 다음 상태 변경(접수/체결/부분 체결/취소/거부)까지 대기
+    - reconcile(order_id, filled_quantity, avg_price): 통보를 못 받은 경우 조회 결과로 상태 보정
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.orders: Dict[str, TrackedOrder] = {}
+            self._unmatched: Dict[str, List[FillNotice]] = {}    # {주문번호: 등록 전 도착한 통보}
+            self._unmatched_at: Dict[str, float] = {}
+            self.hts_id = ""
+            self.active = False
+            self.fill_latency: deque = deque(maxlen=100)        # 주문 등록 → 전량 체결 통보 (ms)
+            self.stats = {
+                "notices": 0,
+                "fills": 0,
+                "partial_fills": 0,
+                "rejects": 0,
+                "cancels": 0,
+                "unmatched": 0,
+                "reconciled": 0,
+            }
+
+            tick_bus.add_listener(TOPIC_FILL, None, self.on_notice)
+            self._initialized = True
+
+    async def start(self, hts_id: str = None) -> bool:
+        """계좌 체결 통보 구독
+
+        Returns:
+            bool: 구독 성공 여부 (실패하면 주문 관리자는 대기 시간 후 주문 내역 조회로 확인)
+        """
+        self.hts_id = hts_id or config["api"].hts_id
+        if not self.hts_id:
+            logger.log_warning("[체결통보] KIS_HTS_ID 미설정 - 체결 통보 구독을 건너뜁니다.")
+            return False
+        if AES is None:
+            logger.log_warning("[체결통보] pycryptodome 미설치 - 체결 통보를 복호화할 수 없어 구독을 건너뜁니다.")
+            return False
+
+        self.active = await ws_pool.subscribe(self.hts_id, "fill")
+        if self.active:
+            logger.log_system("[체결통보] 계좌 체결 통보 구독 완료")
+        else:
+            logger.log_warning("[체결통보] 계좌 체결 통보 구독 실패")
+        return self.active
+
+    @property
+    def is_active(self) -> bool:
+        """체결 통보 수신 가능 여부"""
+        return self.active and ws_pool.is_subscribed(self.hts_id, "fill") and ws_pool.is_connected()
+
+    def track(self, order_id: str, symbol: str, side: str, quantity: int, price: float) -> TrackedOrder:
+        """주문 등록 (먼저 도착해 보관 중인 통보를 순서대로 반영)"""
+        order_id = normalize_order_id(order_id)
+        order = TrackedOrder(order_id, symbol, side.upper(), quantity, price)
+        self.orders[order_id] = order
+        for notice in self._unmatched.pop(order_id, ()):
+            self._apply(order, notice)
+        self._unmatched_at.pop(order_id, None)
+        return order
+
+    def get(self, order_id: str) -> Optional[TrackedOrder]:
+        return self.orders.get(normalize_order_id(order_id))
+
+    def forget(self, order_id: str):
+        """처리가 끝난 주문 제거"""
+        self.orders.pop(normalize_order_id(order_id), None)
+
+    async def wait_for_update(self, order: TrackedOrder, timeout: float) -> bool:
+        """다음 상태 변경까지 대기 (변경되면 True, 시간 초과면 False)"""
+        try:
+            await asyncio.wait_for(order.changed.wait(), timeout=max(0.0, timeout))
+        except asyncio.TimeoutError:
+            return False
+        order.changed.clear()
+        return True
+
+    async def on_notice(self, notice: FillNotice):
+        """체결 통보 처리 (tick_bus TOPIC_FILL 구독자)"""
+        self.stats["notices"] += 1
+        order = self.orders.get(notice.order_id)
+        # 정정/취소 확인 통보는 새 주문번호로 오므로 원주문에 반영
+        if order is None and (notice.cancelled or notice.modified) and notice.orig_order_id:
+            order = self.orders.get(notice.orig_order_id)
+        if order is None:
+            self._hold(notice)
+            return
+        self._apply(order, notice)
+
+    def _hold(self, notice: FillNotice):
+        """등록 전 주문의 통보 보관 (오래된 항목은 정리)"""
+        now = time.monotonic()
+        for order_id, held_at in list(self._unmatched_at.items()):
+            if now - held_at > UNMATCHED_TTL:
+                self._unmatched.pop(order_id, None)
+                del self._unmatched_at[order_id]
+        order_id = notice.orig_order_id if (notice.cancelled or notice.modified) and notice.orig_order_id \
+            else notice.order_id
+        self._unmatched.setdefault(order_id, []).append(notice)
+        self._unmatched_at.setdefault(order_id, now)
+        self.stats["unmatched"] += 1
+
+    def _apply(self, order: TrackedOrder, notice: FillNotice):
+        """통보 1건으로 상태 전이"""
+        if order.is_done:
+            return
+        if notice.rejected:
+            order.status = ORDER_REJECTED
+            self.stats["rejects"] += 1
+            logger.log_warning(f"[체결통보] {order.symbol} 주문 거부 (주문번호 {order.order_id})")
+        elif notice.is_fill:
+            order.fills.append((notice.quantity, notice.price))
+            if order.filled_quantity >= order.quantity:
+                order.status = ORDER_FILLED
+                self.stats["fills"] += 1
+                self.fill_latency.append((time.monotonic() - order.created_at) * 1000)
+            else:
+                order.status = ORDER_PARTIALLY_FILLED
+                self.stats["partial_fills"] += 1
+            logger.log_debug(f"[체결통보] {order.symbol} {order.side} 체결 {notice.quantity}주 @ {notice.price:,.0f}원 "
+                             f"({order.filled_quantity}/{order.quantity}주)")
+        elif notice.cancelled:
+            order.status = ORDER_CANCELLED
+            self.stats["cancels"] += 1
+        elif order.status == ORDER_PENDING:
+            order.status = ORDER_ACCEPTED
+        else:
+            return
+        order.updated_at = time.monotonic()
+        order.changed.set()
+
+    def reconcile(self, order_id: str, filled_quantity: int, avg_price: float, cancelled: bool = False):
+        """주문 내역 조회 결과로 체결 상태 보정 (통보로 받지 못한 체결분만 추가)"""
+        order = self.get(order_id)
+        if order is None or order.is_done:
+            return
+        missing = filled_quantity - order.filled_quantity
+        if missing > 0:
+            # 누락분 단가 = 전체 체결 금액 - 통보로 받은 체결 금액
+            received = sum(quantity * price for quantity, price in order.fills)
+            order.fills.append((missing, (filled_quantity * avg_price - received) / missing))
+        if order.filled_quantity >= order.quantity:
+            order.status = ORDER_FILLED
+        elif cancelled:
+            order.status = ORDER_CANCELLED
+        elif order.fills:
+            order.status = ORDER_PARTIALLY_FILLED
+        order.updated_at = time.monotonic()
+        order.changed.set()
+        self.stats["reconciled"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """체결 통보 통계 (fill_latency_ms: 주문 등록부터 전량 체결 통보까지)"""
+        latencies = sorted(self.fill_latency)
+        return {
+            **self.stats,
+            "active": self.is_active,
+            "tracking": len(self.orders),
+            "held": sum(len(notices) for notices in self._unmatched.values()),
+            "fill_latency_ms_p50": round(latencies[len(latencies) // 2], 1) if latencies else None,
+            "fill_latency_ms_max": round(latencies[-1], 1) if latencies else None,
+        }
+
+
+# 싱글톤 인스턴스
+order_tracker = OrderTracker()
@@ -0,0 +1,240 @@
+"""
+실시간 체결(H0STCNT0) 틱으로 갱신되는 시세 캐시
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterable, Tuple
+
+from utils.logger import logger
+
+# 현재가 조회(get_current_price) 응답을 만들기 위해 필요한 필드
+PRICE_FIELDS = ("current_price", "open_price", "high_price", "low_price", "volume", "change_rate")
+
+# 종목 정보 조회(get_symbol_info) 응답을 만들기 위해 필요한 필드
+SYMBOL_INFO_FIELDS = PRICE_FIELDS + ("name", "prev_close")
+
+# 캐시 필드 -> KIS 현재가 응답(output) 필드
+KIS_OUTPUT_FIELDS = {
+    "current_price": "stck_prpr",
+    "open_price": "stck_oprc",
+    "high_price": "stck_hgpr",
+    "low_price": "stck_lwpr",
+    "prev_close": "stck_sdpr",
+    "volume": "acml_vol",
+    "change_rate": "prdy_ctrt",
+}
+
+
+class QuoteCache:
+    """종목별 시세 캐시 (필드별 TTL)
+
+    - 웹소켓 체결 틱과 REST 응답이 모두 캐시를 갱신
+    - 필드마다 유효 시간이 다름 (현재가는 수 초, 시가/종목명/전일종가는 길게)
+    - 요청한 필드가 모두 유효할 때만 적중으로 처리하고, 아니면 호출 측이 REST로 조회
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.enabled = True
+
+            # 필드별 유효 시간 (초)
+            self.field_ttls = {
+                "current_price": 2.0,
+                "high_price": 2.0,
+                "low_price": 2.0,
+                "volume": 2.0,
+                "change_rate": 2.0,
+                "open_price": 600.0,     # 장중 시가는 변하지 않음
+                "prev_close": 21600.0,   # 전일 종가 (6시간)
+                "name": 86400.0,         # 종목명 (1일)
+            }
+            self.default_ttl = 2.0
+
+            # {symbol: {field: (value, monotonic_ts)}}
+            self._quotes: Dict[str, Dict[str, Tuple[Any, float]]] = {}
+            # {symbol: 마지막 갱신 시각 문자열}
+            self._updated_at: Dict[str, str] = {}
+            self._cache_lock = threading.Lock()
+
+            self.stats = {
+                "hits": 0,
+                "misses": 0,        # 종목 또는 필드 없음
+                "stale": 0,         # 필드는 있지만 유효 시간 경과
+                "tick_updates": 0,
+                "rest_updates": 0,
+            }
+
+            self._initialized = True
+
+    @staticmethod
+    def _to_float(value: Any) -> Optional[float]:
+        try:
+            return float(value) if value not in (None, "") else None
+        except (ValueError, TypeError):
+            return None
+
+    def update(self, symbol: str, fields: Dict[str, Any], source: str = "tick"):
+        """캐시 필드 갱신 (None 값은 무시)"""
+        if not self.enabled or not symbol:
+            return
+
+        now = time.monotonic()
+        with self._cache_lock:
+            quote = self._quotes.setdefault(symbol, {})
+            for field, value in fields.items():
+                if value is not None:
+                    quote[field] = (value, now)
+            self._updated_at[symbol] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.stats["tick_updates" if source == "tick" else "rest_updates"] += 1
+
+    def update_from_tick(self, symbol: str, tick: Dict[str, Any]):
+        """실시간 체결 틱(H0STCNT0)으로 캐시 갱신"""
+        price = self._to_float(tick.get("stck_prpr"))
+        if price is None:
+            return
+
+        fields = {
+            "current_price": price,
+            "open_price": self._to_float(tick.get("stck_oprc")),
+            "high_price": self._to_float(tick.get("stck_hgpr")),
+            "low_price": self._to_float(tick.get("stck_lwpr")),
+            "change_rate": self._to_float(tick.get("prdy_ctrt")),
+        }
+
+        volume = self._to_float(tick.get("acml_vol"))
+        if volume is not None:
+            fields["volume"] = int(volume)
+
+        # 전일대비(부호 포함)로 전일 종가 계산
+        change = self._to_float(tick.get("prdy_vrss"))
+        if change is not None:
+            fields["prev_close"] = price - change
+
+        self.update(symbol, fields, source="tick")
+
+    def update_from_trade(self, tick):
+        """파싱된 실시간 체결 틱(core.realtime_frames.Tick)으로 캐시 갱신 (문자열 변환 없음)"""
+        if tick.price <= 0:
+            return
+        self.update(tick.symbol, {
+            "current_price": tick.price,
+            "open_price": tick.open or None,
+            "high_price": tick.high or None,
+            "low_price": tick.low or None,
+            "change_rate": tick.change_rate,
+            "volume": tick.cum_volume,
+            "prev_close": tick.prev_close,
+        }, source="tick")
+
+    def update_from_rest(self, symbol: str, output: Dict[str, Any]):
+        """REST 현재가 응답(output)으로 캐시 갱신"""
+        if not isinstance(output, dict):
+            return
+
+        fields = {
+            field: self._to_float(output.get(kis_field))
+            for field, kis_field in KIS_OUTPUT_FIELDS.items()
+        }
+        if fields["current_price"] is None:
+            return
+        if fields["volume"] is not None:
+            fields["volume"] = int(fields["volume"])
+        if output.get("rprs_mrkt_kor_name"):
+            fields["name"] = output["rprs_mrkt_kor_name"]
+
+        self.update(symbol, fields, source="rest")
+
+    def get(self, symbol: str, fields: Iterable[str] = PRICE_FIELDS) -> Optional[Dict[str, Any]]:
+        """요청한 필드가 모두 유효하면 값 딕셔너리 반환, 아니면 None
+
+        Args:
+            symbol: 종목코드
+            fields: 필요한 필드 목록
+
+        Returns:
+            {field: value, "updated_at": str} 또는 None
+        """
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        with self._cache_lock:
+            quote = self._quotes.get(symbol)
+            if not quote:
+                self.stats["misses"] += 1
+                return None
+
+            result = {}
+            for field in fields:
+                entry = quote.get(field)
+                if entry is None:
+                    self.stats["misses"] += 1
+                    return None
+                value, updated = entry
+                if now - updated > self.field_ttls.get(field, self.default_ttl):
+                    self.stats["stale"] += 1
+                    return None
+                result[field] = value
+
+            self.stats["hits"] += 1
+            result["updated_at"] = self._updated_at.get(symbol)
+            return result
+
+    @staticmethod
+    def to_price_output(quote: Dict[str, Any]) -> Dict[str, str]:
+        """캐시 값을 KIS 현재가 응답(output) 형식으로 변환"""
+        output = {}
+        for field, kis_field in KIS_OUTPUT_FIELDS.items():
+            value = quote.get(field)
+            if value is None:
+                continue
+            if field == "change_rate":
+                output[kis_field] = f"{value:.2f}"
+            else:
+                output[kis_field] = str(int(value))
+        return output
+
+    def invalidate(self, symbol: str = None):
+        """종목(또는 전체) 캐시 삭제"""
+        with self._cache_lock:
+            if symbol is None:
+                self._quotes.clear()
+                self._updated_at.clear()
+            else:
+                self._quotes.pop(symbol, None)
+                self._updated_at.pop(symbol, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중/미스/만료 통계 반환"""
+        with self._cache_lock:
+            lookups = self.stats["hits"] + self.stats["misses"] + self.stats["stale"]
+            return {
+                **self.stats,
+                "symbols": len(self._quotes),
+                "hit_ratio": self.stats["hits"] / lookups if lookups else 0.0,
+            }
+
+    def log_stats(self):
+        """캐시 통계 로그 출력"""
+        stats = self.get_stats()
+        logger.log_system(
+            f"[시세캐시] 적중 {stats['hits']} / 미스 {stats['misses']} / 만료 {stats['stale']} "
+            f"(적중률 {stats['hit_ratio']:.1%}, 종목 {stats['symbols']}개)"
+        )
+
+
+# 싱글톤 인스턴스
+quote_cache = QuoteCache()
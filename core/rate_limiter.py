@@ -0,0 +1,293 @@
+"""
+KIS REST API 요청 속도 제한기 (계좌/TR ID별 토큰 버킷 + 우선순위 레인)
+"""
+import asyncio
+import threading
+import time
+import itertools
+from typing import Dict, Any, Optional, Tuple
+
+from utils.logger import logger
+
+# 우선순위 레인 (숫자가 작을수록 먼저 처리)
+PRIORITY_ORDER = 0      # 주문/정정/취소
+PRIORITY_ACCOUNT = 1    # 잔고/포지션/체결 조회
+PRIORITY_QUOTE = 2      # 시세/호가/차트
+PRIORITY_SCAN = 3       # 종목 스캔 (거래량 순위 등)
+
+LANE_NAMES = {
+    PRIORITY_ORDER: "order",
+    PRIORITY_ACCOUNT: "account",
+    PRIORITY_QUOTE: "quote",
+    PRIORITY_SCAN: "scan",
+}
+
+# TR ID별 기본 우선순위 (등록되지 않은 TR ID는 PRIORITY_QUOTE)
+TR_ID_PRIORITIES = {
+    # 주문 (실전/모의)
+    "TTTC0012U": PRIORITY_ORDER, "TTTC0011U": PRIORITY_ORDER,
+    "VTTC0012U": PRIORITY_ORDER, "VTTC0011U": PRIORITY_ORDER,
+    "TTTC0802U": PRIORITY_ORDER, "TTTC0801U": PRIORITY_ORDER,
+    "VTTC0802U": PRIORITY_ORDER, "VTTC0801U": PRIORITY_ORDER,
+    # 정정/취소
+    "TTTC0803U": PRIORITY_ORDER, "VTTC0803U": PRIORITY_ORDER,
+    # 해시키 (주문 바디 서명)
+    "hashkey": PRIORITY_ORDER,
+    # 잔고/체결 조회
+    "TTTC8434R": PRIORITY_ACCOUNT, "VTTC8434R": PRIORITY_ACCOUNT,
+    "TTTC8001R": PRIORITY_ACCOUNT, "VTTC8001R": PRIORITY_ACCOUNT,
+    # 시세/차트
+    "FHKST01010100": PRIORITY_QUOTE,
+    "FHKST01010200": PRIORITY_QUOTE,
+    "FHKST03010100": PRIORITY_QUOTE,
+    "FHKST03010200": PRIORITY_QUOTE,
+    "CTPF1002R": PRIORITY_QUOTE,
+    # 스캔
+    "FHPST01710000": PRIORITY_SCAN,
+}
+
+
+class TokenBucket:
+    """단순 토큰 버킷 (스레드 안전성은 호출 측 락에서 보장)"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float):
+        """경과 시간만큼 토큰 보충"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def time_until_available(self, now: float) -> float:
+        """토큰 1개가 생길 때까지 남은 시간 (초)"""
+        self.refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """계좌/TR ID별 토큰 버킷 속도 제한기
+
+    - 계좌(앱키) 단위 버킷: KIS 초당 요청 제한 (실전 20건, 모의 2건)
+    - TR ID 단위 버킷: 특정 TR ID에 별도 제한이 필요한 경우 사용
+    - 우선순위 레인: 토큰이 부족할 때 주문 > 잔고 > 시세 > 스캔 순으로 배정
+    - 여러 이벤트 루프(메인 루프, 동기 호출용 백그라운드 루프)에서 공유 가능
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.enabled = True
+
+            # 계좌 단위 기본 제한 (초당 요청 수, 버스트 허용량)
+            self.default_account_rate = 20.0
+            self.default_account_burst = 20.0
+            # TR ID별 제한 {tr_id: (rate, burst)} - 미등록 TR ID는 계좌 제한만 적용
+            self.tr_id_limits: Dict[str, Tuple[float, float]] = {}
+            # 대기 중 재확인 최소 간격 (초)
+            self.min_poll_interval = 0.001
+
+            self._account_buckets: Dict[str, TokenBucket] = {}
+            self._tr_buckets: Dict[Tuple[str, str], TokenBucket] = {}
+            self._account_limits: Dict[str, Tuple[float, float]] = {}
+
+            # 대기열: {(priority, seq): (account, tr_id)}
+            self._waiters: Dict[Tuple[int, int], Tuple[str, str]] = {}
+            self._seq = itertools.count()
+            self._state_lock = threading.Lock()
+
+            # 레인별 통계
+            self._lane_stats: Dict[int, Dict[str, Any]] = {
+                priority: self._new_lane_stats() for priority in LANE_NAMES
+            }
+
+            self._initialized = True
+
+    @staticmethod
+    def _new_lane_stats() -> Dict[str, Any]:
+        return {
+            "acquired": 0,
+            "waited": 0,            # 대기가 발생한 요청 수
+            "total_wait": 0.0,      # 누적 대기 시간 (초)
+            "max_wait": 0.0,
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+        }
+
+    def configure_account(self, account: str, rate: float, burst: float = None):
+        """계좌별 초당 요청 제한 설정
+
+        Args:
+            account: 계좌번호 (또는 앱키 식별자)
+            rate: 초당 허용 요청 수
+            burst: 순간 허용량 (기본값 rate)
+        """
+        burst = burst if burst is not None else rate
+        with self._state_lock:
+            self._account_limits[account] = (rate, burst)
+            self._account_buckets[account] = TokenBucket(rate, burst)
+        logger.log_system(f"[속도제한] 계좌 {account[:4] if account else '-'}**** 초당 {rate}건 (버스트 {burst})")
+
+    def set_tr_id_limit(self, tr_id: str, rate: float, burst: float = None):
+        """TR ID별 초당 요청 제한 설정"""
+        burst = burst if burst is not None else rate
+        with self._state_lock:
+            self.tr_id_limits[tr_id] = (rate, burst)
+            for key in [k for k in self._tr_buckets if k[1] == tr_id]:
+                del self._tr_buckets[key]
+
+    @staticmethod
+    def get_priority(tr_id: Optional[str]) -> int:
+        """TR ID의 기본 우선순위 반환"""
+        return TR_ID_PRIORITIES.get(tr_id, PRIORITY_QUOTE)
+
+    def _get_account_bucket(self, account: str) -> TokenBucket:
+        bucket = self._account_buckets.get(account)
+        if bucket is None:
+            rate, burst = self._account_limits.get(
+                account, (self.default_account_rate, self.default_account_burst)
+            )
+            bucket = TokenBucket(rate, burst)
+            self._account_buckets[account] = bucket
+        return bucket
+
+    def _get_tr_bucket(self, account: str, tr_id: str) -> Optional[TokenBucket]:
+        limit = self.tr_id_limits.get(tr_id)
+        if limit is None:
+            return None
+        key = (account, tr_id)
+        bucket = self._tr_buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(*limit)
+            self._tr_buckets[key] = bucket
+        return bucket
+
+    def _try_acquire(self, key: Tuple[int, int], account: str, tr_id: str) -> float:
+        """토큰 획득 시도 (_state_lock 보유 상태에서 호출)
+
+        같은 계좌에서 자기보다 우선순위가 높고 TR 버킷이 준비된 대기자가 있으면 양보한다.
+        TR 버킷 때문에 막힌 대기자는 다른 TR ID의 요청을 막지 않는다.
+
+        Returns:
+            0이면 획득 성공, 양수면 다시 시도할 때까지 기다릴 시간 (초)
+        """
+        now = time.monotonic()
+        tr_bucket = self._get_tr_bucket(account, tr_id)
+        if tr_bucket is not None:
+            tr_wait = tr_bucket.time_until_available(now)
+            if tr_wait > 0:
+                return tr_wait
+
+        account_bucket = self._get_account_bucket(account)
+
+        for other_key, (other_account, other_tr_id) in self._waiters.items():
+            if other_key >= key or other_account != account:
+                continue
+            other_tr_bucket = self._get_tr_bucket(other_account, other_tr_id)
+            if other_tr_bucket is None or other_tr_bucket.time_until_available(now) == 0:
+                # 우선 대기자가 먼저 가져가도록 다음 토큰 시점까지 대기
+                return max(self.min_poll_interval, 1.0 / account_bucket.rate)
+
+        account_wait = account_bucket.time_until_available(now)
+        if account_wait > 0:
+            return account_wait
+
+        account_bucket.tokens -= 1
+        if tr_bucket is not None:
+            tr_bucket.tokens -= 1
+        return 0.0
+
+    async def acquire(self, tr_id: Optional[str] = None, account: str = "", priority: int = None) -> float:
+        """요청 허가 획득 (토큰이 없으면 우선순위에 따라 대기)
+
+        Args:
+            tr_id: 요청 TR ID
+            account: 계좌 식별자
+            priority: 우선순위 레인 (None이면 TR ID 기본값)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if not self.enabled:
+            return 0.0
+
+        if priority is None:
+            priority = self.get_priority(tr_id)
+        tr_id = tr_id or ""
+        key = (priority, next(self._seq))
+        stats = self._lane_stats.setdefault(priority, self._new_lane_stats())
+        started_at = time.monotonic()
+
+        with self._state_lock:
+            wait = self._try_acquire(key, account, tr_id)
+            if wait > 0:
+                self._waiters[key] = (account, tr_id)
+                stats["queue_depth"] += 1
+                stats["max_queue_depth"] = max(stats["max_queue_depth"], stats["queue_depth"])
+
+        if wait > 0:
+            try:
+                while wait > 0:
+                    await asyncio.sleep(max(wait, self.min_poll_interval))
+                    with self._state_lock:
+                        wait = self._try_acquire(key, account, tr_id)
+            finally:
+                with self._state_lock:
+                    self._waiters.pop(key, None)
+                    stats["queue_depth"] -= 1
+
+        waited = time.monotonic() - started_at
+        with self._state_lock:
+            stats["acquired"] += 1
+            if waited > self.min_poll_interval:
+                stats["waited"] += 1
+                stats["total_wait"] += waited
+                stats["max_wait"] = max(stats["max_wait"], waited)
+
+        if waited >= 1.0:
+            logger.log_debug(f"[속도제한] {tr_id} ({LANE_NAMES.get(priority, priority)}) {waited:.2f}초 대기")
+        return waited
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """레인별 대기열 깊이 및 대기 시간 통계 반환"""
+        with self._state_lock:
+            lanes = {}
+            for priority, stats in sorted(self._lane_stats.items()):
+                lanes[LANE_NAMES.get(priority, str(priority))] = {
+                    **stats,
+                    "avg_wait": stats["total_wait"] / stats["waited"] if stats["waited"] else 0.0,
+                }
+            return {
+                "enabled": self.enabled,
+                "queue_depth": len(self._waiters),
+                "lanes": lanes,
+            }
+
+    def reset_metrics(self):
+        """통계 초기화 (대기열 깊이는 유지)"""
+        with self._state_lock:
+            for priority, stats in self._lane_stats.items():
+                depth = stats["queue_depth"]
+                self._lane_stats[priority] = self._new_lane_stats()
+                self._lane_stats[priority]["queue_depth"] = depth
+
+
+# 싱글톤 인스턴스
+rate_limiter = RateLimiter()
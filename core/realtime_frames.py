@@ -0,0 +1,288 @@
+"""
+KIS 실시간 웹소켓 프레임 파서 (파이프/캐럿 형식)
+
+실시간 데이터는 JSON이 아닌 `암호화여부|TR_ID|건수|필드1^필드2^...` 형식으로 전송되며,
+한 프레임에 여러 건의 레코드가 이어 붙어 올 수 있다. 구독 응답/PINGPONG 등 제어 메시지만 JSON이다.
+체결 통보(H0STCNI0/H0STCNI9)는 본문이 AES-256-CBC로 암호화되어 오며(암호화여부=1),
+복호화 키/IV는 구독 응답(body.output.key/iv)으로 받는다.
+"""
+import base64
+from typing import Dict, Any, List, Optional, Tuple
+
+from core.response_models import _Record
+
+try:
+    from Crypto.Cipher import AES
+    from Crypto.Util.Padding import unpad
+except ImportError:
+    AES = None
+
+# H0STCNT0 실시간 체결가 필드 순서 (KIS 문서 기준 46개)
+H0STCNT0_FIELDS = (
+    "mksc_shrn_iscd", "stck_cntg_hour", "stck_prpr", "prdy_vrss_sign", "prdy_vrss", "prdy_ctrt",
+    "wghn_avrg_stck_prc", "stck_oprc", "stck_hgpr", "stck_lwpr", "askp1", "bidp1", "cntg_vol",
+    "acml_vol", "acml_tr_pbmn", "seln_cntg_csnu", "shnu_cntg_csnu", "ntby_cntg_csnu", "cttr",
+    "seln_cntg_smtn", "shnu_cntg_smtn", "ccld_dvsn", "shnu_rate", "prdy_vol_vrss_acml_vol_rate",
+    "oprc_hour", "oprc_vrss_prpr_sign", "oprc_vrss_prpr", "hgpr_hour", "hgpr_vrss_prpr_sign",
+    "hgpr_vrss_prpr", "lwpr_hour", "lwpr_vrss_prpr_sign", "lwpr_vrss_prpr", "bsop_date",
+    "new_mkop_cls_code", "trht_yn", "askp_rsqn1", "bidp_rsqn1", "total_askp_rsqn", "total_bidp_rsqn",
+    "vol_tnrt", "prdy_smns_hour_acml_vol", "prdy_smns_hour_acml_vol_rate", "hour_cls_code",
+    "mrkt_trtm_cls_code", "vi_stnd_prc",
+)
+
+# 호가 단계 수 (H0STASP0 매도/매수 각 10단계)
+BOOK_LEVELS = 10
+
+# H0STASP0 실시간 호가 필드 순서 (KIS 문서 기준 59개)
+H0STASP0_FIELDS = (
+    "mksc_shrn_iscd", "bsop_hour", "hour_cls_code",
+    *(f"askp{level}" for level in range(1, BOOK_LEVELS + 1)),
+    *(f"bidp{level}" for level in range(1, BOOK_LEVELS + 1)),
+    *(f"askp_rsqn{level}" for level in range(1, BOOK_LEVELS + 1)),
+    *(f"bidp_rsqn{level}" for level in range(1, BOOK_LEVELS + 1)),
+    "total_askp_rsqn", "total_bidp_rsqn", "ovtm_total_askp_rsqn", "ovtm_total_bidp_rsqn",
+    "antc_cnpr", "antc_cnqn", "antc_vol", "antc_cntg_vrss", "antc_cntg_vrss_sign", "antc_cntg_prdy_ctrt",
+    "acml_vol", "total_askp_rsqn_icdc", "total_bidp_rsqn_icdc", "ovtm_total_askp_icdc",
+    "ovtm_total_bidp_icdc", "stck_deal_cls_code",
+)
+
+# H0STCNI0 실시간 체결 통보 필드 순서 (KIS 문서 기준 26개, 모의투자 H0STCNI9 동일)
+H0STCNI0_FIELDS = (
+    "cust_id", "acnt_no", "oder_no", "ooder_no", "seln_byov_cls", "rctf_cls", "oder_kind", "oder_cond",
+    "stck_shrn_iscd", "cntg_qty", "cntg_unpr", "stck_cntg_hour", "rfus_yn", "cntg_yn", "acpt_yn",
+    "brnc_no", "oder_qty", "acnt_name", "ord_cond_prc", "ord_exg_gb", "popup_yn", "filler",
+    "crdt_cls", "crdt_loan_date", "cntg_isnm40", "oder_prc",
+)
+
+# 체결 통보 TR ID (실전, 모의)
+FILL_TR_IDS = ("H0STCNI0", "H0STCNI9")
+
+# {TR_ID: 필드 순서}
+REALTIME_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "H0STCNT0": H0STCNT0_FIELDS,
+    "H0STASP0": H0STASP0_FIELDS,
+    "H0STCNI0": H0STCNI0_FIELDS,
+    "H0STCNI9": H0STCNI0_FIELDS,
+}
+
+# {TR_ID: {필드명: 인덱스}} (필드명으로 원본 값을 찾을 때 사용)
+FIELD_INDEX: Dict[str, Dict[str, int]] = {
+    tr_id: {name: index for index, name in enumerate(fields)} for tr_id, fields in REALTIME_FIELDS.items()
+}
+
+_H0STCNT0_INDEX = FIELD_INDEX["H0STCNT0"]
+_CTTR = _H0STCNT0_INDEX["cttr"]
+_CCLD_DVSN = _H0STCNT0_INDEX["ccld_dvsn"]
+_H0STASP0_INDEX = FIELD_INDEX["H0STASP0"]
+_H0STCNI0_INDEX = FIELD_INDEX["H0STCNI0"]
+
+
+def normalize_order_id(order_id: str) -> str:
+    """주문번호 정규화 (REST ODNO와 체결 통보 ODER_NO의 0 채움 자릿수 차이 제거)"""
+    return str(order_id).strip().lstrip("0") or "0"
+
+
+def decrypt_payload(payload: str, key: str, iv: str) -> str:
+    """암호화된 실시간 본문 복호화 (AES-256-CBC, base64, PKCS7)
+
+    Raises:
+        RuntimeError: pycryptodome 미설치
+    """
+    if AES is None:
+        raise RuntimeError("pycryptodome 미설치 - 체결 통보 복호화 불가 (pip install pycryptodome)")
+    cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, iv.encode("utf-8"))
+    return unpad(cipher.decrypt(base64.b64decode(payload)), AES.block_size).decode("utf-8")
+
+
+def _num(value: str) -> float:
+    """숫자 문자열 변환 (빈 값/오류는 0.0)"""
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+class Tick(_Record):
+    """실시간 체결 틱 (H0STCNT0 레코드 1건)
+
+    주요 필드는 숫자로 변환해 속성으로 제공하고, 그 밖의 필드는 get("KIS 필드명")으로 원본 문자열을 조회한다.
+    get()은 JSON 본문(dict)과 같은 방식으로 동작하므로 기존 dict 기반 콜백에도 그대로 전달할 수 있다.
+    """
+    __slots__ = ("symbol", "time", "price", "change", "change_rate", "open", "high", "low",
+                 "volume", "cum_volume", "cum_amount", "ask1", "bid1", "strength", "side", "raw")
+
+    def __init__(self, raw: List[str]):
+        self.raw = raw                                          # 원본 필드 (H0STCNT0_FIELDS 순서)
+        self.symbol = raw[0]
+        self.time = raw[1]                                      # HHMMSS
+        self.price = _num(raw[2])
+        self.change = _num(raw[4])                              # 전일 대비 (부호 포함)
+        self.change_rate = _num(raw[5])
+        self.open = _num(raw[7])
+        self.high = _num(raw[8])
+        self.low = _num(raw[9])
+        self.ask1 = _num(raw[10])
+        self.bid1 = _num(raw[11])
+        self.volume = int(_num(raw[12]))                        # 체결 거래량
+        self.cum_volume = int(_num(raw[13]))                    # 누적 거래량
+        self.cum_amount = _num(raw[14])                         # 누적 거래대금
+        self.strength = _num(raw[_CTTR])                        # 체결강도
+        self.side = raw[_CCLD_DVSN]                             # 1: 매수 체결, 5: 매도 체결
+
+    @property
+    def prev_close(self) -> float:
+        return self.price - self.change
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """KIS 필드명으로 원본 문자열 조회 (tr_key는 종목코드)"""
+        if name == "tr_key":
+            return self.symbol
+        position = _H0STCNT0_INDEX.get(name)
+        if position is None:
+            return default
+        return self.raw[position]
+
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name, KeyError)
+        if value is KeyError:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: str) -> bool:
+        return name == "tr_key" or name in _H0STCNT0_INDEX
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"tr_key": self.symbol, **dict(zip(H0STCNT0_FIELDS, self.raw))}
+
+
+class OrderBookRecord(_Record):
+    """실시간 호가 레코드 (H0STASP0 1건, 수치 변환은 core.order_book.OrderBook.apply에서 수행)"""
+    __slots__ = ("symbol", "raw")
+
+    def __init__(self, raw: List[str]):
+        self.raw = raw                                          # 원본 필드 (H0STASP0_FIELDS 순서)
+        self.symbol = raw[0]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """KIS 필드명으로 원본 문자열 조회 (tr_key는 종목코드)"""
+        if name == "tr_key":
+            return self.symbol
+        position = _H0STASP0_INDEX.get(name)
+        if position is None:
+            return default
+        return self.raw[position]
+
+
+class FillNotice(_Record):
+    """실시간 체결 통보 (H0STCNI0 레코드 1건)
+
+    같은 TR로 주문 접수, 체결, 정정/취소 확인, 거부가 모두 전달된다.
+    - is_fill: 체결 (quantity/price는 이번 체결 수량/단가)
+    - rejected: 주문 거부
+    - cancelled/modified: 취소/정정 확인 (order_id는 취소/정정 주문번호, orig_order_id가 원주문)
+    """
+    __slots__ = ("order_id", "orig_order_id", "symbol", "side", "quantity", "price", "order_quantity",
+                 "time", "is_fill", "rejected", "cancelled", "modified", "raw")
+
+    def __init__(self, raw: List[str]):
+        self.raw = raw                                          # 원본 필드 (H0STCNI0_FIELDS 순서)
+        self.order_id = normalize_order_id(raw[2])
+        self.orig_order_id = normalize_order_id(raw[3]) if raw[3].strip() else ""
+        self.side = "SELL" if raw[4] == "01" else "BUY"         # 01: 매도, 02: 매수
+        self.modified = raw[5] == "1"                           # 정정구분 0: 정상, 1: 정정, 2: 취소
+        self.cancelled = raw[5] == "2"
+        self.symbol = raw[8]
+        self.quantity = int(_num(raw[9]))
+        self.price = _num(raw[10])
+        self.time = raw[11]                                     # HHMMSS
+        self.rejected = raw[12] == "1"                          # 거부여부 0: 승인, 1: 거부
+        self.is_fill = raw[13] == "2"                           # 체결여부 1: 접수/정정/취소/거부, 2: 체결
+        self.order_quantity = int(_num(raw[16]))
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """KIS 필드명으로 원본 문자열 조회 (tr_key는 종목코드)"""
+        if name == "tr_key":
+            return self.symbol
+        position = _H0STCNI0_INDEX.get(name)
+        if position is None or position >= len(self.raw):
+            return default
+        return self.raw[position]
+
+
+class RealtimeFrame:
+    """파이프 형식 실시간 프레임 (헤더 + 레코드 목록)"""
+    __slots__ = ("encrypted", "tr_id", "count", "payload", "records")
+
+    def __init__(self, encrypted: bool, tr_id: str, count: int, payload: str, records: List[List[str]]):
+        self.encrypted = encrypted
+        self.tr_id = tr_id
+        self.count = count
+        self.payload = payload          # 암호화된 프레임이면 복호화 전 본문
+        self.records = records          # 레코드별 필드 목록 (암호화/미등록 TR이면 빈 목록)
+
+    def ticks(self) -> List[Tick]:
+        """H0STCNT0 레코드를 Tick 목록으로 변환"""
+        if self.tr_id != "H0STCNT0":
+            return []
+        return [Tick(record) for record in self.records]
+
+    def order_books(self) -> List[OrderBookRecord]:
+        """H0STASP0 레코드를 OrderBookRecord 목록으로 변환"""
+        if self.tr_id != "H0STASP0":
+            return []
+        return [OrderBookRecord(record) for record in self.records]
+
+    def fill_notices(self, key: str, iv: str) -> List[FillNotice]:
+        """체결 통보 프레임 복호화 후 FillNotice 목록으로 변환 (key/iv: 구독 응답 output)"""
+        if self.tr_id not in FILL_TR_IDS:
+            return []
+        payload = decrypt_payload(self.payload, key, iv) if self.encrypted else self.payload
+        if self.count <= 1:
+            # 단건은 필드 수가 문서 버전마다 달라도(23/26개) 주문수량까지만 있으면 처리
+            values = payload.split("^")
+            records = [values] if len(values) > _H0STCNI0_INDEX["oder_qty"] else []
+        else:
+            records = split_records(self.tr_id, payload, self.count)
+        return [FillNotice(record) for record in records]
+
+
+def is_realtime_frame(message: str) -> bool:
+    """파이프 형식 실시간 프레임 여부 (JSON 제어 메시지는 '{'로 시작)"""
+    return len(message) > 2 and message[1] == "|" and message[0] in "01"
+
+
+def split_records(tr_id: str, payload: str, count: int) -> List[List[str]]:
+    """캐럿(^)으로 이어진 본문을 건수만큼 레코드로 분할
+
+    Args:
+        tr_id: 실시간 TR ID (REALTIME_FIELDS에 등록된 경우만 분할)
+        payload: 본문 문자열
+        count: 헤더의 데이터 건수
+    """
+    fields = REALTIME_FIELDS.get(tr_id)
+    if fields is None:
+        return []
+    values = payload.split("^")
+    width = len(fields)
+    if count <= 1:
+        return [values] if len(values) >= width else []
+    # 전체를 한 번만 분할한 뒤 필드 수 단위로 자름 (부족한 마지막 레코드는 제외)
+    available = min(count, len(values) // width)
+    return [values[i * width:(i + 1) * width] for i in range(available)]
+
+
+def parse_frame(message: str) -> Optional[RealtimeFrame]:
+    """파이프 형식 프레임 파싱 (JSON 제어 메시지나 형식 오류면 None)"""
+    if not is_realtime_frame(message):
+        return None
+    parts = message.split("|", 3)
+    if len(parts) != 4:
+        return None
+    flag, tr_id, count_text, payload = parts
+    try:
+        count = int(count_text)
+    except ValueError:
+        return None
+    encrypted = flag == "1"
+    records = [] if encrypted else split_records(tr_id, payload, count)
+    return RealtimeFrame(encrypted, tr_id, count, payload, records)
@@ -0,0 +1,136 @@
+"""
+동일 요청 병합기 (single-flight)
+
+같은 (path, tr_id, params) 요청이 동시에 진행 중이면 하나의 실제 요청 결과를 공유한다.
+"""
+import asyncio
+import concurrent.futures
+import copy
+import threading
+from typing import Dict, Any, Callable, Awaitable, Hashable, Optional, Tuple
+
+from utils.logger import logger
+
+
+class RequestCoalescer:
+    """진행 중인 동일 요청을 하나로 합치는 관리자
+
+    - 키가 같은 요청이 진행 중이면 새 요청을 보내지 않고 결과를 기다림
+    - 여러 이벤트 루프(메인 루프, 동기 호출용 백그라운드 루프) 간에도 공유
+    - 결과를 여러 호출자가 받으면 호출자별 사본을 반환 (호출자가 결과를 수정해도 안전)
+    - 대기자 하나가 취소되어도 실제 요청과 다른 대기자에는 영향 없음
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.enabled = True
+
+            # {키: [concurrent.futures.Future, 대기자 수]}
+            self._inflight: Dict[Hashable, list] = {}
+            self._inflight_lock = threading.Lock()
+            # 실행 중 태스크 참조 보관 (GC 방지)
+            self._tasks = set()
+
+            self.stats = {
+                "requests": 0,      # 전체 요청 수
+                "executed": 0,      # 실제 실행된 요청 수
+                "coalesced": 0,     # 진행 중 요청에 합쳐진 요청 수
+            }
+
+            self._initialized = True
+
+    @staticmethod
+    def make_key(method: str, path: str, tr_id: Optional[str], params: Optional[Dict[str, Any]],
+                 *extra: Hashable) -> Tuple:
+        """요청 병합 키 생성"""
+        params_key = tuple(sorted((k, str(v)) for k, v in params.items())) if params else ()
+        return (method.upper(), path, tr_id, params_key) + extra
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """키가 같은 요청이 진행 중이면 그 결과를 기다리고, 없으면 factory를 실행
+
+        Args:
+            key: 요청 병합 키 (make_key 참조)
+            factory: 실제 요청 코루틴을 생성하는 함수
+
+        Returns:
+            요청 결과
+        """
+        if not self.enabled:
+            return await factory()
+
+        with self._inflight_lock:
+            self.stats["requests"] += 1
+            entry = self._inflight.get(key)
+            if entry is None:
+                entry = [concurrent.futures.Future(), 1]
+                self._inflight[key] = entry
+                leader = True
+                self.stats["executed"] += 1
+            else:
+                entry[1] += 1
+                leader = False
+                self.stats["coalesced"] += 1
+
+        future = entry[0]
+        if leader:
+            # 호출자가 취소되어도 실제 요청은 끝까지 실행하여 다른 대기자에게 결과 전달
+            task = asyncio.ensure_future(self._execute(key, future, factory))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            logger.log_debug(f"[요청병합] 진행 중인 요청에 합류: {key[1] if isinstance(key, tuple) and len(key) > 1 else key}")
+
+        result = await asyncio.shield(asyncio.wrap_future(future))
+
+        # 둘 이상이 결과를 공유하면 호출자별 사본 반환
+        if entry[1] > 1:
+            return copy.deepcopy(result)
+        return result
+
+    async def _execute(self, key: Hashable, future: concurrent.futures.Future,
+                       factory: Callable[[], Awaitable[Any]]):
+        """실제 요청 실행 후 모든 대기자에게 결과 전달"""
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            self._release(key)
+            future.cancel()
+            raise
+        except Exception as e:
+            self._release(key)
+            future.set_exception(e)
+        else:
+            self._release(key)
+            future.set_result(result)
+
+    def _release(self, key: Hashable):
+        """진행 중 목록에서 제거 (이후 들어온 요청은 새로 실행)"""
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """병합 통계 반환"""
+        with self._inflight_lock:
+            requests = self.stats["requests"]
+            return {
+                **self.stats,
+                "inflight": len(self._inflight),
+                "coalesce_ratio": self.stats["coalesced"] / requests if requests else 0.0,
+            }
+
+
+# 싱글톤 인스턴스
+request_coalescer = RequestCoalescer()
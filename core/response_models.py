@@ -0,0 +1,273 @@
+"""
+KIS 응답 디코딩 계층 (빠른 JSON 디코더 + __slots__ 기반 레코드)
+
+문자열 필드는 클라이언트 경계에서 한 번만 숫자로 변환하고,
+이후 코드는 레코드 속성을 바로 사용한다.
+"""
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+try:
+    import orjson
+
+    def loads(text):
+        """JSON 디코딩 (orjson 사용)"""
+        return orjson.loads(text)
+
+    JSON_DECODER = "orjson"
+except ImportError:
+    loads = json.loads
+    JSON_DECODER = "json"
+
+
+def to_float(value: Any, default: float = 0.0) -> float:
+    """KIS 숫자 문자열을 float로 변환 (빈 값/오류 시 default)"""
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def to_int(value: Any, default: int = 0) -> int:
+    """KIS 숫자 문자열을 int로 변환 ("123.0" 형식 허용)"""
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        try:
+            return int(float(value))
+        except (ValueError, TypeError):
+            return default
+
+
+class _Record:
+    """슬롯 기반 읽기 전용 레코드 공통 기능"""
+    __slots__ = ()
+
+    def __deepcopy__(self, memo):
+        # 생성 후 변경하지 않으므로 응답 사본(요청 병합 등)에서도 공유
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Quote(_Record):
+    """현재가 시세 (inquire-price output)"""
+    __slots__ = ("symbol", "price", "open", "high", "low", "prev_close", "volume", "change_rate", "name")
+
+    def __init__(self, symbol: str, price: float, open: float = 0.0, high: float = 0.0, low: float = 0.0,
+                 prev_close: float = 0.0, volume: int = 0, change_rate: float = 0.0, name: str = ""):
+        self.symbol = symbol
+        self.price = price
+        self.open = open
+        self.high = high
+        self.low = low
+        self.prev_close = prev_close
+        self.volume = volume
+        self.change_rate = change_rate
+        self.name = name
+
+    @classmethod
+    def from_output(cls, symbol: str, output: Dict[str, Any]) -> Optional["Quote"]:
+        """현재가 응답 output에서 생성 (현재가가 없으면 None)"""
+        if not isinstance(output, dict):
+            return None
+        price = to_float(output.get("stck_prpr"))
+        if price <= 0:
+            return None
+        return cls(
+            symbol=symbol,
+            price=price,
+            open=to_float(output.get("stck_oprc")),
+            high=to_float(output.get("stck_hgpr")),
+            low=to_float(output.get("stck_lwpr")),
+            prev_close=to_float(output.get("stck_sdpr")),
+            volume=to_int(output.get("acml_vol")),
+            change_rate=to_float(output.get("prdy_ctrt")),
+            name=output.get("rprs_mrkt_kor_name") or output.get("hts_kor_isnm") or "",
+        )
+
+
+class Holding(_Record):
+    """보유 종목 (잔고 조회 output1 항목)"""
+    __slots__ = ("symbol", "name", "quantity", "orderable_quantity", "avg_price", "current_price",
+                 "profit_rate", "profit_amount", "eval_amount", "purchase_amount")
+
+    def __init__(self, symbol: str, name: str, quantity: int, orderable_quantity: int, avg_price: float,
+                 current_price: float, profit_rate: float, profit_amount: float, eval_amount: float,
+                 purchase_amount: float):
+        self.symbol = symbol
+        self.name = name
+        self.quantity = quantity
+        self.orderable_quantity = orderable_quantity
+        self.avg_price = avg_price
+        self.current_price = current_price
+        self.profit_rate = profit_rate          # 평가손익률 (%, KIS evlu_pfls_rt 그대로)
+        self.profit_amount = profit_amount
+        self.eval_amount = eval_amount
+        self.purchase_amount = purchase_amount
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> "Holding":
+        return cls(
+            symbol=item.get("pdno", ""),
+            name=item.get("prdt_name", ""),
+            quantity=to_int(item.get("hldg_qty")),
+            orderable_quantity=to_int(item.get("ord_psbl_qty")),
+            avg_price=to_float(item.get("pchs_avg_pric")),
+            current_price=to_float(item.get("prpr")),
+            profit_rate=to_float(item.get("evlu_pfls_rt")),
+            profit_amount=to_float(item.get("evlu_pfls_amt")),
+            eval_amount=to_float(item.get("evlu_amt")),
+            purchase_amount=to_float(item.get("pchs_amt")),
+        )
+
+
+class AccountSummary(_Record):
+    """계좌 요약 (잔고 조회 output2 항목)"""
+    __slots__ = ("cash", "total_eval", "securities_eval", "net_asset")
+
+    def __init__(self, cash: float, total_eval: float, securities_eval: float, net_asset: float):
+        self.cash = cash
+        self.total_eval = total_eval
+        self.securities_eval = securities_eval
+        self.net_asset = net_asset
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> "AccountSummary":
+        item = item if isinstance(item, dict) else {}
+        return cls(
+            cash=to_float(item.get("dnca_tot_amt")),
+            total_eval=to_float(item.get("tot_evlu_amt")),
+            securities_eval=to_float(item.get("scts_evlu_amt")),
+            net_asset=to_float(item.get("nass_amt")),
+        )
+
+
+def decode_holdings(items: List[Dict[str, Any]], held_only: bool = True) -> List[Holding]:
+    """잔고 output1을 Holding 목록으로 변환
+
+    Args:
+        items: output1 항목 목록
+        held_only: True면 종목코드가 있고 보유 수량이 0보다 큰 항목만 포함
+    """
+    holdings = []
+    for item in items or []:
+        if not isinstance(item, dict):
+            continue
+        holding = Holding.from_item(item)
+        if held_only and (not holding.symbol or holding.quantity <= 0):
+            continue
+        holdings.append(holding)
+    return holdings
+
+
+# 차트 응답(output2) 필드 매핑 {열 이름: KIS 필드}
+MINUTE_CHART_FIELDS = {
+    "date": "stck_bsop_date",
+    "time": "stck_cntg_hour",
+    "open": "stck_oprc",
+    "high": "stck_hgpr",
+    "low": "stck_lwpr",
+    "close": "stck_prpr",
+    "volume": "cntg_vol",
+}
+DAILY_CHART_FIELDS = {
+    "date": "stck_bsop_date",
+    "open": "stck_oprc",
+    "high": "stck_hgpr",
+    "low": "stck_lwpr",
+    "close": "stck_clpr",
+    "volume": "acml_vol",
+}
+
+
+@dataclass
+class ChartColumns:
+    """시간순(과거 -> 최근)으로 정렬된 차트 열 배열"""
+    ts: np.ndarray = field(default_factory=lambda: np.array([], dtype="datetime64[s]"))
+    open: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    high: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    low: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    close: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    volume: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def take(self, index) -> "ChartColumns":
+        """인덱스 배열 또는 불리언 마스크로 행 선택"""
+        return ChartColumns(
+            ts=self.ts[index],
+            open=self.open[index],
+            high=self.high[index],
+            low=self.low[index],
+            close=self.close[index],
+            volume=self.volume[index],
+        )
+
+
+def _column(items: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """숫자 문자열 열을 float64 배열로 변환 (빈 값/오류는 NaN)"""
+    raw = np.array([item.get(key) or "nan" for item in items])
+    try:
+        return raw.astype(np.float64)
+    except ValueError:
+        # 숫자가 아닌 값이 섞인 경우에만 행 단위로 변환
+        return np.array([to_float(value, np.nan) for value in raw], dtype=np.float64)
+
+
+def decode_chart(items: List[Dict[str, Any]], fields: Dict[str, str] = None) -> ChartColumns:
+    """차트 응답 output2를 열 배열로 변환 (필드가 빠진 행은 제외, 시간순 정렬)
+
+    Args:
+        items: output2 항목 목록 (KIS는 최신순으로 반환)
+        fields: 필드 매핑 (MINUTE_CHART_FIELDS 또는 DAILY_CHART_FIELDS)
+
+    Returns:
+        ChartColumns: ts는 datetime64[s]
+    """
+    fields = fields or MINUTE_CHART_FIELDS
+    items = [item for item in items or [] if isinstance(item, dict)]
+    if not items:
+        return ChartColumns()
+
+    columns = {name: _column(items, key) for name, key in fields.items()}
+    if "time" not in columns:
+        columns["time"] = np.zeros(len(items))
+
+    valid = np.ones(len(items), dtype=bool)
+    for values in columns.values():
+        valid &= ~np.isnan(values)
+    valid &= (columns["date"] > 0) & (columns["close"] > 0)
+    if not valid.any():
+        return ChartColumns()
+
+    # YYYYMMDD / HHMMSS 정수를 datetime64로 변환
+    date = columns["date"][valid].astype(np.int64)
+    hhmmss = columns["time"][valid].astype(np.int64)
+    months = (date // 10000 - 1970) * 12 + (date // 100 % 100 - 1)
+    days = months.astype("datetime64[M]").astype("datetime64[D]") + (date % 100 - 1).astype("timedelta64[D]")
+    seconds = (hhmmss // 10000) * 3600 + (hhmmss // 100 % 100) * 60 + hhmmss % 100
+    ts = days.astype("datetime64[s]") + seconds.astype("timedelta64[s]")
+
+    order = np.argsort(ts, kind="stable")
+    return ChartColumns(
+        ts=ts[order],
+        open=columns["open"][valid][order],
+        high=columns["high"][valid][order],
+        low=columns["low"][valid][order],
+        close=columns["close"][valid][order],
+        volume=columns["volume"][valid][order].astype(np.int64),
+    )
@@ -0,0 +1,178 @@
+"""
+REST 요청 재시도 정책 (오류 유형별 규칙 + 지수 백오프/비상관 지터 + 재시도 예산)
+"""
+import random
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from utils.logger import logger
+
+# 오류 유형
+ERROR_TIMEOUT = "timeout"               # 요청 타임아웃
+ERROR_CONNECTION = "connection"         # 연결 실패/끊김 (aiohttp.ClientError)
+ERROR_SERVER = "server"                 # 502/503/504 등 일시적 서버 오류
+ERROR_RATE_LIMITED = "rate_limited"     # KIS 초당 거래건수 초과 (EGW00201)
+ERROR_TOKEN = "token"                   # 토큰 만료/인증 오류 (재발급 후 즉시 재시도)
+
+# KIS 초당 거래건수 초과 응답 코드
+RATE_LIMIT_MSG_CODES = ("EGW00201",)
+
+# 일시적 오류로 보고 재시도하는 HTTP 상태 코드
+RETRYABLE_HTTP_STATUSES = (429, 502, 503, 504)
+
+
+class RetryRule:
+    """오류 유형별 재시도 규칙"""
+
+    def __init__(self, retryable: bool = True, base_delay: float = 0.2, max_delay: float = 5.0,
+                 max_attempts: int = None, use_budget: bool = True):
+        """
+        Args:
+            retryable: 재시도 여부
+            base_delay: 최소 대기 시간 (초)
+            max_delay: 최대 대기 시간 (초)
+            max_attempts: 이 유형으로 허용할 최대 재시도 횟수 (None이면 호출 측 max_retries만 적용)
+            use_budget: 재시도 예산 차감 여부 (토큰 재발급처럼 장애와 무관한 재시도는 False)
+        """
+        self.retryable = retryable
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.use_budget = use_budget
+
+
+class RetryBudget:
+    """재시도 예산 (최근 요청 수 대비 재시도 비율 제한)
+
+    요청마다 ratio만큼, 시간에 따라 min_per_second만큼 적립되고 재시도마다 1씩 차감된다.
+    장애로 모든 요청이 실패해도 재시도가 요청량의 ratio 이상으로 늘지 않아 부하가 증폭되지 않는다.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, capacity: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.balance = capacity
+        self.updated_at = time.monotonic()
+        self._budget_lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.balance = min(self.capacity, self.balance + elapsed * self.min_per_second)
+            self.updated_at = now
+
+    def deposit(self):
+        """요청 1건 적립"""
+        with self._budget_lock:
+            self._refill(time.monotonic())
+            self.balance = min(self.capacity, self.balance + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """재시도 1건 차감 (잔액 부족 시 False)"""
+        with self._budget_lock:
+            self._refill(time.monotonic())
+            if self.balance >= 1:
+                self.balance -= 1
+                return True
+            return False
+
+
+class RetryPolicy:
+    """REST 요청 재시도 정책
+
+    - 오류 유형별로 재시도 여부와 대기 범위를 다르게 적용
+    - 대기 시간은 비상관 지터(decorrelated jitter): min(max_delay, uniform(base, 이전 대기 * 3))
+    - 재시도 예산을 넘으면 즉시 실패 처리하여 장애 시 재시도 폭주 방지
+    - 대기는 호출 측에서 asyncio.sleep으로 수행 (이벤트 루프를 막지 않음)
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.rules: Dict[str, RetryRule] = {
+                ERROR_TIMEOUT: RetryRule(base_delay=0.5, max_delay=5.0, max_attempts=2),
+                ERROR_CONNECTION: RetryRule(base_delay=0.2, max_delay=3.0),
+                ERROR_SERVER: RetryRule(base_delay=0.3, max_delay=5.0),
+                ERROR_RATE_LIMITED: RetryRule(base_delay=0.1, max_delay=1.0, use_budget=False),
+                ERROR_TOKEN: RetryRule(base_delay=0.0, max_delay=0.0, use_budget=False),
+            }
+            self.budget = RetryBudget()
+            self._random = random.Random()
+
+            self.stats = {
+                "requests": 0,
+                "retries": {},              # {오류 유형: 재시도 수}
+                "budget_exhausted": 0,      # 예산 부족으로 포기한 횟수
+                "total_delay": 0.0,         # 누적 대기 시간 (초)
+            }
+
+            self._initialized = True
+
+    def record_request(self):
+        """요청 시작 기록 (재시도 예산 적립)"""
+        self.stats["requests"] += 1
+        self.budget.deposit()
+
+    def next_delay(self, error_type: str, retry_count: int, previous_delay: float = 0.0) -> Optional[float]:
+        """다음 재시도까지 대기 시간 계산
+
+        Args:
+            error_type: 오류 유형 (ERROR_* 상수)
+            retry_count: 이 오류 유형으로 이미 수행한 재시도 횟수
+            previous_delay: 직전 대기 시간 (초)
+
+        Returns:
+            대기 시간 (초), 재시도하지 않아야 하면 None
+        """
+        rule = self.rules.get(error_type)
+        if rule is None or not rule.retryable:
+            return None
+        if rule.max_attempts is not None and retry_count >= rule.max_attempts:
+            return None
+        if rule.use_budget and not self.budget.try_withdraw():
+            self.stats["budget_exhausted"] += 1
+            logger.log_warning(f"[재시도] 재시도 예산 소진 - {error_type} 오류 재시도 생략")
+            return None
+
+        upper = max(rule.base_delay, previous_delay * 3)
+        delay = min(rule.max_delay, self._random.uniform(rule.base_delay, upper))
+
+        retries = self.stats["retries"]
+        retries[error_type] = retries.get(error_type, 0) + 1
+        self.stats["total_delay"] += delay
+        return delay
+
+    @staticmethod
+    def classify_http_error(status_code: int, body: Dict[str, Any] = None) -> Optional[str]:
+        """HTTP 응답을 오류 유형으로 분류 (재시도 대상이 아니면 None)"""
+        msg_cd = (body or {}).get("msg_cd", "")
+        if msg_cd in RATE_LIMIT_MSG_CODES or status_code == 429:
+            return ERROR_RATE_LIMITED
+        if status_code in RETRYABLE_HTTP_STATUSES:
+            return ERROR_SERVER
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """재시도 통계 반환"""
+        return {
+            **self.stats,
+            "retries": dict(self.stats["retries"]),
+            "budget_balance": round(self.budget.balance, 2),
+        }
+
+
+# 싱글톤 인스턴스
+retry_policy = RetryPolicy()
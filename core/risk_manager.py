@@ -8,9 +8,12 @@ from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 import time
 
+import numpy as np
+
 from config.settings import config
 from core.api_client import api_client
 from core.account_state import account_state
+from core.daily_bars import daily_bar_store
 from utils.logger import logger
 from utils.database import database_manager
 
@@ -178,33 +181,15 @@ class RiskManager:
             if symbol in self.symbol_volatility:
                 return self.symbol_volatility[symbol]
             
-            # 일봉 데이터 조회
-            daily_data = api_client.get_daily_price(symbol, 20)
-            
-            if not daily_data or daily_data.get("rt_cd") != "0":
-                # 실패 시 기본값 반환
-                return 0.02  # 기본 변동성 2%
-            
-            # 일별 종가 추출
-            prices = []
-            chart_data = daily_data.get("output2", [])
-            
-            for item in chart_data:
-                if "stck_clpr" in item:
-                    prices.append(float(item["stck_clpr"]))
+            # 저장된 일봉 종가 (최근 20일 수익률 계산용 21개, REST 호출 없음)
+            prices = daily_bar_store.get_bars(symbol, 21).close
             
             if len(prices) < 2:
                 return 0.02  # 데이터 부족 시 기본값
             
-            # 일별 수익률 계산
-            returns = []
-            for i in range(1, len(prices)):
-                daily_return = (prices[i] - prices[i-1]) / prices[i-1]
-                returns.append(daily_return)
-            
             # 변동성 계산 (일별 수익률의 표준편차)
-            import numpy as np
-            volatility = np.std(returns)
+            returns = np.diff(prices) / prices[:-1]
+            volatility = float(np.std(returns))
             
             # 연간 변동성으로 변환 (일별 변동성 * sqrt(252))
             annualized_volatility = volatility * (252 ** 0.5)
@@ -1,6 +1,7 @@
 """
 종목 탐색 및 필터링 모듈
 """
+import asyncio
 from typing import List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import numpy as np
@@ -39,7 +40,7 @@ class StockExplorer:
             
             # 2) 거래량 순위 API 호출 (새로운 함수 형식으로 매개변수 맞춤)
             logger.log_system(f"거래량 상위 종목 조회 시작: 시장={market_code}, 정렬={1}, 개수={max_symbols}")
-            vol_data = api_client.get_market_trading_volume(
+            vol_data = await api_client.get_market_trading_volume_async(
                 market_code=market_code,
                 screen_code="20171",  
                 vol_cnt=str(max_symbols)
@@ -111,11 +112,12 @@ class StockExplorer:
                 top_symbols=", ".join(symbols[:5])  # 상위 5개만 기록
             )
             
-            # 상위 5개 종목 정보 로깅
+            # 상위 5개 종목 정보 로깅 (동시 조회)
+            top_infos = await self.get_symbol_info_many(symbols[:5])
             for symbol in symbols[:5]:
                 try:
-                    symbol_info = self.get_symbol_info(symbol)
-                    if symbol_info:
+                    symbol_info = top_infos.get(symbol)
+                    if symbol_info and not symbol_info.get("error"):
                         logger.log_trade(
                             action="SYMBOL_INFO",
                             symbol=symbol,
@@ -158,103 +160,130 @@ class StockExplorer:
             error_message=error_message
         )
     
-    def get_symbol_info(self, symbol: str) -> Dict[str, Any]:
-        """종목 정보 조회"""
-        try:
-            # 기본 정보
-            info = api_client.get_stock_info(symbol)
-            
-            # API 응답 구조 로깅 (오류 발생 시에만)
-            if info.get("rt_cd") != "0":
-                logger.log_system(f"종목 정보 API 응답 구조: {list(info.keys())}")
-                if "output" in info:
-                    logger.log_system(f"종목 정보 output 구조: {list(info['output'].keys())}")
-            
-            # 현재가
-            price_data = api_client.get_current_price(symbol)
+    def _build_symbol_info(self, symbol: str, info: Dict[str, Any], price_data: Dict[str, Any]) -> Dict[str, Any]:
+        """종목 기본 정보/현재가 응답으로 종목 정보 생성"""
+        # API 응답 구조 로깅 (오류 발생 시에만)
+        if info.get("rt_cd") != "0":
+            logger.log_system(f"종목 정보 API 응답 구조: {list(info.keys())}")
+            if "output" in info:
+                logger.log_system(f"종목 정보 output 구조: {list(info['output'].keys())}")
+        
+        if info.get("rt_cd") == "0" and price_data.get("rt_cd") == "0":
+            # 종목명 필드 찾기
+            name_field = None
+            name = "Unknown"
             
-            if info.get("rt_cd") == "0" and price_data.get("rt_cd") == "0":
-                # 종목명 필드 찾기
-                name_field = None
-                name = "Unknown"
+            if "output" in info:
+                output = info["output"]
+                # 가능한 이름 필드들을 순서대로 확인
+                for field in ["hts_kor_isnm", "prdt_name", "stck_prdt_name", "kor_name", "name", "rprs_mrkt_kor_name"]:
+                    if field in output:
+                        name = output[field]
+                        name_field = field
+                        break
                 
-                if "output" in info:
-                    output = info["output"]
-                    # 가능한 이름 필드들을 순서대로 확인
-                    for field in ["hts_kor_isnm", "prdt_name", "stck_prdt_name", "kor_name", "name", "rprs_mrkt_kor_name"]:
-                        if field in output:
+                # 필드 이름에 "name"이 포함된 키를 검색
+                if not name_field:
+                    for field in output.keys():
+                        if "name" in field.lower() or "nm" in field.lower():
                             name = output[field]
                             name_field = field
                             break
-                    
-                    # 필드 이름에 "name"이 포함된 키를 검색
-                    if not name_field:
-                        for field in output.keys():
-                            if "name" in field.lower() or "nm" in field.lower():
-                                name = output[field]
-                                name_field = field
-                                break
+            
+            # 가격 정보 필드 찾기
+            current_price = 0
+            volume = 0
+            change_rate = 0
+            prev_close = 0
+            
+            if "output" in price_data:
+                price_output = price_data["output"]
                 
-                # 가격 정보 필드 찾기
-                current_price = 0
-                volume = 0
-                change_rate = 0
-                prev_close = 0
+                # 현재가 필드 찾기
+                for field in ["stck_prpr", "current_price", "price", "prpr"]:
+                    if field in price_output:
+                        current_price = float(price_output[field])
+                        break
                 
-                if "output" in price_data:
-                    price_output = price_data["output"]
-                    
-                    # 현재가 필드 찾기
-                    for field in ["stck_prpr", "current_price", "price", "prpr"]:
-                        if field in price_output:
-                            current_price = float(price_output[field])
-                            break
-                    
-                    # 거래량 필드 찾기
-                    for field in ["acml_vol", "volume", "vol"]:
-                        if field in price_output:
-                            volume = int(price_output[field])
-                            break
-                    
-                    # 등락률 필드 찾기
-                    for field in ["prdy_ctrt", "change_rate", "prdy_vrss_prpr_rate"]:
-                        if field in price_output:
-                            change_rate = float(price_output[field])
-                            break
-                    
-                    # 전일종가 필드 찾기
-                    for field in ["pstc_prpr", "prev_close", "stck_prdy_clpr"]:
-                        if field in price_output:
-                            prev_close = float(price_output[field])
-                            break
+                # 거래량 필드 찾기
+                for field in ["acml_vol", "volume", "vol"]:
+                    if field in price_output:
+                        volume = int(price_output[field])
+                        break
                 
-                # 결과 조합
-                result = {
-                    "symbol": symbol,
-                    "name": name, 
-                    "current_price": current_price,
-                    "prev_close": prev_close,
-                    "change_rate": change_rate,
-                    "volume": volume
-                }
-                return result
+                # 등락률 필드 찾기
+                for field in ["prdy_ctrt", "change_rate", "prdy_vrss_prpr_rate"]:
+                    if field in price_output:
+                        change_rate = float(price_output[field])
+                        break
                 
-            # API 오류 시 빈 결과 반환 이전에 오류 로깅
-            if info.get("rt_cd") != "0":
-                error_msg = f"API 응답 오류: {info.get('msg1', '알 수 없는 오류')} (rt_cd: {info.get('rt_cd')})"
-                logger.log_system(error_msg)
-            return {}
+                # 전일종가 필드 찾기
+                for field in ["pstc_prpr", "prev_close", "stck_prdy_clpr"]:
+                    if field in price_output:
+                        prev_close = float(price_output[field])
+                        break
             
-        except Exception as e:
-            logger.log_error(e, f"Error getting symbol info: {symbol}")
-            return {
+            # 결과 조합
+            result = {
                 "symbol": symbol,
-                "name": f"Unknown({symbol})",
-                "current_price": 0,
-                "prev_close": 0, 
-                "change_rate": 0,
-                "volume": 0
+                "name": name, 
+                "current_price": current_price,
+                "prev_close": prev_close,
+                "change_rate": change_rate,
+                "volume": volume
             }
+            return result
+            
+        # API 오류 시 빈 결과 반환 이전에 오류 로깅
+        if info.get("rt_cd") != "0":
+            error_msg = f"API 응답 오류: {info.get('msg1', '알 수 없는 오류')} (rt_cd: {info.get('rt_cd')})"
+            logger.log_system(error_msg)
+        return {}
+
+    def _default_symbol_info(self, symbol: str) -> Dict[str, Any]:
+        """조회 실패 시 기본 종목 정보"""
+        return {
+            "symbol": symbol,
+            "name": f"Unknown({symbol})",
+            "current_price": 0,
+            "prev_close": 0, 
+            "change_rate": 0,
+            "volume": 0
+        }
+
+    def get_symbol_info(self, symbol: str) -> Dict[str, Any]:
+        """종목 정보 조회"""
+        try:
+            # 기본 정보
+            info = api_client.get_stock_info(symbol)
+            # 현재가
+            price_data = api_client.get_current_price(symbol)
+            return self._build_symbol_info(symbol, info, price_data)
+            
+        except Exception as e:
+            logger.log_error(e, f"Error getting symbol info: {symbol}")
+            return self._default_symbol_info(symbol)
+
+    async def get_symbol_info_async(self, symbol: str) -> Dict[str, Any]:
+        """종목 정보 조회 (비동기 버전, 기본 정보와 현재가 동시 조회)"""
+        try:
+            info, price_data = await asyncio.gather(
+                api_client.get_stock_info_async(symbol),
+                api_client.get_current_price_async(symbol)
+            )
+            return self._build_symbol_info(symbol, info, price_data)
+            
+        except Exception as e:
+            logger.log_error(e, f"Error getting symbol info: {symbol}")
+            return self._default_symbol_info(symbol)
+
+    async def get_symbol_info_many(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 종목 정보 동시 조회
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {종목코드: 종목 정보} (실패 종목은 빈 딕셔너리 또는 error 포함)
+        """
+        return await api_client.gather_by_symbol(symbols, self.get_symbol_info_async)
 
     async def get_top_volume_stocks(self, market: str = None, limit: int = 20) -> List[Dict[str, Any]]:
         """거래량 상위 종목 조회 및 상세 정보 반환
@@ -286,11 +315,12 @@ class StockExplorer:
             # 상위 종목만 선택 (limit 개수만큼)
             selected_symbols = symbols[:min(limit, len(symbols))]
             
-            # 종목별 상세 정보 조회
+            # 종목별 상세 정보 동시 조회
+            symbol_infos = await self.get_symbol_info_many(selected_symbols)
             result = []
             for symbol in selected_symbols:
-                symbol_info = self.get_symbol_info(symbol)
-                if symbol_info:  # 정보 조회 성공 시에만 추가
+                symbol_info = symbol_infos.get(symbol)
+                if symbol_info and not symbol_info.get("error"):  # 정보 조회 성공 시에만 추가
                     result.append(symbol_info)
             
             # 로그 기록
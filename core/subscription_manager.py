@@ -0,0 +1,104 @@
+"""
+실시간 구독 목록 동기화 (종목 교체용)
+
+목표 종목 집합과 현재 구독 상태(tick_bus 구독자)의 차이만 해지/구독한다.
+해지와 구독 요청은 동시에 내보내고, 실제 프레임 전송 간격은 세션의 전송 한도가 조절한다.
+구독 성공 여부는 서버 ACK로 종목별로 확인되므로 먼저 확인된 종목부터 틱이 바로 들어온다.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Any, Callable, Iterable, Set, Tuple
+
+from core.tick_bus import tick_bus, TOPIC_TRADE
+from utils.logger import logger
+
+
+class SubscriptionManager:
+    """구독 목록 동기화
+
+    - diff(callback, symbols): (추가할 종목, 해지할 종목) 계산
+    - sync(callback, symbols): 해지 후 추가 구독을 한꺼번에 요청하고 종목별 결과 반환
+    - 같은 콜백의 sync 호출은 순서대로 처리 (종목 교체가 겹쳐도 최종 상태는 마지막 목록)
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            # {(토픽, 콜백): 동기화 직렬화 락}
+            self._sync_locks: Dict[Tuple[str, Callable], asyncio.Lock] = {}
+            self.stats = {"syncs": 0, "added": 0, "removed": 0, "failed": 0, "last_sync_ms": 0.0}
+            self._initialized = True
+
+    def diff(self, callback: Callable, symbols: Iterable[str], topic: str = TOPIC_TRADE) -> Tuple[Set[str], Set[str]]:
+        """현재 구독 대비 (추가할 종목, 해지할 종목)"""
+        current = set(tick_bus.listener_symbols(topic, callback))
+        target = set(symbols)
+        return target - current, current - target
+
+    async def sync(self, callback: Callable, symbols: Iterable[str], topic: str = TOPIC_TRADE) -> Dict[str, bool]:
+        """구독 목록을 symbols로 맞춤
+
+        Args:
+            callback: 틱 버스 구독자 (전략의 가격 업데이트 핸들러)
+            symbols: 목표 종목 목록
+            topic: 구독 토픽
+
+        Returns:
+            Dict[str, bool]: 새로 구독한 종목별 성공 여부
+        """
+        key = (topic, callback)
+        lock = self._sync_locks.get(key)
+        if lock is None:
+            lock = self._sync_locks[key] = asyncio.Lock()
+
+        async with lock:
+            started = time.monotonic()
+            to_add, to_remove = self.diff(callback, symbols, topic)
+
+            # 해지를 먼저 보내 세션 등록 한도를 비운 뒤 구독
+            removed = await asyncio.gather(*(tick_bus.unsubscribe(topic, symbol, callback) for symbol in to_remove),
+                                           return_exceptions=True)
+            for symbol, outcome in zip(to_remove, removed):
+                if isinstance(outcome, Exception):
+                    logger.log_error(outcome, f"[구독 관리] {symbol} 구독 해지 오류")
+
+            added = sorted(to_add)
+            outcomes = await asyncio.gather(*(tick_bus.subscribe(topic, symbol, callback) for symbol in added),
+                                            return_exceptions=True)
+            results = {}
+            for symbol, outcome in zip(added, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.log_error(outcome, f"[구독 관리] {symbol} 구독 오류")
+                    tick_bus.remove_listener(topic, symbol, callback)
+                results[symbol] = outcome is True
+
+            elapsed_ms = (time.monotonic() - started) * 1000
+            failed = sum(1 for ok in results.values() if not ok)
+            self.stats["syncs"] += 1
+            self.stats["added"] += len(results) - failed
+            self.stats["removed"] += len(to_remove)
+            self.stats["failed"] += failed
+            self.stats["last_sync_ms"] = round(elapsed_ms, 1)
+            logger.log_system(f"[구독 관리] {topic} 동기화: 추가 {len(results) - failed}/{len(results)}, "
+                              f"해지 {len(to_remove)}, {elapsed_ms:.0f}ms")
+            return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """동기화 통계"""
+        return dict(self.stats)
+
+
+# 싱글톤 인스턴스
+subscription_manager = SubscriptionManager()
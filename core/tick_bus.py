@@ -0,0 +1,270 @@
+"""
+실시간 데이터 발행/구독 버스 (웹소켓 클라이언트 상위 계층)
+
+종목별 상류(웹소켓) 구독은 하나만 유지하고, 같은 종목을 구독하는 여러 전략에 모두 전달한다.
+"""
+import asyncio
+import inspect
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from utils.logger import logger
+
+# 토픽
+TOPIC_TRADE = "trade"       # 실시간 체결가 (H0STCNT0)
+TOPIC_QUOTE = "quote"       # 실시간 호가 (H0STASP0)
+TOPIC_FILL = "fill"         # 실시간 체결 통보 (H0STCNI0, 계좌 단위)
+TOPIC_GAP = "gap"           # 재연결 후 끊긴 구간 분봉 보정 (core.gap_filler.GapFill)
+TOPICS = (TOPIC_TRADE, TOPIC_QUOTE, TOPIC_FILL, TOPIC_GAP)
+
+# {실시간 TR ID: 토픽}
+TR_ID_TOPICS = {
+    "H0STCNT0": TOPIC_TRADE,
+    "H0STASP0": TOPIC_QUOTE,
+    "H0STCNI0": TOPIC_FILL,
+    "H0STCNI9": TOPIC_FILL,
+}
+
+# 상류 웹소켓 구독이 필요한 토픽 {토픽: ws_pool 구독 종류}
+UPSTREAM_FEEDS = {
+    TOPIC_TRADE: "price",
+    TOPIC_QUOTE: "orderbook",
+}
+
+
+def _trade_values(event: Any) -> Tuple[Optional[str], float, int]:
+    """체결 이벤트에서 (종목코드, 체결가, 체결량) 추출 (Tick 또는 JSON 본문 dict)"""
+    symbol = getattr(event, "symbol", None)
+    if symbol is not None:
+        return symbol, event.price, event.volume
+    try:
+        return event.get("tr_key"), float(event.get("stck_prpr") or 0), int(event.get("cntg_vol") or 0)
+    except (TypeError, ValueError):
+        return event.get("tr_key"), 0.0, 0
+
+
+class ConflatedTick:
+    """마지막으로 읽은 뒤 들어온 체결을 종목별로 합친 값"""
+    __slots__ = ("symbol", "last", "price", "open", "high", "low", "volume", "count",
+                 "first_at", "last_at")
+
+    def __init__(self, symbol: str, event: Any, price: float, volume: int, now: float):
+        self.symbol = symbol
+        self.last = event           # 마지막 원본 이벤트 (Tick 또는 dict)
+        self.price = price          # 마지막 체결가
+        self.open = price           # 구간 첫 체결가
+        self.high = price
+        self.low = price
+        self.volume = volume        # 구간 체결량 합계
+        self.count = 1              # 합쳐진 틱 수
+        self.first_at = now         # 구간 첫/마지막 틱 수신 시각 (monotonic)
+        self.last_at = now
+
+    def add(self, event: Any, price: float, volume: int, now: float):
+        self.last = event
+        self.price = price
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+        self.volume += volume
+        self.count += 1
+        self.last_at = now
+
+
+class ConflatedFeed:
+    """최신값 병합 구독자 (느린 소비자용)
+
+    tick_bus 구독 콜백으로 등록하면 틱마다 종목별 슬롯만 갱신하고(O(1)) 틱을 쌓아 두지 않는다.
+    소비자는 주기마다 drain()으로 변경된 종목의 ConflatedTick을 받는다 (O(변경 종목 수)).
+
+        feed = ConflatedFeed("combined")
+        await tick_bus.subscribe(TOPIC_TRADE, symbol, feed)
+        for symbol, tick in feed.drain().items(): ...
+    """
+
+    def __init__(self, name: str = "conflated"):
+        self.name = name
+        self._pending: Dict[str, ConflatedTick] = {}
+        self.stats = {"ticks": 0, "delivered": 0, "drains": 0}
+
+    def __call__(self, event: Any):
+        symbol, price, volume = _trade_values(event)
+        if not symbol or price <= 0:
+            return
+        self.stats["ticks"] += 1
+        now = time.monotonic()
+        slot = self._pending.get(symbol)
+        if slot is None:
+            self._pending[symbol] = ConflatedTick(symbol, event, price, volume, now)
+        else:
+            slot.add(event, price, volume, now)
+
+    def __repr__(self) -> str:
+        return f"ConflatedFeed({self.name})"
+
+    def drain(self) -> Dict[str, ConflatedTick]:
+        """마지막으로 읽은 뒤 변경된 종목의 병합 값 (읽은 구간은 초기화)"""
+        pending, self._pending = self._pending, {}
+        self.stats["drains"] += 1
+        self.stats["delivered"] += len(pending)
+        return pending
+
+    def discard(self, symbol: str):
+        """읽지 않은 종목 값 제거 (구독 해지 시)"""
+        self._pending.pop(symbol, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """수신 틱 수 대비 전달 건수 (병합률)"""
+        ticks = self.stats["ticks"]
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "conflation_ratio": round(1 - self.stats["delivered"] / ticks, 4) if ticks else 0.0,
+        }
+
+
+class TickBus:
+    """실시간 데이터 버스
+
+    - subscribe(topic, symbol, callback): 구독자 등록, 해당 종목의 첫 구독자일 때만 웹소켓 구독
+    - unsubscribe(topic, symbol, callback): 구독자 제거, 마지막 구독자일 때만 웹소켓 구독 해지
+    - publish(topic, symbol, event): 종목 구독자 + 전체(symbol=None) 구독자에게 순서대로 전달
+      (한 구독자의 오류가 다른 구독자에게 영향을 주지 않음)
+    - 콜백은 동기/비동기 함수 모두 허용
+    - 느린 소비자는 ConflatedFeed를 콜백으로 등록해 종목별 최신값/구간 집계만 주기적으로 읽음
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            # {(토픽, 종목코드 또는 None): [콜백]}
+            self._subscribers: Dict[Tuple[str, Optional[str]], List[Callable]] = {}
+            # 종목별 상류 구독/해지 직렬화 락
+            self._upstream_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+            self.stats = {topic: {"published": 0, "delivered": 0, "errors": 0} for topic in TOPICS}
+            self._initialized = True
+
+    # --- 구독자 관리 ---
+    def add_listener(self, topic: str, symbol: Optional[str], callback: Callable) -> bool:
+        """상류 구독 없이 구독자만 등록 (이미 등록된 콜백이면 False)"""
+        callbacks = self._subscribers.setdefault((topic, symbol), [])
+        if callback in callbacks:
+            return False
+        callbacks.append(callback)
+        return True
+
+    def remove_listener(self, topic: str, symbol: Optional[str], callback: Callable) -> bool:
+        """구독자만 제거 (남은 구독자가 없으면 키도 제거)"""
+        callbacks = self._subscribers.get((topic, symbol))
+        if not callbacks or callback not in callbacks:
+            return False
+        callbacks.remove(callback)
+        if not callbacks:
+            del self._subscribers[(topic, symbol)]
+        return True
+
+    def subscriber_count(self, topic: str, symbol: Optional[str] = None) -> int:
+        """구독자 수 (symbol=None이면 전체 구독자)"""
+        return len(self._subscribers.get((topic, symbol), ()))
+
+    def symbols(self, topic: str = TOPIC_TRADE) -> List[str]:
+        """구독자가 있는 종목 목록"""
+        return [symbol for (t, symbol) in self._subscribers if t == topic and symbol is not None]
+
+    def listener_symbols(self, topic: str, callback: Callable) -> List[str]:
+        """콜백이 구독자로 등록된 종목 목록"""
+        return [symbol for (t, symbol), callbacks in self._subscribers.items()
+                if t == topic and symbol is not None and callback in callbacks]
+
+    def _upstream_lock(self, topic: str, symbol: str) -> asyncio.Lock:
+        key = (topic, symbol)
+        lock = self._upstream_locks.get(key)
+        if lock is None:
+            lock = self._upstream_locks[key] = asyncio.Lock()
+        return lock
+
+    async def subscribe(self, topic: str, symbol: Optional[str], callback: Callable) -> bool:
+        """구독자 등록 (필요 시 웹소켓 구독)
+
+        Returns:
+            bool: 상류 구독까지 성공했는지 여부 (실패 시 구독자 등록도 취소)
+        """
+        self.add_listener(topic, symbol, callback)
+        feed = UPSTREAM_FEEDS.get(topic)
+        if feed is None or symbol is None:
+            return True
+
+        from core.ws_pool import ws_pool
+        async with self._upstream_lock(topic, symbol):
+            if ws_pool.is_subscribed(symbol, feed):
+                return True
+            ok = await ws_pool.subscribe(symbol, feed)
+            if not ok:
+                self.remove_listener(topic, symbol, callback)
+            return ok
+
+    async def unsubscribe(self, topic: str, symbol: Optional[str], callback: Callable):
+        """구독자 제거 (마지막 구독자면 웹소켓 구독 해지)"""
+        self.remove_listener(topic, symbol, callback)
+        if symbol is None or UPSTREAM_FEEDS.get(topic) is None:
+            return
+
+        from core.ws_pool import ws_pool
+        feed = UPSTREAM_FEEDS[topic]
+        async with self._upstream_lock(topic, symbol):
+            if self.subscriber_count(topic, symbol) or not ws_pool.is_subscribed(symbol, feed):
+                return
+            await ws_pool.unsubscribe(symbol, feed)
+
+    # --- 발행 ---
+    async def publish(self, topic: str, symbol: Optional[str], event: Any) -> int:
+        """이벤트 전달 (전달한 구독자 수 반환)"""
+        callbacks = self._subscribers.get((topic, symbol), ())
+        wildcard = self._subscribers.get((topic, None), ()) if symbol is not None else ()
+        stats = self.stats[topic]
+        stats["published"] += 1
+
+        delivered = 0
+        # 전달 중 구독 변경에 영향받지 않도록 복사본 순회
+        for callback in (*callbacks, *wildcard):
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
+                delivered += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats["errors"] += 1
+                logger.log_error(e, f"[틱버스] {topic} {symbol or '-'} 구독자 처리 오류 ({getattr(callback, '__qualname__', callback)})")
+        stats["delivered"] += delivered
+        return delivered
+
+    def get_stats(self) -> Dict[str, Any]:
+        """토픽별 발행/전달 통계와 구독자 수"""
+        subscribers: Dict[str, int] = {topic: 0 for topic in TOPICS}
+        for (topic, _), callbacks in self._subscribers.items():
+            subscribers[topic] = subscribers.get(topic, 0) + len(callbacks)
+        return {
+            "topics": {topic: dict(values) for topic, values in self.stats.items()},
+            "subscribers": subscribers,
+            "symbols": len(self.symbols(TOPIC_TRADE)),
+        }
+
+
+# 싱글톤 인스턴스
+tick_bus = TickBus()
@@ -0,0 +1,412 @@
+"""
+KIS 접근 토큰 관리자 (메모리 캐시 + 백그라운드 사전 갱신)
+"""
+import asyncio
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+import requests
+
+from utils.logger import logger
+
+# 토큰 정보 저장 파일 경로
+TOKEN_FILE_PATH = os.path.join(os.path.abspath(os.getcwd()), "token_info.json")
+
+
+class TokenManager:
+    """KIS 접근 토큰 관리자
+
+    - 토큰을 메모리에 보관하여 요청 경로에서 파일 I/O 없이 바로 사용
+    - 토큰 파일은 mtime이 바뀐 경우에만 다시 읽음 (다중 프로세스 간 토큰 공유)
+    - 만료 임계값 이전에 백그라운드 태스크에서 미리 갱신
+    - 발급은 스레드 락으로 단일화하여 동시 요청이 중복 발급하지 않도록 함
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.access_token: Optional[str] = None
+            self.token_expire_time: Optional[float] = None  # 만료 시간 (Unix timestamp)
+            self.token_issue_time: Optional[float] = None   # 발급 시간 (Unix timestamp)
+
+            # 발급 정보 (configure로 설정)
+            self.base_url = None
+            self.app_key = None
+            self.app_secret = None
+
+            # 토큰 재발급 임계값 (12시간 = 43200초)
+            # KIS 토큰은 24시간 유효하므로 만료 12시간 전부터 백그라운드에서 갱신
+            self.renewal_threshold = 43200
+            # 요청 경로에서 허용하는 최소 잔여 시간 (초) - 이보다 적으면 즉시 발급
+            self.expiry_margin = 300
+            # 백그라운드 태스크의 토큰 파일 변경 확인 주기 (초)
+            self.file_check_interval = 60
+            # 백그라운드 갱신 실패 시 재시도 간격 (초, KIS 토큰 발급은 분당 1회 제한)
+            self.retry_interval = 60
+
+            self._file_mtime: Optional[float] = None
+            self._issue_lock = threading.Lock()
+            self._refresh_task: Optional[asyncio.Task] = None
+
+            # 통계
+            self.stats = {
+                "issued": 0,
+                "issue_failures": 0,
+                "file_reloads": 0,
+                "background_refreshes": 0
+            }
+
+            self._initialized = True
+
+    def configure(self, base_url: str, app_key: str, app_secret: str):
+        """토큰 발급에 필요한 접속 정보 설정"""
+        self.base_url = base_url
+        self.app_key = app_key
+        self.app_secret = app_secret
+
+    def remaining_seconds(self) -> float:
+        """메모리 토큰의 만료까지 남은 시간 (초, 토큰이 없으면 0)"""
+        if not self.access_token or not self.token_expire_time:
+            return 0
+        return self.token_expire_time - datetime.now().timestamp()
+
+    def get_cached_token(self, min_remaining: float = None) -> Optional[str]:
+        """메모리에 보관된 토큰 반환 (파일 I/O 없음)
+
+        Args:
+            min_remaining: 필요한 최소 잔여 시간 (초, 기본값 expiry_margin)
+
+        Returns:
+            유효한 토큰 또는 None
+        """
+        if min_remaining is None:
+            min_remaining = self.expiry_margin
+        if self.remaining_seconds() > min_remaining:
+            return self.access_token
+        return None
+
+    def needs_renewal(self) -> bool:
+        """만료 임계값 이내로 남아 갱신이 필요한지 여부"""
+        return self.remaining_seconds() <= self.renewal_threshold
+
+    def invalidate(self, token: str = None):
+        """메모리 토큰 무효화
+
+        Args:
+            token: 무효화할 토큰. 지정 시 현재 토큰과 같을 때만 무효화하여
+                   이미 다른 요청이 갱신한 토큰을 다시 버리지 않도록 함
+        """
+        if token is not None and token != self.access_token:
+            return
+        self.access_token = None
+        self.token_expire_time = None
+        self.token_issue_time = None
+
+    def get_token(self, min_remaining: float = None, force: bool = False) -> str:
+        """유효한 토큰 반환 (필요 시 발급, 동기 버전)
+
+        Args:
+            min_remaining: 필요한 최소 잔여 시간 (초, 기본값 expiry_margin)
+            force: True면 메모리/파일 토큰과 무관하게 새로 발급
+
+        Returns:
+            접근 토큰
+        """
+        if not force:
+            token = self.get_cached_token(min_remaining)
+            if token:
+                return token
+
+        with self._issue_lock:
+            if not force:
+                # 락 대기 중 다른 스레드/프로세스가 갱신했는지 확인
+                self.sync_from_file()
+                token = self.get_cached_token(min_remaining)
+                if token:
+                    return token
+            return self._issue_token()
+
+    async def get_token_async(self, min_remaining: float = None, force: bool = False) -> str:
+        """유효한 토큰 반환 (비동기 버전)
+
+        메모리 토큰이 유효하면 즉시 반환하고, 발급이 필요한 경우에만
+        executor에서 발급하여 이벤트 루프를 블로킹하지 않음
+        """
+        if not force:
+            token = self.get_cached_token(min_remaining)
+            if token:
+                return token
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.get_token(min_remaining, force))
+
+    def _issue_token(self) -> str:
+        """토큰 발급 요청 (_issue_lock 보유 상태에서 호출)"""
+        current_time = datetime.now().timestamp()
+
+        if self.access_token and self.token_expire_time:
+            remaining_hours = (self.token_expire_time - current_time) / 3600
+            logger.log_system(f"[토큰갱신] 토큰이 {remaining_hours:.1f}시간 후 만료 예정, 갱신합니다. (만료={datetime.fromtimestamp(self.token_expire_time).strftime('%Y-%m-%d %H:%M:%S')})")
+        else:
+            logger.log_system("[토큰발급] 새로운 KIS API 토큰 발급을 시작합니다...")
+
+        url = f"{self.base_url}/oauth2/tokenP"
+        headers = {"content-type": "application/json"}
+        body = {
+            "grant_type": "client_credentials",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret
+        }
+
+        try:
+            response = requests.post(url, headers=headers, json=body, timeout=10)
+            response.raise_for_status()
+            token_data = response.json()
+
+            self.access_token = token_data["access_token"]
+            self.token_issue_time = current_time
+            # 토큰 만료 시간 설정 (24시간)
+            self.token_expire_time = current_time + (24 * 60 * 60)
+            self.stats["issued"] += 1
+
+            # 토큰 정보를 파일에 저장
+            self.save_token_to_file(
+                token=self.access_token,
+                issue_time=current_time,
+                expire_time=self.token_expire_time
+            )
+
+            logger.log_system("Access token refreshed successfully")
+            return self.access_token
+
+        except Exception as e:
+            self.stats["issue_failures"] += 1
+            # 토큰 발급 실패 로그
+            logger.log_error(e, "Failed to get access token")
+            # 토큰 발급 실패 정보를 파일에 저장
+            self.save_token_to_file(
+                token=None,
+                issue_time=current_time,
+                expire_time=None,
+                status="FAIL",
+                error_message=str(e)
+            )
+            raise
+
+    def _get_file_mtime(self) -> Optional[float]:
+        """토큰 파일 수정 시각 (파일이 없으면 None)"""
+        try:
+            return os.stat(TOKEN_FILE_PATH).st_mtime
+        except OSError:
+            return None
+
+    def sync_from_file(self, force: bool = False) -> bool:
+        """토큰 파일이 변경된 경우에만 다시 읽어 메모리 토큰 갱신
+
+        Args:
+            force: True면 mtime과 무관하게 파일을 다시 읽음
+
+        Returns:
+            bool: 메모리에 유효한(만료되지 않은) 토큰이 있는지 여부
+        """
+        mtime = self._get_file_mtime()
+        if mtime is None:
+            if force:
+                logger.log_debug(f"토큰 파일이 존재하지 않습니다: {TOKEN_FILE_PATH}")
+            return self.remaining_seconds() > 0
+
+        if force or mtime != self._file_mtime:
+            self._file_mtime = mtime
+            self.stats["file_reloads"] += 1
+            self._load_token_file()
+
+        return self.remaining_seconds() > 0
+
+    def _load_token_file(self) -> bool:
+        """파일에서 토큰 정보 로드
+
+        파일의 토큰이 메모리 토큰보다 늦게 만료되는 경우에만 교체한다.
+
+        Returns:
+            bool: 유효한 토큰 로드 성공 여부
+        """
+        current_time = datetime.now().timestamp()
+
+        try:
+            try:
+                with open(TOKEN_FILE_PATH, 'r') as f:
+                    token_info = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError) as e:
+                logger.log_error(e, f"토큰 파일 데이터 파싱 오류: {TOKEN_FILE_PATH}")
+                return False
+
+            current_token = token_info.get('current')
+            if not current_token:
+                logger.log_debug("토큰 파일에 'current' 필드가 없습니다")
+                return False
+
+            if not current_token.get('token') or not current_token.get('expire_time'):
+                logger.log_debug("토큰 파일에 필수 필드(token/expire_time)가 없습니다")
+                return False
+
+            expire_time = current_token['expire_time']
+            if current_time >= expire_time:
+                expire_time_str = datetime.fromtimestamp(expire_time).strftime("%Y-%m-%d %H:%M:%S")
+                logger.log_debug(f"만료된 토큰이 발견됨. 만료 시간: {expire_time_str}")
+                return False
+
+            if self.token_expire_time and self.access_token and expire_time <= self.token_expire_time:
+                # 메모리 토큰이 같거나 더 최신
+                return True
+
+            self.access_token = current_token['token']
+            self.token_expire_time = expire_time
+            self.token_issue_time = current_token.get('issue_time')
+
+            time_remaining = expire_time - current_time
+            if time_remaining < self.renewal_threshold:
+                logger.log_system(f"유효한 토큰이지만 만료까지 {time_remaining / 3600:.1f}시간만 남았습니다. (임계값: {self.renewal_threshold / 3600:.1f}시간)")
+
+            return True
+
+        except Exception as e:
+            logger.log_error(e, "파일에서 토큰 정보를 로드하는 중 예상치 못한 오류 발생")
+            return False
+
+    def save_token_to_file(self, token: str = None, issue_time: float = None,
+                           expire_time: float = None, status: str = "SUCCESS",
+                           error_message: str = None):
+        """토큰 정보를 파일에 저장"""
+        try:
+            # 파일이 존재하면 기존 내용 로드
+            token_info = {}
+            if os.path.exists(TOKEN_FILE_PATH):
+                try:
+                    with open(TOKEN_FILE_PATH, 'r') as f:
+                        token_info = json.load(f)
+                        # 기존 정보 보존을 위해 'history' 키가 없으면 생성
+                        if 'history' not in token_info:
+                            token_info['history'] = []
+                except (json.JSONDecodeError, FileNotFoundError):
+                    # 파일이 손상되었거나 없으면 새로 생성
+                    token_info = {'current': {}, 'history': []}
+            else:
+                token_info = {'current': {}, 'history': []}
+
+            # 현재 시간
+            current_time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            # 현재 토큰 정보 업데이트
+            if status == "SUCCESS" and token:
+                token_info['current'] = {
+                    'token': token,
+                    'issue_time': issue_time,
+                    'issue_time_str': datetime.fromtimestamp(issue_time).strftime("%Y-%m-%d %H:%M:%S") if issue_time else None,
+                    'expire_time': expire_time,
+                    'expire_time_str': datetime.fromtimestamp(expire_time).strftime("%Y-%m-%d %H:%M:%S") if expire_time else None,
+                    'status': status,
+                    'updated_at': current_time_str
+                }
+
+            # 히스토리에 추가
+            history_entry = {
+                'token': token[:10] + '...' if token else None,  # 보안상 전체 토큰은 저장하지 않음
+                'issue_time_str': datetime.fromtimestamp(issue_time).strftime("%Y-%m-%d %H:%M:%S") if issue_time else None,
+                'expire_time_str': datetime.fromtimestamp(expire_time).strftime("%Y-%m-%d %H:%M:%S") if expire_time else None,
+                'status': status,
+                'error_message': error_message,
+                'recorded_at': current_time_str
+            }
+            token_info['history'].append(history_entry)
+
+            # 히스토리 최대 50개로 제한
+            if len(token_info['history']) > 50:
+                token_info['history'] = token_info['history'][-50:]
+
+            # 파일에 저장
+            with open(TOKEN_FILE_PATH, 'w') as f:
+                json.dump(token_info, f, indent=2)
+
+            # 자신이 쓴 파일은 다시 읽지 않도록 mtime 기록
+            self._file_mtime = self._get_file_mtime()
+
+            logger.log_system(f"토큰 정보를 파일에 저장했습니다: {TOKEN_FILE_PATH}")
+
+        except Exception as e:
+            logger.log_error(e, "토큰 정보를 파일에 저장하는 중 오류 발생")
+
+    async def start_background_refresh(self):
+        """현재 이벤트 루프에서 백그라운드 토큰 갱신 태스크 시작"""
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+        logger.log_system("[토큰관리] 백그라운드 토큰 갱신 태스크 시작")
+
+    async def stop_background_refresh(self):
+        """백그라운드 토큰 갱신 태스크 중지"""
+        task = self._refresh_task
+        self._refresh_task = None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            logger.log_system("[토큰관리] 백그라운드 토큰 갱신 태스크 중지")
+
+    async def _refresh_loop(self):
+        """만료 임계값 도달 전에 토큰을 미리 갱신하는 루프"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            wait_time = self.file_check_interval
+            try:
+                # 다른 프로세스가 갱신한 토큰 반영
+                self.sync_from_file()
+
+                if self.needs_renewal():
+                    await loop.run_in_executor(
+                        None, lambda: self.get_token(min_remaining=self.renewal_threshold)
+                    )
+                    self.stats["background_refreshes"] += 1
+
+                # 다음 갱신 시점까지 남은 시간 (파일 확인 주기보다 길면 주기 단위로 확인)
+                until_renewal = self.remaining_seconds() - self.renewal_threshold
+                wait_time = max(1, min(self.file_check_interval, until_renewal))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.log_error(e, f"[토큰관리] 백그라운드 토큰 갱신 실패, {self.retry_interval}초 후 재시도")
+                wait_time = self.retry_interval
+
+            await asyncio.sleep(wait_time)
+
+    def get_status(self) -> Dict[str, Any]:
+        """토큰 관리자 상태 정보 반환"""
+        remaining = self.remaining_seconds()
+        return {
+            "has_token": bool(self.access_token),
+            "remaining_hours": round(remaining / 3600, 2) if remaining > 0 else 0,
+            "needs_renewal": self.needs_renewal(),
+            "background_refresh_running": bool(self._refresh_task and not self._refresh_task.done()),
+            **self.stats
+        }
+
+
+# 싱글톤 인스턴스
+token_manager = TokenManager()
@@ -4,44 +4,58 @@
 import json
 import asyncio
 import websockets
+from websockets.protocol import State
 import os
 import threading
-from typing import Dict, Any, Callable, List, Optional
+import time
+from collections import deque
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from datetime import datetime
 from config.settings import config, APIConfig
 from utils.logger import logger
+from core.quote_cache import quote_cache
+from core.cassette import cassette
+from core.realtime_frames import parse_frame, RealtimeFrame, Tick, OrderBookRecord, FILL_TR_IDS
+from core.order_book import order_books
+from core.ws_dispatch import DispatchQueue, POLICY_CONFLATE
+from core.tick_bus import tick_bus, TOPIC_TRADE, TOPIC_QUOTE, TOPIC_FILL, TR_ID_TOPICS
+from core.rate_limiter import TokenBucket
 
-class KISWebSocketClient:
-    """한국투자증권 웹소켓 클라이언트"""
-    
-    _instance = None
-    _lock = threading.Lock()
+# 이미 구독 중인 종목 재구독 응답 (실패 코드지만 구독 상태는 유지됨)
+MSG_CD_ALREADY_SUBSCRIBED = "OPSP0002"
+
+# {구독 종류: TR ID} (체결 통보는 계좌 단위로 tr_key에 HTS ID 사용, 모의투자는 H0STCNI9)
+FEED_TR_IDS = {
+    "price": "H0STCNT0",        # 실시간 체결가
+    "orderbook": "H0STASP0",    # 실시간 호가 (10단계)
+    "fill": "H0STCNI9" if os.getenv("TEST_MODE", "False").strip().lower() in ['true', '1', 't', 'y', 'yes']
+            else "H0STCNI0",    # 실시간 체결 통보 (암호화)
+}
+FEED_NAMES = {"price": "실시간 가격", "orderbook": "실시간 호가", "fill": "체결 통보"}
+
+class KISWebSocketSession:
+    """한국투자증권 웹소켓 세션 (접속키 1개 = 연결 1개)
     
-    def __new__(cls, *args, **kwargs):
-        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
-        with cls._lock:  # 스레드 안전성을 위한 락 사용
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialized = False
-        return cls._instance
+    기본 접속키 세션은 KISWebSocketClient 싱글톤(ws_client)이고,
+    추가 접속키 세션은 core.ws_pool에서 생성해 구독 종목을 나눠 맡긴다.
+    """
     
-    def __init__(self):
+    def __init__(self, app_key: str = None, app_secret: str = None, name: str = "웹소켓"):
         """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
         if not hasattr(self, '_initialized') or not self._initialized:
             self.config = config.get("api", APIConfig.from_env())
             self.ws_url = self.config.ws_url
-            self.app_key = self.config.app_key
-            self.app_secret = self.config.app_secret
+            self.app_key = app_key or self.config.app_key
+            self.app_secret = app_secret or self.config.app_secret
+            self.name = name
             self.ws = None
             self.running = False
             self.subscriptions = {}
-            self.callbacks = {}
             self.reconnect_attempts = 0
             self.max_reconnect_attempts = 10
             self.reconnect_delay = 10
             self.auth_successful = False
             self.connection_lock = asyncio.Lock()
-            self.subscription_semaphore = asyncio.Semaphore(5)
             self.last_connection_attempt = 0
             self.receive_lock = asyncio.Lock()  # 메시지 수신 동시성 제어를 위한 락 추가
             self.connection_check_interval = 30  # 연결 상태 확인 간격 (초)
@@ -52,10 +66,75 @@ class KISWebSocketClient:
             self.approval_key_expire_time = None
             
             # 구독 제한 관련 설정
-            self.max_subscriptions = 100
-            self.subscription_delay = 0.1
+            self.max_subscriptions = 41  # 세션(접속키)당 실시간 등록 한도
+            
+            # 구독/해지 프레임은 ACK를 기다리지 않고 초당 한도 내에서 연속 전송
+            self.subscription_rate = 20  # 초당 구독/해지 프레임 수
+            self.subscription_burst = 5
+            self.ack_timeout = 5.0  # 구독 응답(ACK) 대기 시간 (초)
+            self._frame_bucket = TokenBucket(self.subscription_rate, self.subscription_burst)
+            # {(TR ID, 종목코드): 구독 응답 대기 Future}
+            self._pending_acks: Dict[Tuple[str, str], asyncio.Future] = {}
+            # {TR ID: (AES 키, IV)} 암호화 실시간 TR(체결 통보) 복호화용, 구독 응답으로 받음
+            self._cipher_keys: Dict[str, Tuple[str, str]] = {}
+            # 복호화 키(구독 응답) 처리 전에 도착한 체결 통보 프레임 (키 수신 후 순서대로 처리)
+            self._held_fill_frames: deque = deque(maxlen=100)
+            
+            # 연결 상태 변경 알림 {콜백(세션, 연결 여부)} (ws_pool 재배치용)
+            self.state_listeners: List[Callable] = []
+            # 재연결 완료 알림 {콜백(세션, 끊긴 시각, 재구독 소요 초)} (끊긴 동안의 분봉 보정용)
+            self.reconnect_listeners: List[Callable] = []
+            # 연결 끊김 알림 {콜백(세션, 끊긴 시각, 재연결 포기 여부)} (보정 전 매매 판단 보류용)
+            self.disconnect_listeners: List[Callable] = []
+            self.disconnected_at: Optional[datetime] = None  # 연결이 끊긴 시각 (재연결 완료 시 초기화)
+            
+            # 수신 루프는 읽기만 하고 콜백은 디스패처 워커에서 실행 (종목별 순서 유지)
+            self.dispatcher = DispatchQueue(self._dispatch_item, workers=4, max_queue=5000,
+                                            overflow_policy=POLICY_CONFLATE, name=name)
             
             self._initialized = True
+    
+    async def _on_connected(self):
+        """연결(재연결) 직후 처리: 기존 구독 재등록 → 상태 알림 → 재연결 알림 (끊겼던 경우)"""
+        down_since, self.disconnected_at = self.disconnected_at, None
+        started = time.monotonic()
+        if self.subscriptions:
+            await self.resubscribe_all()
+        resubscribe_seconds = time.monotonic() - started
+        await self._notify_state(True)
+        if down_since is not None:
+            await self._notify_reconnect(down_since, resubscribe_seconds)
+    
+    async def _notify_reconnect(self, down_since: datetime, resubscribe_seconds: float):
+        """재연결 완료 알림 (리스너 오류는 연결 처리에 영향 없음)"""
+        for listener in list(self.reconnect_listeners):
+            try:
+                await listener(self, down_since, resubscribe_seconds)
+            except Exception as e:
+                logger.log_error(e, f"{self.name} 재연결 리스너 오류")
+    
+    async def _notify_disconnect(self, down_since: datetime, gave_up: bool):
+        """연결 끊김 알림 (리스너 오류는 연결 처리에 영향 없음)"""
+        for listener in list(self.disconnect_listeners):
+            try:
+                await listener(self, down_since, gave_up)
+            except Exception as e:
+                logger.log_error(e, f"{self.name} 연결 끊김 리스너 오류")
+    
+    async def _give_up(self):
+        """재연결 포기 알림 (끊김 리스너에 포기 알림 후 연결 해제 상태 알림 → ws_pool이 종목을 다른 세션으로 이동)"""
+        if self.disconnected_at is None:
+            self.disconnected_at = datetime.now()
+        await self._notify_disconnect(self.disconnected_at, gave_up=True)
+        await self._notify_state(False)
+    
+    async def _notify_state(self, connected: bool):
+        """연결 상태 변경 알림 (리스너 오류는 연결 처리에 영향 없음)"""
+        for listener in list(self.state_listeners):
+            try:
+                await listener(self, connected)
+            except Exception as e:
+                logger.log_error(e, f"{self.name} 연결 상태 리스너 오류")
         
     async def connect(self) -> bool:
         """웹소켓 연결
@@ -114,7 +193,7 @@ class KISWebSocketClient:
                         
                         # 연결 시도
                         self.ws = await asyncio.wait_for(
-                            websockets.connect(self.ws_url, **connection_options),
+                            self._open_connection(connection_options),
                             timeout=20.0  # 연결 타임아웃 증가
                         )
                         #logger.log_system("웹소켓 초기 연결 성공")
@@ -145,13 +224,15 @@ class KISWebSocketClient:
                             if hasattr(self, '_ping_task') and self._ping_task and not self._ping_task.done():
                                 self._ping_task.cancel()
                             
-                            # 메시지 수신 루프 시작
+                            # 디스패처 워커 및 메시지 수신 루프 시작
+                            self.dispatcher.start()
                             self._receive_task = asyncio.create_task(self._receive_messages())
                             
                             # 핑 태스크 시작
                             self._ping_task = asyncio.create_task(self._ping_loop())
                             
                             logger.log_system("웹소켓 관리 태스크 시작 완료")
+                            asyncio.create_task(self._on_connected())
                             return True
                             
                         except Exception as task_error:
@@ -176,6 +257,12 @@ class KISWebSocketClient:
             logger.log_error(lock_error, "웹소켓 연결 락 획득 중 오류 발생")
             return False
     
+    async def _open_connection(self, connection_options: Dict[str, Any]):
+        """웹소켓 연결 생성 (카세트 재생 중에는 기록된 프레임을 반환하는 연결)"""
+        if cassette.replaying:
+            return await cassette.open_websocket()
+        return await websockets.connect(self.ws_url, **connection_options)
+
     async def _get_approval_key(self) -> str:
         """웹소켓 접속키 발급 (1년 유효)
         
@@ -202,6 +289,11 @@ class KISWebSocketClient:
             else:
                 logger.log_system(f"웹소켓 접속키 만료 임박 ({remaining_days:.0f}일 남음), 새로 발급")
         
+        # 카세트 재생 중에는 접속키 발급 요청을 보내지 않음
+        if cassette.replaying:
+            self.approval_key = "CASSETTE_REPLAY"
+            return self.approval_key
+
         # 새 접속키 발급
         logger.log_system("웹소켓 접속키 발급 시작")
         
@@ -263,173 +355,260 @@ class KISWebSocketClient:
                 logger.log_error(e, "웹소켓 접속키 발급 최종 실패")
                 raise
     
+    @staticmethod
+    def _subscription_key(symbol: str, feed_type: str) -> str:
+        """subscriptions 키 (가격 구독은 종목코드, 그 외는 "종목코드_구독종류")"""
+        return symbol if feed_type == "price" else f"{symbol}_{feed_type}"
+    
     async def subscribe_price(self, symbol: str, callback: Callable = None) -> bool:
         """실시간 가격 구독
         
+        구독 프레임은 전송 한도(subscription_rate) 내에서 바로 보내고 서버 ACK로 확인한다.
+        동시에 여러 종목을 요청하면 프레임이 연속으로 전송되고, 먼저 확인된 종목부터 틱이 들어온다.
+        
         Args:
             symbol: 종목코드 (ex: "005930")
-            callback: 가격 업데이트 시 호출될 콜백 함수
+            callback: 가격 업데이트 시 호출될 콜백 함수 (tick_bus 구독자로 추가 등록)
+            
+        Returns:
+            bool: 구독 성공 여부 (ACK 실패 응답이면 False, ACK 시간 초과는 전송 성공으로 간주)
+        """
+        # 콜백은 틱 버스에 등록 (같은 종목을 여러 전략이 구독해도 웹소켓 구독은 1건)
+        if callback:
+            tick_bus.add_listener(TOPIC_TRADE, symbol, callback)
+        return await self._subscribe_feed(symbol, "price", callback)
+    
+    async def subscribe_orderbook(self, symbol: str, callback: Callable = None) -> bool:
+        """실시간 10단계 호가 구독
+        
+        수신한 호가는 core.order_book.order_books에 반영되고 tick_bus TOPIC_QUOTE로도 전달된다.
+        호가 구독도 가격 구독과 같은 세션 등록 한도(max_subscriptions)를 차지한다.
+        
+        Args:
+            symbol: 종목코드
+            callback: 호가 갱신 시 호출될 콜백 함수 (OrderBook 전달)
             
         Returns:
             bool: 구독 성공 여부
         """
-        # 현재 구독 종목 수 확인
+        if callback:
+            tick_bus.add_listener(TOPIC_QUOTE, symbol, callback)
+        return await self._subscribe_feed(symbol, "orderbook", callback)
+    
+    async def _subscribe_feed(self, symbol: str, feed_type: str, callback: Callable = None) -> bool:
+        """구독 종류(FEED_TR_IDS)별 구독 요청 전송 후 ACK 대기"""
+        tr_id = FEED_TR_IDS[feed_type]
+        key = self._subscription_key(symbol, feed_type)
+        
+        # 이미 구독 중인지 확인
+        if key in self.subscriptions:
+            logger.log_system(f"{symbol} 종목은 이미 {FEED_NAMES[feed_type]} 구독 중입니다.")
+            return True
+        
+        # 현재 구독 수 확인 (ACK 대기 중인 구독 포함)
         if len(self.subscriptions) >= self.max_subscriptions:
             logger.log_warning(f"최대 구독 가능 종목 수({self.max_subscriptions})를 초과했습니다.")
             return False
-            
-        # 이미 구독 중인지 확인
-        if symbol in self.subscriptions:
-            logger.log_system(f"{symbol} 종목은 이미 구독 중입니다.")
-            return True
-            
-        # 세마포어를 사용해 동시 구독 요청 제한
-        async with self.subscription_semaphore:
-            # 최대 3번까지 구독 시도
-            for attempt in range(3):
-                try:
-                    # 연결 상태 확인
-                    if not self.is_connected():
-                        logger.log_system(f"웹소켓 연결이 없습니다. {symbol} 구독 전 연결 시도... (시도 {attempt + 1}/3)")
-                        if not await self.connect():
-                            if attempt < 2:  # 마지막 시도가 아니면
-                                await asyncio.sleep(2)  # 2초 대기 후 재시도
-                                continue
-                            logger.log_error(Exception("WebSocket connection failed"), 
-                                           f"{symbol} 구독을 위한 웹소켓 연결 실패")
-                            return False
-                    
-                    # 구독 간 지연 시간 (서버 부하 방지)
-                    await asyncio.sleep(self.subscription_delay)
-                    
-                    # 구독 데이터 구성
-                    subscribe_data = {
-                        "header": {
-                            "tr_id": "H0STCNT0",  # 실시간 주식 체결가
-                            "tr_key": symbol,  # 종목코드
-                        }
-                    }
-                    
-                    # 연결 상태 재확인 (중간에 연결이 끊겼을 수 있음)
-                    if self.ws is None:
-                        logger.log_system(f"{symbol} 종목 구독 시도 중 웹소켓 연결이 끊어졌습니다. 재연결 시도... (시도 {attempt + 1}/3)")
-                        if not await self.connect():
-                            if attempt < 2:
-                                await asyncio.sleep(2)
-                                continue
-                            return False
-                    
-                    # 구독 요청 전송
-                    await self.ws.send(json.dumps(subscribe_data))
-                    logger.log_system(f"{symbol} 종목 실시간 가격 구독 요청")
-                    
-                    # 콜백 등록
-                    if callback:
-                        callback_key = f"H0STCNT0|{symbol}"
-                        self.callbacks[callback_key] = callback
-                    
-                    # 구독 정보 추가
-                    self.subscriptions[symbol] = {
-                        "type": "price", 
-                        "callback": callback,
-                        "subscribed_at": datetime.now()
-                    }
-                    
-                    logger.log_system(f"{symbol} 종목 실시간 가격 구독 성공 (현재 구독 종목 수: {len(self.subscriptions)})")
-                    return True
-                    
-                except Exception as e:
-                    logger.log_error(e, f"{symbol} 종목 구독 시도 {attempt + 1}/3 실패")
-                    if attempt < 2:  # 마지막 시도가 아니면
-                        await asyncio.sleep(2)  # 2초 대기 후 재시도
-                        continue
-                    return False
-            
-            return False  # 모든 시도 실패
+        
+        # 최대 3번까지 전송 시도
+        for attempt in range(3):
+            try:
+                # 연결 상태 확인
+                if not self.is_connected():
+                    logger.log_system(f"웹소켓 연결이 없습니다. {symbol} 구독 전 연결 시도... (시도 {attempt + 1}/3)")
+                    if not await self.connect():
+                        if attempt < 2:  # 마지막 시도가 아니면
+                            await asyncio.sleep(2)  # 2초 대기 후 재시도
+                            continue
+                        logger.log_error(Exception("WebSocket connection failed"), 
+                                       f"{symbol} 구독을 위한 웹소켓 연결 실패")
+                        return False
+                
+                # 동시 요청 시 한도 초과를 막기 위해 전송 전에 먼저 등록 (ACK 전까지 미확인 상태)
+                self.subscriptions[key] = {
+                    "type": feed_type,
+                    "tr_id": tr_id,
+                    "symbol": symbol,
+                    "callback": callback,
+                    "subscribed_at": datetime.now(),
+                    "confirmed": False
+                }
+                ack = self._expect_ack(tr_id, symbol)
+                await self._send_subscription(tr_id, symbol, "1")
+                logger.log_debug(f"{symbol} 종목 {FEED_NAMES[feed_type]} 구독 요청 전송")
+                break
+                
+            except Exception as e:
+                self.subscriptions.pop(key, None)
+                self._pending_acks.pop((tr_id, symbol), None)
+                logger.log_error(e, f"{symbol} 종목 구독 시도 {attempt + 1}/3 실패")
+                if attempt < 2:  # 마지막 시도가 아니면
+                    await asyncio.sleep(2)  # 2초 대기 후 재시도
+                    continue
+                return False
+        
+        return await self._await_ack(key, tr_id, symbol, ack)
+    
+    def _expect_ack(self, tr_id: str, symbol: str) -> asyncio.Future:
+        """구독 응답 대기 Future 등록 (같은 종목의 이전 대기는 새 요청으로 대체)"""
+        future = asyncio.get_running_loop().create_future()
+        previous = self._pending_acks.get((tr_id, symbol))
+        if previous is not None and not previous.done():
+            previous.cancel()
+        self._pending_acks[(tr_id, symbol)] = future
+        return future
+    
+    async def _await_ack(self, key: str, tr_id: str, symbol: str, ack: asyncio.Future) -> bool:
+        """구독 응답 대기 후 구독 상태 확정 (key: subscriptions 키)"""
+        try:
+            ok, message = await asyncio.wait_for(asyncio.shield(ack), timeout=self.ack_timeout)
+        except asyncio.TimeoutError:
+            # 응답이 없어도 프레임은 전송되었으므로 구독을 유지 (실제 틱 수신 여부는 시세 캐시로 확인)
+            logger.log_warning(f"{symbol} 구독 응답 없음 ({self.ack_timeout:.0f}초) - 미확인 상태로 유지")
+            return key in self.subscriptions
+        except asyncio.CancelledError:
+            # 재연결/재구독으로 대기가 대체된 경우
+            if ack.cancelled():
+                return key in self.subscriptions
+            raise
+        finally:
+            if self._pending_acks.get((tr_id, symbol)) is ack:
+                del self._pending_acks[(tr_id, symbol)]
+        
+        info = self.subscriptions.get(key)
+        feed_name = FEED_NAMES.get(info.get("type"), tr_id) if isinstance(info, dict) else tr_id
+        if not ok:
+            self.subscriptions.pop(key, None)
+            logger.log_warning(f"{symbol} 종목 {feed_name} 구독 거부: {message}")
+            return False
+        if isinstance(info, dict):
+            info["confirmed"] = True
+        logger.log_system(f"{symbol} 종목 {feed_name} 구독 성공 (현재 구독 종목 수: {len(self.subscriptions)})")
+        return info is not None
+    
+    def _handle_subscription_ack(self, data: Dict[str, Any]) -> bool:
+        """구독/해지 응답 처리 (응답 메시지가 아니면 False)
+        
+        응답 형식: {"header": {"tr_id", "tr_key", ...}, "body": {"rt_cd", "msg_cd", "msg1", "output"}}
+        """
+        header = data.get("header") or {}
+        body = data.get("body") or {}
+        tr_key = header.get("tr_key")
+        if not tr_key or ("rt_cd" not in body and "rslt_cd" not in header):
+            return False
+        
+        tr_id = header.get("tr_id", "")
+        msg_cd = body.get("msg_cd", "")
+        message = body.get("msg1", "")
+        result_code = body.get("rt_cd", header.get("rslt_cd"))
+        ok = result_code == "0" or msg_cd == MSG_CD_ALREADY_SUBSCRIBED
+        
+        # 암호화 TR은 구독 응답의 키/IV로 이후 프레임을 복호화
+        output = body.get("output") or {}
+        if ok and tr_id in FILL_TR_IDS and output.get("key") and output.get("iv"):
+            self._cipher_keys[tr_id] = (output["key"], output["iv"])
+        
+        # 해지 응답은 대기 중인 구독 요청과 무관
+        if "UNSUBSCRIBE" not in message.upper():
+            future = self._pending_acks.get((tr_id, tr_key))
+            if future is not None and not future.done():
+                future.set_result((ok, f"{msg_cd} {message}".strip()))
+        
+        if ok:
+            logger.log_debug(f"구독 응답: {tr_id}|{tr_key} {message}")
+        else:
+            logger.log_warning(f"구독 응답 실패: {tr_id}|{tr_key} rt_cd={result_code}, msg_cd={msg_cd}, msg={message}")
+        return True
+    
+    async def _send_subscription(self, tr_id: str, symbol: str, tr_type: str):
+        """구독(tr_type=1)/해지(tr_type=2) 프레임 전송 (전송 한도 내에서 ACK 대기 없이 전송)"""
+        message = json.dumps({
+            "header": {
+                "approval_key": await self._get_approval_key(),
+                "custtype": "P",
+                "tr_type": tr_type,
+                "content-type": "utf-8"
+            },
+            "body": {
+                "input": {
+                    "tr_id": tr_id,
+                    "tr_key": symbol
+                }
+            }
+        })
+        await self._pace_frame()
+        if self.ws is None:
+            raise ConnectionError("웹소켓 연결이 없습니다")
+        await self.ws.send(message)
+    
+    async def _pace_frame(self):
+        """구독/해지 프레임 전송 간격 조절 (토큰 버킷)"""
+        while True:
+            wait = self._frame_bucket.time_until_available(time.monotonic())
+            if wait <= 0:
+                self._frame_bucket.tokens -= 1
+                return
+            await asyncio.sleep(wait)
+    
+    def is_subscribed(self, symbol: str, feed_type: str = "price") -> bool:
+        """웹소켓 구독 여부"""
+        return self._subscription_key(symbol, feed_type) in self.subscriptions
+    
+    def _subscription_tr_id(self, symbol: str, feed_type: str) -> Optional[str]:
+        """구독 정보에서 TR ID 조회"""
+        info = self.subscriptions.get(self._subscription_key(symbol, feed_type))
+        if info is None:
+            return None
+        if isinstance(info, dict):
+            return info.get("tr_id", FEED_TR_IDS.get(feed_type))
+        return info
+    
+    async def resubscribe_all(self) -> int:
+        """기존 가격/호가 구독 재등록 (서버 측 구독은 연결이 끊기면 사라짐)
+        
+        전체 구독을 동시에 요청하고 프레임 전송 간격은 전송 한도가 조절한다.
+        
+        Returns:
+            int: 재등록에 성공한 구독 수
+        """
+        feeds = [(key, info.get("symbol", key), info["type"]) for key, info in self.subscriptions.items()
+                 if isinstance(info, dict) and info.get("type") in FEED_TR_IDS]
+        for key, _, _ in feeds:
+            del self.subscriptions[key]
+        
+        results = await asyncio.gather(*(self._subscribe_feed(symbol, feed_type) for _, symbol, feed_type in feeds),
+                                       return_exceptions=True)
+        restored = sum(1 for result in results if result is True)
+        logger.log_system(f"{self.name} 구독 재등록: {restored}/{len(feeds)}건")
+        return restored
     
     async def unsubscribe(self, symbol: str, feed_type: str = "price"):
-        """구독 취소"""
+        """구독 취소 (웹소켓 구독만 해지, 틱 버스 구독자는 tick_bus.unsubscribe로 제거)"""
+        key = self._subscription_key(symbol, feed_type)
+        tr_id = self._subscription_tr_id(symbol, feed_type)
+        if not tr_id:
+            return
+        
         # 웹소켓 연결 상태 확인
         if not self.is_connected():
             logger.log_system(f"웹소켓 연결이 없어 {symbol}의 {feed_type} 구독 취소를 건너뜁니다.")
-            
             # 단, 내부 상태는 업데이트
-            if feed_type == "price" and symbol in self.subscriptions:
-                if isinstance(self.subscriptions[symbol], dict) and "type" in self.subscriptions[symbol]:
-                    callback_key = f"H0STCNT0|{symbol}"
-                    if callback_key in self.callbacks:
-                        del self.callbacks[callback_key]
-                    del self.subscriptions[symbol]
-                    logger.log_system(f"Cleaned up subscription info for {symbol} {feed_type}")
-                else:
-                    # 이전 버전 호환성 유지
-                    tr_id = self.subscriptions.get(symbol)
-                    callback_key = f"{tr_id}|{symbol}"
-                    if callback_key in self.callbacks:
-                        del self.callbacks[callback_key]
-                    del self.subscriptions[symbol]
-                    logger.log_system(f"Cleaned up subscription info for {symbol} {feed_type}")
-            elif f"{symbol}_{feed_type}" in self.subscriptions:
-                tr_id = self.subscriptions.get(f"{symbol}_{feed_type}")
-                callback_key = f"{tr_id}|{symbol}"
-                if callback_key in self.callbacks:
-                    del self.callbacks[callback_key]
-                del self.subscriptions[f"{symbol}_{feed_type}"]
-                logger.log_system(f"Cleaned up subscription info for {symbol} {feed_type}")
-                
-            return
-        
-        if feed_type == "price":
-            tr_id = self.subscriptions.get(symbol)
-        else:
-            tr_id = self.subscriptions.get(f"{symbol}_{feed_type}")
-        
-        if not tr_id:
+            del self.subscriptions[key]
+            logger.log_system(f"Cleaned up subscription info for {symbol} {feed_type}")
             return
         
         try:
-            unsubscribe_data = {
-                "header": {
-                    "approval_key": await self._get_approval_key(),
-                    "custtype": "P",
-                    "tr_type": "2",  # 해지
-                    "content-type": "utf-8"
-                },
-                "body": {
-                    "input": {
-                        "tr_id": tr_id,
-                        "tr_key": symbol
-                    }
-                }
-            }
-            
-            await self.ws.send(json.dumps(unsubscribe_data))
-            
-            # 콜백 제거
-            callback_key = f"{tr_id}|{symbol}"
-            if callback_key in self.callbacks:
-                del self.callbacks[callback_key]
-            
-            if feed_type == "price":
-                del self.subscriptions[symbol]
-            else:
-                del self.subscriptions[f"{symbol}_{feed_type}"]
+            await self._send_subscription(tr_id, symbol, "2")
+            self.subscriptions.pop(key, None)
             
             logger.log_system(f"Unsubscribed from {feed_type} feed for {symbol}")
         except Exception as e:
             logger.log_error(e, f"Error unsubscribing from {feed_type} feed for {symbol}")
             
             # 웹소켓 연결 문제인 경우, 컬렉션에서 구독 정보는 삭제
-            if "ConnectionClosed" in str(e) or "NoneType" in str(e):
+            if isinstance(e, ConnectionError) or "ConnectionClosed" in str(e) or "NoneType" in str(e):
                 logger.log_system(f"Removing subscription info for {symbol} due to connection issues")
-                callback_key = f"{tr_id}|{symbol}"
-                if callback_key in self.callbacks:
-                    del self.callbacks[callback_key]
-                
-                if feed_type == "price" and symbol in self.subscriptions:
-                    del self.subscriptions[symbol]
-                elif f"{symbol}_{feed_type}" in self.subscriptions:
-                    del self.subscriptions[f"{symbol}_{feed_type}"]
+                self.subscriptions.pop(key, None)
     
     async def _receive_messages(self):
         """메시지 수신 루프"""
@@ -440,11 +619,14 @@ class KISWebSocketClient:
                     async with self.receive_lock:
                         # 메시지 수신 시 타임아웃 적용 (무한 대기 방지)
                         message = await asyncio.wait_for(self.ws.recv(), timeout=60.0)
-                        await self._process_message(message)
+                    if cassette.recording:
+                        cassette.record_ws(message)
+                    # 처리는 디스패처 워커에 맡기고 바로 다음 프레임 수신
+                    await self._enqueue_message(message)
                 except asyncio.TimeoutError:
                     # 60초 동안 메시지가 없으면 ping 전송
                     logger.log_system("WebSocket message receive timeout, sending ping")
-                    if self.ws and not getattr(self.ws, 'closed', True):
+                    if self.ws and not self._ws_closed():
                         try:
                             pong = await self.ws.ping()
                             await asyncio.wait_for(pong, timeout=5.0)
@@ -482,6 +664,12 @@ class KISWebSocketClient:
     async def _process_message(self, message: str):
         """메시지 처리"""
         try:
+            # 실시간 데이터(파이프 형식)는 JSON 디코딩 없이 바로 처리
+            frame = parse_frame(message)
+            if frame is not None:
+                await self._process_realtime_frame(frame)
+                return
+
             # 서버로부터 받은 메시지 길이 기록 (로그 길이 제한)
             max_log_length = 100
             shortened_message = message[:max_log_length] + ('...' if len(message) > max_log_length else '')
@@ -490,6 +678,12 @@ class KISWebSocketClient:
             # JSON 형식인지 확인
             data = json.loads(message)
             
+            # 구독/해지 응답 (ACK)
+            if self._handle_subscription_ack(data):
+                if self._held_fill_frames:
+                    await self._flush_fill_frames()
+                return
+            
             # 오류 메시지 확인
             # 서버 오류 응답 처리 (rt_cd가 0이 아닌 경우)
             if "body" in data and "rt_cd" in data["body"] and data["body"]["rt_cd"] != "0":
@@ -539,13 +733,13 @@ class KISWebSocketClient:
                     logger.log_debug(f"형식 오류 메시지 (tr_id/tr_key 누락) - 처리 스킵: {shortened_message}")
                     return
                 
-                callback_key = f"{tr_id}|{tr_key}"
-                callback = self.callbacks.get(callback_key)
+                # 실시간 체결가로 시세 캐시 갱신 (REST 현재가 조회 대체)
+                if tr_id == "H0STCNT0":
+                    quote_cache.update_from_tick(tr_key, body)
                 
-                if callback:
-                    await callback(body)
-                else:
-                    logger.log_debug(f"등록된 콜백 없음: {callback_key}")
+                topic = TR_ID_TOPICS.get(tr_id)
+                if topic is None or not await tick_bus.publish(topic, tr_key, body):
+                    logger.log_debug(f"등록된 구독자 없음: {tr_id}|{tr_key}")
             
         except json.JSONDecodeError:
             # 로그 길이 제한
@@ -554,6 +748,92 @@ class KISWebSocketClient:
         except Exception as e:
             logger.log_error(e, f"메시지 처리 중 오류 발생")
     
+    async def _enqueue_message(self, message: str):
+        """수신 메시지를 디스패치 큐에 추가 (체결 틱/호가는 종목별 키, 그 외는 수신 순서대로)
+        
+        호가는 매번 전체 스냅샷이므로 체결 틱과 다른 키로 병합되어 밀리면 최신 호가만 남는다.
+        체결 틱은 건별 거래량/고가/저가가 누적되므로 버리거나 교체하지 않는다 (큐가 가득 차면 대기).
+        체결 통보는 큐가 가득 차도 버려지면 안 되므로 큐를 거치지 않고 수신 루프에서 바로 처리한다.
+        JSON 제어 메시지(구독 응답/PINGPONG)도 같은 이유로 바로 처리한다 (체결 통보 복호화 키가 구독 응답으로 옴).
+        """
+        frame = parse_frame(message)
+        if frame is None:
+            await self._process_message(message)
+            return
+        if frame.tr_id in FILL_TR_IDS:
+            await self._handle_fill_frame(frame)
+            return
+        if not frame.encrypted:
+            if frame.tr_id == "H0STCNT0":
+                for tick in frame.ticks():
+                    await self.dispatcher.put(tick.symbol, tick, droppable=False)
+                return
+            if frame.tr_id == "H0STASP0":
+                for record in frame.order_books():
+                    await self.dispatcher.put(f"{record.symbol}|H0STASP0", record)
+                return
+        await self.dispatcher.put(None, message)
+
+    async def _dispatch_item(self, key: Optional[str], item: Any):
+        """디스패처 워커에서 호출되는 처리 함수"""
+        if isinstance(item, Tick):
+            await self._handle_tick(item)
+        elif isinstance(item, OrderBookRecord):
+            await self._handle_order_book(item)
+        else:
+            await self._process_message(item)
+
+    async def _handle_tick(self, tick: Tick):
+        """체결 틱 1건 처리 (시세 캐시 갱신 후 틱 버스 구독자에게 전달)"""
+        # 실시간 체결가로 시세 캐시 갱신 (REST 현재가 조회 대체)
+        quote_cache.update_from_trade(tick)
+        await tick_bus.publish(TOPIC_TRADE, tick.symbol, tick)
+
+    async def _handle_order_book(self, record: OrderBookRecord):
+        """호가 레코드 1건 처리 (호가창 갱신 후 틱 버스 구독자에게 전달)"""
+        book = order_books.apply(record)
+        await tick_bus.publish(TOPIC_QUOTE, record.symbol, book)
+
+    async def _handle_fill_frame(self, frame: RealtimeFrame):
+        """체결 통보 프레임 복호화 후 틱 버스(TOPIC_FILL)로 전달 (수신 순서대로 처리)"""
+        cipher_key = self._cipher_keys.get(frame.tr_id, ("", ""))
+        if frame.encrypted and not cipher_key[0]:
+            logger.log_warning(f"{self.name} 체결 통보 복호화 키 없음 - 구독 응답 처리 후 반영: {frame.tr_id}")
+            self._held_fill_frames.append(frame)
+            return
+        try:
+            notices = frame.fill_notices(*cipher_key)
+        except Exception as e:
+            logger.log_error(e, f"{self.name} 체결 통보 복호화 실패")
+            return
+        for notice in notices:
+            await tick_bus.publish(TOPIC_FILL, notice.symbol, notice)
+
+    async def _flush_fill_frames(self):
+        """복호화 키를 받은 TR의 보관 중인 체결 통보 처리"""
+        held, self._held_fill_frames = self._held_fill_frames, deque(maxlen=self._held_fill_frames.maxlen)
+        for frame in held:
+            await self._handle_fill_frame(frame)
+    
+    async def _process_realtime_frame(self, frame: RealtimeFrame):
+        """파이프 형식 실시간 프레임 처리 (체결은 레코드별 Tick, 호가는 호가창 갱신)"""
+        if frame.tr_id in FILL_TR_IDS:
+            await self._handle_fill_frame(frame)
+            return
+        if frame.encrypted:
+            logger.log_debug(f"암호화된 실시간 데이터 수신 (미처리): {frame.tr_id}")
+            return
+        if frame.tr_id == "H0STASP0":
+            for record in frame.order_books():
+                await self._handle_order_book(record)
+            return
+        if frame.tr_id != "H0STCNT0":
+            logger.log_debug(f"처리하지 않는 실시간 TR: {frame.tr_id} ({frame.count}건)")
+            return
+
+        for tick in frame.ticks():
+            await self._handle_tick(tick)
+
     async def _handle_ping(self):
         """핑퐁 처리"""
         try:
@@ -598,6 +878,11 @@ class KISWebSocketClient:
             if not self.running:
                 logger.log_warning("이미 재연결 중이거나 연결이 종료된 상태")
                 return
+            
+            # 끊긴 시각 기록 (재연결 후 공백 구간 보정 기준, 연속 실패 시 최초 시각 유지)
+            if self.disconnected_at is None:
+                self.disconnected_at = datetime.now()
+                await self._notify_disconnect(self.disconnected_at, gave_up=False)
                 
             # 상태 먼저 업데이트
             self.running = False
@@ -608,6 +893,7 @@ class KISWebSocketClient:
                     Exception("Max reconnection attempts reached"),
                     "WebSocket reconnection failed"
                 )
+                await self._give_up()
                 return
             
             self.reconnect_attempts += 1
@@ -660,7 +946,7 @@ class KISWebSocketClient:
                 # 웹소켓 연결 시도
                 logger.log_system("기본 웹소켓 연결 시도...")
                 self.ws = await asyncio.wait_for(
-                    websockets.connect(self.ws_url, **connection_options),
+                    self._open_connection(connection_options),
                     timeout=20.0  # 연결 타임아웃 증가
                 )
                 logger.log_system("기본 웹소켓 연결 성공")
@@ -676,6 +962,7 @@ class KISWebSocketClient:
                 
                 # 메시지 수신 루프 시작
                 #logger.log_system("메시지 수신 루프 재시작...")
+                self.dispatcher.start()
                 asyncio.create_task(self._receive_messages())
                 
                 # 핑 루프 시작 - 연결 상태 확인용
@@ -683,6 +970,7 @@ class KISWebSocketClient:
                 asyncio.create_task(self._ping_loop())
                 
                 logger.log_system("기본 재연결 성공!")
+                await self._on_connected()
                 return True
                 
             except Exception as conn_error:
@@ -690,6 +978,7 @@ class KISWebSocketClient:
                 self.ws = None
                 self.running = False
                 self.auth_successful = False
+                await self._give_up()
                 return False
                 
         except Exception as e:
@@ -724,7 +1013,7 @@ class KISWebSocketClient:
                         break
                     
                     # 헬스체크 메시지 전송
-                    if self.ws and not getattr(self.ws, 'closed', True):
+                    if self.ws and not self._ws_closed():
                         try:
                             ping_data = {
                                 "header": {
@@ -760,6 +1049,15 @@ class KISWebSocketClient:
             self._receive_task.cancel()
         if hasattr(self, '_ping_task') and self._ping_task:
             self._ping_task.cancel()
+        
+        # 디스패처 워커 중지 (대기 중인 틱은 재연결 후 의미가 없으므로 버림)
+        await self.dispatcher.stop()
+        
+        # 응답을 기다리던 구독 요청은 미확인 상태로 종료 (재연결 시 재구독)
+        for future in self._pending_acks.values():
+            if not future.done():
+                future.cancel()
+        self._pending_acks.clear()
             
         # 웹소켓 연결 종료
         if self.ws:
@@ -799,41 +1097,18 @@ class KISWebSocketClient:
                     results[symbol] = False
                 return results
         
-        # 배치 처리를 위해 종목을 나눕니다
-        batch_size = 5  # 한 번에 5개씩 처리 (더 적게 설정)
-        
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
-            
-            # 배치 내 종목들을 순차적으로 처리
-            for symbol in batch:
-                if symbol in self.subscriptions:
-                    results[symbol] = True  # 이미 구독 중
-                    success_count += 1
-                    continue
-                
-                try:
-                    # 동기적으로 구독 실행 (Task 생성 없이)
-                    result = await self.subscribe_price(symbol, callback)
-                    results[symbol] = result
-                    if result:
-                        success_count += 1
-                    else:
-                        failure_count += 1
-                        logger.log_warning(f"{symbol} 구독 실패")
-                except Exception as e:
-                    logger.log_error(e, f"{symbol} 구독 중 오류 발생")
-                    results[symbol] = False
-                    failure_count += 1
-                
-                # 종목 간 짧은 지연 추가 (100ms)
-                await asyncio.sleep(0.1)
-            
-            # 배치 간 지연시간 (서버 부하 방지)
-            if i + batch_size < len(symbols):
-                # 2초로 배치 간 지연 증가
-                await asyncio.sleep(2.0)
-                logger.log_system(f"구독 진행중: {min(i + batch_size, total_symbols)}/{total_symbols} 종목 완료")
+        # 구독 프레임은 세션 전송 한도 내에서 연속 전송되고 종목별 ACK는 각각 확인
+        outcomes = await asyncio.gather(*(self.subscribe_price(symbol, callback) for symbol in symbols),
+                                        return_exceptions=True)
+        for symbol, outcome in zip(symbols, outcomes):
+            if isinstance(outcome, Exception):
+                logger.log_error(outcome, f"{symbol} 구독 중 오류 발생")
+            results[symbol] = outcome is True
+            if results[symbol]:
+                success_count += 1
+            else:
+                failure_count += 1
+                logger.log_warning(f"{symbol} 구독 실패")
         
         logger.log_system(
             f"종목 구독 완료 - 성공: {success_count}, 실패: {failure_count}, "
@@ -842,17 +1117,32 @@ class KISWebSocketClient:
         
         return results
     
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """수신 디스패치 큐 상태 (깊이, 처리 지연, 버림/병합 수)"""
+        return self.dispatcher.get_stats()
+    
     def get_subscription_status(self) -> Dict[str, Any]:
         """현재 구독 상태 정보 반환"""
         return {
             "total_subscriptions": len(self.subscriptions),
             "max_subscriptions": self.max_subscriptions,
             "subscribed_symbols": list(self.subscriptions.keys()),
-            "semaphore_available": self.subscription_semaphore._value,
+            "unconfirmed": [key for key, info in self.subscriptions.items()
+                            if isinstance(info, dict) and not info.get("confirmed", True)],
+            "pending_acks": len(self._pending_acks),
             "is_connected": self.is_connected(),
             "auth_successful": self.auth_successful
         }
     
+    def _ws_closed(self) -> bool:
+        """연결 객체 종료 여부 (websockets 14+ 연결 객체에는 closed 속성이 없어 state로 확인)"""
+        if self.ws is None:
+            return True
+        state = getattr(self.ws, "state", None)
+        if state is not None:
+            return state is not State.OPEN
+        return getattr(self.ws, "closed", True)
+    
     def is_connected(self) -> bool:
         """웹소켓 연결 상태 확인"""
         # 웹소켓 객체가 존재하고, running 상태이며, 인증이 성공적으로 완료되었는지 확인
@@ -861,9 +1151,8 @@ class KISWebSocketClient:
         
         if ws_exists:
             try:
-                # ClientConnection 객체의 closed 속성을 안전하게 확인
-                # getattr를 사용하여 속성이 없는 경우 기본값 반환
-                not_closed = not getattr(self.ws, 'closed', True)
+                # 연결 객체의 상태를 안전하게 확인
+                not_closed = not self._ws_closed()
             except Exception as e:
                 logger.log_debug(f"웹소켓 상태 확인 중 오류 (무시): {str(e)}")
                 not_closed = False
@@ -881,6 +1170,20 @@ class KISWebSocketClient:
         
         return is_active
 
+class KISWebSocketClient(KISWebSocketSession):
+    """한국투자증권 웹소켓 클라이언트 (기본 접속키 세션)"""
+    
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
 # 싱글톤 인스턴스
 ws_client = KISWebSocketClient()
 
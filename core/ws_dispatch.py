@@ -0,0 +1,209 @@
+"""
+웹소켓 수신/처리 분리용 디스패치 큐
+
+수신 루프는 프레임을 읽어 큐에 넣기만 하고, 디스패처 워커가 콜백(시세 캐시, 전략)을 실행한다.
+키(종목코드)별로 같은 워커가 처리하므로 종목 단위 순서는 유지된다.
+"""
+import asyncio
+import time
+import zlib
+from collections import deque
+from typing import Dict, Any, Callable, Awaitable, List, Optional
+
+from core.api_metrics import LatencyHistogram
+from utils.logger import logger
+
+# 큐가 가득 찼을 때 정책
+POLICY_DROP_OLDEST = "drop_oldest"      # 가장 오래된 항목을 버리고 추가
+POLICY_CONFLATE = "conflate"            # 같은 키의 대기 항목을 최신 값으로 교체 (없으면 drop_oldest)
+POLICY_BLOCK = "block"                  # 자리가 날 때까지 수신 루프 대기
+OVERFLOW_POLICIES = (POLICY_DROP_OLDEST, POLICY_CONFLATE, POLICY_BLOCK)
+
+# 처리 지연(큐 대기 시간) 히스토그램 버킷 상한 (초)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+class _Entry:
+    """큐 항목"""
+    __slots__ = ("key", "item", "enqueued_at", "droppable")
+
+    def __init__(self, key: Optional[str], item: Any, enqueued_at: float, droppable: bool = True):
+        self.key = key
+        self.item = item
+        self.enqueued_at = enqueued_at
+        self.droppable = droppable              # False면 버리거나 교체하지 않음 (체결 틱 등)
+
+
+class _Shard:
+    """워커 1개가 처리하는 큐"""
+
+    def __init__(self):
+        self.queue: deque = deque()
+        self.pending: Dict[str, _Entry] = {}    # {키: 큐에 남아 있는 최신 항목} (conflate용)
+        self.ready = asyncio.Event()
+        self.space = asyncio.Event()
+        self.max_depth = 0
+
+
+class DispatchQueue:
+    """키별 순서를 보장하는 유한 디스패치 큐 + 워커
+
+    - put(): 수신 루프에서 호출, 큐가 가득 차면 overflow_policy에 따라 처리
+      (droppable=False 항목은 정책과 무관하게 버리거나 교체하지 않고 자리가 날 때까지 대기)
+    - 워커는 handler(key, item)를 순서대로 await (느린 콜백이 소켓 읽기를 막지 않음)
+    - 워커가 실행 중이 아니면 put()에서 바로 처리 (연결 전/종료 후 호출 대비)
+    """
+
+    def __init__(self, handler: Callable[[Optional[str], Any], Awaitable[None]], workers: int = 4,
+                 max_queue: int = 5000, overflow_policy: str = POLICY_DROP_OLDEST, name: str = "ws"):
+        self.handler = handler
+        self.name = name
+        self.workers = workers
+        self.max_queue = max_queue              # 워커별 최대 대기 항목 수
+        self.overflow_policy = overflow_policy
+
+        self._shards: List[_Shard] = []
+        self._tasks: List[asyncio.Task] = []
+        self.lag = LatencyHistogram(LAG_BUCKETS)
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {"enqueued": 0, "processed": 0, "dropped": 0, "conflated": 0,
+                "blocked": 0, "blocked_seconds": 0.0, "handler_errors": 0}
+
+    def configure(self, workers: int = None, max_queue: int = None, overflow_policy: str = None):
+        """설정 변경 (워커 수 변경은 다음 start()부터 적용)"""
+        if overflow_policy is not None:
+            if overflow_policy not in OVERFLOW_POLICIES:
+                raise ValueError(f"지원하지 않는 큐 정책: {overflow_policy} ({', '.join(OVERFLOW_POLICIES)})")
+            self.overflow_policy = overflow_policy
+        if workers is not None:
+            self.workers = max(1, workers)
+        if max_queue is not None:
+            self.max_queue = max(1, max_queue)
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self):
+        """현재 이벤트 루프에서 워커 시작 (이미 실행 중이면 무시)"""
+        if self.running:
+            return
+        self._shards = [_Shard() for _ in range(self.workers)]
+        self._tasks = [asyncio.create_task(self._worker(shard)) for shard in self._shards]
+        logger.log_system(f"[디스패치] {self.name} 워커 {self.workers}개 시작 "
+                          f"(큐 {self.max_queue}, 정책 {self.overflow_policy})")
+
+    async def stop(self, drain: bool = False):
+        """워커 중지 (drain=True면 남은 항목을 처리한 뒤 중지)"""
+        if drain:
+            for shard in self._shards:
+                while shard.queue:
+                    await self._dispatch(shard, shard.queue.popleft())
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._tasks = []
+        for shard in self._shards:
+            shard.queue.clear()
+            shard.pending.clear()
+            shard.space.set()
+
+    def _shard_for(self, key: Optional[str]) -> _Shard:
+        if key is None or len(self._shards) == 1:
+            return self._shards[0]
+        return self._shards[zlib.crc32(key.encode()) % len(self._shards)]
+
+    async def put(self, key: Optional[str], item: Any, droppable: bool = True):
+        """항목 추가 (key가 같은 항목은 같은 워커에서 순서대로 처리)
+
+        Args:
+            key: 순서 보장/교체 기준 키 (None이면 교체 대상 아님)
+            item: handler에 전달할 항목
+            droppable: False면 큐가 가득 차도 버리거나 교체하지 않음
+                (거래량이 누적되는 체결 틱처럼 항목마다 의미가 있는 경우)
+        """
+        if not self.running:
+            await self.handler(key, item)
+            return
+
+        shard = self._shard_for(key)
+        if len(shard.queue) >= self.max_queue:
+            policy = self.overflow_policy
+            pending = shard.pending.get(key) if key is not None else None
+            if (policy == POLICY_CONFLATE and droppable
+                    and pending is not None and pending.droppable):
+                # 아직 처리되지 않은 같은 키의 항목을 최신 값으로 교체 (대기 시간은 기존 항목 기준)
+                pending.item = item
+                self.stats["conflated"] += 1
+                return
+            if policy == POLICY_BLOCK or not droppable or not shard.queue[0].droppable:
+                await self._wait_for_space(shard)
+            else:
+                dropped = shard.queue.popleft()
+                if dropped.key is not None and shard.pending.get(dropped.key) is dropped:
+                    del shard.pending[dropped.key]
+                self.stats["dropped"] += 1
+
+        entry = _Entry(key, item, time.monotonic(), droppable)
+        shard.queue.append(entry)
+        if key is not None:
+            shard.pending[key] = entry
+        shard.max_depth = max(shard.max_depth, len(shard.queue))
+        self.stats["enqueued"] += 1
+        shard.ready.set()
+
+    async def _wait_for_space(self, shard: _Shard):
+        """자리가 날 때까지 수신 루프 대기"""
+        started = time.monotonic()
+        self.stats["blocked"] += 1
+        while len(shard.queue) >= self.max_queue and self.running:
+            shard.space.clear()
+            await shard.space.wait()
+        self.stats["blocked_seconds"] += time.monotonic() - started
+
+    async def _worker(self, shard: _Shard):
+        while True:
+            if not shard.queue:
+                shard.ready.clear()
+                await shard.ready.wait()
+                continue
+            await self._dispatch(shard, shard.queue.popleft())
+
+    async def _dispatch(self, shard: _Shard, entry: _Entry):
+        if entry.key is not None and shard.pending.get(entry.key) is entry:
+            del shard.pending[entry.key]
+        shard.space.set()
+        self.lag.observe(time.monotonic() - entry.enqueued_at)
+        try:
+            await self.handler(entry.key, entry.item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats["handler_errors"] += 1
+            logger.log_error(e, f"[디스패치] {self.name} 처리 중 오류 (key={entry.key})")
+        self.stats["processed"] += 1
+
+    def depth(self) -> int:
+        """현재 대기 항목 수"""
+        return sum(len(shard.queue) for shard in self._shards)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """큐 깊이/처리 지연/버림 통계 반환"""
+        return {
+            "running": self.running,
+            "workers": len(self._shards) or self.workers,
+            "max_queue": self.max_queue,
+            "overflow_policy": self.overflow_policy,
+            "depth": self.depth(),
+            "max_depth": max((shard.max_depth for shard in self._shards), default=0),
+            "shard_depths": [len(shard.queue) for shard in self._shards],
+            "lag": self.lag.to_dict(),
+            **self.stats,
+        }
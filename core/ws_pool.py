@@ -0,0 +1,356 @@
+"""
+다중 접속키 웹소켓 세션 풀
+
+KIS 실시간 등록은 세션(접속키)당 41건으로 제한되므로, 추가 접속키로 세션을 늘려
+거래량 상위 전체 종목을 실시간으로 받는다. 종목은 일관 해싱(가상 노드 + 세션 용량 제한)으로
+세션에 배정하고, 세션이 끊기거나 복구되면 해당 세션 몫의 종목만 다시 배정한다.
+모든 세션의 틱은 tick_bus/quote_cache로 합쳐지므로 사용하는 쪽은 세션을 구분하지 않는다.
+호가 구독(H0STASP0)도 같은 한도를 차지하며, 같은 종목 해시로 배정되어 보통 가격 구독과 같은 세션에 놓인다.
+
+추가 접속키는 환경 변수 KIS_WS_EXTRA_KEYS에 "앱키:시크릿" 쌍을 쉼표로 구분해 지정한다.
+"""
+import asyncio
+import bisect
+import os
+import threading
+import zlib
+from datetime import datetime
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from core.websocket_client import ws_client, KISWebSocketSession
+from core.tick_bus import tick_bus, TOPIC_TRADE, TOPIC_QUOTE
+from utils.logger import logger
+
+# 세션당 해시 링 가상 노드 수 (세션 간 종목 분포 균등화)
+VIRTUAL_NODES = 64
+
+
+def _hash(key: str) -> int:
+    return zlib.crc32(key.encode())
+
+
+def _split_key(key: str) -> Tuple[str, str]:
+    """배정 키 → (종목코드, 구독 종류) (세션 subscriptions 키와 같은 형식)"""
+    symbol, _, feed_type = key.partition("_")
+    return symbol, feed_type or "price"
+
+
+def parse_extra_keys(value: str) -> List[Tuple[str, str]]:
+    """"앱키:시크릿,앱키:시크릿" 형식 파싱 (형식 오류 항목은 제외)"""
+    keys = []
+    for item in (value or "").split(","):
+        app_key, sep, app_secret = item.strip().partition(":")
+        if sep and app_key and app_secret:
+            keys.append((app_key.strip(), app_secret.strip()))
+    return keys
+
+
+class WebSocketPool:
+    """웹소켓 세션 풀 (세션 0은 기본 접속키의 ws_client)
+
+    - subscribe_price/subscribe_orderbook/unsubscribe/is_subscribed: ws_client와 같은 구독 API
+    - connect/close/is_connected: 전체 세션 대상 (하나라도 연결되어 있으면 연결 상태)
+    - 세션 장애 시 해당 세션 종목을 남은 세션으로 옮기고, 복구되면 원래 세션으로 되돌림
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """싱글톤 패턴 구현을 위한 __new__ 메서드 오버라이드"""
+        with cls._lock:  # 스레드 안전성을 위한 락 사용
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """생성자는 인스턴스가 처음 생성될 때만 실행됨을 보장"""
+        if not hasattr(self, '_initialized') or not self._initialized:
+            self.sessions: List[KISWebSocketSession] = []
+            self._active: List[bool] = []
+            self._ring: List[Tuple[int, int]] = []           # [(해시, 세션 번호)] 정렬
+            self._ring_hashes: List[int] = []
+            self.assignments: Dict[str, int] = {}            # {구독 키: 세션 번호} (가격은 종목코드, 호가는 "종목코드_orderbook")
+            self.orphans: set = set()                        # 용량 부족으로 배정하지 못한 구독 키
+            self._pending: set = set()                       # 구독 요청 진행 중인 구독 키
+            self._rebalance_lock = asyncio.Lock()
+            self.stats = {"rebalances": 0, "moved": 0, "failed": 0}
+            # 모든 세션에 등록할 재연결/연결 끊김 리스너 (세션 구성이 바뀌어도 유지)
+            self._reconnect_listeners: List[Callable] = []
+            self._disconnect_listeners: List[Callable] = []
+
+            self.configure(parse_extra_keys(os.getenv("KIS_WS_EXTRA_KEYS", "")))
+            self._initialized = True
+
+    def configure(self, extra_keys: List[Tuple[str, str]]):
+        """세션 구성 (기본 세션 + 추가 접속키 세션, 연결 전에 호출)"""
+        for session in self.sessions:
+            if self._on_session_state in session.state_listeners:
+                session.state_listeners.remove(self._on_session_state)
+            for listener in self._reconnect_listeners:
+                if listener in session.reconnect_listeners:
+                    session.reconnect_listeners.remove(listener)
+            for listener in self._disconnect_listeners:
+                if listener in session.disconnect_listeners:
+                    session.disconnect_listeners.remove(listener)
+
+        self.sessions = [ws_client]
+        for index, (app_key, app_secret) in enumerate(extra_keys, start=1):
+            self.sessions.append(KISWebSocketSession(app_key, app_secret, name=f"웹소켓#{index}"))
+        for session in self.sessions:
+            session.state_listeners.append(self._on_session_state)
+            session.reconnect_listeners.extend(self._reconnect_listeners)
+            session.disconnect_listeners.extend(self._disconnect_listeners)
+
+        self._active = [True] * len(self.sessions)
+        self.assignments.clear()
+        self.orphans.clear()
+        self._build_ring()
+        if extra_keys:
+            logger.log_system(f"[웹소켓 풀] 세션 {len(self.sessions)}개 구성 (최대 {self.capacity}종목)")
+
+    def add_reconnect_listener(self, listener: Callable):
+        """모든 세션의 재연결 완료 알림 등록 {콜백(세션, 끊긴 시각, 재구독 소요 초)}"""
+        if listener in self._reconnect_listeners:
+            return
+        self._reconnect_listeners.append(listener)
+        for session in self.sessions:
+            session.reconnect_listeners.append(listener)
+
+    def add_disconnect_listener(self, listener: Callable):
+        """모든 세션의 연결 끊김 알림 등록 {콜백(세션, 끊긴 시각, 재연결 포기 여부)}"""
+        if listener in self._disconnect_listeners:
+            return
+        self._disconnect_listeners.append(listener)
+        for session in self.sessions:
+            session.disconnect_listeners.append(listener)
+
+    def _build_ring(self):
+        """활성 세션으로 해시 링 구성"""
+        self._ring = sorted(
+            (_hash(f"{session.name}#{node}"), index)
+            for index, session in enumerate(self.sessions) if self._active[index]
+            for node in range(VIRTUAL_NODES)
+        )
+        self._ring_hashes = [point for point, _ in self._ring]
+
+    @property
+    def capacity(self) -> int:
+        """활성 세션 전체의 구독 한도"""
+        return sum(session.max_subscriptions for index, session in enumerate(self.sessions) if self._active[index])
+
+    def _load(self, index: int) -> int:
+        return sum(1 for assigned in self.assignments.values() if assigned == index)
+
+    def _candidates(self, symbol: str):
+        """링에서 종목 해시 이후 순서로 활성 세션 번호 (중복 제외)"""
+        if not self._ring:
+            return
+        start = bisect.bisect(self._ring_hashes, _hash(symbol))
+        seen = set()
+        for offset in range(len(self._ring)):
+            index = self._ring[(start + offset) % len(self._ring)][1]
+            if index not in seen:
+                seen.add(index)
+                yield index
+
+    def home_of(self, symbol: str) -> Optional[int]:
+        """용량을 고려하지 않은 종목의 기본 세션 번호"""
+        return next(self._candidates(symbol), None)
+
+    def _target(self, symbol: str, exclude: set = ()) -> Optional[int]:
+        """용량이 남은 첫 세션 (기본 세션이 가득 차면 링 다음 세션)"""
+        for index in self._candidates(symbol):
+            if index in exclude:
+                continue
+            if self._load(index) < self.sessions[index].max_subscriptions:
+                return index
+        return None
+
+    def session_for(self, symbol: str, feed_type: str = "price") -> Optional[KISWebSocketSession]:
+        """종목이 배정된 세션"""
+        index = self.assignments.get(KISWebSocketSession._subscription_key(symbol, feed_type))
+        return self.sessions[index] if index is not None else None
+
+    # --- 구독 API (ws_client와 동일) ---
+    def is_subscribed(self, symbol: str, feed_type: str = "price") -> bool:
+        return any(session.is_subscribed(symbol, feed_type) for session in self.sessions)
+
+    async def subscribe_price(self, symbol: str, callback: Callable = None) -> bool:
+        """실시간 가격 구독 (배정된 세션에서 구독, 실패하면 다음 세션 시도)"""
+        if callback:
+            tick_bus.add_listener(TOPIC_TRADE, symbol, callback)
+        return await self.subscribe(symbol, "price")
+
+    async def subscribe_orderbook(self, symbol: str, callback: Callable = None) -> bool:
+        """실시간 호가 구독 (배정된 세션에서 구독, 실패하면 다음 세션 시도)"""
+        if callback:
+            tick_bus.add_listener(TOPIC_QUOTE, symbol, callback)
+        return await self.subscribe(symbol, "orderbook")
+
+    async def subscribe(self, symbol: str, feed_type: str = "price") -> bool:
+        """구독 종류별 구독 (tick_bus 상류 구독용, 콜백 등록 없음)"""
+        key = KISWebSocketSession._subscription_key(symbol, feed_type)
+        if key in self.assignments or self.is_subscribed(symbol, feed_type):
+            return True
+        return await self._place(key)
+
+    async def _place(self, key: str, exclude: set = ()) -> bool:
+        """구독을 세션에 배정하고 구독 (같은 종목의 가격/호가는 같은 해시로 배정)"""
+        symbol, feed_type = _split_key(key)
+        tried = set(exclude)
+        while True:
+            index = self._target(symbol, tried)
+            if index is None:
+                self.orphans.add(key)
+                logger.log_warning(f"[웹소켓 풀] {key} 배정 가능한 세션 없음 (한도 {self.capacity}건)")
+                return False
+            # 동시 구독 시 한도 초과를 막기 위해 결과 전에 먼저 배정
+            self.assignments[key] = index
+            self._pending.add(key)
+            try:
+                ok = await self.sessions[index]._subscribe_feed(symbol, feed_type)
+            finally:
+                self._pending.discard(key)
+            if ok:
+                self.orphans.discard(key)
+                return True
+            del self.assignments[key]
+            self.stats["failed"] += 1
+            tried.add(index)
+
+    async def unsubscribe(self, symbol: str, feed_type: str = "price"):
+        """구독 취소 (배정된 세션에서 해지)"""
+        key = KISWebSocketSession._subscription_key(symbol, feed_type)
+        self.orphans.discard(key)
+        index = self.assignments.pop(key, None)
+        sessions = [self.sessions[index]] if index is not None else self.sessions
+        for session in sessions:
+            if session.is_subscribed(symbol, feed_type):
+                await session.unsubscribe(symbol, feed_type)
+
+    async def subscribe_multiple_prices(self, symbols: List[str], callback: Callable = None) -> Dict[str, bool]:
+        """여러 종목 실시간 가격 구독 (세션별로 동시에 진행)"""
+        results = await asyncio.gather(*(self.subscribe_price(symbol, callback) for symbol in symbols))
+        return dict(zip(symbols, results))
+
+    # --- 연결 관리 ---
+    async def connect(self) -> bool:
+        """전체 세션 연결 (하나라도 성공하면 True)"""
+        results = await asyncio.gather(*(session.connect() for session in self.sessions), return_exceptions=True)
+        for index, result in enumerate(results):
+            if result is not True:
+                logger.log_warning(f"[웹소켓 풀] {self.sessions[index].name} 연결 실패: {result}")
+        return any(result is True for result in results)
+
+    def is_connected(self) -> bool:
+        return any(session.is_connected() for session in self.sessions)
+
+    async def close(self):
+        """전체 세션 종료"""
+        await asyncio.gather(*(session.close() for session in self.sessions), return_exceptions=True)
+
+    # --- 재배치 ---
+    async def _on_session_state(self, session: KISWebSocketSession, connected: bool):
+        """세션 연결 상태 변경 시 종목 재배치"""
+        if session not in self.sessions:
+            return
+        index = self.sessions.index(session)
+        async with self._rebalance_lock:
+            if connected:
+                await self._session_up(index)
+            elif self._active[index]:
+                await self._session_down(index)
+
+    async def _session_down(self, index: int):
+        """장애 세션의 종목을 남은 세션으로 이동"""
+        session = self.sessions[index]
+        self._active[index] = False
+        self._build_ring()
+        keys = [key for key, assigned in self.assignments.items() if assigned == index]
+        for key in keys:
+            del self.assignments[key]
+            session.subscriptions.pop(key, None)
+
+        moved = 0
+        for key in keys:
+            if await self._place(key):
+                moved += 1
+        self.stats["rebalances"] += 1
+        self.stats["moved"] += moved
+        logger.log_warning(f"[웹소켓 풀] {session.name} 장애 - {moved}/{len(keys)}건 이동")
+
+        # 종목이 다른 세션으로 옮겨졌으므로 이 세션 기준으로 보류 중인 상태 해제 (재연결 포기와 동일하게 알림)
+        down_since = session.disconnected_at or datetime.now()
+        for listener in list(self._disconnect_listeners):
+            try:
+                await listener(session, down_since, True)
+            except Exception as e:
+                logger.log_error(e, f"[웹소켓 풀] {session.name} 연결 끊김 리스너 오류")
+
+    async def _session_up(self, index: int):
+        """복구된 세션 기준으로 재배치 (기본 세션이 이 세션인 종목을 되돌리고 미배정 종목 배정)"""
+        session = self.sessions[index]
+        was_active = self._active[index]
+        self._active[index] = True
+        if not was_active:
+            self._build_ring()
+
+        # 재연결 후 재등록에 실패한 구독은 다시 배정
+        lost = [key for key, assigned in self.assignments.items()
+                if assigned == index and key not in self._pending and key not in session.subscriptions]
+        for key in lost:
+            del self.assignments[key]
+            await self._place(key)
+
+        moved = 0
+        if not was_active:
+            returning = [key for key, assigned in self.assignments.items()
+                         if assigned != index and self.home_of(_split_key(key)[0]) == index]
+            for key in returning:
+                if self._load(index) >= session.max_subscriptions:
+                    break
+                symbol, feed_type = _split_key(key)
+                previous = self.sessions[self.assignments[key]]
+                # 새 세션 구독이 성공한 뒤 이전 세션을 해지해 틱 공백을 줄임
+                self.assignments[key] = index
+                if await session._subscribe_feed(symbol, feed_type):
+                    await previous.unsubscribe(symbol, feed_type)
+                    moved += 1
+                else:
+                    self.assignments[key] = self.sessions.index(previous)
+
+        for key in list(self.orphans):
+            await self._place(key)
+
+        if moved or lost or not was_active:
+            self.stats["rebalances"] += 1
+            self.stats["moved"] += moved
+            logger.log_system(f"[웹소켓 풀] {session.name} 복구 - {moved}건 복귀, {len(lost)}건 재배정, "
+                              f"미배정 {len(self.orphans)}건")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """세션별 배정/구독 수와 재배치 통계"""
+        sessions = []
+        for index, session in enumerate(self.sessions):
+            sessions.append({
+                "name": session.name,
+                "active": self._active[index],
+                "connected": session.is_connected(),
+                "assigned": self._load(index),
+                "subscribed": len(session.subscriptions),
+                "max_subscriptions": session.max_subscriptions,
+                "dispatch_depth": session.dispatcher.depth(),
+            })
+        return {
+            "sessions": sessions,
+            "capacity": self.capacity,
+            "assigned": len(self.assignments),
+            "orphans": len(self.orphans),
+            **self.stats,
+        }
+
+
+# 싱글톤 인스턴스
+ws_pool = WebSocketPool()
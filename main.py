@@ -13,6 +13,10 @@ from datetime import datetime, timedelta, time as datetime_time
 from typing import Dict, List, Any, Optional, Tuple
 
 from core.api_client import api_client
+from core.token_manager import token_manager
+from core.api_metrics import api_metrics
+from core.cassette import cassette
+from core.daily_bars import daily_bar_store
 from core.order_manager import order_manager
 from core.account_state import account_state
 from core.websocket_client import websocket_client
@@ -46,7 +50,9 @@ from utils.dotenv_helper import dotenv_helper
 from config.settings import config
 from core.api_client import api_client
 from core.websocket_client import ws_client
+from core.ws_pool import ws_pool
 from core.order_manager import order_manager
+from core.order_tracker import order_tracker
 from core.stock_explorer import stock_explorer
 from strategies.combined_strategy import combined_strategy
 from utils.logger import logger
@@ -92,6 +98,12 @@ class TradingBot:
             # DB 초기화
             database_manager.update_system_status("INITIALIZING")
             
+            # API 트래픽 기록/재생 설정 (토큰/계좌 조회보다 먼저 적용)
+            self._setup_cassette()
+            
+            # 토큰 사전 갱신 태스크 시작 (요청 경로에서 토큰 발급 대기 방지)
+            await token_manager.start_background_refresh()
+            
             # 계좌 상태 관리자 초기화
             #logger.log_system("계좌 상태 관리자 초기화 중...")
             await account_state.initialize()
@@ -127,17 +139,19 @@ class TradingBot:
                     logger.log_system(f"웹소켓 연결 시도... ({retry_count}/{self.max_retries})")
                     
                     # 웹소켓 클라이언트 상태 초기화 확인
-                    if ws_client.ws is not None or ws_client.is_connected():
+                    if ws_client.ws is not None or ws_pool.is_connected():
                         logger.log_system("기존 웹소켓 연결 자원 정리...")
-                        await ws_client.close()
+                        await ws_pool.close()
                         await asyncio.sleep(2)  # 자원 정리를 위한 대기
                     
-                    # 접속 시도
-                    connection_success = await ws_client.connect()
-                    websocket_connected = ws_client.is_connected()
+                    # 접속 시도 (추가 접속키 세션 포함)
+                    connection_success = await ws_pool.connect()
+                    websocket_connected = ws_pool.is_connected()
                     
                     if websocket_connected:
                         logger.log_system("웹소켓 연결 성공!")
+                        # 계좌 체결 통보 구독 (지정가 주문 체결을 상태 조회 없이 통보로 확인)
+                        await order_tracker.start()
                         break
                     else:
                         logger.log_warning(f"웹소켓 연결 시도 실패 ({retry_count}/{self.max_retries})")
@@ -252,20 +266,15 @@ class TradingBot:
                     
                 logger.log_system(f"보유 종목 수: {len(position_items)}개")
                 
-                # 보유 종목 심볼 목록 생성 (빠른 조회용)
+                # 보유 종목 심볼 목록 생성 (빠른 조회용, 수량 > 0인 종목만 레코드로 변환됨)
                 held_symbols = {}
-                for position in position_items:
-                    symbol = position.get("pdno", "")
-                    qty = int(position.get("hldg_qty", "0"))
-                    
-                    # 수량이 0 초과인 종목만 저장
-                    if qty > 0 and symbol:
-                        held_symbols[symbol] = {
-                            "qty": qty,
-                            "avg_price": float(position.get("pchs_avg_pric", "0")),
-                            "profit_rate": float(position.get("evlu_pfls_rt", "0")),
-                            "pchs_amt": float(position.get("pchs_amt", "0"))
-                        }
+                for holding in positions.get("holdings", []):
+                    held_symbols[holding.symbol] = {
+                        "qty": holding.quantity,
+                        "avg_price": holding.avg_price,
+                        "profit_rate": holding.profit_rate,
+                        "pchs_amt": holding.purchase_amount
+                    }
                 
                 # 보유 종목이 실제로 있는지 다시 확인
                 if not held_symbols:
@@ -1085,17 +1094,20 @@ class TradingBot:
             logger.log_system(f"초기 종목 스캔 완료: {len(MONITORED_SYMBOLS)}개 종목 선정")
             #logger.log_system(f"상위 10개 종목: {', '.join(MONITORED_SYMBOLS[:10])}")
             
-            # 3. 통합 전략에 종목 업데이트 (30개만 사용)
+            # 3. 일봉 이력 저장소 갱신 (장 시작 전에만 REST 조회)
+            await daily_bar_store.prefill(MONITORED_SYMBOLS[:30])
+            
+            # 4. 통합 전략에 종목 업데이트 (30개만 사용)
             await combined_strategy.update_symbols(MONITORED_SYMBOLS[:30])
             
-            # 4. 전략 시작 (이미 시작된 경우 무시됨)
+            # 5. 전략 시작 (이미 시작된 경우 무시됨)
             if not combined_strategy.running:
                 await combined_strategy.start(MONITORED_SYMBOLS[:30])
                 logger.log_system("통합 전략 시작 완료")
             else:
                 logger.log_system("통합 전략이 이미 실행 중입니다")
             
-            # 5. 스캔 결과 로그
+            # 6. 스캔 결과 로그
             logger.log_trade(
                 action="INITIAL_SCAN_COMPLETE",
                 symbol="SYSTEM",
@@ -1354,6 +1366,9 @@ class TradingBot:
             logger.log_system(f"추가된 종목: {len(added_symbols)}개")
             logger.log_system(f"제거된 종목: {len(removed_symbols)}개")
             
+            # 일봉 이력 저장소 갱신 (장 시작 전 재스캔에서 하루 한 번 채워짐)
+            await daily_bar_store.prefill(MONITORED_SYMBOLS[:30])
+            
             # 통합 전략 업데이트 및 재시작 (30개만 사용)
             await combined_strategy.update_symbols(MONITORED_SYMBOLS[:30])
             await combined_strategy.start(MONITORED_SYMBOLS[:30])
@@ -1429,11 +1444,40 @@ class TradingBot:
             # 데이터베이스 백업 제거
             # database_manager.backup_database()
             
+            # 당일 API 지연 시간 계측 저장
+            self._dump_api_metrics()
+            
             logger.log_system("Market closed. Daily process completed")
             
         except Exception as e:
             logger.log_error(e, "Market close handling error")
     
+    def _setup_cassette(self):
+        """환경 변수에 따라 API 트래픽 기록 또는 재생 시작
+
+        - KIS_CASSETTE_RECORD: 기록 파일 경로 ("1"이면 로그 디렉토리에 자동 생성)
+        - KIS_CASSETTE_REPLAY: 재생할 기록 파일 경로
+        - KIS_CASSETTE_SPEED: 재생 배속 (기본 1, 0이면 최대 속도)
+        """
+        replay_path = os.getenv("KIS_CASSETTE_REPLAY")
+        record_path = os.getenv("KIS_CASSETTE_RECORD")
+        try:
+            if replay_path:
+                cassette.replay(replay_path, speed=float(os.getenv("KIS_CASSETTE_SPEED", "1")))
+            elif record_path:
+                cassette.record(None if record_path == "1" else record_path)
+        except Exception as e:
+            logger.log_error(e, "API 트래픽 기록/재생 설정 실패")
+    
+    def _dump_api_metrics(self):
+        """API 계측 요약 로그 및 JSON/Prometheus 파일 저장"""
+        try:
+            api_metrics.log_summary()
+            paths = api_metrics.dump()
+            logger.log_system(f"API 계측 저장 완료: {paths['json']}, {paths['prometheus']}")
+        except Exception as e:
+            logger.log_error(e, "API 계측 저장 실패")
+    
     async def shutdown(self, error: Optional[str] = None) -> None:
         """종료"""
         logger.log_system(f"Shutdown called. Error: {error}")
@@ -1442,7 +1486,13 @@ class TradingBot:
             logger.log_system("Stopping combined strategy...")
             await combined_strategy.stop()
             logger.log_system("Closing WebSocket connection...")
-            await ws_client.close()
+            await ws_pool.close()
+            logger.log_system("Closing HTTP sessions...")
+            await token_manager.stop_background_refresh()
+            await api_client.close()
+            daily_bar_store.close()
+            self._dump_api_metrics()
+            cassette.stop()
 
             shutdown_message = ""
             message_type = ""
@@ -16,6 +16,7 @@ from datetime import datetime, timedelta
 from config.settings import config
 from core.order_manager import order_manager
 from core.api_client import KISAPIClient
+from core.api_metrics import api_metrics
 from core.stock_explorer import stock_explorer
 from strategies.combined_strategy import combined_strategy
 from monitoring.alert_system import alert_system
@@ -87,6 +88,7 @@ class TelegramBotHandler:
             '/close_all': self.close_all_positions,
             '/price': self.get_price,
             '/trades': self.get_trades,
+            '/latency': self.get_latency,
             '/help': self.get_help,
         }
         self.message_lock = asyncio.Lock()  # 메시지 전송 동시성 제어를 위한 락
@@ -525,12 +527,15 @@ class TelegramBotHandler:
         
         await self._send_message(f"🔄 {len(positions)}개 종목의 포지션을 청산하는 중...")
         
+        # 현재가 일괄 조회
+        stock_infos = await stock_explorer.get_symbol_info_many([pos["symbol"] for pos in positions])
+        
         for pos in positions:
             symbol = pos["symbol"]
             quantity = pos["quantity"]
             
             # 현재가 조회
-            stock_info = await stock_explorer.get_symbol_info(symbol)
+            stock_info = stock_infos.get(symbol)
             price = stock_info.get("current_price", 0) if stock_info else 0
             
             result = await order_manager.place_order(
@@ -565,7 +570,7 @@ class TelegramBotHandler:
             return "사용법: /price 종목코드"
             
         symbol = args[0]
-        stock_info = await stock_explorer.get_symbol_info(symbol)
+        stock_info = await stock_explorer.get_symbol_info_async(symbol)
         
         if not stock_info:
             return f"❌ {symbol} 종목 정보를 찾을 수 없습니다."
@@ -586,6 +591,30 @@ class TelegramBotHandler:
 거래량: {int(volume):,}주
 """
 
+    async def get_latency(self, args: List[str]) -> str:
+        """API 엔드포인트별 응답 지연 시간 통계"""
+        metrics = api_metrics.get_metrics(include_components=False)
+        endpoints = [m for m in metrics["endpoints"] if m["latency"]["count"]]
+        if not endpoints:
+            return "📭 아직 기록된 API 호출이 없습니다."
+        endpoints.sort(key=lambda m: m["latency"].get("p95", 0.0), reverse=True)
+
+        totals = metrics["totals"]
+        lines = [
+            "<b>⏱ API 응답 지연 시간</b>",
+            f"호출 {totals['calls']:,}회 / 재시도 {totals['retries']:,}회 / 오류 {totals['errors']:,}회",
+            f"속도 제한 대기 합계: {totals['rate_limit_wait']:.1f}초",
+            "",
+        ]
+        for m in endpoints[:10]:
+            latency = m["latency"]
+            lines.append(
+                f"<code>{m['tr_id'] or m['path']}</code> {m['calls']:,}회 | "
+                f"p50 {latency.get('p50', 0) * 1000:.0f} / p95 {latency.get('p95', 0) * 1000:.0f} / "
+                f"p99 {latency.get('p99', 0) * 1000:.0f}ms"
+            )
+        return "\n".join(lines)
+
     async def get_trades(self, args: List[str]) -> str:
         """최근 거래 내역 조회"""
         # 파라미터 처리
@@ -814,6 +843,7 @@ class TelegramBotHandler:
 
 <b>기본 명령어:</b>
 /status - 시스템 상태 확인
+/latency - API 응답 지연 시간 통계
 /scan [KOSPI|KOSDAQ] - 거래 가능 종목 스캔
 
 <b>계좌 및 거래:</b>
@@ -1053,7 +1083,7 @@ class TelegramBotHandler:
         # 현재가 조회
         if price == 0:
             try:
-                stock_info = await stock_explorer.get_symbol_info(symbol)
+                stock_info = await stock_explorer.get_symbol_info_async(symbol)
                 if stock_info:
                     price = self.safe_float(stock_info.get("current_price", 0), 0)
             except Exception as e:
@@ -1107,7 +1137,7 @@ class TelegramBotHandler:
         # 현재가 조회
         if price == 0:
             try:
-                stock_info = await stock_explorer.get_symbol_info(symbol)
+                stock_info = await stock_explorer.get_symbol_info_async(symbol)
                 if stock_info:
                     price = self.safe_float(stock_info.get("current_price", 0), 0)
             except Exception as e:
@@ -1147,6 +1177,9 @@ class TelegramBotHandler:
         positions_text = ""
         total_value = 0
         
+        # 종목 정보 일괄 조회 (현재가/종목명)
+        stock_infos = await stock_explorer.get_symbol_info_many([pos.get("symbol", "") for pos in positions])
+        
         for pos in positions:
             symbol = pos.get("symbol", "N/A")
             quantity = self.safe_float(pos.get("quantity", 0), 0)
@@ -1156,7 +1189,7 @@ class TelegramBotHandler:
             # 현재가가 없으면 API에서 조회
             if current_price == 0:
                 try:
-                    stock_info = await stock_explorer.get_symbol_info(symbol)
+                    stock_info = stock_infos.get(symbol)
                     if stock_info:
                         current_price = self.safe_float(stock_info.get("current_price", 0), 0)
                 except Exception:
@@ -1177,7 +1210,7 @@ class TelegramBotHandler:
             # 종목명 가져오기
             stock_name = "N/A"
             try:
-                stock_info = await stock_explorer.get_symbol_info(symbol)
+                stock_info = stock_infos.get(symbol)
                 if stock_info:
                     stock_name = stock_info.get("name", "N/A")
             except Exception:
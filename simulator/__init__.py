@@ -0,0 +1,11 @@
+"""
+KIS REST/웹소켓 로컬 시뮬레이터
+
+실제 서버 없이 처리량, 꼬리 지연, 장 시작 과부하를 재현하기 위한 대체 서버.
+
+    python -m simulator --port 18080 --latency-ms 20 --error-rate 0.01
+"""
+from simulator.market import SyntheticMarket, H0STCNT0_FIELDS
+from simulator.server import KISSimulator, SimulatorConfig
+
+__all__ = ["SyntheticMarket", "H0STCNT0_FIELDS", "KISSimulator", "SimulatorConfig"]
@@ -0,0 +1,72 @@
+"""
+시뮬레이터 실행 진입점
+
+    python -m simulator --symbols 005930,000660 --latency-ms 20 --tail-probability 0.01
+    python -m simulator --bench --requests 2000 --concurrency 50
+"""
+import argparse
+import asyncio
+
+from simulator.server import KISSimulator, SimulatorConfig
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m simulator", description="KIS REST/웹소켓 로컬 시뮬레이터")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--symbols", default="", help="쉼표로 구분한 종목코드 (기본: 50개 임의 코드)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--volatility", type=float, default=0.02, help="일간 변동성")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--tail-probability", type=float, default=0.0)
+    parser.add_argument("--tail-latency-ms", type=float, default=1000.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 응답 비율")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="응답 없이 대기하는 요청 비율")
+    parser.add_argument("--rate-limit", type=int, default=20, help="계좌별 초당 요청 한도 (0: 무제한)")
+    parser.add_argument("--tick-interval", type=float, default=0.1)
+    parser.add_argument("--tick-activity", type=float, default=0.5)
+    parser.add_argument("--frame-format", choices=("kis", "json"), default="kis")
+    parser.add_argument("--ping-interval", type=float, default=60.0)
+    parser.add_argument("--bench", action="store_true", help="서버를 띄우고 현재가 조회 부하 테스트 실행")
+    parser.add_argument("--requests", type=int, default=1000, help="부하 테스트 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="부하 테스트 동시 요청 수")
+    return parser.parse_args()
+
+
+def build_config(args: argparse.Namespace) -> SimulatorConfig:
+    config = SimulatorConfig(
+        host=args.host, port=args.port, seed=args.seed, volatility=args.volatility,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        tail_probability=args.tail_probability, tail_latency_ms=args.tail_latency_ms,
+        error_rate=args.error_rate, timeout_rate=args.timeout_rate, rate_limit_per_sec=args.rate_limit,
+        tick_interval=args.tick_interval, tick_activity=args.tick_activity,
+        frame_format=args.frame_format, ping_interval=args.ping_interval,
+    )
+    if args.symbols:
+        config.symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+    return config
+
+
+async def serve(config: SimulatorConfig):
+    async with KISSimulator(config) as simulator:
+        print(f"REST: {simulator.base_url}  WS: {simulator.ws_url}  (Ctrl+C로 종료)")
+        while True:
+            await asyncio.sleep(3600)
+
+
+def main():
+    args = parse_args()
+    config = build_config(args)
+    try:
+        if args.bench:
+            from simulator.bench import run_bench
+            asyncio.run(run_bench(config, args.requests, args.concurrency))
+        else:
+            asyncio.run(serve(config))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+시뮬레이터 대상 REST 부하 테스트
+
+시뮬레이터를 별도 스레드(이벤트 루프)에서 실행하고 KISAPIClient로 현재가 조회를 동시에 보내
+처리량과 클라이언트 측 지연 시간 분포(api_metrics)를 출력한다.
+"""
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from simulator.server import KISSimulator, SimulatorConfig
+
+
+def _start_in_thread(simulator: KISSimulator) -> asyncio.AbstractEventLoop:
+    """시뮬레이터를 전용 이벤트 루프 스레드에서 시작 (클라이언트 지연 측정에 서버 부하가 섞이지 않도록)"""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(simulator.start())
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, name="kis-simulator", daemon=True).start()
+    started.wait(10)
+    return loop
+
+
+async def run_bench(config: SimulatorConfig, total_requests: int = 1000, concurrency: int = 50):
+    """현재가 조회 부하 테스트 실행"""
+    simulator = KISSimulator(config)
+    loop = _start_in_thread(simulator)
+
+    # 클라이언트 싱글톤이 시뮬레이터를 바라보도록 환경 변수 설정 (.env 값보다 우선)
+    os.environ["KIS_BASE_URL"] = simulator.base_url
+    os.environ.setdefault("KIS_APP_KEY", "SIMULATOR")
+    os.environ.setdefault("KIS_APP_SECRET", "SIMULATOR")
+    os.environ.setdefault("KIS_ACCOUNT_NO", "00000000-01")
+
+    # 실제 토큰 파일을 덮어쓰지 않도록 임시 경로 사용
+    import core.token_manager as token_module
+    token_module.TOKEN_FILE_PATH = os.path.join(tempfile.mkdtemp(prefix="kis_sim_"), "token_info.json")
+
+    from core.api_client import api_client
+    from core.api_metrics import api_metrics
+    from core.token_manager import token_manager
+
+    api_client.base_url = simulator.base_url
+    token_manager.configure(simulator.base_url, api_client.app_key, api_client.app_secret)
+    api_metrics.reset()
+
+    symbols = list(simulator.market.symbols)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one(index: int):
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            result = await api_client.get_current_price_async(symbols[index % len(symbols)], use_cache=False)
+            latencies.append(time.perf_counter() - started)
+            if result.get("rt_cd") != "0":
+                failures += 1
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(i) for i in range(total_requests)))
+    finally:
+        elapsed = time.perf_counter() - started
+        await api_client.close()
+        asyncio.run_coroutine_threadsafe(simulator.stop(), loop).result(10)
+        loop.call_soon_threadsafe(loop.stop)
+
+    values = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, (50, 95, 99)) if len(values) else (0.0, 0.0, 0.0)
+    print(f"요청 {total_requests}건 / 동시 {concurrency} / 소요 {elapsed:.2f}초 / 처리량 {total_requests / elapsed:.1f}건/초")
+    print(f"호출 지연(재시도 포함) p50 {p50:.1f}ms / p95 {p95:.1f}ms / p99 {p99:.1f}ms / 실패 {failures}건")
+    print(f"서버 통계: {simulator.get_stats()}")
+    api_metrics.log_summary()
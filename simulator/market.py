@@ -0,0 +1,469 @@
+"""
+시뮬레이터용 합성 시장 (종목별 가격 경로, 분봉/일봉 이력, 계좌/주문 상태)
+"""
+import math
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+from core.realtime_frames import H0STCNT0_FIELDS
+
+# 장 운영 시간 (HHMM)
+SESSION_OPEN = "0900"
+SESSION_CLOSE = "1530"
+
+
+def tick_size(price: float) -> int:
+    """KRX 호가 단위"""
+    if price < 2000:
+        return 1
+    if price < 5000:
+        return 5
+    if price < 20000:
+        return 10
+    if price < 50000:
+        return 50
+    if price < 200000:
+        return 100
+    if price < 500000:
+        return 500
+    return 1000
+
+
+def round_to_tick(price: float) -> int:
+    unit = tick_size(price)
+    return max(unit, int(round(price / unit)) * unit)
+
+
+def _sign(change: float) -> str:
+    """전일대비 부호 (2: 상승, 3: 보합, 5: 하락)"""
+    return "2" if change > 0 else "5" if change < 0 else "3"
+
+
+class SymbolState:
+    """종목별 당일 시세와 분봉"""
+
+    def __init__(self, symbol: str, name: str, prev_close: int):
+        self.symbol = symbol
+        self.name = name
+        self.prev_close = prev_close
+        self.price = prev_close
+        self.open = 0
+        self.high = 0
+        self.low = 0
+        self.volume = 0
+        self.turnover = 0
+        self.last_tick: Dict[str, str] = {}
+        # {HHMM: [open, high, low, close, volume]}
+        self.minute_bars: Dict[str, List[int]] = {}
+        # [(YYYYMMDD, open, high, low, close, volume)] 과거 -> 최근
+        self.daily_bars: List[Tuple[str, int, int, int, int, int]] = []
+
+    def apply_trade(self, price: int, quantity: int, now: datetime):
+        """체결 반영 (당일 시고저/누적 거래량/분봉 갱신)"""
+        if not self.open:
+            self.open = self.high = self.low = price
+        self.price = price
+        self.high = max(self.high, price)
+        self.low = min(self.low, price)
+        self.volume += quantity
+        self.turnover += price * quantity
+
+        minute = now.strftime("%H%M")
+        bar = self.minute_bars.get(minute)
+        if bar is None:
+            self.minute_bars[minute] = [price, price, price, price, quantity]
+        else:
+            bar[1] = max(bar[1], price)
+            bar[2] = min(bar[2], price)
+            bar[3] = price
+            bar[4] += quantity
+
+    @property
+    def change(self) -> int:
+        return self.price - self.prev_close
+
+    @property
+    def change_rate(self) -> float:
+        return self.change / self.prev_close * 100 if self.prev_close else 0.0
+
+
+class SyntheticMarket:
+    """합성 가격 경로 생성기 + 모의 계좌
+
+    - 종목별로 기하 브라운 운동(GBM) 틱을 생성하고 호가 단위로 반올림
+    - 시작 시 장 시작부터 현재 분까지의 분봉과 과거 일봉을 같은 시드로 생성 (재현 가능)
+    - 주문은 시장가/체결 가능한 지정가는 즉시 체결, 나머지는 미체결로 보관
+    """
+
+    def __init__(self, symbols: List[str], seed: int = 42, volatility: float = 0.02,
+                 cash: int = 10_000_000, history_days: int = 150, now: datetime = None):
+        """
+        Args:
+            symbols: 종목코드 목록
+            seed: 난수 시드
+            volatility: 일간 변동성 (틱/분봉 변동폭 기준)
+            cash: 모의 계좌 예수금
+            history_days: 생성할 과거 일봉 수 (영업일)
+            now: 기준 시각 (기본값 현재 시각)
+        """
+        self.random = random.Random(seed)
+        self.volatility = volatility
+        self.symbols: Dict[str, SymbolState] = {}
+        self._market_lock = threading.Lock()
+
+        self.cash = cash
+        self.holdings: Dict[str, Dict[str, float]] = {}   # {symbol: {"qty", "avg_price"}}
+        self.orders: Dict[str, Dict[str, Any]] = {}        # {주문번호: 주문}
+        self._next_order_no = 1
+
+        now = now or datetime.now()
+        for index, symbol in enumerate(symbols):
+            prev_close = round_to_tick(self.random.uniform(3000, 150000))
+            state = SymbolState(symbol, f"시뮬종목{index + 1:03d}", prev_close)
+            self._build_daily_history(state, now, history_days)
+            self._build_session_bars(state, now)
+            self.symbols[symbol] = state
+
+    # --- 가격 경로 ---
+    def _build_daily_history(self, state: SymbolState, now: datetime, days: int):
+        """전일 종가로 끝나는 과거 일봉 생성 (역방향 랜덤워크)"""
+        dates = []
+        day = now.date()
+        while len(dates) < days:
+            day -= timedelta(days=1)
+            if day.weekday() < 5:
+                dates.append(day.strftime("%Y%m%d"))
+        dates.reverse()
+
+        close = float(state.prev_close)
+        closes = [close]
+        for _ in range(days - 1):
+            close /= math.exp(self.random.gauss(0, self.volatility))
+            closes.append(close)
+        closes.reverse()
+
+        for date, close in zip(dates, closes):
+            spread = abs(self.random.gauss(0, self.volatility)) * close
+            open_price = round_to_tick(close * math.exp(self.random.gauss(0, self.volatility / 2)))
+            close_price = round_to_tick(close)
+            high = round_to_tick(max(open_price, close_price) + spread / 2)
+            low = round_to_tick(max(1, min(open_price, close_price) - spread / 2))
+            volume = int(self.random.lognormvariate(12, 0.6))
+            state.daily_bars.append((date, open_price, high, low, close_price, volume))
+        # 마지막 일봉 종가를 전일 종가로 맞춤
+        date, o, h, l, _, v = state.daily_bars[-1]
+        state.daily_bars[-1] = (date, o, max(h, state.prev_close), min(l, state.prev_close), state.prev_close, v)
+
+    def _build_session_bars(self, state: SymbolState, now: datetime):
+        """장 시작부터 현재 분 직전까지 분봉 생성"""
+        start = now.replace(hour=9, minute=0, second=0, microsecond=0)
+        end = min(now.replace(second=0, microsecond=0), now.replace(hour=15, minute=30, second=0, microsecond=0))
+        minute_sigma = self.volatility / math.sqrt(390)
+        t = start
+        while t < end:
+            for _ in range(4):
+                price = round_to_tick(state.price * math.exp(self.random.gauss(0, minute_sigma / 2)))
+                state.apply_trade(price, int(self.random.lognormvariate(5, 1)), t)
+            t += timedelta(minutes=1)
+
+    def step(self, now: datetime = None, tick_seconds: float = 0.1, activity: float = 0.5) -> List[Dict[str, str]]:
+        """한 틱 진행 (체결이 발생한 종목의 H0STCNT0 필드 목록 반환)
+
+        Args:
+            now: 체결 시각
+            tick_seconds: 틱 간격 (초, 가격 변동폭 스케일)
+            activity: 틱마다 종목별 체결이 발생할 확률
+        """
+        now = now or datetime.now()
+        sigma = self.volatility * math.sqrt(tick_seconds / (390 * 60))
+        ticks = []
+        with self._market_lock:
+            for state in self.symbols.values():
+                if self.random.random() > activity:
+                    continue
+                price = round_to_tick(state.price * math.exp(self.random.gauss(0, sigma)))
+                quantity = int(self.random.lognormvariate(3, 1)) + 1
+                state.apply_trade(price, quantity, now)
+                state.last_tick = self._tick_fields(state, quantity, now)
+                ticks.append(state.last_tick)
+                self._match_open_orders(state)
+        return ticks
+
+    @staticmethod
+    def _tick_fields(state: SymbolState, quantity: int, now: datetime) -> Dict[str, str]:
+        """H0STCNT0 필드 딕셔너리 생성"""
+        unit = tick_size(state.price)
+        fields = dict.fromkeys(H0STCNT0_FIELDS, "0")
+        fields.update({
+            "mksc_shrn_iscd": state.symbol,
+            "stck_cntg_hour": now.strftime("%H%M%S"),
+            "stck_prpr": str(state.price),
+            "prdy_vrss_sign": _sign(state.change),
+            "prdy_vrss": str(state.change),
+            "prdy_ctrt": f"{state.change_rate:.2f}",
+            "wghn_avrg_stck_prc": f"{state.turnover / state.volume:.2f}" if state.volume else "0",
+            "stck_oprc": str(state.open),
+            "stck_hgpr": str(state.high),
+            "stck_lwpr": str(state.low),
+            "askp1": str(state.price + unit),
+            "bidp1": str(state.price),
+            "cntg_vol": str(quantity),
+            "acml_vol": str(state.volume),
+            "acml_tr_pbmn": str(state.turnover),
+            "ccld_dvsn": "1",
+            "bsop_date": now.strftime("%Y%m%d"),
+            "new_mkop_cls_code": "20",
+            "trht_yn": "N",
+            "hour_cls_code": "0",
+            "mrkt_trtm_cls_code": "N",
+        })
+        return fields
+
+    def get(self, symbol: str) -> Optional[SymbolState]:
+        return self.symbols.get(symbol)
+
+    # --- REST 응답 본문 ---
+    def price_output(self, symbol: str) -> Optional[Dict[str, str]]:
+        """inquire-price output"""
+        state = self.symbols.get(symbol)
+        if state is None:
+            return None
+        with self._market_lock:
+            return {
+                "stck_prpr": str(state.price),
+                "stck_oprc": str(state.open or state.price),
+                "stck_hgpr": str(state.high or state.price),
+                "stck_lwpr": str(state.low or state.price),
+                "stck_sdpr": str(state.prev_close),
+                "prdy_vrss": str(state.change),
+                "prdy_vrss_sign": _sign(state.change),
+                "prdy_ctrt": f"{state.change_rate:.2f}",
+                "acml_vol": str(state.volume),
+                "acml_tr_pbmn": str(state.turnover),
+                "rprs_mrkt_kor_name": state.name,
+                "temp_stop_yn": "N",
+            }
+
+    def minute_chart(self, symbol: str, before: str, count: int = 30) -> List[Dict[str, str]]:
+        """inquire-time-itemchartprice output2 (before(HHMMSS) 이전 count개, 최신순)"""
+        state = self.symbols.get(symbol)
+        if state is None:
+            return []
+        date = datetime.now().strftime("%Y%m%d")
+        limit = before[:4]
+        with self._market_lock:
+            minutes = sorted((m for m in state.minute_bars if m <= limit), reverse=True)[:count]
+            return [
+                {
+                    "stck_bsop_date": date,
+                    "stck_cntg_hour": f"{minute}00",
+                    "stck_prpr": str(bar[3]),
+                    "stck_oprc": str(bar[0]),
+                    "stck_hgpr": str(bar[1]),
+                    "stck_lwpr": str(bar[2]),
+                    "cntg_vol": str(bar[4]),
+                    "acml_tr_pbmn": str(bar[3] * bar[4]),
+                }
+                for minute, bar in ((m, state.minute_bars[m]) for m in minutes)
+            ]
+
+    def daily_chart(self, symbol: str, start_date: str = "", end_date: str = "",
+                    count: int = 100) -> List[Dict[str, str]]:
+        """inquire-daily-itemchartprice output2 (기간 내 최대 count개, 최신순, 당일 포함)"""
+        state = self.symbols.get(symbol)
+        if state is None:
+            return []
+        today = datetime.now().strftime("%Y%m%d")
+        with self._market_lock:
+            bars = list(state.daily_bars)
+            if state.open:
+                bars.append((today, state.open, state.high, state.low, state.price, state.volume))
+        rows = [
+            bar for bar in bars
+            if (not start_date or bar[0] >= start_date) and (not end_date or bar[0] <= end_date)
+        ]
+        rows = rows[-count:]
+        return [
+            {
+                "stck_bsop_date": date,
+                "stck_oprc": str(o),
+                "stck_hgpr": str(h),
+                "stck_lwpr": str(l),
+                "stck_clpr": str(c),
+                "acml_vol": str(v),
+            }
+            for date, o, h, l, c, v in reversed(rows)
+        ]
+
+    def volume_rank(self, count: int = 30) -> List[Dict[str, str]]:
+        """volume-rank output (누적 거래량 내림차순)"""
+        with self._market_lock:
+            ranked = sorted(self.symbols.values(), key=lambda s: s.volume, reverse=True)[:count]
+            return [
+                {
+                    "hts_kor_isnm": state.name,
+                    "mksc_shrn_iscd": state.symbol,
+                    "data_rank": str(rank),
+                    "stck_prpr": str(state.price),
+                    "prdy_vrss_sign": _sign(state.change),
+                    "prdy_vrss": str(state.change),
+                    "prdy_ctrt": f"{state.change_rate:.2f}",
+                    "acml_vol": str(state.volume),
+                    "acml_tr_pbmn": str(state.turnover),
+                }
+                for rank, state in enumerate(ranked, start=1)
+            ]
+
+    def stock_info_output(self, symbol: str) -> Optional[Dict[str, str]]:
+        """search-stock-info output"""
+        state = self.symbols.get(symbol)
+        if state is None:
+            return None
+        return {"pdno": symbol, "prdt_name": state.name, "hts_kor_isnm": state.name, "lmtd_ord_yn": "N"}
+
+    def orderbook_output(self, symbol: str, levels: int = 10) -> Optional[Dict[str, str]]:
+        """inquire-asking-price-exp-ccn output1 (현재가 기준 매도/매수 호가)"""
+        state = self.symbols.get(symbol)
+        if state is None:
+            return None
+        with self._market_lock:
+            price = state.price
+        unit = tick_size(price)
+        output = {"stck_prpr": str(price)}
+        total_ask = total_bid = 0
+        for level in range(1, levels + 1):
+            ask_qty = int(self.random.lognormvariate(6, 0.8))
+            bid_qty = int(self.random.lognormvariate(6, 0.8))
+            output[f"askp{level}"] = str(price + unit * level)
+            output[f"bidp{level}"] = str(price - unit * (level - 1))
+            output[f"askp_rsqn{level}"] = str(ask_qty)
+            output[f"bidp_rsqn{level}"] = str(bid_qty)
+            total_ask += ask_qty
+            total_bid += bid_qty
+        output["total_askp_rsqn"] = str(total_ask)
+        output["total_bidp_rsqn"] = str(total_bid)
+        return output
+
+    # --- 계좌/주문 ---
+    def balance(self) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
+        """inquire-balance (output1, output2 항목)"""
+        with self._market_lock:
+            items = []
+            securities = 0
+            purchase = 0
+            for symbol, holding in self.holdings.items():
+                state = self.symbols[symbol]
+                qty = int(holding["qty"])
+                avg = holding["avg_price"]
+                evaluation = state.price * qty
+                cost = avg * qty
+                securities += evaluation
+                purchase += cost
+                items.append({
+                    "pdno": symbol,
+                    "prdt_name": state.name,
+                    "hldg_qty": str(qty),
+                    "ord_psbl_qty": str(qty),
+                    "pchs_avg_pric": f"{avg:.4f}",
+                    "pchs_amt": str(int(cost)),
+                    "prpr": str(state.price),
+                    "evlu_amt": str(evaluation),
+                    "evlu_pfls_amt": str(int(evaluation - cost)),
+                    "evlu_pfls_rt": f"{(evaluation - cost) / cost * 100 if cost else 0:.2f}",
+                })
+            summary = {
+                "dnca_tot_amt": str(int(self.cash)),
+                "scts_evlu_amt": str(int(securities)),
+                "tot_evlu_amt": str(int(self.cash + securities)),
+                "nass_amt": str(int(self.cash + securities)),
+                "pchs_amt_smtl_amt": str(int(purchase)),
+            }
+        return items, summary
+
+    def place_order(self, symbol: str, side: str, quantity: int, price: int, market: bool) -> Tuple[bool, str, Dict[str, Any]]:
+        """주문 접수 (성공 여부, 메시지, 주문 정보)"""
+        state = self.symbols.get(symbol)
+        if state is None:
+            return False, "존재하지 않는 종목입니다", {}
+        if quantity <= 0:
+            return False, "주문수량을 확인하세요", {}
+
+        with self._market_lock:
+            order_no = f"{self._next_order_no:010d}"
+            self._next_order_no += 1
+            order = {
+                "order_no": order_no, "symbol": symbol, "side": side, "quantity": quantity,
+                "price": price, "market": market, "filled": 0, "status": "open",
+                "ordered_at": datetime.now().strftime("%H%M%S"),
+            }
+            if side == "SELL" and self.holdings.get(symbol, {}).get("qty", 0) < quantity:
+                return False, "주문가능수량을 초과하였습니다", {}
+            if side == "BUY" and (price if not market else state.price) * quantity > self.cash:
+                return False, "주문가능금액을 초과하였습니다", {}
+            self.orders[order_no] = order
+            self._try_fill(state, order)
+        return True, "주문 전송 완료 되었습니다.", order
+
+    def cancel_order(self, order_no: str) -> Tuple[bool, str]:
+        with self._market_lock:
+            order = self.orders.get(order_no)
+            if order is None or order["status"] != "open":
+                return False, "취소 가능한 주문이 없습니다"
+            order["status"] = "cancelled"
+        return True, "주문 취소 완료 되었습니다."
+
+    def _try_fill(self, state: SymbolState, order: Dict[str, Any]):
+        """체결 가능하면 체결 (_market_lock 보유 상태에서 호출)"""
+        if order["status"] != "open":
+            return
+        price = state.price
+        if not order["market"]:
+            if order["side"] == "BUY" and order["price"] < price:
+                return
+            if order["side"] == "SELL" and order["price"] > price:
+                return
+        quantity = order["quantity"]
+        holding = self.holdings.setdefault(order["symbol"], {"qty": 0, "avg_price": 0.0})
+        if order["side"] == "BUY":
+            total = holding["qty"] + quantity
+            holding["avg_price"] = (holding["avg_price"] * holding["qty"] + price * quantity) / total
+            holding["qty"] = total
+            self.cash -= price * quantity
+        else:
+            holding["qty"] -= quantity
+            self.cash += price * quantity
+            if holding["qty"] <= 0:
+                del self.holdings[order["symbol"]]
+        order.update(filled=quantity, fill_price=price, status="filled",
+                     filled_at=datetime.now().strftime("%H%M%S"))
+
+    def _match_open_orders(self, state: SymbolState):
+        """새 체결가로 미체결 지정가 주문 체결 시도 (_market_lock 보유 상태에서 호출)"""
+        for order in self.orders.values():
+            if order["status"] == "open" and order["symbol"] == state.symbol:
+                self._try_fill(state, order)
+
+    def order_history(self) -> List[Dict[str, str]]:
+        """inquire-daily-ccld output1 (최신순)"""
+        today = datetime.now().strftime("%Y%m%d")
+        with self._market_lock:
+            orders = list(self.orders.values())
+        return [
+            {
+                "ord_dt": today,
+                "odno": order["order_no"],
+                "pdno": order["symbol"],
+                "prdt_name": self.symbols[order["symbol"]].name,
+                "sll_buy_dvsn_cd": "01" if order["side"] == "SELL" else "02",
+                "ord_qty": str(order["quantity"]),
+                "ord_unpr": str(order["price"]),
+                "ord_tmd": order["ordered_at"],
+                "tot_ccld_qty": str(order["filled"]),
+                "avg_prvs": str(order.get("fill_price", 0)),
+                "cncl_yn": "Y" if order["status"] == "cancelled" else "N",
+                "rmn_qty": str(order["quantity"] - order["filled"] if order["status"] == "open" else 0),
+            }
+            for order in reversed(orders)
+        ]
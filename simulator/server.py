@@ -0,0 +1,420 @@
+"""
+KIS REST/웹소켓 로컬 시뮬레이터 서버 (aiohttp)
+
+실제 증권사 서버 대신 KISAPIClient / KISWebSocketClient / OrderManager를 연결하여
+처리량과 지연 시간 분포를 측정하고 장 시작 과부하 상황을 재현한다.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from aiohttp import web, WSMsgType
+
+from core.realtime_frames import H0STASP0_FIELDS
+from simulator.market import SyntheticMarket, H0STCNT0_FIELDS
+from utils.logger import logger
+
+# 초당 거래건수 초과 응답 (KIS EGW00201)
+RATE_LIMIT_BODY = {"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."}
+
+# 구독 가능한 실시간 TR (체결가, 호가)
+WS_TR_IDS = ("H0STCNT0", "H0STASP0")
+
+QUOTATIONS = "/uapi/domestic-stock/v1/quotations"
+TRADING = "/uapi/domestic-stock/v1/trading"
+
+
+@dataclass
+class SimulatorConfig:
+    """시뮬레이터 설정"""
+    host: str = "127.0.0.1"
+    port: int = 18080
+    symbols: List[str] = field(default_factory=lambda: [f"{i:06d}" for i in range(5930, 5930 + 50)])
+    seed: int = 42
+    volatility: float = 0.02            # 일간 변동성
+
+    # 지연 시간 주입 (REST 응답마다)
+    latency_ms: float = 5.0             # 기본 지연
+    jitter_ms: float = 5.0              # 균등 분포 추가 지연 상한
+    tail_probability: float = 0.0       # 꼬리 지연 발생 확률
+    tail_latency_ms: float = 1000.0     # 꼬리 지연
+
+    # 오류 주입
+    error_rate: float = 0.0             # HTTP 500 (서버 오류) 응답 비율
+    timeout_rate: float = 0.0           # 응답하지 않고 hang_seconds 동안 대기하는 비율
+    hang_seconds: float = 60.0
+
+    # 계좌별 초당 요청 한도 (0이면 무제한, 초과 시 EGW00201)
+    rate_limit_per_sec: int = 20
+
+    # 웹소켓
+    tick_interval: float = 0.1          # 틱 생성 간격 (초)
+    tick_activity: float = 0.5          # 틱마다 종목별 체결 발생 확률
+    frame_format: str = "kis"           # "kis": 0|H0STCNT0|001|... 파이프 형식, "json": JSON 본문
+    ping_interval: float = 60.0         # 서버 PINGPONG 전송 간격 (초)
+
+
+class KISSimulator:
+    """KIS REST/웹소켓 시뮬레이터
+
+    - REST: 토큰/접속키/해시키, 현재가, 분봉, 일봉, 거래량 순위, 종목정보, 호가, 잔고, 주문, 취소, 주문내역
+    - 웹소켓: H0STCNT0/H0STASP0 구독/해지, 체결/호가 프레임 전송, PINGPONG
+    - 응답마다 설정한 지연/오류/속도 제한을 주입하고 경로별 처리 통계를 기록
+    """
+
+    def __init__(self, config: SimulatorConfig = None, market: SyntheticMarket = None):
+        self.config = config or SimulatorConfig()
+        self.market = market or SyntheticMarket(self.config.symbols, seed=self.config.seed,
+                                                volatility=self.config.volatility)
+        self._random = random.Random(self.config.seed)
+        self._runner: Optional[web.AppRunner] = None
+        self._tasks: List[asyncio.Task] = []
+        self._clients: Dict[web.WebSocketResponse, Set[Tuple[str, str]]] = {}   # {연결: {(TR ID, 종목코드)}}
+        # {appkey: 최근 1초 요청 시각}
+        self._request_times: Dict[str, deque] = {}
+
+        self.stats = {
+            "requests": {},             # {path: 수}
+            "rate_limited": 0,
+            "injected_errors": 0,
+            "injected_hangs": 0,
+            "ws_clients": 0,
+            "ws_frames": 0,
+            "ws_ticks": 0,
+        }
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.config.host}:{self.config.port}"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://{self.config.host}:{self.config.port}"
+
+    # --- 서버 수명 ---
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._inject_middleware])
+        app.router.add_get("/", self._handle_websocket)
+        app.router.add_get("/tryitout/H0STCNT0", self._handle_websocket)
+        app.router.add_post("/oauth2/tokenP", self._handle_token)
+        app.router.add_post("/oauth2/Approval", self._handle_approval)
+        app.router.add_post("/uapi/hashkey", self._handle_hashkey)
+        app.router.add_get(f"{QUOTATIONS}/inquire-price", self._handle_price)
+        app.router.add_get(f"{QUOTATIONS}/inquire-time-itemchartprice", self._handle_minute_chart)
+        app.router.add_get(f"{QUOTATIONS}/inquire-daily-itemchartprice", self._handle_daily_chart)
+        app.router.add_get(f"{QUOTATIONS}/volume-rank", self._handle_volume_rank)
+        app.router.add_get(f"{QUOTATIONS}/search-stock-info", self._handle_stock_info)
+        app.router.add_get(f"{QUOTATIONS}/inquire-asking-price-exp-ccn", self._handle_orderbook)
+        app.router.add_get(f"{TRADING}/inquire-balance", self._handle_balance)
+        app.router.add_get(f"{TRADING}/inquire-daily-ccld", self._handle_order_history)
+        app.router.add_post(f"{TRADING}/order-cash", self._handle_order)
+        app.router.add_post(f"{TRADING}/order-rvsecncl", self._handle_cancel)
+        app.router.add_get("/stats", self._handle_stats)
+        return app
+
+    async def start(self):
+        """서버 및 틱 생성 태스크 시작"""
+        self._runner = web.AppRunner(self.build_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.config.host, self.config.port).start()
+        self._tasks = [asyncio.create_task(self._tick_loop()), asyncio.create_task(self._ping_loop())]
+        logger.log_system(
+            f"[시뮬레이터] 시작: {self.base_url} (종목 {len(self.market.symbols)}개, "
+            f"지연 {self.config.latency_ms}+{self.config.jitter_ms}ms, 오류율 {self.config.error_rate:.1%}, "
+            f"초당 한도 {self.config.rate_limit_per_sec or '무제한'})"
+        )
+
+    async def stop(self):
+        """서버 종료"""
+        for task in self._tasks:
+            task.cancel()
+        for ws in list(self._clients):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        logger.log_system("[시뮬레이터] 종료")
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    # --- 지연/오류/속도 제한 주입 ---
+    def _over_rate_limit(self, appkey: str) -> bool:
+        limit = self.config.rate_limit_per_sec
+        if not limit:
+            return False
+        now = time.monotonic()
+        times = self._request_times.setdefault(appkey, deque())
+        while times and now - times[0] >= 1.0:
+            times.popleft()
+        if len(times) >= limit:
+            return True
+        times.append(now)
+        return False
+
+    @web.middleware
+    async def _inject_middleware(self, request: web.Request, handler):
+        path = request.path
+        requests = self.stats["requests"]
+        requests[path] = requests.get(path, 0) + 1
+        if not path.startswith("/uapi/"):
+            return await handler(request)
+
+        cfg = self.config
+        delay = cfg.latency_ms + self._random.uniform(0, cfg.jitter_ms)
+        if cfg.tail_probability and self._random.random() < cfg.tail_probability:
+            delay += cfg.tail_latency_ms
+        await asyncio.sleep(delay / 1000)
+
+        if self._over_rate_limit(request.headers.get("appkey", "")):
+            self.stats["rate_limited"] += 1
+            return web.json_response(RATE_LIMIT_BODY, status=500)
+        if cfg.timeout_rate and self._random.random() < cfg.timeout_rate:
+            self.stats["injected_hangs"] += 1
+            await asyncio.sleep(cfg.hang_seconds)
+        if cfg.error_rate and self._random.random() < cfg.error_rate:
+            self.stats["injected_errors"] += 1
+            return web.Response(status=500, text="Internal Server Error")
+        if not request.headers.get("authorization", "").startswith("Bearer ") and path != "/uapi/hashkey":
+            return web.json_response({"rt_cd": "1", "msg_cd": "EGW00123", "msg1": "기간이 만료된 token 입니다."},
+                                     status=500)
+        return await handler(request)
+
+    # --- 인증 ---
+    async def _handle_token(self, request: web.Request) -> web.Response:
+        expires = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+        return web.json_response({
+            "access_token": f"SIM{uuid.uuid4().hex}",
+            "token_type": "Bearer",
+            "expires_in": 86400,
+            "access_token_token_expired": expires,
+        })
+
+    async def _handle_approval(self, request: web.Request) -> web.Response:
+        return web.json_response({"approval_key": str(uuid.uuid4())})
+
+    async def _handle_hashkey(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        return web.json_response({"HASH": hashlib.sha256(body).hexdigest()})
+
+    # --- 시세 ---
+    @staticmethod
+    def _ok(**payload) -> web.Response:
+        return web.json_response({"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다.", **payload})
+
+    @staticmethod
+    def _fail(message: str, msg_cd: str = "APBK0001") -> web.Response:
+        return web.json_response({"rt_cd": "1", "msg_cd": msg_cd, "msg1": message})
+
+    async def _handle_price(self, request: web.Request) -> web.Response:
+        output = self.market.price_output(request.query.get("FID_INPUT_ISCD", ""))
+        if output is None:
+            return self._fail("조회할 자료가 없습니다.")
+        return self._ok(output=output)
+
+    async def _handle_minute_chart(self, request: web.Request) -> web.Response:
+        symbol = request.query.get("FID_INPUT_ISCD", "")
+        before = request.query.get("FID_INPUT_HOUR_1") or datetime.now().strftime("%H%M%S")
+        price = self.market.price_output(symbol)
+        if price is None:
+            return self._fail("조회할 자료가 없습니다.")
+        return self._ok(output1=price, output2=self.market.minute_chart(symbol, before))
+
+    async def _handle_daily_chart(self, request: web.Request) -> web.Response:
+        symbol = request.query.get("FID_INPUT_ISCD", "")
+        try:
+            count = min(100, int(request.query.get("FID_DAY_1") or 100))
+        except ValueError:
+            count = 100
+        rows = self.market.daily_chart(symbol, request.query.get("FID_INPUT_DATE_1", ""),
+                                       request.query.get("FID_INPUT_DATE_2", ""), count)
+        return self._ok(output1=self.market.price_output(symbol) or {}, output2=rows)
+
+    async def _handle_volume_rank(self, request: web.Request) -> web.Response:
+        return self._ok(output=self.market.volume_rank())
+
+    async def _handle_stock_info(self, request: web.Request) -> web.Response:
+        output = self.market.stock_info_output(request.query.get("PDNO", ""))
+        if output is None:
+            return self._fail("조회할 자료가 없습니다.")
+        return self._ok(output=output)
+
+    async def _handle_orderbook(self, request: web.Request) -> web.Response:
+        output = self.market.orderbook_output(request.query.get("FID_INPUT_ISCD", ""))
+        if output is None:
+            return self._fail("조회할 자료가 없습니다.")
+        return self._ok(output1=output, output2={})
+
+    # --- 계좌/주문 ---
+    async def _handle_balance(self, request: web.Request) -> web.Response:
+        items, summary = self.market.balance()
+        return self._ok(output1=items, output2=[summary], ctx_area_fk100="", ctx_area_nk100="")
+
+    async def _handle_order_history(self, request: web.Request) -> web.Response:
+        return self._ok(output1=self.market.order_history(), output2={}, ctx_area_fk100="", ctx_area_nk100="")
+
+    async def _handle_order(self, request: web.Request) -> web.Response:
+        try:
+            data = await request.json()
+        except json.JSONDecodeError:
+            return self._fail("요청 형식이 올바르지 않습니다.", "OPSQ2001")
+        side = "BUY" if request.headers.get("tr_id", "") in ("TTTC0012U", "VTTC0012U", "TTTC0802U", "VTTC0802U") else "SELL"
+        market = data.get("ORD_DVSN") == "01"
+        try:
+            quantity = int(data.get("ORD_QTY") or 0)
+            price = int(float(data.get("ORD_UNPR") or 0))
+        except ValueError:
+            return self._fail("주문수량/단가를 확인하세요.", "APBK0919")
+        ok, message, order = self.market.place_order(data.get("PDNO", ""), side, quantity, price, market)
+        if not ok:
+            return self._fail(message, "APBK0986")
+        return self._ok(output={
+            "KRX_FWDG_ORD_ORGNO": "91252",
+            "ODNO": order["order_no"],
+            "ORD_TMD": order["ordered_at"],
+        })
+
+    async def _handle_cancel(self, request: web.Request) -> web.Response:
+        try:
+            data = await request.json()
+        except json.JSONDecodeError:
+            return self._fail("요청 형식이 올바르지 않습니다.", "OPSQ2001")
+        ok, message = self.market.cancel_order(data.get("ORGN_ODNO", ""))
+        if not ok:
+            return self._fail(message, "APBK0344")
+        return self._ok(output={"KRX_FWDG_ORD_ORGNO": "91252", "ODNO": data.get("ORGN_ODNO", ""),
+                                "ORD_TMD": datetime.now().strftime("%H%M%S")})
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.get_stats())
+
+    # --- 웹소켓 ---
+    async def _handle_websocket(self, request: web.Request) -> web.StreamResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._clients[ws] = set()
+        self.stats["ws_clients"] += 1
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.TEXT:
+                    await self._handle_ws_message(ws, msg.data)
+                elif msg.type == WSMsgType.ERROR:
+                    break
+        finally:
+            self._clients.pop(ws, None)
+        return ws
+
+    async def _handle_ws_message(self, ws: web.WebSocketResponse, text: str):
+        """구독/해지/PINGPONG 메시지 처리"""
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return
+        header = data.get("header", {})
+        if header.get("tr_id") == "PINGPONG":
+            return
+
+        # 표준 형식(body.input) 또는 header에 tr_id/tr_key를 넣은 형식 모두 허용
+        body_input = data.get("body", {}).get("input", {})
+        tr_id = body_input.get("tr_id") or header.get("tr_id", "")
+        tr_key = body_input.get("tr_key") or header.get("tr_key", "")
+        tr_type = header.get("tr_type", "1")
+
+        if tr_id not in WS_TR_IDS or tr_key not in self.market.symbols:
+            await ws.send_str(json.dumps({
+                "header": {"tr_id": tr_id, "tr_key": tr_key, "encrypt": "N"},
+                "body": {"rt_cd": "1", "msg_cd": "OPSP0011", "msg1": "invalid tr_key"},
+            }))
+            return
+
+        subscriptions = self._clients.get(ws)
+        if subscriptions is None:
+            return
+        if tr_type == "2":
+            subscriptions.discard((tr_id, tr_key))
+            msg1 = "UNSUBSCRIBE SUCCESS"
+        else:
+            subscriptions.add((tr_id, tr_key))
+            msg1 = "SUBSCRIBE SUCCESS"
+        await ws.send_str(json.dumps({
+            "header": {"tr_id": tr_id, "tr_key": tr_key, "encrypt": "N"},
+            "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": msg1,
+                     "output": {"iv": "0000000000000000", "key": "0" * 32}},
+        }))
+
+    def _encode_frame(self, tick: Dict[str, str]) -> str:
+        """체결 틱을 설정한 형식의 프레임으로 변환"""
+        if self.config.frame_format == "json":
+            return json.dumps({"header": {"tr_id": "H0STCNT0"},
+                               "body": {"tr_key": tick["mksc_shrn_iscd"], **tick}})
+        return "0|H0STCNT0|001|" + "^".join(tick[name] for name in H0STCNT0_FIELDS)
+
+    def _encode_orderbook(self, tick: Dict[str, str]) -> str:
+        """체결 직후 호가를 설정한 형식의 H0STASP0 프레임으로 변환"""
+        symbol = tick["mksc_shrn_iscd"]
+        book = {"mksc_shrn_iscd": symbol, "bsop_hour": tick["stck_cntg_hour"], "hour_cls_code": "0",
+                **self.market.orderbook_output(symbol)}
+        if self.config.frame_format == "json":
+            return json.dumps({"header": {"tr_id": "H0STASP0"}, "body": {"tr_key": symbol, **book}})
+        return "0|H0STASP0|001|" + "^".join(book.get(name, "0") for name in H0STASP0_FIELDS)
+
+    async def _tick_loop(self):
+        """틱 생성 및 구독 클라이언트로 전송"""
+        interval = self.config.tick_interval
+        while True:
+            started = time.monotonic()
+            try:
+                ticks = self.market.step(tick_seconds=interval, activity=self.config.tick_activity)
+                self.stats["ws_ticks"] += len(ticks)
+                if self._clients and ticks:
+                    frames = {("H0STCNT0", tick["mksc_shrn_iscd"]): self._encode_frame(tick) for tick in ticks}
+                    books = {symbol for client_subscriptions in self._clients.values()
+                             for tr_id, symbol in client_subscriptions if tr_id == "H0STASP0"}
+                    for tick in ticks:
+                        if tick["mksc_shrn_iscd"] in books:
+                            frames[("H0STASP0", tick["mksc_shrn_iscd"])] = self._encode_orderbook(tick)
+                    for ws, subscriptions in list(self._clients.items()):
+                        for key in subscriptions & frames.keys():
+                            if ws.closed:
+                                break
+                            await ws.send_str(frames[key])
+                            self.stats["ws_frames"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.log_error(e, "[시뮬레이터] 틱 전송 오류")
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    async def _ping_loop(self):
+        """서버 PINGPONG 전송"""
+        while True:
+            await asyncio.sleep(self.config.ping_interval)
+            message = json.dumps({"header": {"tr_id": "PINGPONG",
+                                             "datetime": datetime.now().strftime("%Y%m%d%H%M%S")}})
+            for ws in list(self._clients):
+                if not ws.closed:
+                    try:
+                        await ws.send_str(message)
+                    except ConnectionResetError:
+                        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """처리 통계 반환"""
+        return {
+            **self.stats,
+            "requests": dict(self.stats["requests"]),
+            "ws_connected": len(self._clients),
+            "ws_subscriptions": sum(len(s) for s in self._clients.values()),
+            "orders": len(self.market.orders),
+        }
@@ -10,7 +10,8 @@ import numpy as np
 
 from config.settings import config
 from core.api_client import api_client
-from core.websocket_client import ws_client
+from core.minute_bars import minute_bar_service
+from core.tick_bus import tick_bus, TOPIC_TRADE
 from core.order_manager import order_manager
 from utils.logger import logger
 from monitoring.alert_system import alert_system
@@ -60,7 +61,7 @@ class BreakoutStrategy:
                 self.initialization_complete[symbol] = False
                 
                 # 웹소켓 구독
-                await ws_client.subscribe_price(symbol, self._handle_price_update)
+                await tick_bus.subscribe(TOPIC_TRADE, symbol, self._handle_price_update)
             
             logger.log_system(f"Breakout strategy started for {len(symbols)} symbols")
             
@@ -77,7 +78,7 @@ class BreakoutStrategy:
         
         # 웹소켓 구독 해제
         for symbol in self.watched_symbols:
-            await ws_client.unsubscribe(symbol, "price")
+            await tick_bus.unsubscribe(TOPIC_TRADE, symbol, self._handle_price_update)
         
         logger.log_system("Breakout strategy stopped")
     
@@ -134,41 +135,18 @@ class BreakoutStrategy:
             
             # 9:00~9:30 데이터에서 고가/저가 계산
             if breakout_data['init_high'] is None or breakout_data['init_low'] is None:
-                # 실시간 데이터 부족한 경우 API로 조회
-                data = api_client.get_minute_price(
-                    symbol=symbol,
-                    time_unit="1"
-                )
-                
-                if not data or data.get("rt_cd") != "0":
-                    logger.log_warning(f"{symbol} - 브레이크아웃 전략 초기 데이터 부족")
-                    return
-                
-                # output2가 실제 차트 데이터를 담고 있음
-                chart_data = data.get("output2", [])
-                if not chart_data or len(chart_data) < 10:  # 최소 10개 데이터 필요
+                # 실시간 데이터 부족한 경우 당일 분봉 조회
+                series = await minute_bar_service.load_session(symbol)
+                if len(series) < 10:  # 최소 10개 데이터 필요
                     logger.log_warning(f"{symbol} - 브레이크아웃 전략 초기 데이터 부족")
                     return
                 
                 # 데이터 저장
-                for item in chart_data:
-                    # 시간 정보 파싱
-                    time_str = item.get("bass_tm", "")
-                    if time_str and len(time_str) >= 6:
-                        try:
-                            hour = int(time_str[:2])
-                            minute = int(time_str[2:4])
-                            second = int(time_str[4:6])
-                            timestamp = datetime.now().replace(hour=hour, minute=minute, second=second)
-                        except ValueError:
-                            timestamp = datetime.now()
-                    else:
-                        timestamp = datetime.now()
-
+                for timestamp, price, volume in series.rows():
                     self.price_data[symbol].append({
                         "timestamp": timestamp,
-                        "price": float(item["stck_prpr"]),
-                        "volume": int(item.get("cntg_vol", 0))
+                        "price": price,
+                        "volume": volume
                     })
                 
                 # 돌파 레벨 계산
@@ -418,45 +396,18 @@ class BreakoutStrategy:
             }
             self.initialization_complete[symbol] = False
             
-            # 초기 데이터 요청
-            end_time = datetime.now()
-            start_time = end_time - timedelta(minutes=30)  # 30분 데이터
-            
-            # API로 데이터 요청
-            data = api_client.get_minute_price(
-                symbol=symbol,
-                time_unit="1"
-            )
-            
-            if not data or data.get("rt_cd") != "0":
-                logger.log_warning(f"{symbol} - 브레이크아웃 전략 초기 데이터 부족")
-                return
-            
-            # output2가 실제 차트 데이터를 담고 있음
-            chart_data = data.get("output2", [])
-            if not chart_data or len(chart_data) < 10:  # 최소 10개 데이터 필요
+            # 당일 분봉 (장 시작부터 연속 시계열)
+            series = await minute_bar_service.load_session(symbol)
+            if len(series) < 10:  # 최소 10개 데이터 필요
                 logger.log_warning(f"{symbol} - 브레이크아웃 전략 초기 데이터 부족")
                 return
             
             # 데이터 저장
-            for item in chart_data:
-                # 시간 정보 파싱
-                time_str = item.get("bass_tm", "")
-                if time_str and len(time_str) >= 6:
-                    try:
-                        hour = int(time_str[:2])
-                        minute = int(time_str[2:4])
-                        second = int(time_str[4:6])
-                        timestamp = datetime.now().replace(hour=hour, minute=minute, second=second)
-                    except ValueError:
-                        timestamp = datetime.now()
-                else:
-                    timestamp = datetime.now()
-
+            for timestamp, price, volume in series.rows():
                 self.price_data[symbol].append({
                     "timestamp": timestamp,
-                    "price": float(item["stck_prpr"]),
-                    "volume": int(item.get("cntg_vol", 0))
+                    "price": price,
+                    "volume": volume
                 })
             
             # 돌파 레벨 계산
@@ -608,9 +559,9 @@ class BreakoutStrategy:
             # 현재가가 없으면 API에서 가져오기
             if current_price <= 0:
                 try:
-                    price_data = api_client.get_current_price(symbol)
-                    if price_data and price_data.get("rt_cd") == "0" and "output" in price_data:
-                        current_price = float(price_data["output"]["stck_prpr"])
+                    price_data = await api_client.get_current_price_async(symbol)
+                    if price_data and price_data.get("rt_cd") == "0" and price_data.get("quote"):
+                        current_price = price_data["quote"].price
                     else:
                         logger.log_system(f"[DEBUG] {symbol} - 브레이크아웃 현재가 조회 실패, 중립 신호 반환")
                         return {"signal": 0, "direction": "NEUTRAL"}
@@ -15,6 +15,8 @@ import concurrent.futures
 from config.settings import config
 from core.api_client import api_client
 from core.websocket_client import ws_client
+from core.tick_bus import tick_bus, TOPIC_TRADE, ConflatedFeed
+from core.subscription_manager import subscription_manager
 from core.order_manager import order_manager
 from utils.logger import logger
 from monitoring.alert_system import alert_system
@@ -74,6 +76,8 @@ class CombinedStrategy:
             self.positions = {}             # {position_id: position_data}
             self.signals = {}               # {symbol: {'score': float, 'direction': str, 'strategies': {}}}
             self.price_data = {}            # {symbol: deque of price data}
+            # 체결 틱은 종목별 최신값/구간 집계로 병합해 전략 루프에서 주기적으로 읽음
+            self.tick_feed = ConflatedFeed("combined")
             
             # 전략 객체 초기화 - 명시적 모듈 로드 및 에러 처리 개선
             self.strategies = {}
@@ -182,7 +186,7 @@ class CombinedStrategy:
                 }
                 
                 # 웹소켓 구독
-                await ws_client.subscribe_price(symbol, self._handle_price_update)
+                await tick_bus.subscribe(TOPIC_TRADE, symbol, self.tick_feed)
             
             # 개별 전략 시작
             await self._start_individual_strategies(symbols)
@@ -218,7 +222,7 @@ class CombinedStrategy:
         
         # 웹소켓 구독 해제
         for symbol in self.watched_symbols:
-            await ws_client.unsubscribe(symbol, "price")
+            await tick_bus.unsubscribe(TOPIC_TRADE, symbol, self.tick_feed)
         
         # 각 전략 중지
         await breakout_strategy.stop()
@@ -259,18 +263,23 @@ class CombinedStrategy:
             logger.log_system("Combined strategy resumed")
         return True
     
-    async def _handle_price_update(self, data: Dict[str, Any]):
-        """실시간 체결가 업데이트 처리"""
-        try:
-            symbol = data.get("tr_key")
-            price = float(data.get("stck_prpr", 0))
-            volume = int(data.get("cntg_vol", 0))
-            
-            if symbol in self.price_data:
-                timestamp = datetime.now()
+    async def _apply_price_updates(self):
+        """병합된 체결 반영 (틱마다가 아니라 주기마다 변경된 종목 수만큼만 처리)
+
+        drain()이 모든 종목의 구간 집계를 비우므로 한 종목의 오류가 나머지 종목 처리를 막지 않도록 종목별로 처리한다.
+        """
+        timestamp = datetime.now()
+        for symbol, tick in self.tick_feed.drain().items():
+            try:
+                if symbol not in self.price_data:
+                    continue
+                # 구간 집계 1건으로 저장 (구간 체결량 합계와 고가/저가 포함)
                 self.price_data[symbol].append({
-                    "price": price,
-                    "volume": volume,
+                    "price": tick.price,
+                    "volume": tick.volume,
+                    "high": tick.high,
+                    "low": tick.low,
+                    "ticks": tick.count,
                     "timestamp": timestamp
                 })
                 
@@ -280,8 +289,8 @@ class CombinedStrategy:
                     await self._update_signals(symbol)
                     self.signals[symbol]['last_update'] = timestamp
                 
-        except Exception as e:
-            logger.log_error(e, "Error handling price update in combined strategy")
+            except Exception as e:
+                logger.log_error(e, f"Error handling price update in combined strategy: {symbol}")
     
     async def _update_signals(self, symbol: str):
         """개별 전략 신호 업데이트"""
@@ -686,6 +695,9 @@ class CombinedStrategy:
                     logger.log_error(e, "is_trading_paused 호출 실패")
                     # 오류 발생 시 기본값으로 계속 진행
                 
+                # 마지막 주기 이후 병합된 체결 반영
+                await self._apply_price_updates()
+                
                 # 거래 신호 확인 및 실행 (평가 로그 생성)
                 for symbol in self.watched_symbols:
                     try:
@@ -1433,71 +1445,59 @@ class CombinedStrategy:
             
             logger.log_system(f"구독 해제 대상: {len(to_unsubscribe)}개, 새로 구독 대상: {len(to_subscribe)}개")
             
-            # 구독 해제
+            # 구독 해제 종목 데이터 정리
             for symbol in to_unsubscribe:
-                try:
-                    await ws_client.unsubscribe(symbol, "price")
-                    if symbol in self.price_data:
-                        del self.price_data[symbol]
-                    if symbol in self.signals:
-                        del self.signals[symbol]
-                except Exception as e:
-                    logger.log_error(e, f"Failed to unsubscribe from {symbol}")
-                    # 에러가 발생해도 계속 진행
+                self.tick_feed.discard(symbol)
+                if symbol in self.price_data:
+                    del self.price_data[symbol]
+                if symbol in self.signals:
+                    del self.signals[symbol]
+            
+            # 새 종목 가격 데이터와 시그널 초기화
+            for symbol in to_subscribe:
+                self.price_data[symbol] = deque(maxlen=100)
+                self.signals[symbol] = {
+                    'score': 0,
+                    'direction': "NEUTRAL",
+                    'strategies': {
+                        'breakout': {'signal': 0, 'direction': "NEUTRAL"},
+                        'momentum': {'signal': 0, 'direction': "NEUTRAL"},
+                        'gap': {'signal': 0, 'direction': "NEUTRAL"},
+                        'vwap': {'signal': 0, 'direction': "NEUTRAL"},
+                        'volume': {'signal': 0, 'direction': "NEUTRAL"}
+                    },
+                    'last_update': None
+                }
             
-            # 새로 구독 (최대 세 개씩 처리하며 잠시 대기하여 서버 부하 감소)
             subscribed_count = 0
             failed_count = 0
-            batch_size = 3
             
-            # 종목을 batch_size 단위로 나누어 처리
-            for i in range(0, len(to_subscribe), batch_size):
-                batch = list(to_subscribe)[i:i+batch_size]
-                
-                for symbol in batch:
+            # 웹소켓 구독 - SKIP_WEBSOCKET 상태에 따라 처리
+            if skip_websocket:
+                for symbol in to_unsubscribe:
                     try:
-                        # 가격 데이터와 시그널 초기화
-                        self.price_data[symbol] = deque(maxlen=100)
-                        self.signals[symbol] = {
-                            'score': 0,
-                            'direction': "NEUTRAL",
-                            'strategies': {
-                                'breakout': {'signal': 0, 'direction': "NEUTRAL"},
-                                'momentum': {'signal': 0, 'direction': "NEUTRAL"},
-                                'gap': {'signal': 0, 'direction': "NEUTRAL"},
-                                'vwap': {'signal': 0, 'direction': "NEUTRAL"},
-                                'volume': {'signal': 0, 'direction': "NEUTRAL"}
-                            },
-                            'last_update': None
-                        }
-                        
-                        # 웹소켓 구독 - SKIP_WEBSOCKET 상태에 따라 처리
-                        if skip_websocket:
-                            # 웹소켓 구독 건너뛰기
-                            logger.log_system(f"SKIP_WEBSOCKET=True 설정으로 {symbol} 웹소켓 구독 건너뜀")
-                            # 콜백 정보 직접 설정
-                            callback_key = f"H0STCNT0|{symbol}"
-                            ws_client.callbacks[callback_key] = self._handle_price_update
-                            # 구독 정보 직접 추가
-                            ws_client.subscriptions[symbol] = {"type": "price", "callback": self._handle_price_update}
-                            # 성공으로 처리
-                            subscribed_count += 1
-                        else:
-                            # 실제 웹소켓 구독 시도
-                            subscription_result = await ws_client.subscribe_price(symbol, self._handle_price_update)
-                            if subscription_result:
-                                subscribed_count += 1
-                            else:
-                                failed_count += 1
-                                logger.log_system(f"웹소켓 구독 실패: {symbol}")
+                        await tick_bus.unsubscribe(TOPIC_TRADE, symbol, self.tick_feed)
                     except Exception as e:
-                        failed_count += 1
-                        logger.log_error(e, f"Failed to subscribe to {symbol}")
+                        logger.log_error(e, f"Failed to unsubscribe from {symbol}")
                         # 에러가 발생해도 계속 진행
+                for symbol in to_subscribe:
+                    # 콜백은 틱 버스 구독자로만 등록
+                    tick_bus.add_listener(TOPIC_TRADE, symbol, self.tick_feed)
+                    # 구독 정보 직접 추가
+                    ws_client.subscriptions[symbol] = {"type": "price", "callback": self.tick_feed}
+                    # 성공으로 처리
+                    subscribed_count += 1
+            else:
+                # 현재 구독과의 차이만 해지/구독 (프레임은 연속 전송, 성공 여부는 서버 ACK로 확인)
+                results = await subscription_manager.sync(self.tick_feed, new_set)
+                subscribed_count = sum(1 for ok in results.values() if ok)
+                failed_count = len(results) - subscribed_count
+                for symbol, ok in results.items():
+                    if not ok:
+                        logger.log_system(f"웹소켓 구독 실패: {symbol}")
                 
-                # 배치 처리 후 잠시 대기 (서버 부하 방지)
-                if i + batch_size < len(to_subscribe):
-                    await asyncio.sleep(0.5)
+                # 관심 종목 호가도 미리 구독 (주문 시점에 호가창 스냅샷이 준비되어 REST 현재가 조회 생략)
+                await order_manager.watch_orderbooks(new_symbols)
             
             # 진행 상황 로그
             if skip_websocket:
@@ -1636,9 +1636,9 @@ class CombinedStrategy:
             
             if price is None:
                 # 현재가 조회
-                price_data = api_client.get_current_price(symbol)
-                if price_data.get("rt_cd") == "0" and "output" in price_data:
-                    price = float(price_data["output"]["stck_prpr"])
+                price_data = await api_client.get_current_price_async(symbol)
+                if price_data.get("rt_cd") == "0" and price_data.get("quote"):
+                    price = price_data["quote"].price
                 else:
                     logger.log_system(f"[포지션진입실패] {symbol} - 현재가 조회 실패")
                     return {"status": "failed", "reason": "현재가 조회 실패"}
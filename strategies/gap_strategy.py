@@ -11,9 +11,11 @@ import numpy as np
 
 from config.settings import config
 from core.api_client import api_client
-from core.websocket_client import ws_client
+from core.daily_bars import daily_bar_store
+from core.tick_bus import tick_bus, TOPIC_TRADE
 from core.order_manager import order_manager
 from utils.logger import logger
+from utils.market_hours import get_previous_trading_day
 from monitoring.alert_system import alert_system
 
 class GapStrategy:
@@ -85,7 +87,7 @@ class GapStrategy:
                 }
                 
                 # 웹소켓 구독
-                await ws_client.subscribe_price(symbol, self._handle_price_update)
+                await tick_bus.subscribe(TOPIC_TRADE, symbol, self._handle_price_update)
                 
                 # 전일 종가 및 거래량 데이터 로드
                 await self._load_historical_data(symbol)
@@ -141,42 +143,14 @@ class GapStrategy:
                 })
                 logger.log_system(f"갭 전략 - {symbol} 현재가 로드: {current_price:,.0f}원")
             
-            # 일봉 데이터 조회
-            price_data = api_client.get_daily_price(symbol)
-            if price_data.get("rt_cd") == "0":
-                # API 응답 구조에 맞게 수정
-                if "output2" in price_data and price_data["output2"]:
-                    daily_data = price_data["output2"]
-                elif "output" in price_data and "lst" in price_data["output"]:
-                    daily_data = price_data["output"]["lst"]
-                else:
-                    daily_data = []
-                
-                if daily_data and len(daily_data) > 1:
-                    # 전일 데이터 (첫 번째가 오늘, 두 번째가 어제)
-                    prev_day = daily_data[1]
-                    prev_close = float(prev_day.get("stck_clpr", 0))
-                    
-                    if prev_close > 0:
-                        self.gap_data[symbol]['prev_close'] = prev_close
-                        
-                        # 거래량 데이터 수집
-                        volumes = []
-                        for day_data in daily_data[1:21]:  # 최근 20일
-                            vol = int(day_data.get("acml_vol", 0))
-                            if vol > 0:
-                                volumes.append(vol)
-                        
-                        if volumes:
-                            avg_volume = np.mean(volumes)
-                            self.volume_data[symbol]['avg_volume'] = avg_volume
-                            self.volume_data[symbol]['volumes'] = deque(volumes, maxlen=20)
-                            
-                        logger.log_system(f"갭 전략 - {symbol} 전일 종가 로드: {prev_close:,.0f}원")
+            # 저장된 일봉에서 전일 종가/평균 거래량 로드 (REST 호출 없음)
+            prev_close = self._apply_daily_history(symbol, (price_info or {}).get("prev_close"))
+            if prev_close:
+                logger.log_system(f"갭 전략 - {symbol} 전일 종가 로드: {prev_close:,.0f}원")
             
             # 오늘 시가 조회
-            if "output1" in price_data and price_data["output1"]:
-                today_open = float(price_data["output1"].get("stck_oprc", 0))
+            if price_info and price_info.get("open_price"):
+                today_open = float(price_info["open_price"])
                 if today_open > 0:
                     self.gap_data[symbol]['today_open'] = today_open
                     
@@ -200,6 +174,37 @@ class GapStrategy:
         except Exception as e:
             logger.log_error(e, f"갭 전략 - {symbol} 초기 데이터 로딩 오류")
     
+    def _apply_daily_history(self, symbol: str, quote_prev_close: Optional[float] = None) -> Optional[float]:
+        """저장된 일봉으로 전일 종가와 최근 20일 거래량 설정
+        
+        장중에는 일봉을 REST로 보충하지 않으므로 마지막 저장 일봉이 며칠 전 것일 수 있다.
+        마지막 일봉이 직전 거래일 것일 때만 그 종가를 쓰고, 아니면 시세의 전일 종가(stck_sdpr)를 쓴다.
+        
+        Args:
+            symbol: 종목코드
+            quote_prev_close: 현재가 시세의 전일 종가
+            
+        Returns:
+            전일 종가 (확인할 수 없으면 None)
+        """
+        bars = daily_bar_store.get_bars(symbol, 20)
+        
+        prev_close = None
+        if len(bars) > 0 and bars.close[-1] > 0 and \
+                bars.dates[-1] == np.datetime64(get_previous_trading_day(), "D"):
+            prev_close = float(bars.close[-1])
+        elif quote_prev_close and quote_prev_close > 0:
+            prev_close = float(quote_prev_close)
+        if prev_close is None:
+            return None
+        self.gap_data[symbol]['prev_close'] = prev_close
+        
+        volumes = [int(v) for v in bars.volume if v > 0]
+        if volumes:
+            self.volume_data[symbol]['avg_volume'] = np.mean(volumes)
+            self.volume_data[symbol]['volumes'] = deque(volumes, maxlen=20)
+        return prev_close
+    
     async def _load_historical_data(self, symbol: str):
         """과거 데이터 로드 (전일 종가, 거래량 등)"""
         try:
@@ -223,35 +228,16 @@ class GapStrategy:
                     'volumes': deque(maxlen=20)
                 }
                 
-            # 일봉 데이터 조회
-            price_data = api_client.get_daily_price(symbol)
-            if price_data.get("rt_cd") == "0":
-                # API 응답 구조 확인 - output2가 일봉 데이터 리스트
-                if "output2" in price_data and price_data["output2"]:
-                    daily_data = price_data["output2"]
-                
-                    if len(daily_data) > 1:
-                        # 전일 데이터 (인덱스 0은 오늘, 1은 어제)
-                        prev_day = daily_data[1]
-                        prev_close = float(prev_day.get("stck_clpr", 0))
-                        
-                        if prev_close > 0:
-                            self.gap_data[symbol]['prev_close'] = prev_close
-                            
-                            # 거래량 데이터 수집
-                            volumes = []
-                            for day_data in daily_data[1:21]:  # 최근 20일
-                                vol = int(day_data.get("acml_vol", 0))
-                                if vol > 0:
-                                    volumes.append(vol)
-                            
-                            if volumes:
-                                avg_volume = np.mean(volumes)
-                                self.volume_data[symbol]['avg_volume'] = avg_volume
-                                self.volume_data[symbol]['volumes'] = deque(volumes, maxlen=20)
-                            
-                            logger.log_system(f"갭 전략 - {symbol} 과거 데이터 로드 완료: "
-                                            f"전일종가={prev_close:,.0f}원, 평균거래량={avg_volume:,.0f}")
+            # 저장된 일봉에서 전일 종가/평균 거래량 로드 (REST 호출 없음)
+            prev_close = self._apply_daily_history(symbol)
+            if prev_close is None:
+                # 저장된 일봉이 직전 거래일 것이 아니면 시세의 전일 종가 사용
+                price_info = await api_client.get_symbol_info(symbol)
+                prev_close = self._apply_daily_history(symbol, (price_info or {}).get("prev_close"))
+            if prev_close:
+                avg_volume = self.volume_data[symbol]['avg_volume'] or 0
+                logger.log_system(f"갭 전략 - {symbol} 과거 데이터 로드 완료: "
+                                f"전일종가={prev_close:,.0f}원, 평균거래량={avg_volume:,.0f}")
                     
         except Exception as e:
             logger.log_error(e, f"갭 전략 - {symbol} 과거 데이터 로딩 오류")
@@ -262,7 +248,7 @@ class GapStrategy:
         
         # 웹소켓 구독 해제
         for symbol in self.watched_symbols:
-            await ws_client.unsubscribe(symbol, "price")
+            await tick_bus.unsubscribe(TOPIC_TRADE, symbol, self._handle_price_update)
         
         logger.log_system("Gap strategy stopped")
     
@@ -11,7 +11,9 @@ import threading
 
 from config.settings import config
 from core.api_client import api_client
-from core.websocket_client import ws_client
+from core.minute_bars import minute_bar_service
+from core.tick_bus import tick_bus, TOPIC_TRADE, TOPIC_GAP
+from core.gap_filler import gap_filler, splice_bars, GapFill
 from core.order_manager import order_manager
 from utils.logger import logger
 from monitoring.alert_system import alert_system
@@ -79,11 +81,14 @@ class MomentumStrategy:
                 }
                 
                 # 웹소켓 구독
-                await ws_client.subscribe_price(symbol, self._handle_price_update)
+                await tick_bus.subscribe(TOPIC_TRADE, symbol, self._handle_price_update)
                 
                 # 초기 데이터 로딩 (API 호출)
                 await self._load_initial_data(symbol)
             
+            # 재연결 공백 분봉 보정 수신
+            tick_bus.add_listener(TOPIC_GAP, None, self._handle_gap_fill)
+            
             logger.log_system(f"Momentum strategy started for {len(symbols)} symbols")
             
             # 전략 실행 루프
@@ -94,83 +99,28 @@ class MomentumStrategy:
             await alert_system.notify_error(e, "Momentum strategy start error")
     
     async def _load_initial_data(self, symbol: str):
-        # 현재 시간 가져오기
-        now = datetime.now()
-
-        # HHMMSS 형식으로 변환 (콜론 없이 시분초)
-        current_time_str = now.strftime("%H%M%S")
-
         """초기 데이터 로딩"""
         try:
-            # 분봉 데이터 조회
-            price_data = api_client.get_minute_price(symbol, time_unit=current_time_str)
-            if price_data.get("rt_cd") == "0":
-                prices = []
-                volumes = []
-                timestamps = []
-                
-                # API 응답에서 필요한 데이터 추출 - output2가 실제 차트 데이터
-                chart_data = price_data.get("output2", [])
-                
-                if chart_data:
-                    logger.log_system(f"{symbol} - 모멘텀 전략 초기 데이터 {len(chart_data)}개 로드 성공")
-                    
-                    # 일반적으로 최신 데이터가 먼저 오므로, 과거->현재 순서로 처리하기 위해 reversed 사용
-                    # API 응답 구조에 따라 달라질 수 있음
-                    for item in reversed(chart_data):
-                        # 가격 데이터 - stck_prpr 또는 clos 필드 사용
-                        if "stck_prpr" in item:
-                            prices.append(float(item["stck_prpr"]))
-                        elif "clos" in item:  # 종가(clos) 필드가 있는 경우
-                            prices.append(float(item["clos"]))
-                        else:
-                            continue  # 가격 데이터가 없으면 건너뜀
-                        
-                        # 거래량 데이터 - cntg_vol 또는 vol 필드 사용
-                        if "cntg_vol" in item:
-                            volumes.append(int(item["cntg_vol"]))
-                        elif "vol" in item:
-                            volumes.append(int(item["vol"]))
-                        else:
-                            volumes.append(0)  # 거래량 데이터가 없으면 0으로 설정
-                        
-                        # 시간 데이터 - bass_tm 또는 time 필드 사용
-                        if "bass_tm" in item:
-                            timestamps.append(item["bass_tm"])
-                        elif "time" in item:
-                            timestamps.append(item["time"])
-                        else:
-                            timestamps.append("")  # 시간 데이터가 없으면 빈 문자열로 설정
-                    
-                    # 가격 데이터 저장
-                    for i in range(len(prices)):
-                        # 시간 정보가 있으면 파싱, 없으면 현재 시간에서 역산
-                        if timestamps[i] and len(timestamps[i]) >= 6:
-                            # 시간 형식에 맞게 파싱 (예: "093000" -> 09:30:00)
-                            try:
-                                hour = int(timestamps[i][:2])
-                                minute = int(timestamps[i][2:4])
-                                second = int(timestamps[i][4:6])
-                                timestamp = datetime.now().replace(hour=hour, minute=minute, second=second)
-                            except ValueError:
-                                # 시간 파싱 실패 시 현재 시간에서 역산
-                                timestamp = datetime.now() - timedelta(minutes=len(prices)-i)
-                        else:
-                            # 시간 정보가 없으면 현재 시간에서 역산
-                            timestamp = datetime.now() - timedelta(minutes=len(prices)-i)
-                        
-                        self.price_data[symbol].append({
-                            "price": prices[i],
-                            "volume": volumes[i],
-                            "timestamp": timestamp
-                        })
-                    
-                    # 초기 지표 계산
-                    self._calculate_indicators(symbol)
-                    
-                    logger.log_system(f"Loaded initial data for {symbol}: {len(prices)} data points")
-                else:
-                    logger.log_system(f"{symbol} - 모멘텀 전략 초기 데이터 없음")
+            # 당일 분봉 (장 시작부터, 이미 보유한 분봉은 증분 조회)
+            series = await minute_bar_service.load_session(symbol)
+            
+            if len(series) > 0:
+                logger.log_system(f"{symbol} - 모멘텀 전략 초기 데이터 {len(series)}개 로드 성공")
+                
+                # 과거 -> 현재 순서
+                for timestamp, price, volume in series.rows():
+                    self.price_data[symbol].append({
+                        "price": price,
+                        "volume": volume,
+                        "timestamp": timestamp
+                    })
+                
+                # 초기 지표 계산
+                self._calculate_indicators(symbol)
+                
+                logger.log_system(f"Loaded initial data for {symbol}: {len(series)} data points")
+            else:
+                logger.log_system(f"{symbol} - 모멘텀 전략 초기 데이터 없음")
                 
         except Exception as e:
             logger.log_error(e, f"Error loading initial data for {symbol}")
@@ -206,7 +156,8 @@ class MomentumStrategy:
         
         # 웹소켓 구독 해제
         for symbol in self.watched_symbols:
-            await ws_client.unsubscribe(symbol, "price")
+            await tick_bus.unsubscribe(TOPIC_TRADE, symbol, self._handle_price_update)
+        tick_bus.remove_listener(TOPIC_GAP, None, self._handle_gap_fill)
         
         logger.log_system("Momentum strategy stopped")
     
@@ -246,6 +197,13 @@ class MomentumStrategy:
         except Exception as e:
             logger.log_error(e, "Error handling price update in momentum strategy")
     
+    def _handle_gap_fill(self, gap: GapFill):
+        """재연결 공백 분봉 보정 (가격 시계열에 시간순으로 끼워 넣고 지표 재계산)"""
+        if gap.symbol not in self.price_data:
+            return
+        self.price_data[gap.symbol] = splice_bars(self.price_data[gap.symbol], gap.series)
+        self._calculate_indicators(gap.symbol)
+    
     def _calculate_indicators(self, symbol: str):
         """기술적 지표 계산"""
         try:
@@ -359,8 +317,10 @@ class MomentumStrategy:
                     await asyncio.sleep(1)
                     continue
                 
-                # 각 종목 분석
+                # 각 종목 분석 (재연결 공백 보정 중인 종목은 보정 완료 후 분석)
                 for symbol in self.watched_symbols:
+                    if gap_filler.is_recovering(symbol):
+                        continue
                     await self._analyze_and_trade(symbol)
                 
                 # 포지션 모니터링
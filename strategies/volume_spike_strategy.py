@@ -11,7 +11,10 @@ import threading
 
 from config.settings import config
 from core.api_client import api_client
-from core.websocket_client import ws_client
+from core.daily_bars import daily_bar_store
+from core.minute_bars import minute_bar_service
+from core.tick_bus import tick_bus, TOPIC_TRADE, TOPIC_GAP
+from core.gap_filler import gap_filler, splice_bars, GapFill
 from core.order_manager import order_manager
 from utils.logger import logger
 from monitoring.alert_system import alert_system
@@ -78,11 +81,14 @@ class VolumeStrategy:
                 self.pending_entry[symbol] = None
                 
                 # 웹소켓 구독
-                await ws_client.subscribe_price(symbol, self._handle_price_update)
+                await tick_bus.subscribe(TOPIC_TRADE, symbol, self._handle_price_update)
                 
                 # 과거 거래량 데이터 로드
                 await self._load_historical_volumes(symbol)
             
+            # 재연결 공백 분봉 보정 수신
+            tick_bus.add_listener(TOPIC_GAP, None, self._handle_gap_fill)
+            
             logger.log_system(f"Volume spike strategy started for {len(symbols)} symbols")
             
             # 전략 실행 루프
@@ -95,98 +101,43 @@ class VolumeStrategy:
     async def _load_historical_volumes(self, symbol: str):
         """과거 거래량 데이터 로드"""
         try:
-            # 일봉 데이터 조회
-            price_data = api_client.get_daily_price(symbol)
-            if price_data.get("rt_cd") == "0":
-                volumes = []
+            # 저장된 일봉 조회 (REST 호출 없음)
+            daily_bars = daily_bar_store.get_bars(symbol, self.params["look_back_periods"])
+            if len(daily_bars) > 0:
+                logger.log_system(f"{symbol} - 볼륨 전략 일봉 데이터 {len(daily_bars)}개 로드")
                 
-                # output2가 실제 일봉 데이터 배열임
-                daily_data = price_data.get("output2", [])
+                volumes = [int(v) for v in daily_bars.volume if v > 0]
                 
-                if daily_data:
-                    logger.log_system(f"{symbol} - 볼륨 전략 일봉 데이터 {len(daily_data)}개 로드")
-                    
-                    # look_back_periods 개수만큼 필터링
-                    for item in daily_data[:self.params["look_back_periods"]]:
-                        # 거래량 필드 확인 (다양한 필드명에 대응)
-                        volume = 0
-                        if "acml_vol" in item:
-                            volume = int(item["acml_vol"])
-                        elif "vol" in item:
-                            volume = int(item["vol"])
-                        elif "volume" in item:
-                            volume = int(item["volume"])
-                        
-                        if volume > 0:
-                            volumes.append(volume)
+                # 평균 거래량 계산
+                if volumes:
+                    self.volume_data[symbol]['historical_volumes'].extend(volumes)
+                    self.volume_data[symbol]['avg_volume'] = np.mean(volumes)
                     
-                    # 평균 거래량 계산
-                    if volumes:
-                        self.volume_data[symbol]['historical_volumes'].extend(volumes)
-                        self.volume_data[symbol]['avg_volume'] = np.mean(volumes)
-                        
-                        logger.log_system(f"일봉 거래량 데이터 로드 완료 - {symbol}: 평균={self.volume_data[symbol]['avg_volume']:.0f}")
-                    else:
-                        logger.log_system(f"{symbol} - 거래량 데이터를 찾을 수 없음")
+                    logger.log_system(f"일봉 거래량 데이터 로드 완료 - {symbol}: 평균={self.volume_data[symbol]['avg_volume']:.0f}")
                 else:
-                    logger.log_system(f"{symbol} - 일봉 데이터가 없음")
+                    logger.log_system(f"{symbol} - 거래량 데이터를 찾을 수 없음")
             else:
-                error_msg = price_data.get("msg1", "Unknown error")
-                logger.log_system(f"{symbol} - 일봉 데이터 조회 실패: {error_msg}")
+                logger.log_system(f"{symbol} - 일봉 데이터가 없음")
             
-            # 분봉 데이터 조회 (당일)
-            minute_data = api_client.get_minute_price(symbol)
-            if minute_data.get("rt_cd") == "0":
-                # output2가 실제 분봉 데이터 배열임
-                minute_items = minute_data.get("output2", [])
+            # 분봉 데이터 조회 (당일, 장 시작부터 연속 시계열)
+            series = await minute_bar_service.load_session(symbol)
+            if len(series) > 0:
+                logger.log_system(f"{symbol} - 볼륨 전략 분봉 데이터 {len(series)}개 로드")
                 
-                if minute_items:
-                    logger.log_system(f"{symbol} - 볼륨 전략 분봉 데이터 {len(minute_items)}개 로드")
-                    
-                    # 최근 60개 분봉 처리
-                    for item in minute_items[:60]:
-                        # 거래량 필드 확인
-                        volume = 0
-                        if "cntg_vol" in item:
-                            volume = int(item["cntg_vol"])
-                        elif "vol" in item:
-                            volume = int(item["vol"])
-                        elif "volume" in item:
-                            volume = int(item["volume"])
-                        
-                        # 시간 정보 추출
-                        time_str = ""
-                        if "time" in item:
-                            time_str = item["time"]
-                        elif "bass_tm" in item:
-                            time_str = item["bass_tm"]
-                        
-                        # 유효한 시간 형식인지 확인
-                        timestamp = None
-                        if time_str and len(time_str) >= 6:
-                            try:
-                                hour = int(time_str[:2])
-                                minute = int(time_str[2:4])
-                                timestamp = datetime.now().replace(hour=hour, minute=minute)
-                            except ValueError:
-                                timestamp = datetime.now()
-                        else:
-                            timestamp = datetime.now()
-                        
-                        # 분봉 거래량 데이터 저장
-                        self.volume_data[symbol]['minute_volumes'].append({
-                            'volume': volume,
-                            'minute': timestamp.minute,
-                            'hour': timestamp.hour,
-                            'timestamp': timestamp
-                        })
-                    
-                    logger.log_system(f"{symbol} - 분봉 거래량 데이터 로드 완료: {len(self.volume_data[symbol]['minute_volumes'])}개")
-                else:
-                    logger.log_system(f"{symbol} - 분봉 데이터가 없음")
+                # 최근 60개 분봉 처리
+                recent = series.tail(60)
+                for timestamp, volume in zip(recent.timestamps, recent.volume.tolist()):
+                    # 분봉 거래량 데이터 저장
+                    self.volume_data[symbol]['minute_volumes'].append({
+                        'volume': volume,
+                        'minute': timestamp.minute,
+                        'hour': timestamp.hour,
+                        'timestamp': timestamp
+                    })
+                
+                logger.log_system(f"{symbol} - 분봉 거래량 데이터 로드 완료: {len(self.volume_data[symbol]['minute_volumes'])}개")
             else:
-                error_msg = minute_data.get("msg1", "Unknown error")
-                logger.log_system(f"{symbol} - 분봉 데이터 조회 실패: {error_msg}")
+                logger.log_system(f"{symbol} - 분봉 데이터가 없음")
         
         except Exception as e:
             logger.log_error(e, f"Error loading historical volume data for {symbol}")
@@ -198,7 +149,8 @@ class VolumeStrategy:
         
         # 웹소켓 구독 해제
         for symbol in self.watched_symbols:
-            await ws_client.unsubscribe(symbol, "price")
+            await tick_bus.unsubscribe(TOPIC_TRADE, symbol, self._handle_price_update)
+        tick_bus.remove_listener(TOPIC_GAP, None, self._handle_gap_fill)
         
         logger.log_system("Volume spike strategy stopped")
     
@@ -247,13 +199,29 @@ class VolumeStrategy:
                     # 기존 분봉 업데이트
                     self.volume_data[symbol]['minute_volumes'][-1]['volume'] += volume
                 
-                # 일정 간격마다 (1분) 볼륨 스파이크 감지
-                if is_new_minute:
+                # 일정 간격마다 (1분) 볼륨 스파이크 감지 (재연결 공백 보정 중에는 보정 후 판단)
+                if is_new_minute and not gap_filler.is_recovering(symbol):
                     self._detect_volume_spike(symbol, timestamp)
                 
         except Exception as e:
             logger.log_error(e, "Error handling price update in volume strategy")
     
+    def _handle_gap_fill(self, gap: GapFill):
+        """재연결 공백 분봉 보정 (가격 시계열과 분봉 거래량에 시간순으로 끼워 넣음)"""
+        symbol = gap.symbol
+        if symbol not in self.price_data:
+            return
+        self.price_data[symbol] = splice_bars(self.price_data[symbol], gap.series)
+        
+        minute_volumes = self.volume_data[symbol]['minute_volumes']
+        covered = {(item['hour'], item['minute']) for item in minute_volumes}
+        missing = [{'volume': volume, 'minute': timestamp.minute, 'hour': timestamp.hour, 'timestamp': timestamp}
+                   for timestamp, volume in zip(gap.series.timestamps, gap.series.volume.tolist())
+                   if (timestamp.hour, timestamp.minute) not in covered]
+        if missing:
+            merged = sorted([*minute_volumes, *missing], key=lambda item: item['timestamp'])
+            self.volume_data[symbol]['minute_volumes'] = deque(merged, maxlen=minute_volumes.maxlen)
+    
     def _detect_volume_spike(self, symbol: str, timestamp: datetime):
         """볼륨 스파이크 감지"""
         try:
@@ -339,7 +307,7 @@ class VolumeStrategy:
                 current_timestamp = datetime.now()
                 for symbol in self.watched_symbols:
                     pending = self.pending_entry.get(symbol)
-                    if pending:
+                    if pending and not gap_filler.is_recovering(symbol):
                         # 가격 조정 대기 시간 확인
                         elapsed_minutes = (current_timestamp - pending['detection_time']).total_seconds() / 60
                         
@@ -11,7 +11,8 @@ import threading
 
 from config.settings import config
 from core.api_client import api_client
-from core.websocket_client import ws_client
+from core.minute_bars import minute_bar_service
+from core.tick_bus import tick_bus, TOPIC_TRADE
 from core.order_manager import order_manager
 from utils.logger import logger
 from monitoring.alert_system import alert_system
@@ -71,7 +72,7 @@ class VWAPStrategy:
                 self.initialization_complete[symbol] = False
                 
                 # 웹소켓 구독
-                await ws_client.subscribe_price(symbol, self._handle_price_update)
+                await tick_bus.subscribe(TOPIC_TRADE, symbol, self._handle_price_update)
                 
                 # 초기 데이터 로드
                 await self._load_initial_data(symbol)
@@ -93,60 +94,29 @@ class VWAPStrategy:
             self.vwap_data[symbol] = deque(maxlen=2000)
             self.initialization_complete[symbol] = False
             
-            # 초기 데이터 요청
-            end_time = datetime.now()
-            start_time = end_time - timedelta(minutes=30)  # 30분 데이터
-            
-            # API로 데이터 요청
-            data = api_client.get_minute_price(
-                symbol=symbol,
-                time_unit="1"
-            )
-            
-            if not data or data.get("rt_cd") != "0":
+            # 당일 분봉 (장 시작부터 연속 시계열)
+            series = await minute_bar_service.load_session(symbol)
+            if len(series) < 20:  # 최소 20개 데이터 필요
                 logger.log_warning(f"{symbol} - VWAP 전략 초기 데이터 부족")
                 return
             
-            # output2가 실제 차트 데이터를 담고 있음
-            chart_data = data.get("output2", [])
-            if not chart_data or len(chart_data) < 20:  # 최소 20개 데이터 필요
-                logger.log_warning(f"{symbol} - VWAP 전략 초기 데이터 부족")
-                return
+            # VWAP 누적 계산 (과거 -> 현재 순서, 배열 연산)
+            cumulative_pv = np.cumsum(series.close * series.volume)
+            cumulative_volume = np.cumsum(series.volume)
+            vwaps = np.where(cumulative_volume > 0,
+                             cumulative_pv / np.maximum(cumulative_volume, 1),
+                             series.close)
+            band_factor = self.params.get('band_factor', 0.005)
             
-            # 데이터 저장 및 VWAP 계산
-            cumulative_pv = 0
-            cumulative_volume = 0
-            
-            for item in chart_data:
-                price = float(item["stck_prpr"])
-                volume = int(item.get("cntg_vol", 0))
-                
-                # 시간 정보 파싱
-                time_str = item.get("bass_tm", "")
-                if time_str and len(time_str) >= 6:
-                    try:
-                        hour = int(time_str[:2])
-                        minute = int(time_str[2:4])
-                        second = int(time_str[4:6])
-                        timestamp = datetime.now().replace(hour=hour, minute=minute, second=second)
-                    except ValueError:
-                        timestamp = datetime.now()
-                else:
-                    timestamp = datetime.now()
-                
+            # 데이터 저장
+            for (timestamp, price, volume), vwap in zip(series.rows(), vwaps.tolist()):
                 self.price_data[symbol].append({
                     "timestamp": timestamp,
                     "price": price,
                     "volume": volume
                 })
                 
-                # VWAP 계산
-                cumulative_pv += price * volume
-                cumulative_volume += volume
-                vwap = cumulative_pv / cumulative_volume if cumulative_volume > 0 else price
-                
                 # 밴드 계산
-                band_factor = self.params.get('band_factor', 0.005)
                 upper_band = vwap * (1 + band_factor)
                 lower_band = vwap * (1 - band_factor)
                 
@@ -171,7 +141,7 @@ class VWAPStrategy:
         
         # 웹소켓 구독 해제
         for symbol in self.watched_symbols:
-            await ws_client.unsubscribe(symbol, "price")
+            await tick_bus.unsubscribe(TOPIC_TRADE, symbol, self._handle_price_update)
         
         logger.log_system("VWAP strategy stopped")
     
@@ -0,0 +1,96 @@
+"""
+적응형 타임아웃 및 주문 요청 타임아웃 처리 테스트
+"""
+import sys
+import os
+import asyncio
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.api_client import api_client
+from core.api_metrics import api_metrics
+from core.adaptive_timeout import adaptive_timeouts, ORDER_PATH_PREFIX
+from core.retry_policy import retry_policy
+from core.token_manager import token_manager
+from core.rate_limiter import rate_limiter
+from core.http_session import http_session_manager
+
+
+def _observe(path: str, seconds: float, count: int, tr_id: str = "TEST"):
+    metrics = api_metrics.endpoint(path, tr_id)
+    for _ in range(count):
+        metrics.observe_response(200, seconds, 100)
+
+
+def test_p99_times_factor_after_min_samples():
+    """표본이 min_samples 미만이면 기본값, 이후에는 p99 * factor를 사용하는지 확인"""
+    path = "/test/adaptive/p99"
+    _observe(path, 0.5, adaptive_timeouts.min_samples - 1)
+    assert adaptive_timeouts.get(path, "TEST") == adaptive_timeouts.default_timeout
+
+    _observe(path, 0.5, 1)
+    assert adaptive_timeouts.get(path, "TEST") == 0.5 * adaptive_timeouts.factor
+
+    # 연속 타임아웃 시 배수 증가, 응답을 받으면 다시 감소
+    adaptive_timeouts.record_timeout(path, "TEST")
+    assert adaptive_timeouts.get(path, "TEST") == 0.5 * adaptive_timeouts.factor * 1.5
+    adaptive_timeouts.record_success(path, "TEST")
+    assert round(adaptive_timeouts.get(path, "TEST"), 6) == round(0.5 * adaptive_timeouts.factor * 1.2, 6)
+
+
+def test_floor_and_ceiling_by_path_prefix():
+    """계산 값이 경로별 하한/상한으로 제한되는지 확인 (주문 경로 5~15초, 기본 1~10초)"""
+    cases = [
+        ("/test/adaptive/fast", 0.1, 1.0),
+        ("/test/adaptive/slow", 5.0, 10.0),
+        (f"{ORDER_PATH_PREFIX}-test-fast", 0.1, 5.0),
+        (f"{ORDER_PATH_PREFIX}-test-slow", 8.0, 15.0),
+    ]
+    for path, latency, expected in cases:
+        _observe(path, latency, adaptive_timeouts.min_samples)
+        assert adaptive_timeouts.get(path, "TEST") == expected, path
+
+
+class _TimeoutSession:
+    """요청마다 asyncio.TimeoutError를 발생시키는 aiohttp 세션 대체"""
+
+    def __init__(self):
+        self.sent = []
+
+    def request(self, method, url, **kwargs):
+        self.sent.append((method, url))
+        raise asyncio.TimeoutError()
+
+
+def _stub_transport(monkeypatch) -> _TimeoutSession:
+    session = _TimeoutSession()
+
+    async def get_token_async(*args, **kwargs):
+        return "token"
+
+    async def acquire(*args, **kwargs):
+        return 0.0
+
+    monkeypatch.setattr(token_manager, "get_token_async", get_token_async)
+    monkeypatch.setattr(rate_limiter, "acquire", acquire)
+    monkeypatch.setattr(http_session_manager, "get_session", lambda: session)
+    monkeypatch.setattr(retry_policy, "next_delay", lambda *args, **kwargs: 0.0)
+    return session
+
+
+def test_order_post_is_not_resent_after_timeout(monkeypatch):
+    """주문 POST는 타임아웃 후 재전송하지 않고 9998을 반환하며, 조회 GET은 재시도하는지 확인"""
+    session = _stub_transport(monkeypatch)
+
+    result = asyncio.run(api_client._make_request_async(
+        "POST", f"{ORDER_PATH_PREFIX}-cash", headers={"tr_id": "TEST_ORDER"}, data={}, max_retries=3))
+    assert result["rt_cd"] == "9998"
+    assert result["error_type"] == "timeout"
+    assert len(session.sent) == 1
+
+    session.sent.clear()
+    result = asyncio.run(api_client._make_request_async(
+        "GET", "/test/adaptive/inquiry", headers={"tr_id": "TEST_INQUIRY"}, params={}, max_retries=3))
+    assert result["rt_cd"] == "9998"
+    assert len(session.sent) == 3
@@ -0,0 +1,83 @@
+"""
+서킷 브레이커 상태 전환 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.circuit_breaker as circuit_breaker
+from core.circuit_breaker import CircuitBreaker, STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN
+
+
+class _Clock:
+    """time.monotonic 대체"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _breaker(monkeypatch) -> (CircuitBreaker, _Clock):
+    clock = _Clock()
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return CircuitBreaker("test|TR", failure_threshold=3, open_timeout=10.0, max_open_timeout=30.0), clock
+
+
+def test_opens_after_threshold_and_closes_after_successful_probe(monkeypatch):
+    """연속 실패로 열리고, 대기 후 시험 요청 1건만 통과하며, 성공하면 닫히는지 확인"""
+    breaker, clock = _breaker(monkeypatch)
+
+    for _ in range(2):
+        breaker.record_failure("HTTP 500")
+    assert breaker.state == STATE_CLOSED
+    breaker.record_failure("HTTP 500")
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request()
+    assert breaker.retry_after() == 10.0
+
+    clock.now += 10.0
+    assert breaker.allow_request()              # 시험 요청
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow_request()          # 진행 중인 시험 요청이 있으면 차단
+
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request()
+    assert breaker.stats["rejected"] == 2
+
+
+def test_failed_probe_doubles_open_timeout_up_to_max(monkeypatch):
+    """시험 요청 실패 시 대기 시간이 두 배(최대 max_open_timeout)가 되고, 성공하면 초기값으로 돌아가는지 확인"""
+    breaker, clock = _breaker(monkeypatch)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now += 10.0
+    for expected in (20.0, 30.0, 30.0):
+        assert breaker.allow_request()
+        breaker.record_failure("probe failed")
+        assert breaker.state == STATE_OPEN
+        assert breaker.open_timeout == expected
+        clock.now += expected - 0.1
+        assert not breaker.allow_request()
+        clock.now += 0.1
+
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.open_timeout == 10.0
+
+
+def test_stale_probe_allows_another_probe(monkeypatch):
+    """시험 요청 결과가 probe_timeout 안에 기록되지 않으면 다른 시험 요청을 허용하는지 확인"""
+    breaker, clock = _breaker(monkeypatch)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now += 10.0
+    assert breaker.allow_request()
+    clock.now += breaker.probe_timeout + 1
+    assert breaker.allow_request()
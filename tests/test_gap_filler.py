@@ -0,0 +1,77 @@
+"""
+재연결 공백 보정 보류 상태 테스트 (끊김 → 재연결 실패 → 종목 재배치)
+"""
+import sys
+import os
+import asyncio
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.gap_filler import gap_filler
+from core.websocket_client import ws_client
+from core.ws_pool import ws_pool
+
+
+def _pool_with_failing_session(monkeypatch):
+    """기본 세션 + 재연결이 실패하는 추가 세션 1개로 풀 구성 (005930은 추가 세션에 배정)"""
+    async def subscribe_feed(symbol, feed_type="price"):
+        ws_client.subscriptions[symbol] = {"type": feed_type}
+        return True
+
+    async def open_connection(options):
+        raise ConnectionError("refused")
+
+    ws_pool.configure([("test-key", "test-secret")])
+    session = ws_pool.sessions[1]
+    monkeypatch.setattr(ws_client, "_subscribe_feed", subscribe_feed)
+    monkeypatch.setattr(session, "_open_connection", open_connection)
+    session.reconnect_delay = 0
+    session.running = True
+    session.subscriptions["005930"] = {"type": "price"}
+    ws_pool.assignments["005930"] = 1
+    gap_filler.recovering.clear()
+    gap_filler._held.clear()
+    return session
+
+
+def test_failed_reconnect_releases_held_symbols(monkeypatch):
+    """재연결 실패 시 포기 알림과 재배치로 보류 종목이 해제되고 종목이 다른 세션으로 옮겨지는지 확인"""
+    session = _pool_with_failing_session(monkeypatch)
+    seen = []
+
+    async def on_disconnect(disconnected, down_since, gave_up):
+        seen.append((gap_filler.is_recovering("005930"), gave_up))
+
+    session.disconnect_listeners.append(on_disconnect)
+    try:
+        asyncio.run(session._safe_reconnect())
+
+        # 끊김 감지 시점에는 보류, 재연결 실패 후 포기 알림
+        assert seen == [(True, False), (False, True)]
+        assert not gap_filler.is_recovering("005930")
+        assert session.name not in gap_filler._held
+        assert ws_pool.assignments["005930"] == 0
+        assert "005930" not in session.subscriptions
+    finally:
+        ws_pool.configure([])
+        ws_client.subscriptions.pop("005930", None)
+
+
+def test_reassignment_releases_held_symbols_without_give_up(monkeypatch):
+    """포기 알림 없이 세션이 장애 처리되어도 종목 재배치 시 보류가 해제되는지 확인"""
+    session = _pool_with_failing_session(monkeypatch)
+    try:
+        async def run():
+            await gap_filler.on_disconnect(session, datetime.now(), False)
+            assert gap_filler.is_recovering("005930")
+            await ws_pool._on_session_state(session, False)
+
+        asyncio.run(run())
+        assert not gap_filler.is_recovering("005930")
+        assert session.name not in gap_filler._held
+        assert ws_pool.assignments["005930"] == 0
+    finally:
+        ws_pool.configure([])
+        ws_client.subscriptions.pop("005930", None)
@@ -0,0 +1,101 @@
+"""
+당일 분봉 서비스 테스트 (역방향 페이지 조회, 증분 동기화, 빈 분 채움)
+"""
+import sys
+import os
+import asyncio
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import core.minute_bars as minute_bars
+from core.minute_bars import MinuteBarService
+
+TODAY = "20261016"
+
+
+class _Clock(datetime):
+    """datetime.now() 고정용"""
+    current = datetime(2026, 10, 16, 10, 15, 30)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+class _ChartServer:
+    """get_minute_price_async 대체: time_unit 이전 분봉을 최신순 30건씩 반환 (부족하면 전일 분봉으로 채움)"""
+
+    def __init__(self):
+        self.bars = {}          # {(날짜, HHMMSS): (종가, 거래량)}
+        self.requests = []
+        for minute in range(76):                    # 09:00 ~ 10:15
+            if minute == 30:                        # 09:30 체결 없음
+                continue
+            self.bars[(TODAY, f"{9 + minute // 60:02d}{minute % 60:02d}00")] = (10000 + minute * 10, 100 + minute)
+        for hhmm in ("1527", "1528", "1529"):
+            self.bars[("20261015", f"{hhmm}00")] = (9000, 5)
+
+    async def get_minute_price_async(self, symbol, time_unit="153000"):
+        self.requests.append(time_unit)
+        rows = sorted((key for key in self.bars if key[0] < TODAY or key[1] <= time_unit), reverse=True)[:30]
+        return {"rt_cd": "0", "output2": [
+            {"stck_bsop_date": date, "stck_cntg_hour": hhmmss,
+             "stck_oprc": str(self.bars[(date, hhmmss)][0]), "stck_hgpr": str(self.bars[(date, hhmmss)][0]),
+             "stck_lwpr": str(self.bars[(date, hhmmss)][0]), "stck_prpr": str(self.bars[(date, hhmmss)][0]),
+             "cntg_vol": str(self.bars[(date, hhmmss)][1])}
+            for date, hhmmss in rows
+        ]}
+
+
+def _service(monkeypatch):
+    server = _ChartServer()
+    monkeypatch.setattr(minute_bars, "api_client", server)
+    monkeypatch.setattr(minute_bars, "datetime", _Clock)
+    _Clock.current = datetime(2026, 10, 16, 10, 15, 30)
+    service = MinuteBarService()
+    service.clear()
+    service.min_sync_interval = 0.0
+    return service, server
+
+
+def test_backward_paging_filters_prior_day_and_fills_empty_minutes(monkeypatch):
+    """장 시작까지 여러 페이지를 역방향 조회하고, 전일 분봉은 제외하며, 빈 분은 직전 종가로 채우는지 확인"""
+    service, server = _service(monkeypatch)
+
+    series = asyncio.run(service.load_session("005930"))
+
+    assert server.requests == ["101530", "094500", "091400"]
+    raw = service.get_series("005930", contiguous=False)
+    assert len(raw) == 75
+    assert raw.ts[0] == np.datetime64("2026-10-16T09:00")
+
+    assert len(series) == 76
+    gap = series.timestamps.index(datetime(2026, 10, 16, 9, 30))
+    assert series.close[gap] == series.close[gap - 1] == 10290
+    assert series.volume[gap] == 0
+    assert series.close[-1] == 10750
+
+
+def test_delta_sync_refetches_last_minute(monkeypatch):
+    """증분 동기화가 마지막 보유 분부터 다시 조회하여 미완성 분봉을 새 값으로 교체하는지 확인"""
+    service, server = _service(monkeypatch)
+    asyncio.run(service.load_session("005930"))
+
+    _Clock.current = datetime(2026, 10, 16, 10, 17, 30)
+    server.bars[(TODAY, "101500")] = (10800, 999)       # 조회 당시 미완성이던 10:15 분봉 확정
+    server.bars[(TODAY, "101600")] = (10810, 10)
+    server.bars[(TODAY, "101700")] = (10820, 20)
+    server.requests.clear()
+
+    series = asyncio.run(service.load_session("005930"))
+
+    assert server.requests == ["101730"]
+    assert service.stats["delta_syncs"] == 1
+    assert series.timestamps[-3:] == [datetime(2026, 10, 16, 10, minute) for minute in (15, 16, 17)]
+    assert series.close[-3:].tolist() == [10800, 10810, 10820]
+    assert series.volume[-3] == 999
+    assert len(service.get_series("005930", contiguous=False)) == 77
@@ -0,0 +1,58 @@
+"""
+실시간 호가창 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.realtime_frames import parse_frame, H0STASP0_FIELDS
+from core.order_book import OrderBook
+
+
+def _frame(asks, bids) -> str:
+    """[(가격, 잔량)] 목록으로 H0STASP0 파이프 프레임 생성 (10단계 미만은 0으로 채움)"""
+    fields = dict.fromkeys(H0STASP0_FIELDS, "0")
+    fields["mksc_shrn_iscd"] = "005930"
+    fields["bsop_hour"] = "093000"
+    for level, (price, size) in enumerate(asks, start=1):
+        fields[f"askp{level}"] = str(price)
+        fields[f"askp_rsqn{level}"] = str(size)
+    for level, (price, size) in enumerate(bids, start=1):
+        fields[f"bidp{level}"] = str(price)
+        fields[f"bidp_rsqn{level}"] = str(size)
+    return "0|H0STASP0|001|" + "^".join(fields[name] for name in H0STASP0_FIELDS)
+
+
+def _book(asks, bids) -> OrderBook:
+    record = parse_frame(_frame(asks, bids)).order_books()[0]
+    book = OrderBook(record.symbol)
+    book.apply(record.raw)
+    return book
+
+
+def test_top_of_book_and_depth_aggregates():
+    """최우선 호가, 스프레드, 잔량 가중 중간가, 불균형 계산 확인"""
+    book = _book(asks=[(70100, 100), (70200, 300)], bids=[(70000, 300), (69900, 500)])
+
+    assert book.symbol == "005930"
+    assert book.best_ask == 70100
+    assert book.best_bid == 70000
+    assert book.spread == 100
+    assert book.mid == 70050
+    # 매수 잔량(800)이 매도 잔량(400)보다 두꺼우면 매도 쪽으로 치우침
+    assert book.imbalance == (800 - 400) / 1200
+    assert book.weighted_mid > book.mid
+
+
+def test_liquidity_and_fill_price_walk_opposite_side():
+    """지정가 즉시 체결 가능 수량과 전량 체결 호가 확인"""
+    book = _book(asks=[(70100, 100), (70200, 300)], bids=[(70000, 300), (69900, 500)])
+
+    assert book.liquidity("BUY", 70100) == 100
+    assert book.liquidity("BUY", 70200) == 400
+    assert book.liquidity("SELL", 70000) == 300
+    assert book.fill_price("BUY", 250) == 70200
+    assert book.fill_price("SELL", 300) == 70000
+    assert book.fill_price("BUY", 1000) is None
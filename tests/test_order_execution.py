@@ -0,0 +1,95 @@
+"""
+주문 체결 대기 중 체결분 반영 테스트
+"""
+import sys
+import os
+import asyncio
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.realtime_frames import parse_frame, H0STCNI0_FIELDS
+from core.order_tracker import order_tracker, ORDER_FILLED
+from core.order_manager import order_manager
+from core.api_client import api_client
+from utils.database import database_manager
+
+ORDER_DATA = {"symbol": "005930", "side": "BUY", "quantity": 10, "price": 70000}
+
+
+def _notices(order_no: str, quantity: int, price: int):
+    """평문 H0STCNI0 체결 프레임을 FillNotice 목록으로 변환"""
+    fields = dict.fromkeys(H0STCNI0_FIELDS, "")
+    fields.update(oder_no=order_no, seln_byov_cls="02", rctf_cls="0", stck_shrn_iscd="005930",
+                  cntg_qty=str(quantity), cntg_unpr=str(price), rfus_yn="0", cntg_yn="2", acpt_yn="1",
+                  oder_qty="10")
+    frame = parse_frame("0|H0STCNI0|001|" + "^".join(fields[name] for name in H0STCNI0_FIELDS))
+    return frame.fill_notices("", "")
+
+
+async def _notify(order_no: str, quantity: int, price: int):
+    for notice in _notices(order_no, quantity, price):
+        await order_tracker.on_notice(notice)
+
+
+def _record_executions(monkeypatch, on_execution=None):
+    """포지션 반영(_handle_order_execution) 대신 (수량, 단가) 기록"""
+    booked = []
+
+    async def handle_order_execution(order_id, fill_data):
+        booked.append((fill_data["quantity"], fill_data["price"]))
+        if on_execution is not None:
+            await on_execution()
+
+    monkeypatch.setattr(order_manager, "_handle_order_execution", handle_order_execution)
+    monkeypatch.setattr(database_manager, "update_order", lambda *args, **kwargs: None)
+    return booked
+
+
+def test_fills_before_wait_are_booked(monkeypatch):
+    """대기 시작 전에 전량 체결 통보가 온 주문도 포지션에 반영되는지 확인"""
+    booked = _record_executions(monkeypatch)
+
+    async def run():
+        await _notify("0000012345", 10, 70000)
+        tracked = order_tracker.track("12345", "005930", "BUY", 10, 70000)
+        assert tracked.status == ORDER_FILLED
+        await order_manager._wait_for_order_execution("12345", dict(ORDER_DATA))
+
+    asyncio.run(run())
+    assert booked == [(10, 70000)]
+
+
+def test_fill_arriving_during_apply_is_booked(monkeypatch):
+    """부분 체결 반영 중에 나머지 체결로 종결된 주문의 마지막 체결분도 반영되는지 확인"""
+    async def fill_rest():
+        if len(booked) == 1:
+            await _notify("0000012346", 6, 70100)
+
+    booked = _record_executions(monkeypatch, fill_rest)
+
+    async def run():
+        await _notify("0000012346", 4, 70000)
+        order_tracker.track("12346", "005930", "BUY", 10, 70000)
+        await order_manager._wait_for_order_execution("12346", dict(ORDER_DATA))
+
+    asyncio.run(run())
+    assert booked == [(4, 70000), (6, 70100)]
+
+
+def test_sent_order_is_found_in_order_history(monkeypatch):
+    """응답을 받지 못한 주문을 당일 주문 내역(비동기 조회)에서 종목/방향/수량/시각으로 찾는지 확인"""
+    async def get_order_history_async(start_date=None, end_date=None):
+        return {"rt_cd": "0", "output1": [
+            {"odno": "0000012001", "pdno": "005930", "sll_buy_dvsn_cd": "02", "ord_qty": "10", "ord_tmd": "090000"},
+            {"odno": "0000012002", "pdno": "005930", "sll_buy_dvsn_cd": "01", "ord_qty": "10", "ord_tmd": "100001"},
+            {"odno": "0000012003", "pdno": "005930", "sll_buy_dvsn_cd": "02", "ord_qty": "10", "ord_tmd": "100001"},
+        ]}
+
+    monkeypatch.setattr(api_client, "get_order_history_async", get_order_history_async)
+    monkeypatch.setattr(api_client, "get_order_history", None)    # 동기 조회(스레드 풀)는 사용하지 않음
+    sent_at = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
+
+    found = asyncio.run(order_manager._find_sent_order("005930", "BUY", 10, sent_at))
+    assert found == "0000012003"
@@ -0,0 +1,62 @@
+"""
+체결 통보 주문 상태 머신 테스트
+"""
+import sys
+import os
+import asyncio
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.realtime_frames import parse_frame, H0STCNI0_FIELDS
+from core.order_tracker import OrderTracker, ORDER_PARTIALLY_FILLED, ORDER_FILLED, ORDER_CANCELLED
+
+
+def _notices(order_no: str, quantity: int, price: int, fill: bool = True, cancel_of: str = ""):
+    """평문 H0STCNI0 프레임을 FillNotice 목록으로 변환"""
+    fields = dict.fromkeys(H0STCNI0_FIELDS, "")
+    fields.update(oder_no=order_no, ooder_no=cancel_of, seln_byov_cls="02", rctf_cls="2" if cancel_of else "0",
+                  stck_shrn_iscd="005930", cntg_qty=str(quantity), cntg_unpr=str(price), rfus_yn="0",
+                  cntg_yn="2" if fill else "1", acpt_yn="1", oder_qty="10")
+    frame = parse_frame("0|H0STCNI0|001|" + "^".join(fields[name] for name in H0STCNI0_FIELDS))
+    return frame.fill_notices("", "")
+
+
+def test_notices_before_registration_and_partial_fills():
+    """주문 등록 전에 온 통보가 반영되고, 부분 체결 후 전량 체결 시 대기 쪽이 바로 깨어나는지 확인"""
+    tracker = OrderTracker()
+
+    async def run():
+        for notice in _notices("0000012345", 4, 70000):
+            await tracker.on_notice(notice)
+        order = tracker.track("12345", "005930", "BUY", 10, 70000)
+        assert order.status == ORDER_PARTIALLY_FILLED
+        assert await tracker.wait_for_update(order, 0.1)
+
+        async def push():
+            for notice in _notices("0000012345", 6, 70100):
+                await tracker.on_notice(notice)
+
+        asyncio.get_running_loop().call_later(0.01, lambda: asyncio.ensure_future(push()))
+        assert await tracker.wait_for_update(order, 1.0)
+        assert order.status == ORDER_FILLED
+        assert order.filled_quantity == 10
+        assert order.avg_fill_price == (4 * 70000 + 6 * 70100) / 10
+        tracker.forget("12345")
+
+    asyncio.run(run())
+
+
+def test_cancel_confirmation_resolves_original_order():
+    """취소 확인 통보(새 주문번호 + 원주문번호)가 원주문을 취소 상태로 만드는지 확인"""
+    tracker = OrderTracker()
+
+    async def run():
+        order = tracker.track("0000000777", "005930", "BUY", 5, 1000)
+        for notice in _notices("0000000778", 5, 0, fill=False, cancel_of="0000000777"):
+            await tracker.on_notice(notice)
+        assert order.status == ORDER_CANCELLED
+        assert order.changed.is_set()
+        tracker.forget("777")
+
+    asyncio.run(run())
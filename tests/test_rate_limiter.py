@@ -0,0 +1,63 @@
+"""
+속도 제한기 우선순위 레인 테스트
+"""
+import sys
+import os
+import asyncio
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rate_limiter import RateLimiter, PRIORITY_ORDER, PRIORITY_SCAN
+
+
+def _make_limiter(rate: float) -> RateLimiter:
+    limiter = RateLimiter()
+    limiter.reset_metrics()
+    limiter.configure_account("TEST", rate, burst=1)
+    return limiter
+
+
+def test_order_lane_overtakes_scan_queue():
+    """대기 중인 스캔 요청보다 주문 요청이 먼저 허가되는지 확인"""
+    limiter = _make_limiter(20)
+    completed = []
+
+    async def request(name, tr_id):
+        await limiter.acquire(tr_id, account="TEST")
+        completed.append(name)
+
+    async def run():
+        # 버스트 토큰 소진
+        await limiter.acquire("FHPST01710000", account="TEST")
+        scans = [asyncio.create_task(request(f"scan{i}", "FHPST01710000")) for i in range(5)]
+        await asyncio.sleep(0)
+        order = asyncio.create_task(request("order", "TTTC0011U"))
+        await asyncio.gather(order, *scans)
+
+    asyncio.run(run())
+
+    assert completed[0] == "order"
+    metrics = limiter.get_metrics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["lanes"]["scan"]["max_queue_depth"] >= 5
+    assert metrics["lanes"]["order"]["acquired"] >= 1
+
+
+def test_tr_id_limit_does_not_block_other_tr_ids():
+    """TR ID 버킷에 막힌 요청이 다른 TR ID 요청을 막지 않는지 확인"""
+    limiter = _make_limiter(100)
+    limiter.set_tr_id_limit("SLOW", 1, burst=1)
+
+    async def run():
+        await limiter.acquire("SLOW", account="TEST", priority=PRIORITY_ORDER)
+        slow = asyncio.create_task(limiter.acquire("SLOW", account="TEST", priority=PRIORITY_ORDER))
+        await asyncio.sleep(0)
+        waited = await limiter.acquire("FAST", account="TEST", priority=PRIORITY_SCAN)
+        slow.cancel()
+        return waited
+
+    try:
+        assert asyncio.run(run()) < 0.5
+    finally:
+        limiter.tr_id_limits.pop("SLOW", None)
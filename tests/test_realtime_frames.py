@@ -0,0 +1,62 @@
+"""
+실시간 파이프 프레임 파서 테스트
+"""
+import sys
+import os
+import base64
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.realtime_frames import parse_frame, H0STCNT0_FIELDS, H0STCNI0_FIELDS, AES
+
+
+def _tick_fields(symbol: str, price: int, volume: int):
+    """H0STCNT0 레코드 1건의 필드 목록"""
+    fields = dict.fromkeys(H0STCNT0_FIELDS, "0")
+    fields.update(mksc_shrn_iscd=symbol, stck_cntg_hour="090001", stck_prpr=str(price), cntg_vol=str(volume))
+    return [fields[name] for name in H0STCNT0_FIELDS]
+
+
+def test_multi_record_frame_and_short_trailing_record():
+    """건수 > 1 프레임이 레코드별로 분할되고, 필드가 부족한 마지막 레코드는 제외되는지 확인"""
+    records = [_tick_fields("005930", 70000, 10), _tick_fields("000660", 120000, 3)]
+    payload = "^".join(records[0] + records[1])
+
+    ticks = parse_frame(f"0|H0STCNT0|002|{payload}").ticks()
+    assert [(tick.symbol, tick.price, tick.volume) for tick in ticks] == [("005930", 70000, 10), ("000660", 120000, 3)]
+
+    # 헤더 건수는 3건이지만 세 번째 레코드가 잘려서 온 경우
+    short = _tick_fields("035720", 50000, 1)[:10]
+    frame = parse_frame(f"0|H0STCNT0|003|{payload}^" + "^".join(short))
+    assert frame.count == 3
+    assert [tick.symbol for tick in frame.ticks()] == ["005930", "000660"]
+
+    # 단건인데 필드가 부족하면 레코드 없음
+    assert parse_frame("0|H0STCNT0|001|" + "^".join(short)).ticks() == []
+
+
+def test_encrypted_frame_keeps_payload_for_decryption():
+    """암호화 플래그(1) 프레임은 분할하지 않고 본문을 보관하며, 제어 메시지/형식 오류는 None인지 확인"""
+    fields = dict.fromkeys(H0STCNI0_FIELDS, "")
+    fields.update(oder_no="0000012345", seln_byov_cls="02", stck_shrn_iscd="005930",
+                  cntg_qty="3", cntg_unpr="70000", cntg_yn="2", oder_qty="10")
+    plain = "^".join(fields[name] for name in H0STCNI0_FIELDS)
+    key, iv = "k" * 32, "i" * 16
+    if AES is not None:
+        from Crypto.Util.Padding import pad
+        cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, iv.encode("utf-8"))
+        payload = base64.b64encode(cipher.encrypt(pad(plain.encode("utf-8"), AES.block_size))).decode("ascii")
+    else:
+        payload = base64.b64encode(plain.encode("utf-8")).decode("ascii")
+
+    frame = parse_frame(f"1|H0STCNI0|001|{payload}")
+    assert frame.encrypted
+    assert frame.records == []
+    assert frame.payload == payload
+    if AES is not None:
+        notices = frame.fill_notices(key, iv)
+        assert [(n.order_id, n.symbol, n.quantity, n.price) for n in notices] == [("12345", "005930", 3, 70000)]
+
+    assert parse_frame('{"header": {"tr_id": "PINGPONG"}}') is None
+    assert parse_frame("0|H0STCNT0|abc|1^2") is None
@@ -0,0 +1,44 @@
+"""
+재시도 정책 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.retry_policy import (
+    RetryPolicy, RetryBudget, ERROR_SERVER, ERROR_TIMEOUT, ERROR_RATE_LIMITED
+)
+
+
+def test_delay_stays_within_rule_bounds():
+    """비상관 지터 대기 시간이 규칙의 최소/최대 범위를 벗어나지 않는지 확인"""
+    policy = RetryPolicy()
+    policy.budget = RetryBudget(capacity=1000)
+    policy.budget.balance = 1000
+    rule = policy.rules[ERROR_SERVER]
+
+    delay = 0.0
+    for retry_count in range(50):
+        delay = policy.next_delay(ERROR_SERVER, 0, delay)
+        assert rule.base_delay <= delay <= rule.max_delay
+
+    # 유형별 최대 재시도 횟수를 넘으면 재시도하지 않음
+    assert policy.next_delay(ERROR_TIMEOUT, policy.rules[ERROR_TIMEOUT].max_attempts) is None
+
+
+def test_budget_limits_retries_but_not_rate_limit_backoff():
+    """예산이 소진되면 장애성 재시도는 중단되고 속도 제한 재시도는 계속되는지 확인"""
+    policy = RetryPolicy()
+    policy.budget = RetryBudget(ratio=0.25, min_per_second=0.0, capacity=2)
+
+    assert policy.next_delay(ERROR_SERVER, 0) is not None
+    assert policy.next_delay(ERROR_SERVER, 0) is not None
+    assert policy.next_delay(ERROR_SERVER, 0) is None
+    assert policy.next_delay(ERROR_RATE_LIMITED, 0) is not None
+
+    # 요청 4건이 적립되면 재시도 1건 허용
+    for _ in range(4):
+        policy.record_request()
+    assert policy.next_delay(ERROR_SERVER, 0) is not None
@@ -0,0 +1,51 @@
+"""
+틱 병합 구독자 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.tick_bus import ConflatedFeed
+
+
+def _tick(symbol: str, price: int, volume: int) -> dict:
+    return {"tr_key": symbol, "stck_prpr": str(price), "cntg_vol": str(volume)}
+
+
+def test_drain_returns_latest_value_with_interval_aggregates():
+    """읽기 사이의 틱이 종목별 최신값 + 체결량 합계/고가/저가로 합쳐지는지 확인"""
+    feed = ConflatedFeed("test")
+    for price, volume in [(100, 10), (105, 5), (98, 7), (101, 3)]:
+        feed(_tick("005930", price, volume))
+    feed(_tick("000660", 200, 1))
+
+    snapshot = feed.drain()
+
+    assert set(snapshot) == {"005930", "000660"}
+    tick = snapshot["005930"]
+    assert tick.price == 101
+    assert tick.open == 100
+    assert tick.high == 105
+    assert tick.low == 98
+    assert tick.volume == 25
+    assert tick.count == 4
+    assert tick.last["stck_prpr"] == "101"
+
+
+def test_drain_resets_interval_and_skips_unchanged_symbols():
+    """읽은 구간은 초기화되고 이후 틱이 없는 종목은 다음 읽기에서 빠지는지 확인"""
+    feed = ConflatedFeed("test")
+    feed(_tick("005930", 100, 10))
+    feed(_tick("000660", 200, 1))
+    feed.drain()
+
+    feed(_tick("005930", 99, 2))
+    snapshot = feed.drain()
+
+    assert list(snapshot) == ["005930"]
+    assert snapshot["005930"].volume == 2
+    assert snapshot["005930"].high == 99
+    assert feed.drain() == {}
+    assert feed.get_stats()["ticks"] == 3
@@ -0,0 +1,167 @@
+"""
+웹소켓 디스패치 큐 테스트
+"""
+import sys
+import os
+import asyncio
+import json
+
+# 프로젝트 루트 디렉토리를 Path에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.ws_dispatch import DispatchQueue, POLICY_DROP_OLDEST, POLICY_CONFLATE, POLICY_BLOCK
+from core.websocket_client import KISWebSocketSession
+
+
+async def _fill_past_limit(policy: str):
+    """워커 1개를 첫 항목에서 멈춰 둔 채 max_queue(3)를 넘겨 넣고, 처리 순서와 통계 반환"""
+    gate = asyncio.Event()
+    handled = []
+
+    async def handler(key, item):
+        await gate.wait()
+        handled.append((key, item))
+
+    queue = DispatchQueue(handler, workers=1, max_queue=3, overflow_policy=policy, name="test")
+    queue.start()
+    await queue.put("A", 0)
+    await asyncio.sleep(0)                  # 워커가 A0을 꺼내 handler에서 대기
+    for key, item in [("A", 1), ("B", 1), ("A", 2)]:
+        await queue.put(key, item)
+
+    if policy == POLICY_BLOCK:
+        blocked = asyncio.ensure_future(queue.put("B", 2))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()           # 자리가 날 때까지 수신 측 대기
+        gate.set()
+        await blocked
+    else:
+        await queue.put("B", 2)
+        gate.set()
+
+    await asyncio.sleep(0.01)               # 워커가 남은 항목 처리
+    await queue.stop()
+    return handled, queue.stats
+
+
+def test_overflow_policies_and_per_key_order():
+    """정책별 버림/교체/대기 횟수와 키별 처리 순서 확인"""
+    handled, stats = asyncio.run(_fill_past_limit(POLICY_DROP_OLDEST))
+    assert handled == [("A", 0), ("B", 1), ("A", 2), ("B", 2)]
+    assert (stats["dropped"], stats["conflated"], stats["blocked"]) == (1, 0, 0)
+
+    # B는 대기 항목이 있으므로 최신 값으로 교체 (원래 자리에서 처리)
+    handled, stats = asyncio.run(_fill_past_limit(POLICY_CONFLATE))
+    assert handled == [("A", 0), ("A", 1), ("B", 2), ("A", 2)]
+    assert (stats["dropped"], stats["conflated"], stats["blocked"]) == (0, 1, 0)
+
+    handled, stats = asyncio.run(_fill_past_limit(POLICY_BLOCK))
+    assert handled == [("A", 0), ("A", 1), ("B", 1), ("A", 2), ("B", 2)]
+    assert (stats["dropped"], stats["conflated"], stats["blocked"]) == (0, 0, 1)
+
+    for key in ("A", "B"):
+        items = [item for handled_key, item in handled if handled_key == key]
+        assert items == sorted(items)
+
+
+def test_conflate_falls_back_to_drop_oldest_and_inline_when_stopped():
+    """대기 항목이 없는 키는 가장 오래된 항목을 버리고, 워커가 없으면 put()에서 바로 처리하는지 확인"""
+    async def run():
+        gate = asyncio.Event()
+        handled = []
+
+        async def handler(key, item):
+            await gate.wait()
+            handled.append((key, item))
+
+        queue = DispatchQueue(handler, workers=1, max_queue=2, overflow_policy=POLICY_CONFLATE, name="test")
+        queue.start()
+        await queue.put("A", 0)
+        await asyncio.sleep(0)
+        await queue.put("A", 1)
+        await queue.put("B", 1)
+        await queue.put(None, "control")    # 키 없는 항목은 교체 대상이 아니므로 A1을 버림
+        gate.set()
+        await asyncio.sleep(0.01)
+        await queue.stop()
+        assert handled == [("A", 0), ("B", 1), (None, "control")]
+        assert (queue.stats["dropped"], queue.stats["conflated"]) == (1, 0)
+
+        await queue.put("C", 1)             # 중지 상태: 바로 처리
+        assert handled[-1] == ("C", 1)
+
+    asyncio.run(run())
+
+
+def test_non_droppable_items_are_never_conflated_or_dropped():
+    """droppable=False 항목(체결 틱)은 conflate 정책에서도 교체/버림 없이 자리가 날 때까지 대기하는지 확인"""
+    async def run():
+        gate = asyncio.Event()
+        handled = []
+
+        async def handler(key, item):
+            await gate.wait()
+            handled.append((key, item))
+
+        queue = DispatchQueue(handler, workers=1, max_queue=2, overflow_policy=POLICY_CONFLATE, name="test")
+        queue.start()
+        await queue.put("A", 0, droppable=False)
+        await asyncio.sleep(0)
+        await queue.put("A", 1, droppable=False)
+        await queue.put("B", 1)
+
+        # 같은 키의 대기 항목이 있어도 교체하지 않고 대기
+        blocked = asyncio.ensure_future(queue.put("A", 2, droppable=False))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        gate.set()
+        await blocked
+
+        # 가장 오래된 항목이 버릴 수 없는 항목이면 버리지 않고 대기
+        gate.clear()
+        await asyncio.sleep(0.01)
+        await queue.put("A", 3, droppable=False)
+        await asyncio.sleep(0)
+        await queue.put("A", 4, droppable=False)
+        await queue.put("A", 5, droppable=False)
+        blocked = asyncio.ensure_future(queue.put("C", 1))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        gate.set()
+        await blocked
+
+        await asyncio.sleep(0.01)
+        await queue.stop()
+        assert [item for key, item in handled if key == "A"] == [0, 1, 2, 3, 4, 5]
+        assert (queue.stats["dropped"], queue.stats["conflated"], queue.stats["blocked"]) == (0, 0, 2)
+
+    asyncio.run(run())
+
+
+def test_subscription_ack_is_handled_without_queueing():
+    """큐가 가득 차 있어도 구독 응답(복호화 키 포함)은 버려지지 않고 수신 루프에서 바로 처리되는지 확인"""
+    async def run():
+        gate = asyncio.Event()
+
+        async def handler(key, item):
+            await gate.wait()
+
+        session = KISWebSocketSession("test-key", "test-secret", name="test")
+        session.dispatcher = DispatchQueue(handler, workers=1, max_queue=1, overflow_policy=POLICY_CONFLATE, name="test")
+        session.dispatcher.start()
+        await session.dispatcher.put("A", 0)
+        await asyncio.sleep(0)
+        await session.dispatcher.put("B", 0)
+
+        ack = {"header": {"tr_id": "H0STCNI0", "tr_key": "hts-id", "encrypt": "N"},
+               "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": "SUBSCRIBE SUCCESS",
+                        "output": {"iv": "i" * 16, "key": "k" * 32}}}
+        await session._enqueue_message(json.dumps(ack))
+        assert session._cipher_keys["H0STCNI0"] == ("k" * 32, "i" * 16)
+        assert session.dispatcher.stats["dropped"] == 0
+        assert session.dispatcher.depth() == 1
+
+        gate.set()
+        await session.dispatcher.stop()
+
+    asyncio.run(run())
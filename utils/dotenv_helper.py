@@ -88,6 +88,7 @@ KIS_APP_KEY=your_app_key
 KIS_APP_SECRET=your_app_secret
 KIS_ACCOUNT_NO=your_account_no
 KIS_WS_URL=ws://ops.koreainvestment.com:21000
+KIS_HTS_ID=your_hts_id
 
 # 알림 설정
 TELEGRAM_TOKEN=your_telegram_bot_token
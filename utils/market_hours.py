@@ -98,6 +98,25 @@ def get_next_market_open(current_time: Optional[datetime.datetime] = None) -> da
         # 다음 거래일 찾음
         return datetime.datetime.combine(next_date, market_open)
 
+def get_previous_trading_day(current_date: Optional[datetime.date] = None) -> datetime.date:
+    """
+    직전 거래일을 계산합니다 (주말과 설정된 휴장일 제외).
+    
+    Args:
+        current_date: 기준 날짜 (기본값: 오늘)
+        
+    Returns:
+        datetime.date: 기준 날짜 이전의 마지막 거래일
+    """
+    if current_date is None:
+        current_date = datetime.date.today()
+    
+    holidays = config.get("market_holidays", [])
+    prev_date = current_date - datetime.timedelta(days=1)
+    while prev_date.weekday() >= 5 or prev_date.strftime("%Y-%m-%d") in holidays:
+        prev_date -= datetime.timedelta(days=1)
+    return prev_date
+
 def format_market_time(dt: datetime.datetime) -> str:
     """
     거래 시간을 보기 좋은 형식으로 포맷팅합니다.